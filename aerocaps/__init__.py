@@ -1,12 +1,20 @@
 import os
 
+from .geom.basis import *
+from .geom.batch import *
+from .geom.bvh import *
+from .geom.continuity import *
+from .geom.curvature import *
 from .geom.curves import *
+from .geom.evaluation_plan import *
 from .geom.geometry_container import *
 from .geom.intersection import *
 from .geom.plane import *
 from .geom.point import *
+from .geom.section import *
 from .geom.surfaces import *
 from .geom.tools import *
+from .geom.topology import *
 from .geom.transformation import *
 from .geom.vector import *
 from .units.area import *
@@ -1,3 +1,4 @@
+import typing
 from abc import abstractmethod
 
 import numpy as np
@@ -7,6 +8,8 @@ import aerocaps.iges.entity
 
 class Geometry:
     """Abstract geometry class"""
+    __slots__ = ("_name", "_construction", "container", "_version", "_cache")
+
     def __init__(self, name: str, construction: bool = False):
         """
         Abstract geometry class
@@ -70,6 +73,61 @@ class Geometry:
             raise ValueError("Name must not contain dashes. Dashes are reserved for GeometryContainer indexing")
         return name
 
+    @property
+    def version(self) -> int:
+        """
+        Mutation counter of the geometry. This value is incremented every time the data defining the geometry
+        (such as a control point or weight) is modified, including modifications made directly through point
+        objects returned by the geometry. Derived data cached by the geometry is valid only for the version
+        at which it was computed.
+        """
+        # The counter is only assigned on the first modification, which can happen before Geometry.__init__ is called
+        return getattr(self, "_version", 0)
+
+    def _mark_modified(self):
+        """Increments the mutation counter, invalidating all the derived data cached by the geometry"""
+        self._version = self.version + 1
+
+    def _get_cached(self, key: str, compute: typing.Callable[[], typing.Any]) -> typing.Any:
+        """
+        Gets a piece of derived data from the cache of the geometry, computing and storing it first if it was
+        never computed or if the geometry was modified since it was last computed
+
+        Parameters
+        ----------
+        key: str
+            Name of the derived data
+        compute: typing.Callable[[], typing.Any]
+            Function with no arguments that computes the data from the current state of the geometry
+
+        Returns
+        -------
+        typing.Any
+            Derived data valid for the current version of the geometry
+        """
+        version = self.version
+        cache = getattr(self, "_cache", None)
+        if cache is None:
+            cache = self._cache = {}
+        entry = cache.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        value = compute()
+        cache[key] = (version, value)
+        return value
+
+    def _get_cached_array(self, key: str, compute: typing.Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        Same as :obj:`~aerocaps.geom.Geometry._get_cached`, but for array data. The array is marked read-only
+        before being stored so that callers cannot corrupt the cache by modifying it in-place.
+        """
+        def compute_read_only() -> np.ndarray:
+            array = compute()
+            array.flags.writeable = False
+            return array
+
+        return self._get_cached(key, compute_read_only)
+
     @property
     def construction(self) -> bool:
         """Whether this is a construction geometry (if so, it will not be plotted or exported)"""
@@ -83,11 +141,13 @@ class Geometry:
 
 class Geometry2D(Geometry):
     """Two-dimensional abstract geometry class"""
-    pass
+    __slots__ = ()
 
 
 class Geometry3D(Geometry):
     """Three-dimensional abstract geometry class"""
+    __slots__ = ()
+
     @abstractmethod
     def to_iges(self, *args, **kwargs) -> aerocaps.iges.entity.IGESEntity:
         """
@@ -110,6 +170,24 @@ class Surface(Geometry3D):
     def evaluate_grid(self, Nu: int, Nv: int) -> np.ndarray:
         pass
 
+    def _control_point_array(self) -> np.ndarray:
+        """
+        Read-only control point array, cached until the surface is modified. Used internally to avoid copying the
+        array on every evaluation.
+        """
+        return self._get_cached_array("control_point_array", self._control_points.copy)
+
+    def _control_point_list(self) -> list:
+        """
+        Control point array converted to a nested list, which is the fastest input format for the ``rust_nurbs``
+        evaluation functions. The list is cached until the surface is modified.
+        """
+        return self._get_cached("control_point_list", self._control_points.tolist)
+
+    def _weight_list(self) -> list:
+        """Weight array converted to a nested list and cached until the surface is modified"""
+        return self._get_cached("weight_list", self._weights.tolist)
+
 
 class InvalidGeometryError(Exception):
     pass
@@ -0,0 +1,404 @@
+r"""
+Vectorized basis-function matrices for Bézier and B-spline curves and surfaces.
+
+Each function in this module evaluates every basis function of a curve or surface direction at a vector of parameter
+values at once and returns the result as a matrix with one row per parameter value and one column per control point.
+A tensor-product surface (or its partial derivatives) can then be evaluated on a grid of parameter values with two
+matrix products, :math:`\mathbf{S} = \mathbf{B}_u \mathbf{P} \mathbf{B}_v^T`, which is what allows many surfaces
+that share the same basis to be evaluated in a single vectorized operation.
+
+The module also contains vectorized de Casteljau subdivision and Bézier decomposition of B-spline control points,
+which are used by algorithms that rely on the convex hull property of Bézier segments and patches.
+"""
+import typing
+from math import comb, factorial
+
+import numpy as np
+import scipy.sparse
+
+__all__ = [
+    "bernstein_basis_matrix",
+    "bspline_basis_matrix",
+    "bspline_basis_matrices",
+    "de_casteljau_split",
+    "bspline_to_bezier_segments",
+    "paired_derivatives",
+    "tensor_product_derivatives"
+]
+
+
+def bernstein_basis_matrix(n: int, t: np.ndarray, derivative: int = 0) -> np.ndarray:
+    r"""
+    Evaluates all the Bernstein polynomials of degree :math:`n` (or one of their derivatives) at a vector of
+    parameter values. The Bernstein polynomials are given by
+
+    .. math::
+
+        B_{i,n}(t)={n \choose i} t^i (1-t)^{n-i}
+
+    and the :math:`d`-th derivative is computed from the polynomials of degree :math:`n-d` by
+
+    .. math::
+
+        B_{i,n}^{(d)}(t) = \frac{n!}{(n-d)!} \sum_{j=0}^{d} (-1)^{d-j} {d \choose j} B_{i-j,n-d}(t)
+
+    Parameters
+    ----------
+    n: int
+        Degree of the polynomials
+    t: numpy.ndarray
+        1-D array of :math:`N_t` parameter values
+    derivative: int
+        Order of the derivative with respect to :math:`t`. Default: ``0``
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of size :math:`N_t \times (n+1)`
+    """
+    t = np.asarray(t, dtype=float)
+    if derivative > n:
+        return np.zeros((t.shape[0], n + 1))
+
+    degree = n - derivative
+    i = np.arange(degree + 1)
+    coefficients = np.array([comb(degree, k) for k in range(degree + 1)], dtype=float)
+    lower = coefficients * t[:, np.newaxis] ** i * (1.0 - t[:, np.newaxis]) ** (degree - i)
+    if derivative == 0:
+        return lower
+
+    B = np.zeros((t.shape[0], n + 1))
+    for j in range(derivative + 1):
+        B[:, j:j + degree + 1] += (-1) ** (derivative - j) * comb(derivative, j) * lower
+    return factorial(n) / factorial(degree) * B
+
+
+def _bspline_basis_table(knots: np.ndarray, degree: int, t: np.ndarray) -> typing.List[np.ndarray]:
+    r"""
+    Evaluates the B-spline basis functions of every degree from :math:`0` to ``degree`` using the Cox-de Boor
+    recursion. Each element of the returned list, :math:`\mathbf{N}_p`, is an array of size
+    :math:`N_t \times (N_k - 1 - p)`, where :math:`N_k` is the number of knots.
+    """
+    num_spans = len(knots) - 1
+
+    # Degree 0: each parameter value activates the knot span containing it. The last non-degenerate span is closed
+    # on the right so that the end of the knot vector evaluates to the last control point.
+    last_span = np.nonzero(knots[1:] > knots[:-1])[0][-1]
+    span = np.clip(np.searchsorted(knots, t, side="right") - 1, 0, last_span)
+    N = np.zeros((t.shape[0], num_spans))
+    N[np.arange(t.shape[0]), span] = 1.0
+    table = [N]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for p in range(1, degree + 1):
+            i = np.arange(num_spans - p)
+            left_width = knots[i + p] - knots[i]
+            right_width = knots[i + p + 1] - knots[i + 1]
+            left = np.where(left_width != 0.0, (t[:, np.newaxis] - knots[i]) / left_width, 0.0)
+            right = np.where(right_width != 0.0, (knots[i + p + 1] - t[:, np.newaxis]) / right_width, 0.0)
+            N = left * N[:, :-1] + right * N[:, 1:]
+            table.append(N)
+
+    return table
+
+
+def _bspline_basis_derivative(table: typing.List[np.ndarray], knots: np.ndarray,
+                              degree: int, derivative: int) -> np.ndarray:
+    r"""
+    Computes the ``derivative``-th derivative of the B-spline basis functions of degree ``degree`` from a table
+    generated by :obj:`~aerocaps.geom.basis._bspline_basis_table` using
+
+    .. math::
+
+        N_{i,p}^{(k)} = p \left( \frac{N_{i,p-1}^{(k-1)}}{u_{i+p}-u_i} - \frac{N_{i+1,p-1}^{(k-1)}}{u_{i+p+1}-u_{i+1}}
+        \right)
+    """
+    if derivative == 0:
+        return table[degree]
+    if derivative > degree:
+        return np.zeros_like(table[degree])
+
+    lower = _bspline_basis_derivative(table, knots, degree - 1, derivative - 1)
+    i = np.arange(lower.shape[1] - 1)
+    left_width = knots[i + degree] - knots[i]
+    right_width = knots[i + degree + 1] - knots[i + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        left = np.where(left_width != 0.0, degree / left_width, 0.0)
+        right = np.where(right_width != 0.0, degree / right_width, 0.0)
+    return left * lower[:, :-1] - right * lower[:, 1:]
+
+
+def bspline_basis_matrix(knots: np.ndarray, degree: int, t: np.ndarray, derivative: int = 0) -> np.ndarray:
+    r"""
+    Evaluates all the B-spline basis functions of a given degree and knot vector (or one of their derivatives) at a
+    vector of parameter values using a vectorized form of the Cox-de Boor recursion.
+
+    Parameters
+    ----------
+    knots: numpy.ndarray
+        1-D knot vector with :math:`N_k` knots
+    degree: int
+        Degree :math:`p` of the basis functions
+    t: numpy.ndarray
+        1-D array of :math:`N_t` parameter values
+    derivative: int
+        Order of the derivative with respect to :math:`t`. Default: ``0``
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of size :math:`N_t \times (N_k - p - 1)`, one column per control point
+    """
+    knots = np.asarray(knots, dtype=float)
+    t = np.asarray(t, dtype=float)
+    table = _bspline_basis_table(knots, degree, t)
+    return _bspline_basis_derivative(table, knots, degree, derivative)
+
+
+def bspline_basis_matrices(knots: np.ndarray, degree: int, t: np.ndarray,
+                           max_derivative: int) -> typing.List[np.ndarray]:
+    r"""
+    Evaluates the B-spline basis matrices of every derivative order from :math:`0` to ``max_derivative``. This is
+    equivalent to calling :obj:`~aerocaps.geom.basis.bspline_basis_matrix` once for each derivative order, except that
+    the Cox-de Boor recursion is only carried out once.
+
+    Parameters
+    ----------
+    knots: numpy.ndarray
+        1-D knot vector with :math:`N_k` knots
+    degree: int
+        Degree :math:`p` of the basis functions
+    t: numpy.ndarray
+        1-D array of :math:`N_t` parameter values
+    max_derivative: int
+        Highest derivative order with respect to :math:`t`
+
+    Returns
+    -------
+    typing.List[numpy.ndarray]
+        Arrays of size :math:`N_t \times (N_k - p - 1)` indexed by derivative order
+    """
+    knots = np.asarray(knots, dtype=float)
+    t = np.asarray(t, dtype=float)
+    table = _bspline_basis_table(knots, degree, t)
+    return [_bspline_basis_derivative(table, knots, degree, d) for d in range(max_derivative + 1)]
+
+
+def _basis_product(Bu: np.ndarray or scipy.sparse.spmatrix, C: np.ndarray,
+                   Bv: np.ndarray or scipy.sparse.spmatrix) -> np.ndarray:
+    r"""
+    Computes :math:`\mathbf{B}_u \mathbf{C} \mathbf{B}_v^T` for each coordinate of the control points
+    :math:`\mathbf{C}` (size :math:`\dots \times (n+1) \times (m+1) \times d`). Two-dimensional basis matrices
+    (dense or sparse) are applied as two matrix products after moving any leading dimensions of :math:`\mathbf{C}`
+    into its last dimension. Stacks of basis matrices (one per surface) are applied using :obj:`numpy.einsum`.
+    """
+    if Bu.ndim > 2 or Bv.ndim > 2:
+        return np.einsum("...ui,...ijd,...vj->...uvd", Bu, C, Bv, optimize=True)
+
+    leading_shape = C.shape[:-3]
+    n1, m1, d = C.shape[-3:]
+    Nu, Nv = Bu.shape[0], Bv.shape[0]
+    C = np.moveaxis(C.reshape((-1, n1, m1, d)), 0, 2)  # (n+1) x (m+1) x L x d
+    L = C.shape[2]
+    T = np.asarray(Bu @ C.reshape((n1, m1 * L * d))).reshape((Nu, m1, L * d))
+    S = np.asarray(Bv @ T.transpose((1, 0, 2)).reshape((m1, Nu * L * d))).reshape((Nv, Nu, L, d))
+    return S.transpose((2, 1, 0, 3)).reshape(leading_shape + (Nu, Nv, d))
+
+
+def tensor_product_derivatives(P: np.ndarray,
+                               Bu: typing.Sequence[np.ndarray],
+                               Bv: typing.Sequence[np.ndarray],
+                               orders: typing.Iterable[typing.Tuple[int, int]],
+                               weights: np.ndarray = None) -> typing.Dict[typing.Tuple[int, int], np.ndarray]:
+    r"""
+    Evaluates a tensor-product surface (or a stack of surfaces) and its partial derivatives from precomputed basis
+    matrices using :math:`\mathbf{S}^{(k,l)} = \mathbf{B}_u^{(k)} \mathbf{P} \left[\mathbf{B}_v^{(l)}\right]^T`.
+    For rational surfaces, the derivatives of the weighted control points and of the weights are computed in the
+    same way and combined using the quotient rule
+
+    .. math::
+
+        \mathbf{S}^{(k,l)} = \frac{1}{w} \left( \mathbf{A}^{(k,l)}
+        - \sum_{i=0}^{k} \sum_{j=0}^{l} {k \choose i} {l \choose j} w^{(i,j)} \mathbf{S}^{(k-i,l-j)} \right),
+        \quad (i,j) \neq (0,0)
+
+    where :math:`\mathbf{A}` is the weighted (homogeneous) surface and :math:`w` is the weight function.
+
+    Parameters
+    ----------
+    P: numpy.ndarray
+        Control points of size :math:`\dots \times (n+1) \times (m+1) \times 3`. Any leading dimensions
+        (e.g., a stack of :math:`K` surfaces) are carried through to the output
+    Bu: typing.Sequence[numpy.ndarray or scipy.sparse.spmatrix]
+        :math:`u`-direction basis matrices indexed by derivative order, each of size :math:`N_u \times (n+1)`
+        (or :math:`\dots \times N_u \times (n+1)` for a different basis per surface). Two-dimensional basis
+        matrices may be sparse
+    Bv: typing.Sequence[numpy.ndarray or scipy.sparse.spmatrix]
+        :math:`v`-direction basis matrices indexed by derivative order, each of size :math:`N_v \times (m+1)`
+        (or :math:`\dots \times N_v \times (m+1)` for a different basis per surface). Two-dimensional basis
+        matrices may be sparse
+    orders: typing.Iterable[typing.Tuple[int, int]]
+        Derivative orders :math:`(k,l)` to compute. ``(0, 0)`` is the surface itself
+    weights: numpy.ndarray
+        Control point weights of size :math:`\dots \times (n+1) \times (m+1)`, or ``None`` for a non-rational
+        surface. Default: ``None``
+
+    Returns
+    -------
+    typing.Dict[typing.Tuple[int, int], numpy.ndarray]
+        Arrays of size :math:`\dots \times N_u \times N_v \times 3` keyed by derivative order
+    """
+    return _derivatives_from_products(lambda k, l, C: _basis_product(Bu[k], C, Bv[l]), P, orders, weights)
+
+
+def paired_derivatives(P: np.ndarray,
+                       Bu: typing.Sequence[np.ndarray],
+                       Bv: typing.Sequence[np.ndarray],
+                       orders: typing.Iterable[typing.Tuple[int, int]],
+                       weights: np.ndarray = None) -> typing.Dict[typing.Tuple[int, int], np.ndarray]:
+    r"""
+    Evaluates a tensor-product surface and its partial derivatives at :math:`N` scattered :math:`(u_i,v_i)` pairs
+    from precomputed basis matrices whose rows correspond to the pairs. Unlike
+    :obj:`~aerocaps.geom.basis.tensor_product_derivatives`, which evaluates every combination of the :math:`u`- and
+    :math:`v`-values, this computes only
+
+    .. math::
+
+        \mathbf{S}^{(k,l)}(u_i, v_i) = \sum_{a=0}^{n} \sum_{b=0}^{m} B_{u,ia}^{(k)} \mathbf{P}_{a,b} B_{v,ib}^{(l)}
+
+    which requires :math:`O(N)` rather than :math:`O(N^2)` work. Rational surfaces are handled in the same way as in
+    :obj:`~aerocaps.geom.basis.tensor_product_derivatives`.
+
+    Parameters
+    ----------
+    P: numpy.ndarray
+        Control points of size :math:`(n+1) \times (m+1) \times 3`
+    Bu: typing.Sequence[numpy.ndarray]
+        :math:`u`-direction basis matrices indexed by derivative order, each of size :math:`N \times (n+1)`
+    Bv: typing.Sequence[numpy.ndarray]
+        :math:`v`-direction basis matrices indexed by derivative order, each of size :math:`N \times (m+1)`
+    orders: typing.Iterable[typing.Tuple[int, int]]
+        Derivative orders :math:`(k,l)` to compute. ``(0, 0)`` is the surface itself
+    weights: numpy.ndarray
+        Control point weights of size :math:`(n+1) \times (m+1)`, or ``None`` for a non-rational surface.
+        Default: ``None``
+
+    Returns
+    -------
+    typing.Dict[typing.Tuple[int, int], numpy.ndarray]
+        Arrays of size :math:`N \times 3` keyed by derivative order
+    """
+    def product(k: int, l: int, C: np.ndarray) -> np.ndarray:
+        n1, m1, d = C.shape
+        T = (Bu[k] @ C.reshape((n1, m1 * d))).reshape((-1, m1, d))
+        return np.einsum("nbd,nb->nd", T, Bv[l])
+
+    return _derivatives_from_products(product, P, orders, weights)
+
+
+def _derivatives_from_products(product: typing.Callable[[int, int, np.ndarray], np.ndarray],
+                               P: np.ndarray,
+                               orders: typing.Iterable[typing.Tuple[int, int]],
+                               weights: np.ndarray or None) -> typing.Dict[typing.Tuple[int, int], np.ndarray]:
+    """
+    Computes the requested partial derivatives of a (possibly rational) surface given a function that applies the
+    basis matrices of derivative order ``(k, l)`` to an array of control points, ``product(k, l, C)``
+    """
+    orders = list(orders)
+    if weights is None:
+        return {(k, l): product(k, l, P) for k, l in orders}
+
+    Pw = np.concatenate((P * weights[..., np.newaxis], weights[..., np.newaxis]), axis=-1)
+    homogeneous = {}
+
+    def homogeneous_derivative(k: int, l: int) -> np.ndarray:
+        if (k, l) not in homogeneous:
+            homogeneous[(k, l)] = product(k, l, Pw)
+        return homogeneous[(k, l)]
+
+    S = {}
+
+    def rational_derivative(k: int, l: int) -> np.ndarray:
+        if (k, l) in S:
+            return S[(k, l)]
+        A = homogeneous_derivative(k, l)[..., :3]
+        for i in range(k + 1):
+            for j in range(l + 1):
+                if i == 0 and j == 0:
+                    continue
+                w_ij = homogeneous_derivative(i, j)[..., 3:]
+                A = A - comb(k, i) * comb(l, j) * w_ij * rational_derivative(k - i, l - j)
+        S[(k, l)] = A / homogeneous_derivative(0, 0)[..., 3:]
+        return S[(k, l)]
+
+    return {(k, l): rational_derivative(k, l) for k, l in orders}
+
+
+def de_casteljau_split(control_points: np.ndarray, t: float = 0.5, axis: int = 0) -> (np.ndarray, np.ndarray):
+    r"""
+    Splits Bézier control points at a parameter value using the de Casteljau algorithm. Any number of Bézier
+    curves or surfaces can be split at once by stacking their control points along other axes (e.g., an array of
+    size :math:`K \times (n+1) \times (m+1) \times 4` holds the homogeneous control points of :math:`K` rational
+    Bézier surfaces, which are split in the :math:`u`-direction using ``axis=1``).
+
+    Parameters
+    ----------
+    control_points: numpy.ndarray
+        Control points (or Bernstein coefficients) with the Bézier index along ``axis``
+    t: float
+        Parameter value at which to split. Default: ``0.5``
+    axis: int
+        Axis of ``control_points`` corresponding to the Bézier index. Default: ``0``
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray
+        Control points of the pieces on :math:`[0,t]` and :math:`[t,1]`, each with the same shape as
+        ``control_points``
+    """
+    level = np.moveaxis(np.asarray(control_points, dtype=float), axis, 0)
+    num_control_points = level.shape[0]
+    left = np.empty_like(level)
+    right = np.empty_like(level)
+    for i in range(num_control_points):
+        left[i] = level[0]
+        right[num_control_points - 1 - i] = level[-1]
+        level = (1.0 - t) * level[:-1] + t * level[1:]
+    return np.moveaxis(left, 0, axis), np.moveaxis(right, 0, axis)
+
+
+def bspline_to_bezier_segments(control_points: np.ndarray, knots: np.ndarray, degree: int
+                               ) -> (np.ndarray, np.ndarray, np.ndarray):
+    r"""
+    Decomposes a clamped B-spline curve into Bézier segments by inserting each interior knot until its
+    multiplicity equals the degree (Boehm's algorithm). The control points may have any number of trailing
+    dimensions, so homogeneous control points can be passed to decompose a NURBS curve, and a B-spline surface can be
+    decomposed in one parametric direction by passing its control points with that direction first.
+
+    Parameters
+    ----------
+    control_points: numpy.ndarray
+        Control points of size :math:`(n+1) \times \ldots`
+    knots: numpy.ndarray
+        Clamped knot vector
+    degree: int
+        Degree :math:`p`
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray, numpy.ndarray
+        Control points of the :math:`S` segments (size :math:`S \times (p+1) \times \ldots`), and the starting
+        and ending parameter values of the segments (size :math:`S`)
+    """
+    Q = np.array(control_points, dtype=float)
+    knots = np.array(knots, dtype=float)
+    breakpoints = np.unique(knots[degree:knots.shape[0] - degree])
+    for knot in breakpoints[1:-1]:
+        for _ in range(degree - np.count_nonzero(knots == knot)):
+            k = np.searchsorted(knots, knot, side="right") - 1
+            i = np.arange(k - degree + 1, k + 1)
+            alpha = ((knot - knots[i]) / (knots[i + degree] - knots[i])).reshape((-1,) + (1,) * (Q.ndim - 1))
+            Q = np.concatenate((Q[:k - degree + 1], alpha * Q[i] + (1.0 - alpha) * Q[i - 1], Q[k:]))
+            knots = np.insert(knots, k + 1, knot)
+    segments = np.array([Q[j * degree:(j + 1) * degree + 1] for j in range(breakpoints.shape[0] - 1)])
+    return segments, breakpoints[:-1], breakpoints[1:]
@@ -0,0 +1,341 @@
+"""
+Batched evaluation of many tensor-product surfaces
+"""
+import typing
+
+import numpy as np
+
+from aerocaps.geom import Surface
+from aerocaps.geom.basis import bernstein_basis_matrix, bspline_basis_matrices, tensor_product_derivatives
+from aerocaps.geom.surfaces import BezierSurface, RationalBezierSurface, BSplineSurface, NURBSSurface, \
+    SurfaceDerivativeData
+
+__all__ = [
+    "SurfaceBatch",
+    "evaluate_surface_grids"
+]
+
+
+class _SurfaceGroup:
+    """Surfaces of the same class that share the same basis functions in both parametric directions"""
+    def __init__(self, surfaces: typing.List[Surface], indices: typing.List[int]):
+        self.indices = np.array(indices)
+        surf = surfaces[0]
+        self.degree_u = surf.degree_u
+        self.degree_v = surf.degree_v
+        self.knots_u = np.asarray(surf.knots_u, dtype=float) if hasattr(surf, "knots_u") else None
+        self.knots_v = np.asarray(surf.knots_v, dtype=float) if hasattr(surf, "knots_v") else None
+        self.P = np.stack([s.get_control_point_array() for s in surfaces])
+        self.weights = np.stack([s.weights for s in surfaces]) if isinstance(
+            surf, (RationalBezierSurface, NURBSSurface)) else None
+
+    def basis_matrices_u(self, u: np.ndarray, max_derivative: int) -> typing.List[np.ndarray]:
+        if self.knots_u is None:
+            return [bernstein_basis_matrix(self.degree_u, u, d) for d in range(max_derivative + 1)]
+        return bspline_basis_matrices(self.knots_u, self.degree_u, u, max_derivative)
+
+    def basis_matrices_v(self, v: np.ndarray, max_derivative: int) -> typing.List[np.ndarray]:
+        if self.knots_v is None:
+            return [bernstein_basis_matrix(self.degree_v, v, d) for d in range(max_derivative + 1)]
+        return bspline_basis_matrices(self.knots_v, self.degree_v, v, max_derivative)
+
+
+class SurfaceBatch:
+    """
+    Evaluates many Bézier, rational Bézier, B-spline, and NURBS surfaces at the same parameter values in a
+    small number of vectorized operations
+    """
+    supported_types = (BezierSurface, RationalBezierSurface, BSplineSurface, NURBSSurface)
+
+    def __init__(self, surfaces: typing.Iterable[Surface]):
+        r"""
+        Evaluates many Bézier, rational Bézier, B-spline, and NURBS surfaces at the same parameter values in a
+        small number of vectorized operations. The surfaces are grouped by class and by basis (degree in both
+        parametric directions and, for B-spline and NURBS surfaces, knot vectors). The control points of each group
+        of :math:`K` surfaces are stacked into a single array of size :math:`K \times (n+1) \times (m+1) \times 3`,
+        and the basis matrices of each group are computed only once per evaluation, so that every surface in the
+        group is evaluated by the same pair of matrix products.
+
+        The control points are copied when the batch is created, so the batch must be re-created if any of the
+        surfaces is modified.
+
+        .. code-block:: python
+
+            batch = SurfaceBatch(surfaces)
+            grids = batch.evaluate_grid(50, 50)  # Array of size len(surfaces) x 50 x 50 x 3
+
+        Parameters
+        ----------
+        surfaces: typing.Iterable[Surface]
+            Surfaces to evaluate. Each surface must be an instance of one of the classes in
+            :obj:`~aerocaps.geom.batch.SurfaceBatch.supported_types`
+        """
+        self.surfaces = list(surfaces)
+
+        groups = {}
+        for surf_idx, surf in enumerate(self.surfaces):
+            if not isinstance(surf, self.supported_types):
+                raise TypeError(f"Batched evaluation is not supported for surfaces of type {type(surf).__name__}")
+            key = (type(surf), surf.degree_u, surf.degree_v, surf.n_points_u, surf.n_points_v)
+            if isinstance(surf, (BSplineSurface, NURBSSurface)):
+                key += (tuple(np.asarray(surf.knots_u).tolist()), tuple(np.asarray(surf.knots_v).tolist()))
+            groups.setdefault(key, []).append(surf_idx)
+
+        self._groups = [_SurfaceGroup([self.surfaces[i] for i in indices], indices) for indices in groups.values()]
+
+    def __len__(self) -> int:
+        return len(self.surfaces)
+
+    @property
+    def num_groups(self) -> int:
+        """Number of groups of surfaces that are evaluated together"""
+        return len(self._groups)
+
+    def _evaluate(self, u: np.ndarray, v: np.ndarray,
+                  orders: typing.List[typing.Tuple[int, int]]) -> typing.Dict[typing.Tuple[int, int], np.ndarray]:
+        """
+        Evaluates every surface in the batch (or one of its partial derivatives) on the tensor product of the
+        parameter vectors ``u`` and ``v``. Returns arrays of size ``len(self) x len(u) x len(v) x 3`` keyed
+        by derivative order.
+        """
+        u = np.asarray(u, dtype=float)
+        v = np.asarray(v, dtype=float)
+        max_derivative_u = max(k for k, _ in orders)
+        max_derivative_v = max(l for _, l in orders)
+        results = {order: np.empty((len(self.surfaces), u.shape[0], v.shape[0], 3)) for order in orders}
+        for group in self._groups:
+            group_results = tensor_product_derivatives(
+                group.P,
+                group.basis_matrices_u(u, max_derivative_u),
+                group.basis_matrices_v(v, max_derivative_v),
+                orders,
+                weights=group.weights
+            )
+            for order, values in group_results.items():
+                results[order][group.indices] = values
+        return results
+
+    def evaluate(self, u: float, v: float) -> np.ndarray:
+        r"""
+        Evaluates every surface in the batch at a single :math:`(u,v)` pair
+
+        Parameters
+        ----------
+        u: float
+            Parameter value in the :math:`u`-direction
+        v: float
+            Parameter value in the :math:`v`-direction
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`K \times 3`, where :math:`K` is the number of surfaces in the batch
+        """
+        return self._evaluate(np.array([u]), np.array([v]), [(0, 0)])[(0, 0)][:, 0, 0, :]
+
+    def evaluate_uvvecs(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates every surface in the batch at each combination of the parameter values in the vectors
+        :math:`u` and :math:`v`
+
+        Parameters
+        ----------
+        u: numpy.ndarray
+            1-D array of :math:`N_u` parameter values in the :math:`u`-direction
+        v: numpy.ndarray
+            1-D array of :math:`N_v` parameter values in the :math:`v`-direction
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`K \times N_u \times N_v \times 3`, where :math:`K` is the number of surfaces
+            in the batch
+        """
+        return self._evaluate(u, v, [(0, 0)])[(0, 0)]
+
+    def evaluate_grid(self, Nu: int, Nv: int) -> np.ndarray:
+        r"""
+        Evaluates every surface in the batch on a uniform :math:`N_u \times N_v` grid of parameter values
+
+        Parameters
+        ----------
+        Nu: int
+            Number of uniformly spaced parameter values in the :math:`u`-direction
+        Nv: int
+            Number of uniformly spaced parameter values in the :math:`v`-direction
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`K \times N_u \times N_v \times 3`, where :math:`K` is the number of surfaces
+            in the batch
+        """
+        return self.evaluate_uvvecs(np.linspace(0.0, 1.0, Nu), np.linspace(0.0, 1.0, Nv))
+
+    def dSdu_uvvecs(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the first derivative with respect to :math:`u` of every surface in the batch at each combination
+        of the parameter values in the vectors :math:`u` and :math:`v`
+
+        Parameters
+        ----------
+        u: numpy.ndarray
+            1-D array of :math:`N_u` parameter values in the :math:`u`-direction
+        v: numpy.ndarray
+            1-D array of :math:`N_v` parameter values in the :math:`v`-direction
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`K \times N_u \times N_v \times 3`
+        """
+        return self._evaluate(u, v, [(1, 0)])[(1, 0)]
+
+    def dSdv_uvvecs(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the first derivative with respect to :math:`v` of every surface in the batch at each combination
+        of the parameter values in the vectors :math:`u` and :math:`v`
+
+        Parameters
+        ----------
+        u: numpy.ndarray
+            1-D array of :math:`N_u` parameter values in the :math:`u`-direction
+        v: numpy.ndarray
+            1-D array of :math:`N_v` parameter values in the :math:`v`-direction
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`K \times N_u \times N_v \times 3`
+        """
+        return self._evaluate(u, v, [(0, 1)])[(0, 1)]
+
+    def d2Sdu2_uvvecs(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the second derivative with respect to :math:`u` of every surface in the batch at each combination
+        of the parameter values in the vectors :math:`u` and :math:`v`
+
+        Parameters
+        ----------
+        u: numpy.ndarray
+            1-D array of :math:`N_u` parameter values in the :math:`u`-direction
+        v: numpy.ndarray
+            1-D array of :math:`N_v` parameter values in the :math:`v`-direction
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`K \times N_u \times N_v \times 3`
+        """
+        return self._evaluate(u, v, [(2, 0)])[(2, 0)]
+
+    def d2Sdv2_uvvecs(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the second derivative with respect to :math:`v` of every surface in the batch at each combination
+        of the parameter values in the vectors :math:`u` and :math:`v`
+
+        Parameters
+        ----------
+        u: numpy.ndarray
+            1-D array of :math:`N_u` parameter values in the :math:`u`-direction
+        v: numpy.ndarray
+            1-D array of :math:`N_v` parameter values in the :math:`v`-direction
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`K \times N_u \times N_v \times 3`
+        """
+        return self._evaluate(u, v, [(0, 2)])[(0, 2)]
+
+
+    def evaluate_derivatives(self, u: np.ndarray, v: np.ndarray, order: int = 2) -> SurfaceDerivativeData:
+        r"""
+        Evaluates every surface in the batch and its partial derivatives up to second order
+        (:math:`\mathbf{S}`, :math:`\mathbf{S}_u`, :math:`\mathbf{S}_v`, :math:`\mathbf{S}_{uu}`,
+        :math:`\mathbf{S}_{uv}`, and :math:`\mathbf{S}_{vv}`) at each combination of the parameter values in the
+        vectors :math:`u` and :math:`v`, sharing the basis matrices between all the derivatives
+
+        Parameters
+        ----------
+        u: numpy.ndarray
+            1-D array of :math:`N_u` parameter values in the :math:`u`-direction
+        v: numpy.ndarray
+            1-D array of :math:`N_v` parameter values in the :math:`v`-direction
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Derivatives above this order are
+            ``None`` in the output. Default: ``2``
+
+        Returns
+        -------
+        SurfaceDerivativeData
+            Point and partial derivatives of every surface, each of size :math:`K \times N_u \times N_v \times 3`,
+            where :math:`K` is the number of surfaces in the batch
+        """
+        if order not in (0, 1, 2):
+            raise ValueError(f"Derivative order must be 0, 1, or 2 (found {order = })")
+        orders = [(0, 0), (1, 0), (0, 1), (2, 0), (1, 1), (0, 2)][:{0: 1, 1: 3, 2: 6}[order]]
+        results = self._evaluate(u, v, orders)
+        return SurfaceDerivativeData(
+            u, v, results[(0, 0)],
+            Su=results.get((1, 0)), Sv=results.get((0, 1)),
+            Suu=results.get((2, 0)), Suv=results.get((1, 1)), Svv=results.get((0, 2))
+        )
+
+    def evaluate_derivatives_grid(self, Nu: int, Nv: int, order: int = 2) -> SurfaceDerivativeData:
+        r"""
+        Evaluates every surface in the batch and its partial derivatives up to second order on a uniform
+        :math:`N_u \times N_v` grid of parameter values. See
+        :obj:`~aerocaps.geom.batch.SurfaceBatch.evaluate_derivatives`.
+
+        Parameters
+        ----------
+        Nu: int
+            Number of uniformly spaced parameter values in the :math:`u`-direction
+        Nv: int
+            Number of uniformly spaced parameter values in the :math:`v`-direction
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Default: ``2``
+
+        Returns
+        -------
+        SurfaceDerivativeData
+            Point and partial derivatives of every surface, each of size :math:`K \times N_u \times N_v \times 3`
+        """
+        return self.evaluate_derivatives(np.linspace(0.0, 1.0, Nu), np.linspace(0.0, 1.0, Nv), order=order)
+
+
+def evaluate_surface_grids(surfaces: typing.Iterable[Surface], Nu: int, Nv: int) -> typing.List[np.ndarray]:
+    r"""
+    Evaluates each surface on a uniform :math:`N_u \times N_v` grid of parameter values. Surfaces supported by
+    :obj:`~aerocaps.geom.batch.SurfaceBatch` are evaluated together; any other surface is evaluated with its own
+    ``evaluate_grid`` method.
+
+    Parameters
+    ----------
+    surfaces: typing.Iterable[Surface]
+        Surfaces to evaluate
+    Nu: int
+        Number of uniformly spaced parameter values in the :math:`u`-direction
+    Nv: int
+        Number of uniformly spaced parameter values in the :math:`v`-direction
+
+    Returns
+    -------
+    typing.List[numpy.ndarray]
+        One array of size :math:`N_u \times N_v \times 3` for each surface, in the input order
+    """
+    surfaces = list(surfaces)
+    batch_indices = [i for i, surf in enumerate(surfaces) if isinstance(surf, SurfaceBatch.supported_types)]
+    grids = [None] * len(surfaces)
+
+    if batch_indices:
+        batch_grids = SurfaceBatch([surfaces[i] for i in batch_indices]).evaluate_grid(Nu, Nv)
+        for batch_idx, surf_idx in enumerate(batch_indices):
+            grids[surf_idx] = batch_grids[batch_idx]
+
+    for surf_idx, surf in enumerate(surfaces):
+        if grids[surf_idx] is None:
+            grids[surf_idx] = surf.evaluate_grid(Nu, Nv)
+
+    return grids
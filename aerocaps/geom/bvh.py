@@ -0,0 +1,415 @@
+"""
+Bounding-volume hierarchy over Bézier patches of surfaces for broad-phase spatial queries
+"""
+import copy
+import typing
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from aerocaps.geom import Surface
+from aerocaps.geom.basis import bspline_to_bezier_segments, de_casteljau_split
+from aerocaps.geom.surfaces import BezierSurface, RationalBezierSurface, BSplineSurface, NURBSSurface
+
+__all__ = [
+    "SurfaceBVH"
+]
+
+
+def _bezier_patches(surface: Surface) -> (np.ndarray, np.ndarray):
+    r"""
+    Represents a surface as a set of rational Bézier patches in homogeneous coordinates. B-spline and NURBS surfaces
+    are decomposed into Bézier patches by knot insertion in each parametric direction.
+
+    Parameters
+    ----------
+    surface: Surface
+        Bézier, rational Bézier, B-spline, or NURBS surface
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray
+        Homogeneous control points of the patches (size :math:`K \times (p+1) \times (q+1) \times 4`) and the
+        parameter bounds :math:`[u_0, u_1, v_0, v_1]` of the patches (size :math:`K \times 4`)
+    """
+    P = surface.get_control_point_array()
+    weights = surface.weights if isinstance(surface, (RationalBezierSurface, NURBSSurface)) else np.ones(P.shape[:2])
+    Pw = np.concatenate((P * weights[:, :, np.newaxis], weights[:, :, np.newaxis]), axis=2)
+    if isinstance(surface, (BezierSurface, RationalBezierSurface)):
+        return Pw[np.newaxis], np.array([[0.0, 1.0, 0.0, 1.0]])
+
+    # Decompose in u, then decompose each strip in v
+    strips, u0, u1 = bspline_to_bezier_segments(Pw, surface.knots_u, surface.degree_u)
+    patches, uv_bounds = [], []
+    for strip, strip_u0, strip_u1 in zip(strips, u0, u1):
+        strip_patches, v0, v1 = bspline_to_bezier_segments(np.swapaxes(strip, 0, 1), surface.knots_v,
+                                                           surface.degree_v)
+        patches.append(np.swapaxes(strip_patches, 1, 2))
+        uv_bounds.append(np.column_stack((np.full(v0.shape, strip_u0), np.full(v0.shape, strip_u1), v0, v1)))
+    return np.concatenate(patches), np.concatenate(uv_bounds)
+
+
+def _subdivide_patches(Pw: np.ndarray, uv_bounds: np.ndarray, max_depth: int, flatness: float
+                       ) -> (np.ndarray, np.ndarray):
+    r"""
+    Recursively splits rational Bézier patches of the same degree into four at the parametric midpoints until each
+    control net deviates from the bilinear interpolant of its corners by at most ``flatness`` times its diagonal, or
+    until ``max_depth`` splits have been made
+
+    Parameters
+    ----------
+    Pw: numpy.ndarray
+        Homogeneous control points of the patches (size :math:`K \times (p+1) \times (q+1) \times 4`)
+    uv_bounds: numpy.ndarray
+        Parameter bounds :math:`[u_0, u_1, v_0, v_1]` of the patches, optionally followed by extra columns that are
+        copied to the sub-patches (size :math:`K \times (4+c)`)
+    max_depth: int
+        Maximum number of splits
+    flatness: float
+        Relative flatness tolerance
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray
+        Homogeneous control points and parameter bounds of the subdivided patches
+    """
+    n_u, n_v = Pw.shape[1:3]
+    s = np.linspace(0.0, 1.0, n_u)[:, np.newaxis, np.newaxis]
+    t = np.linspace(0.0, 1.0, n_v)[np.newaxis, :, np.newaxis]
+    finished_Pw, finished_bounds = [], []
+    for depth in range(max_depth + 1):
+        P = Pw[..., :3] / Pw[..., 3:]
+        corners = P[:, [0, 0, -1, -1], [0, -1, 0, -1]]
+        bilinear = ((1 - s) * (1 - t) * corners[:, np.newaxis, np.newaxis, 0] +
+                    (1 - s) * t * corners[:, np.newaxis, np.newaxis, 1] +
+                    s * (1 - t) * corners[:, np.newaxis, np.newaxis, 2] +
+                    s * t * corners[:, np.newaxis, np.newaxis, 3])
+        deviation = np.max(np.linalg.norm(P - bilinear, axis=3), axis=(1, 2))
+        diagonal = np.linalg.norm(P.max(axis=(1, 2)) - P.min(axis=(1, 2)), axis=1)
+        flat = (deviation <= flatness * diagonal) | (depth == max_depth)
+        finished_Pw.append(Pw[flat])
+        finished_bounds.append(uv_bounds[flat])
+        Pw, uv_bounds = Pw[~flat], uv_bounds[~flat]
+        if Pw.shape[0] == 0:
+            break
+
+        # Split each remaining patch into four
+        u_mid = 0.5 * (uv_bounds[:, 0] + uv_bounds[:, 1])
+        v_mid = 0.5 * (uv_bounds[:, 2] + uv_bounds[:, 3])
+        Pw = np.concatenate(de_casteljau_split(Pw, axis=1))
+        Pw = np.concatenate(de_casteljau_split(Pw, axis=2))
+        u0, u1, v0, v1 = uv_bounds[:, :4].T
+        u_halves = np.concatenate((np.column_stack((u0, u_mid)), np.column_stack((u_mid, u1))))
+        v_lower = np.concatenate((np.column_stack((v0, v_mid)), np.column_stack((v0, v_mid))))
+        v_upper = np.concatenate((np.column_stack((v_mid, v1)), np.column_stack((v_mid, v1))))
+        uv_bounds = np.column_stack((
+            np.concatenate((np.column_stack((u_halves, v_lower)), np.column_stack((u_halves, v_upper)))),
+            np.tile(uv_bounds[:, 4:], (4, 1))
+        ))
+    return np.concatenate(finished_Pw), np.concatenate(finished_bounds)
+
+
+class SurfaceBVH:
+    """
+    Bounding-volume hierarchy of axis-aligned boxes over Bézier patches of a set of surfaces
+    """
+    def __init__(self,
+                 surfaces: typing.Iterable[Surface],
+                 names: typing.Iterable[str] = None,
+                 max_depth: int = 4,
+                 flatness: float = 1e-2,
+                 leaf_size: int = 4):
+        r"""
+        Bounding-volume hierarchy of axis-aligned boxes over Bézier patches of a set of surfaces, used for fast
+        broad-phase culling in spatial queries such as ray casting, closest-point, intersection, and clash queries.
+
+        Each B-spline or NURBS surface is first decomposed into Bézier patches by knot insertion. Each patch is then
+        recursively split into four at its parametric midpoints using the de Casteljau algorithm (the same algorithm
+        as ``split_at_u`` and ``split_at_v``, applied to all the patches at once) until its control net is nearly
+        flat or ``max_depth`` splits have been made. By the convex hull property (all weights are assumed to be
+        positive), every leaf patch lies inside the axis-aligned bounding box of its control points, so the boxes
+        are conservative and queries never miss a patch.
+
+        The leaf patches are ordered along a Morton (Z-order) curve through the centers of their boxes, and the
+        hierarchy is a balanced binary tree over groups of ``leaf_size`` consecutive leaves. Every query traverses
+        the tree for all query objects at once, level by level.
+
+        .. code-block:: python
+
+            bvh = SurfaceBVH([wing, fuselage], names=["wing", "fuselage"])
+            ray_index, leaf_index, t_enter = bvh.query_rays(origins, directions)
+            hit_surfaces = bvh.surface_index[leaf_index]
+            uv_bounds = bvh.uv_bounds[leaf_index]
+
+        Parameters
+        ----------
+        surfaces: typing.Iterable[Surface]
+            Bézier, rational Bézier, B-spline, or NURBS surfaces
+        names: typing.Iterable[str]
+            Names of the surfaces. If not specified, the ``name`` attribute of each surface is used. Default: ``None``
+        max_depth: int
+            Maximum number of times each Bézier patch is split into four. Default: ``4``
+        flatness: float
+            Maximum deviation of the control net of a leaf patch from the bilinear interpolant of its corners,
+            relative to the diagonal of its bounding box, below which the patch is no longer split. If negative, every
+            patch is split exactly ``max_depth`` times, so the leaves of each surface form a tensor-product grid in
+            parameter space. Default: ``1e-2``
+        leaf_size: int
+            Maximum number of leaf patches in each bottom-level node of the tree. Default: ``4``
+        """
+        self.surfaces = list(surfaces)
+        for surface in self.surfaces:
+            if not isinstance(surface, (BezierSurface, RationalBezierSurface, BSplineSurface, NURBSSurface)):
+                raise TypeError(f"Bounding-volume hierarchies are not supported for surfaces of type "
+                                f"{type(surface).__name__}")
+        self.names = [surface.name for surface in self.surfaces] if names is None else list(names)
+        self.leaf_size = leaf_size
+
+        # Leaf patches, subdivided together for surfaces of the same degree
+        patches_by_degree = {}
+        for surface_index, surface in enumerate(self.surfaces):
+            Pw, uv_bounds = _bezier_patches(surface)
+            group = patches_by_degree.setdefault(Pw.shape[1:3], ([], [], []))
+            group[0].append(Pw)
+            group[1].append(uv_bounds)
+            group[2].append(np.full(Pw.shape[0], surface_index))
+        control_nets, uv_bounds, surface_index, box_min, box_max = [], [], [], [], []
+        for Pw_list, bounds_list, index_list in patches_by_degree.values():
+            index = np.concatenate(index_list)
+            Pw = np.concatenate(Pw_list)
+            bounds = np.column_stack((np.concatenate(bounds_list), index))
+            Pw, bounds = _subdivide_patches(Pw, bounds, max_depth, flatness)
+            P = Pw[..., :3] / Pw[..., 3:]
+            control_nets.extend(Pw)
+            uv_bounds.append(bounds[:, :4])
+            surface_index.append(bounds[:, 4].astype(int))
+            box_min.append(P.min(axis=(1, 2)))
+            box_max.append(P.max(axis=(1, 2)))
+        box_min = np.concatenate(box_min) if box_min else np.zeros((0, 3))
+        box_max = np.concatenate(box_max) if box_max else np.zeros((0, 3))
+
+        # Sort the leaves along a Morton curve through the box centers
+        order = np.argsort(self._morton_codes(0.5 * (box_min + box_max)), kind="stable")
+        self.control_nets = [control_nets[i] for i in order]
+        """Homogeneous control points of each leaf patch (each of size :math:`(p+1) \\times (q+1) \\times 4`)"""
+        self.uv_bounds = np.concatenate(uv_bounds)[order] if uv_bounds else np.zeros((0, 4))
+        """Parameter bounds :math:`[u_0, u_1, v_0, v_1]` of each leaf patch on its surface"""
+        self.surface_index = np.concatenate(surface_index)[order] if surface_index else np.zeros(0, dtype=int)
+        """Index into :obj:`~aerocaps.geom.bvh.SurfaceBVH.surfaces` of the surface containing each leaf patch"""
+        self.box_min = box_min[order]
+        """Minimum corner of the bounding box of each leaf patch"""
+        self.box_max = box_max[order]
+        """Maximum corner of the bounding box of each leaf patch"""
+
+        # Bounding boxes of the nodes of each level of the tree, from the bottom level to the root
+        node_min = [np.minimum.reduceat(self.box_min, np.arange(0, self.num_leaves, leaf_size))] \
+            if self.num_leaves else [np.zeros((0, 3))]
+        node_max = [np.maximum.reduceat(self.box_max, np.arange(0, self.num_leaves, leaf_size))] \
+            if self.num_leaves else [np.zeros((0, 3))]
+        while node_min[-1].shape[0] > 1:
+            starts = np.arange(0, node_min[-1].shape[0], 2)
+            node_min.append(np.minimum.reduceat(node_min[-1], starts))
+            node_max.append(np.maximum.reduceat(node_max[-1], starts))
+        self._node_min = node_min[::-1]
+        self._node_max = node_max[::-1]
+
+    def _detached(self) -> "SurfaceBVH":
+        """
+        Shallow copy of the hierarchy without the surface objects, holding only the arrays used by the queries, to be
+        sent to worker processes
+        """
+        detached = copy.copy(self)
+        detached.surfaces = []
+        return detached
+
+    @property
+    def num_leaves(self) -> int:
+        """Number of leaf patches"""
+        return self.box_min.shape[0]
+
+    @staticmethod
+    def _morton_codes(centers: np.ndarray) -> np.ndarray:
+        """Computes 30-bit Morton codes of points after normalizing them to the unit cube"""
+        if centers.shape[0] == 0:
+            return np.zeros(0, dtype=np.int64)
+        lower, upper = centers.min(axis=0), centers.max(axis=0)
+        scale = np.where(upper > lower, upper - lower, 1.0)
+        cells = np.clip(((centers - lower) / scale * 1023.0).astype(np.int64), 0, 1023)
+        codes = np.zeros(centers.shape[0], dtype=np.int64)
+        for bit in range(10):
+            for axis in range(3):
+                codes |= ((cells[:, axis] >> bit) & 1) << (3 * bit + axis)
+        return codes
+
+    def _traverse(self, num_queries: int,
+                  test: typing.Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]) -> (np.ndarray, np.ndarray):
+        """
+        Finds every (query, leaf) pair for which ``test(query_indices, box_min, box_max)`` is ``True`` for the
+        leaf box and all the node boxes containing it. All the queries are traversed together, level by level.
+        """
+        query = np.arange(num_queries)
+        node = np.zeros(num_queries, dtype=int)
+        if self.num_leaves == 0:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+        for level, (node_min, node_max) in enumerate(zip(self._node_min, self._node_max)):
+            mask = test(query, node_min[node], node_max[node])
+            query, node = query[mask], node[mask]
+            if level == len(self._node_min) - 1:
+                break
+            query = np.repeat(query, 2)
+            node = (2 * node[:, np.newaxis] + np.array([0, 1])).ravel()
+            if self._node_min[level + 1].shape[0] % 2:
+                valid = node < self._node_min[level + 1].shape[0]
+                query, node = query[valid], node[valid]
+
+        # Expand the bottom-level nodes into their leaves
+        query = np.repeat(query, self.leaf_size)
+        leaf = (self.leaf_size * np.repeat(node, self.leaf_size) + np.tile(np.arange(self.leaf_size), node.shape[0]))
+        valid = leaf < self.num_leaves
+        query, leaf = query[valid], leaf[valid]
+        mask = test(query, self.box_min[leaf], self.box_max[leaf])
+        return query[mask], leaf[mask]
+
+    def query_boxes(self, box_min: np.ndarray, box_max: np.ndarray, tol: float = 0.0) -> (np.ndarray, np.ndarray):
+        r"""
+        Finds the leaf patches whose bounding boxes overlap each of a set of axis-aligned query boxes
+
+        Parameters
+        ----------
+        box_min: numpy.ndarray
+            Minimum corners of the query boxes (size :math:`N \times 3`)
+        box_max: numpy.ndarray
+            Maximum corners of the query boxes (size :math:`N \times 3`)
+        tol: float
+            Distance by which the query boxes are enlarged in each direction. Default: ``0.0``
+
+        Returns
+        -------
+        numpy.ndarray, numpy.ndarray
+            Indices of the query boxes and of the overlapping leaf patches, one entry per overlapping pair
+        """
+        box_min = np.asarray(box_min, dtype=float).reshape((-1, 3)) - tol
+        box_max = np.asarray(box_max, dtype=float).reshape((-1, 3)) + tol
+
+        def overlaps(query: np.ndarray, node_min: np.ndarray, node_max: np.ndarray) -> np.ndarray:
+            return np.all((node_min <= box_max[query]) & (node_max >= box_min[query]), axis=1)
+
+        return self._traverse(box_min.shape[0], overlaps)
+
+    def query_rays(self, origins: np.ndarray, directions: np.ndarray, t_min: float = 0.0,
+                   t_max: float = np.inf) -> (np.ndarray, np.ndarray, np.ndarray):
+        r"""
+        Finds the leaf patches whose bounding boxes are crossed by each of a set of rays
+        :math:`\mathbf{o} + t \mathbf{d}` with :math:`t_\text{min} \leq t \leq t_\text{max}` using the slab test
+
+        Parameters
+        ----------
+        origins: numpy.ndarray
+            Ray origins (size :math:`N \times 3`)
+        directions: numpy.ndarray
+            Ray directions (size :math:`N \times 3`), which need not be normalized
+        t_min: float
+            Minimum ray parameter. Default: ``0.0``
+        t_max: float
+            Maximum ray parameter. Default: ``numpy.inf``
+
+        Returns
+        -------
+        numpy.ndarray, numpy.ndarray, numpy.ndarray
+            Indices of the rays, indices of the crossed leaf patches, and the ray parameters at which the rays enter
+            the leaf boxes, one entry per crossing, sorted by ray index and then by entry parameter
+        """
+        origins = np.asarray(origins, dtype=float).reshape((-1, 3))
+        directions = np.asarray(directions, dtype=float).reshape((-1, 3))
+        # Zero direction components are replaced by a tiny value so that rays parallel to a slab cross it
+        # everywhere if the origin is inside the slab and nowhere otherwise, without special cases
+        inverse_directions = 1.0 / np.where(directions == 0.0, 1e-300, directions)
+
+        def slab_interval(query: np.ndarray, node_min: np.ndarray, node_max: np.ndarray) -> (np.ndarray, np.ndarray):
+            origin, inverse_direction = origins[query], inverse_directions[query]
+            t_1 = (node_min - origin) * inverse_direction
+            t_2 = (node_max - origin) * inverse_direction
+            t_near, t_far = np.minimum(t_1, t_2), np.maximum(t_1, t_2)
+            t_enter = np.maximum(np.maximum(t_near[:, 0], t_near[:, 1]), np.maximum(t_near[:, 2], t_min))
+            t_exit = np.minimum(np.minimum(t_far[:, 0], t_far[:, 1]), np.minimum(t_far[:, 2], t_max))
+            return t_enter, t_exit
+
+        def crosses(query: np.ndarray, node_min: np.ndarray, node_max: np.ndarray) -> np.ndarray:
+            t_enter, t_exit = slab_interval(query, node_min, node_max)
+            return t_enter <= t_exit
+
+        ray, leaf = self._traverse(origins.shape[0], crosses)
+        t_enter = slab_interval(ray, self.box_min[leaf], self.box_max[leaf])[0]
+        order = np.lexsort((t_enter, ray))
+        return ray[order], leaf[order], t_enter[order]
+
+    def query_closest_candidates(self, points: np.ndarray) -> (np.ndarray, np.ndarray, np.ndarray):
+        r"""
+        Finds the leaf patches that may contain the closest surface point to each of a set of points. The corners of
+        the leaf patches lie on the surfaces, so the distance from a point to the nearest leaf corner bounds the
+        distance to the closest surface point from above, and any leaf whose bounding box is farther from the point
+        than this bound is discarded.
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            Array of size :math:`N \times 3`
+
+        Returns
+        -------
+        numpy.ndarray, numpy.ndarray, numpy.ndarray
+            Indices of the points, indices of the candidate leaf patches, and the distances from the points to the
+            leaf boxes, one entry per candidate, sorted by point index and then by box distance
+        """
+        points = np.asarray(points, dtype=float).reshape((-1, 3))
+        if self.num_leaves == 0:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int), np.zeros(0)
+        corners = np.array([net[[0, 0, -1, -1], [0, -1, 0, -1]] for net in self.control_nets])
+        corners = (corners[..., :3] / corners[..., 3:]).reshape((-1, 3))
+        upper, _ = cKDTree(corners).query(points)
+
+        def box_distance(query: np.ndarray, node_min: np.ndarray, node_max: np.ndarray) -> np.ndarray:
+            p = points[query]
+            return np.linalg.norm(p - np.clip(p, node_min, node_max), axis=1)
+
+        def within_bound(query: np.ndarray, node_min: np.ndarray, node_max: np.ndarray) -> np.ndarray:
+            return box_distance(query, node_min, node_max) <= upper[query] * (1.0 + 1e-9)
+
+        point, leaf = self._traverse(points.shape[0], within_bound)
+        distance = box_distance(point, self.box_min[leaf], self.box_max[leaf])
+        order = np.lexsort((distance, point))
+        return point[order], leaf[order], distance[order]
+
+    def query_overlapping_leaves(self, other: "SurfaceBVH" = None, tol: float = 0.0,
+                                 same_surface: bool = False) -> (np.ndarray, np.ndarray):
+        r"""
+        Finds the pairs of leaf patches whose bounding boxes overlap, either between this hierarchy and another
+        one or (if ``other`` is not specified) within this hierarchy. This is the broad phase of surface-surface
+        intersection and clash queries.
+
+        Parameters
+        ----------
+        other: SurfaceBVH
+            Other hierarchy. If not specified, overlapping pairs of distinct leaves of this hierarchy are found.
+            Default: ``None``
+        tol: float
+            Clearance below which two boxes are considered to overlap. Default: ``0.0``
+        same_surface: bool
+            Whether to include pairs of leaves belonging to the same surface when searching within this hierarchy.
+            Default: ``False``
+
+        Returns
+        -------
+        numpy.ndarray, numpy.ndarray
+            Indices of the leaves in this hierarchy and of the overlapping leaves in the other hierarchy (or in this
+            hierarchy, with each pair reported once)
+        """
+        source = self if other is None else other
+        other_leaf, leaf = self.query_boxes(source.box_min, source.box_max, tol=tol)
+        if other is None:
+            keep = leaf < other_leaf
+            if not same_surface:
+                keep &= self.surface_index[leaf] != self.surface_index[other_leaf]
+            leaf, other_leaf = leaf[keep], other_leaf[keep]
+        order = np.lexsort((other_leaf, leaf))
+        return leaf[order], other_leaf[order]
@@ -0,0 +1,1125 @@
+"""
+Simultaneous continuity enforcement and continuity auditing across networks of surfaces
+"""
+import inspect
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.optimize import OptimizeResult
+from scipy.sparse import coo_matrix, csr_matrix, diags, eye, kron
+from scipy.sparse.linalg import splu
+
+from aerocaps.geom import Surface
+from aerocaps.geom.curvature import SurfaceCurvatureData
+from aerocaps.geom.surfaces import BezierSurface, SurfaceEdge
+
+__all__ = [
+    "SharedEdge",
+    "enforce_network_continuity",
+    "ContinuityAuditReport",
+    "audit_continuity",
+    "enforce_multiface_parallel",
+    "ContinuityTracker"
+]
+
+
+class SharedEdge:
+    """Boundary shared by two surfaces of a patch network along with the continuity required across it"""
+    def __init__(self,
+                 surface_a: str,
+                 edge_a: SurfaceEdge,
+                 surface_b: str,
+                 edge_b: SurfaceEdge,
+                 continuity: int = 1,
+                 reverse: bool = False,
+                 f_initial: float = 1.0):
+        r"""
+        Boundary shared by two surfaces. For Bézier surfaces, the control points along ``edge_a`` of ``surface_a`` and
+        ``edge_b`` of ``surface_b`` coincide, in the same order if ``reverse`` is ``False`` and in opposite order
+        otherwise. For continuity of order :math:`l \geq 1`, the :math:`l`-th cross-derivatives of the two surfaces
+        along the boundary satisfy
+
+        .. math::
+
+            \frac{\partial^l \mathbf{S}^a}{\partial \mu_a^l} = \left( \frac{f_{\text{sgn}}}{f} \right)^l
+            \frac{\partial^l \mathbf{S}^b}{\partial \mu_b^l}
+
+        where :math:`f` is the tangent proportionality factor of the boundary and :math:`f_{\text{sgn}}` is the sign
+        given by :obj:`~aerocaps.geom.surfaces.BezierSurface._evaluate_f_sign`.
+
+        Parameters
+        ----------
+        surface_a: str
+            Name of the first surface
+        edge_a: SurfaceEdge
+            Edge of the first surface
+        surface_b: str
+            Name of the second surface
+        edge_b: SurfaceEdge
+            Edge of the second surface
+        continuity: int
+            Order of geometric continuity required across the boundary: ``0`` (:math:`G^0`), ``1`` (:math:`G^1`),
+            or ``2`` (:math:`G^2`). Default: ``1``
+        reverse: bool
+            Whether the two edges run in opposite parametric directions. Default: ``False``
+        f_initial: float
+            Initial value of the tangent proportionality factor. Default: ``1.0``
+        """
+        if continuity not in (0, 1, 2):
+            raise ValueError(f"Invalid continuity order {continuity}. Must be 0, 1, or 2")
+        self.surface_a = surface_a
+        self.edge_a = edge_a
+        self.surface_b = surface_b
+        self.edge_b = edge_b
+        self.continuity = continuity
+        self.reverse = reverse
+        self.f_initial = f_initial
+
+    @property
+    def f_sign(self) -> float:
+        """Sign of the tangent proportionality factor across the boundary"""
+        return BezierSurface._evaluate_f_sign(self.edge_a, self.edge_b)
+
+    def swapped(self) -> "SharedEdge":
+        """
+        Gets the same shared edge seen from the second surface. The tangent proportionality factor is inverted so that
+        the continuity condition is unchanged.
+
+        Returns
+        -------
+        SharedEdge
+            Shared edge with the roles of the two surfaces exchanged
+        """
+        return SharedEdge(self.surface_b, self.edge_b, self.surface_a, self.edge_a, continuity=self.continuity,
+                          reverse=self.reverse, f_initial=1.0 / self.f_initial)
+
+    def __repr__(self):
+        return (f"SharedEdge({self.surface_a}.{self.edge_a.name} <-> {self.surface_b}.{self.edge_b.name}, "
+                f"G{self.continuity}{', reversed' if self.reverse else ''})")
+
+
+def _edge_point_ijs(surf: BezierSurface, edge: SurfaceEdge, max_continuity_index: int,
+                    reverse: bool = False) -> typing.List[typing.Tuple[int, int]]:
+    """
+    Gets the :math:`(i,j)`-indices of the rows of control points along an edge, ordered by continuity index and then
+    by row index (in reverse if ``reverse`` is ``True``)
+    """
+    n_parallel = surf.get_parallel_n_points(edge)
+    row_indices = range(n_parallel - 1, -1, -1) if reverse else range(n_parallel)
+    return [surf.get_point_ij(row_index, continuity_index, edge)
+            for continuity_index in range(max_continuity_index + 1) for row_index in row_indices]
+
+
+class _ContinuityNetwork:
+    """
+    Continuity residuals of a network of Bézier surfaces expressed in terms of the free control points. The control
+    points tied together by :math:`G^0` continuity are merged into a single unknown, so :math:`G^0` continuity is
+    exact by construction, and the cross-derivatives along each shared edge are linear in the unknowns.
+    """
+    def __init__(self, surfaces: typing.Dict[str, BezierSurface], shared_edges: typing.List[SharedEdge],
+                 fixed: typing.Iterable[str] = (), n_deriv_points: int = 10,
+                 fixed_points: typing.Iterable[typing.Tuple[str, int, int]] = ()):
+        fixed, fixed_points = set(fixed), set(fixed_points)
+        self.surfaces = surfaces
+        self.shared_edges = shared_edges
+        self.n_deriv_points = n_deriv_points
+
+        # Index every control point that influences a continuity condition
+        point_index = {}
+        keys = []
+
+        def index_points(name: str, ijs: typing.List[typing.Tuple[int, int]]) -> np.ndarray:
+            for ij in ijs:
+                if (name, *ij) not in point_index:
+                    point_index[(name, *ij)] = len(keys)
+                    keys.append((name, *ij))
+            return np.array([point_index[(name, *ij)] for ij in ijs])
+
+        g0_pairs = []
+        edge_columns = []
+        for shared_edge in shared_edges:
+            surf_a, surf_b = self._get_surface(shared_edge.surface_a), self._get_surface(shared_edge.surface_b)
+            degree_a = surf_a.get_parallel_degree(shared_edge.edge_a)
+            degree_b = surf_b.get_parallel_degree(shared_edge.edge_b)
+            if degree_a != degree_b:
+                raise ValueError(f"Degree parallel to the edge of surface '{shared_edge.surface_a}' ({degree_a}) does "
+                                 f"not match the degree parallel to the edge of surface '{shared_edge.surface_b}' "
+                                 f"({degree_b}) for {shared_edge}")
+            ijs_a = _edge_point_ijs(surf_a, shared_edge.edge_a, shared_edge.continuity)
+            ijs_b = _edge_point_ijs(surf_b, shared_edge.edge_b, shared_edge.continuity, reverse=shared_edge.reverse)
+            cols_a, cols_b = index_points(shared_edge.surface_a, ijs_a), index_points(shared_edge.surface_b, ijs_b)
+            g0_pairs.append(np.column_stack((cols_a[:degree_a + 1], cols_b[:degree_a + 1])))
+            edge_columns.append((ijs_a, cols_a, ijs_b, cols_b))
+        self.keys = keys
+        self.points = np.array([self.surfaces[name].get_control_point_array()[i, j] for name, i, j in keys])
+        is_fixed = np.array([key[0] in fixed or key in fixed_points for key in keys], dtype=bool)
+
+        # Merge the points tied together by G0 continuity (union-find with path halving)
+        parent = np.arange(len(keys))
+
+        def find(idx: int) -> int:
+            while parent[idx] != idx:
+                parent[idx] = parent[parent[idx]]
+                idx = parent[idx]
+            return idx
+
+        for idx_a, idx_b in np.concatenate(g0_pairs) if g0_pairs else []:
+            root_a, root_b = find(idx_a), find(idx_b)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+        roots = np.array([find(idx) for idx in range(len(keys))], dtype=int)
+
+        # Groups with a fixed member take the average of their fixed members and are not unknowns. The unknowns are
+        # initialized with the average of their members, so the points are expressed as X = S @ Y + X_const
+        group_has_fixed = np.zeros(len(keys), dtype=bool)
+        np.logical_or.at(group_has_fixed, roots, is_fixed)
+        self.free_groups = np.unique(roots[~group_has_fixed[roots]])
+        group_to_unknown = np.full(len(keys), -1)
+        group_to_unknown[self.free_groups] = np.arange(self.free_groups.shape[0])
+        self.is_free = ~is_fixed
+        self.unknown_of_point = group_to_unknown[roots]
+        members = self.is_free & (self.unknown_of_point >= 0)
+        self.selection = csr_matrix((np.ones(np.count_nonzero(members)), (np.flatnonzero(members),
+                                     self.unknown_of_point[members])), shape=(len(keys), self.free_groups.shape[0]))
+        counts = np.asarray(self.selection.sum(axis=0)).ravel()
+        self.unknowns_initial = (self.selection.T @ self.points) / counts[:, np.newaxis]
+        self.constant = np.where(self.is_free[:, np.newaxis], 0.0, self.points)
+        fixed_sums, fixed_counts = np.zeros((len(keys), 3)), np.zeros(len(keys))
+        np.add.at(fixed_sums, roots[is_fixed], self.points[is_fixed])
+        np.add.at(fixed_counts, roots[is_fixed], 1.0)
+        tied_to_fixed = self.is_free & group_has_fixed[roots]
+        self.constant[tied_to_fixed] = fixed_sums[roots[tied_to_fixed]] / fixed_counts[roots[tied_to_fixed],
+                                                                                          np.newaxis]
+
+        # Cross-derivative sensitivity matrices of every derivative order along every shared edge, stacked so that
+        # the residual rows are S_a @ X - c * (S_b @ X), where c depends on the factor, order, and sign of each row
+        self.factor_edges = [edge_idx for edge_idx, shared_edge in enumerate(shared_edges)
+                             if shared_edge.continuity > 0]
+        sens_a_coo, sens_b_coo, row_data = [], [], []
+        n_rows = 0
+        for factor_idx, edge_idx in enumerate(self.factor_edges):
+            shared_edge = shared_edges[edge_idx]
+            ijs_a, cols_a, ijs_b, cols_b = edge_columns[edge_idx]
+            surf_a, surf_b = self._get_surface(shared_edge.surface_a), self._get_surface(shared_edge.surface_b)
+            for order in range(1, shared_edge.continuity + 1):
+                get_sens_a = surf_a.get_first_deriv_cp_sens_matrix if order == 1 else \
+                    surf_a.get_second_deriv_cp_sens_matrix
+                get_sens_b = surf_b.get_first_deriv_cp_sens_matrix if order == 1 else \
+                    surf_b.get_second_deriv_cp_sens_matrix
+                sens_a = coo_matrix(get_sens_a(shared_edge.edge_a, ijs_a, n_points=n_deriv_points))
+                sens_b = coo_matrix(get_sens_b(shared_edge.edge_b, ijs_b, n_points=n_deriv_points))
+                rows_b = n_deriv_points - 1 - sens_b.row if shared_edge.reverse else sens_b.row
+                sens_a_coo.append((sens_a.data, n_rows + sens_a.row, cols_a[sens_a.col]))
+                sens_b_coo.append((sens_b.data, n_rows + rows_b, cols_b[sens_b.col]))
+                row_data.append(np.tile([[factor_idx, order, shared_edge.f_sign ** order]], (n_deriv_points, 1)))
+                n_rows += n_deriv_points
+        self.sens_a, self.sens_b = [
+            csr_matrix((np.concatenate([c[0] for c in coo] or [[]]), (np.concatenate([c[1] for c in coo] or [[]]),
+                        np.concatenate([c[2] for c in coo] or [[]]))), shape=(n_rows, len(keys)))
+            for coo in (sens_a_coo, sens_b_coo)
+        ]
+        row_data = np.concatenate(row_data) if row_data else np.zeros((0, 3))
+        self.row_factor, self.row_order, self.row_sign = row_data[:, 0].astype(int), row_data[:, 1], row_data[:, 2]
+        self.factors_initial = np.array([shared_edges[edge_idx].f_initial for edge_idx in self.factor_edges],
+                                        dtype=float)
+
+    def _get_surface(self, name: str) -> BezierSurface:
+        if name not in self.surfaces:
+            raise ValueError(f"No surface named '{name}' in the network")
+        surf = self.surfaces[name]
+        if not isinstance(surf, BezierSurface):
+            raise ValueError(f"Network continuity enforcement requires Bézier surfaces, but '{name}' is a "
+                             f"{type(surf).__name__}")
+        return surf
+
+    def points_from_unknowns(self, unknowns: np.ndarray) -> np.ndarray:
+        """Positions of the network points given the unknowns"""
+        return self.selection @ unknowns + self.constant
+
+    def residuals(self, unknowns: np.ndarray, g: np.ndarray) -> np.ndarray:
+        r"""
+        Stacked cross-derivative continuity residuals
+        :math:`\mathbf{S}^{a(l)} - (f_{\text{sgn}} g)^l \mathbf{S}^{b(l)}`, where :math:`g = 1/f`, of size
+        :math:`N_r \times 3`
+        """
+        X = self.points_from_unknowns(unknowns)
+        scale = self.row_sign * g[self.row_factor] ** self.row_order
+        return self.sens_a @ X - scale[:, np.newaxis] * (self.sens_b @ X)
+
+    def jacobian(self, unknowns: np.ndarray, g: np.ndarray) -> (csr_matrix, csr_matrix):
+        r"""
+        Jacobian of the residuals. The residuals depend on the three coordinates of the unknowns in the same way, so
+        the Jacobian with respect to the unknowns is returned as a matrix of size :math:`N_r \times N_y` that applies
+        to each coordinate. The Jacobian of the flattened residuals with respect to the inverse tangent
+        proportionality factors is returned as a matrix of size :math:`3 N_r \times N_f`.
+        """
+        X = self.points_from_unknowns(unknowns)
+        g_rows = g[self.row_factor]
+        d_unknowns = ((self.sens_a - diags(self.row_sign * g_rows ** self.row_order) @ self.sens_b) @
+                      self.selection).tocsr()
+        d_g = -(self.row_sign * self.row_order * g_rows ** (self.row_order - 1))[:, np.newaxis] * (self.sens_b @ X)
+        d_factors = csr_matrix((d_g.flatten(), (np.arange(d_g.size), np.repeat(self.row_factor, 3))),
+                               shape=(d_g.size, len(self.factor_edges)))
+        return d_unknowns, d_factors
+
+    def apply(self, unknowns: np.ndarray):
+        """Writes the free points back to the control points of their surfaces"""
+        X = self.points_from_unknowns(unknowns)
+        names = np.array([name for name, _, _ in self.keys], dtype=object)
+        for name in np.unique(names[self.is_free]):
+            mask = (names == name) & self.is_free
+            surf = self.surfaces[name]
+            P = surf.get_control_point_array()
+            i, j = np.array([self.keys[idx][1:] for idx in np.flatnonzero(mask)]).T
+            P[i, j] = X[mask]
+            surf.points = P
+
+
+def _gauss_newton_step(d_unknowns: csr_matrix, d_factors: csr_matrix or None, residual: np.ndarray,
+                       regularization: float = 1e-10, chunk_size: int = 64) -> (np.ndarray, np.ndarray):
+    r"""
+    Solves the regularized linearized problem
+    :math:`\min \lVert \mathbf{r} + \mathbf{J}_y \Delta y + \mathbf{J}_g \Delta g \rVert^2 + \lambda \left(
+    \lVert \Delta y \rVert^2 + \lVert \Delta g \rVert^2 \right)` through its normal equations, where
+    :math:`\lambda` is ``regularization`` times the largest diagonal entry of the normal matrix. The regularization
+    makes the normal equations non-singular (the residuals sampled along each edge are redundant, and many unknowns
+    are not constrained in every direction) and leaves the unconstrained components of the correction at zero.
+
+    The block of the normal matrix associated with the unknown control points is the same for each coordinate, so
+    only one sparse factorization of size :math:`N_y` is needed. The factors are eliminated through their Schur
+    complement, which is small because each factor only appears in the residuals of its own edge.
+    """
+    normal = (d_unknowns.T @ d_unknowns).tocsc()
+    damping = regularization * max(normal.diagonal().max(initial=0.0), 1.0)
+    lu = splu(normal + damping * eye(normal.shape[0], format="csc"))
+    rhs_unknowns = -(d_unknowns.T @ residual)
+    if d_factors is None:
+        return lu.solve(rhs_unknowns), np.zeros(0)
+
+    # Coupling block between the unknowns and the factors, with each column reshaped to N_y x 3
+    n_unknowns, n_factors = normal.shape[0], d_factors.shape[1]
+    coupling = (kron(d_unknowns, eye(3), format="csr").T @ d_factors).tocsc()
+    schur = (d_factors.T @ d_factors).toarray() + damping * np.eye(n_factors)
+    for start in range(0, n_factors, chunk_size):
+        block = coupling[:, start:start + chunk_size].toarray()
+        solved = lu.solve(block.reshape((n_unknowns, -1))).reshape(block.shape)
+        schur[:, start:start + chunk_size] -= coupling.T @ solved
+    rhs_factors = -(d_factors.T @ residual.flatten())
+    step_factors = np.linalg.solve(schur, rhs_factors - coupling.T @ lu.solve(rhs_unknowns).flatten())
+    step_unknowns = lu.solve(rhs_unknowns - (coupling @ step_factors).reshape((n_unknowns, 3)))
+    return step_unknowns, step_factors
+
+
+def enforce_network_continuity(surfaces: typing.Dict[str, BezierSurface],
+                               shared_edges: typing.List[SharedEdge],
+                               fixed: typing.Iterable[str] = (),
+                               n_deriv_points: int = 10,
+                               solve_factors: bool = True,
+                               max_iterations: int = 20,
+                               tol: float = 1e-12,
+                               fixed_points: typing.Iterable[typing.Tuple[str, int, int]] = ()) -> OptimizeResult:
+    r"""
+    Enforces :math:`G^0`, :math:`G^1`, and :math:`G^2` continuity across every shared edge of a network of Bézier
+    surfaces simultaneously. Unlike :obj:`~aerocaps.geom.surfaces.BezierSurface.enforce_g0g1_multiface` and
+    related methods, which modify one surface at a time against fixed neighbors, all the free control points and
+    tangent proportionality factors of the network are solved for in a single sparse problem, so the result does not
+    depend on the order of the shared edges.
+
+    The control points along each shared edge are merged into a single unknown (initialized with their average),
+    so :math:`G^0` continuity holds exactly. The cross-derivative residuals of every :math:`G^1` and :math:`G^2`
+    edge (see :obj:`~aerocaps.geom.continuity.SharedEdge`) are evaluated at ``n_deriv_points`` locations and
+    minimized with Gauss-Newton iterations. Each iteration solves the sparse linearized problem for a slightly
+    regularized least-squares correction, so control points that do not need to move stay where they are. If
+    ``solve_factors`` is ``False``, the factors are kept at their initial values and the residuals are linear in the
+    control points, so the iterations only remove the small bias due to the regularization.
+
+    .. code-block:: python
+
+        shared_edges = [
+            SharedEdge("wing_upper_1", SurfaceEdge.u1, "wing_upper_2", SurfaceEdge.u0, continuity=2),
+            SharedEdge("wing_upper_1", SurfaceEdge.v0, "wing_lower_1", SurfaceEdge.v0, continuity=1),
+        ]
+        res = enforce_network_continuity(surfaces, shared_edges, fixed=["fuselage_1"])
+
+    Parameters
+    ----------
+    surfaces: typing.Dict[str, BezierSurface]
+        Surfaces of the network by name. Only the control points in the first :math:`l+1` rows along each shared
+        edge with continuity of order :math:`l` are modified, in place
+    shared_edges: typing.List[SharedEdge]
+        Shared edges of the network and the continuity required across each of them
+    fixed: typing.Iterable[str]
+        Names of the surfaces whose control points must not be modified. Default: ``()``
+    n_deriv_points: int
+        Number of locations along each shared edge where the cross-derivatives are compared. Default: ``10``
+    solve_factors: bool
+        Whether the tangent proportionality factors are solved for along with the control points. Default: ``True``
+    max_iterations: int
+        Maximum number of Gauss-Newton iterations. Default: ``20``
+    tol: float
+        Convergence tolerance on the norm of the correction relative to the norm of the unknowns. Default: ``1e-12``
+    fixed_points: typing.Iterable[typing.Tuple[str, int, int]]
+        Individual control points that must not be modified, each given by the name of its surface and its
+        :math:`(i,j)`-index. Default: ``()``
+
+    Returns
+    -------
+    OptimizeResult
+        Solution, with the flattened unknown control points followed by the tangent proportionality factors of the
+        :math:`G^1` and :math:`G^2` edges in ``x``, the sum of the squares of the residuals in ``fun``, the number of
+        iterations in ``nit``, and the tangent proportionality factor of every shared edge (in the order of
+        ``shared_edges``, with the initial value for :math:`G^0` edges) in ``factors``
+    """
+    network = _ContinuityNetwork(surfaces, shared_edges, fixed=fixed, n_deriv_points=n_deriv_points,
+                                 fixed_points=fixed_points)
+    unknowns = network.unknowns_initial.copy()
+    g = 1.0 / network.factors_initial
+
+    success = True
+    iteration = 0
+    if network.row_factor.shape[0] > 0 and unknowns.size > 0:
+        success = False
+        for iteration in range(1, max_iterations + 1):
+            d_unknowns, d_factors = network.jacobian(unknowns, g)
+            step_unknowns, step_factors = _gauss_newton_step(d_unknowns, d_factors if solve_factors else None,
+                                                             network.residuals(unknowns, g))
+            unknowns = unknowns + step_unknowns
+            g = g + step_factors if solve_factors else g
+            step_norm = np.sqrt(np.sum(step_unknowns ** 2) + np.sum(step_factors ** 2))
+            if step_norm <= tol * max(np.linalg.norm(unknowns) + np.linalg.norm(g), 1.0):
+                success = True
+                break
+
+    network.apply(unknowns)
+    factors = np.array([shared_edge.f_initial for shared_edge in shared_edges], dtype=float)
+    factors[network.factor_edges] = 1.0 / g
+    return OptimizeResult(
+        x=np.concatenate((unknowns.flatten(), 1.0 / g)), fun=float(np.sum(network.residuals(unknowns, g) ** 2)),
+        nit=iteration, success=success, status=0 if success else 1, factors=factors,
+        message="Converged" if success else "Maximum number of iterations reached"
+    )
+
+
+def _edge_uv(edge: SurfaceEdge, t: np.ndarray) -> np.ndarray:
+    r"""Parameter pairs along an edge of a surface at parameter values ``t`` along the edge (size :math:`N \times 2`)"""
+    constant = np.full_like(t, 0.0 if edge in (SurfaceEdge.u0, SurfaceEdge.v0) else 1.0)
+    return np.column_stack((constant, t) if edge in (SurfaceEdge.u0, SurfaceEdge.u1) else (t, constant))
+
+
+def _edge_direction_sign(edge: SurfaceEdge) -> float:
+    """Sign of the direction of increasing parameter along an edge relative to the counterclockwise boundary loop"""
+    return 1.0 if edge in (SurfaceEdge.v0, SurfaceEdge.u1) else -1.0
+
+
+class ContinuityAuditReport:
+    """Continuity errors sampled along every shared edge of a patch network"""
+
+    metrics = ("gap", "angle", "curvature_mismatch")
+
+    def __init__(self,
+                 shared_edges: typing.List[SharedEdge],
+                 t: np.ndarray,
+                 points: np.ndarray,
+                 gap: np.ndarray,
+                 angle: np.ndarray,
+                 curvature_mismatch: np.ndarray):
+        r"""
+        Continuity errors sampled at the same :math:`N` parameter values along each of :math:`N_e` shared edges. Each
+        error array has size :math:`N_e \times N`, and the values are ``nan`` where a surface is degenerate.
+
+        Parameters
+        ----------
+        shared_edges: typing.List[SharedEdge]
+            Audited shared edges
+        t: numpy.ndarray
+            Parameter values of the samples along the edges of the first surfaces
+        points: numpy.ndarray
+            Sample points on the first surfaces (size :math:`N_e \times N \times 3`)
+        gap: numpy.ndarray
+            Distance between the two surfaces (:math:`G^0` error)
+        angle: numpy.ndarray
+            Angle in radians between the unit normals of the two surfaces, oriented consistently across the edge
+            (:math:`G^1` error)
+        curvature_mismatch: numpy.ndarray
+            Absolute difference between the normal curvatures of the two surfaces in the direction perpendicular to
+            the edge in the tangent plane of the first surface (:math:`G^2` error)
+        """
+        self.shared_edges = shared_edges
+        self.t = t
+        self.points = points
+        self.gap = gap
+        self.angle = angle
+        self.curvature_mismatch = curvature_mismatch
+
+    def max(self, metric: str) -> np.ndarray:
+        """
+        Maximum of a continuity error along each edge
+
+        Parameters
+        ----------
+        metric: str
+            One of :obj:`~aerocaps.geom.continuity.ContinuityAuditReport.metrics`
+
+        Returns
+        -------
+        numpy.ndarray
+            Maximum error of each edge, ignoring ``nan`` values
+        """
+        return np.nanmax(self._get_metric(metric), axis=1)
+
+    def rms(self, metric: str) -> np.ndarray:
+        """
+        Root-mean-square value of a continuity error along each edge
+
+        Parameters
+        ----------
+        metric: str
+            One of :obj:`~aerocaps.geom.continuity.ContinuityAuditReport.metrics`
+
+        Returns
+        -------
+        numpy.ndarray
+            RMS error of each edge, ignoring ``nan`` values
+        """
+        return np.sqrt(np.nanmean(self._get_metric(metric) ** 2, axis=1))
+
+    def worst_parameter(self, metric: str) -> np.ndarray:
+        """
+        Parameter value along the edge of the first surface where a continuity error is largest
+
+        Parameters
+        ----------
+        metric: str
+            One of :obj:`~aerocaps.geom.continuity.ContinuityAuditReport.metrics`
+
+        Returns
+        -------
+        numpy.ndarray
+            Parameter value of the worst sample of each edge
+        """
+        return self.t[self._worst_index(metric)]
+
+    def worst_location(self, metric: str) -> np.ndarray:
+        r"""
+        Point on the first surface where a continuity error is largest
+
+        Parameters
+        ----------
+        metric: str
+            One of :obj:`~aerocaps.geom.continuity.ContinuityAuditReport.metrics`
+
+        Returns
+        -------
+        numpy.ndarray
+            Worst sample point of each edge, of size :math:`N_e \times 3`
+        """
+        return self.points[np.arange(len(self.shared_edges)), self._worst_index(metric)]
+
+    def failures(self, gap_tol: float = 1e-6, angle_tol: float = 1e-4, curvature_tol: float = 1e-3) -> typing.List[int]:
+        """
+        Finds the edges whose errors exceed the tolerances. Only the errors up to the order of continuity required
+        across each edge are checked, and samples where a surface is degenerate are ignored.
+
+        Parameters
+        ----------
+        gap_tol: float
+            Maximum distance between the surfaces. Default: ``1e-6``
+        angle_tol: float
+            Maximum angle in radians between the normals of edges requiring :math:`G^1` or :math:`G^2`
+            continuity. Default: ``1e-4``
+        curvature_tol: float
+            Maximum normal curvature mismatch of edges requiring :math:`G^2` continuity. Default: ``1e-3``
+
+        Returns
+        -------
+        typing.List[int]
+            Indices of the failing edges in ``shared_edges``
+        """
+        continuity = np.array([shared_edge.continuity for shared_edge in self.shared_edges])
+        with np.errstate(invalid="ignore"):
+            failed = (np.nanmax(self.gap, axis=1, initial=0.0) > gap_tol) | \
+                     ((continuity >= 1) & (np.nanmax(self.angle, axis=1, initial=0.0) > angle_tol)) | \
+                     ((continuity >= 2) & (np.nanmax(self.curvature_mismatch, axis=1, initial=0.0) > curvature_tol))
+        return np.flatnonzero(failed).tolist()
+
+    def summary(self) -> typing.List[dict]:
+        """
+        Summarizes the report with one row per edge
+
+        Returns
+        -------
+        typing.List[dict]
+            The shared edge along with the maximum, RMS, worst parameter value, and worst location of every metric
+        """
+        columns = {}
+        for metric in self.metrics:
+            columns[f"{metric}_max"] = self.max(metric)
+            columns[f"{metric}_rms"] = self.rms(metric)
+            columns[f"{metric}_worst_t"] = self.worst_parameter(metric)
+            columns[f"{metric}_worst_location"] = self.worst_location(metric)
+        return [{"shared_edge": shared_edge, **{key: value[edge_idx] for key, value in columns.items()}}
+                for edge_idx, shared_edge in enumerate(self.shared_edges)]
+
+    def _get_metric(self, metric: str) -> np.ndarray:
+        if metric not in self.metrics:
+            raise ValueError(f"Invalid metric '{metric}'. Must be one of {self.metrics}")
+        return getattr(self, metric)
+
+    def _worst_index(self, metric: str) -> np.ndarray:
+        return np.argmax(np.nan_to_num(self._get_metric(metric), nan=-np.inf), axis=1)
+
+
+def audit_continuity(surfaces: typing.Dict[str, Surface],
+                     shared_edges: typing.List[SharedEdge],
+                     n_samples: int = 20) -> ContinuityAuditReport:
+    r"""
+    Measures the positional gap, the angle between the normals, and the normal curvature mismatch at ``n_samples``
+    evenly-spaced locations along every shared edge of a patch network. Unlike the ``verify_g0``, ``verify_g1``, and
+    ``verify_g2`` methods of the surface classes, every error is computed (vectorized over all the edges, with one
+    derivative evaluation per surface) and returned instead of asserted.
+
+    The normal of the second surface is flipped if the two surfaces are oriented inconsistently, which is the case if
+    their counterclockwise boundary loops traverse the shared edge in the same direction. The normal curvature of each
+    surface is evaluated in the direction :math:`\hat{\mathbf{n}}^a \times \mathbf{T}^a`, where :math:`\mathbf{T}^a`
+    is the tangent along the edge of the first surface.
+
+    .. code-block:: python
+
+        report = audit_continuity(graph.surfaces, graph.shared_edges)
+        for row in report.summary():
+            print(row["shared_edge"], row["gap_max"], np.degrees(row["angle_max"]))
+
+    Parameters
+    ----------
+    surfaces: typing.Dict[str, Surface]
+        Bézier, rational Bézier, B-spline, or NURBS surfaces of the network by name
+    shared_edges: typing.List[SharedEdge]
+        Shared edges to audit
+    n_samples: int
+        Number of samples along each edge. Default: ``20``
+
+    Returns
+    -------
+    ContinuityAuditReport
+        Errors at every sample of every edge
+    """
+    t = np.linspace(0.0, 1.0, n_samples)
+    n_edges = len(shared_edges)
+
+    # Evaluate each surface once at the samples along all of its shared edges
+    requests = {}
+    for edge_idx, shared_edge in enumerate(shared_edges):
+        requests.setdefault(shared_edge.surface_a, []).append((edge_idx, 0, _edge_uv(shared_edge.edge_a, t)))
+        t_b = t[::-1] if shared_edge.reverse else t
+        requests.setdefault(shared_edge.surface_b, []).append((edge_idx, 1, _edge_uv(shared_edge.edge_b, t_b)))
+    fields = ("S", "Su", "Sv", "normal", "E", "F", "G", "L", "M", "N")
+    data = {field: [np.zeros((n_edges, n_samples, 3)) if field in ("S", "Su", "Sv", "normal") else
+                    np.zeros((n_edges, n_samples)) for _ in range(2)] for field in fields}
+    for name, surface_requests in requests.items():
+        if name not in surfaces:
+            raise ValueError(f"No surface named '{name}' in the network")
+        derivs = surfaces[name].evaluate_derivatives_pairs(np.concatenate([uv for _, _, uv in surface_requests]))
+        curvature = SurfaceCurvatureData.from_derivatives(derivs)
+        values = {"S": derivs.S, "Su": derivs.Su, "Sv": derivs.Sv,
+                  **{field: getattr(curvature, field) for field in fields[3:]}}
+        for request_idx, (edge_idx, side, _) in enumerate(surface_requests):
+            rows = slice(request_idx * n_samples, (request_idx + 1) * n_samples)
+            for field in fields:
+                data[field][side][edge_idx] = values[field][rows]
+
+    # Orientation of the second normal relative to the first
+    orientation = np.array([
+        -_edge_direction_sign(shared_edge.edge_a) * _edge_direction_sign(shared_edge.edge_b) *
+        (-1.0 if shared_edge.reverse else 1.0) for shared_edge in shared_edges
+    ]).reshape((n_edges, 1))
+
+    gap = np.linalg.norm(data["S"][0] - data["S"][1], axis=2)
+    normal_a, normal_b = data["normal"][0], orientation[..., np.newaxis] * data["normal"][1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        angle = np.arccos(np.clip(np.einsum("...i,...i->...", normal_a, normal_b), -1.0, 1.0))
+
+        # Normal curvature of each side in the direction perpendicular to the edge
+        along_u = np.array([shared_edge.edge_a in (SurfaceEdge.v0, SurfaceEdge.v1) for shared_edge in shared_edges])
+        tangent = np.where(along_u[:, np.newaxis, np.newaxis], data["Su"][0], data["Sv"][0])
+        direction = np.cross(normal_a, tangent)
+        normal_curvatures = []
+        for side in range(2):
+            E, F, G = data["E"][side], data["F"][side], data["G"][side]
+            a = np.einsum("...i,...i->...", data["Su"][side], direction)
+            b = np.einsum("...i,...i->...", data["Sv"][side], direction)
+            determinant = E * G - F ** 2
+            du, dv = (G * a - F * b) / determinant, (E * b - F * a) / determinant
+            normal_curvatures.append(
+                (data["L"][side] * du ** 2 + 2.0 * data["M"][side] * du * dv + data["N"][side] * dv ** 2) /
+                (E * du ** 2 + 2.0 * F * du * dv + G * dv ** 2)
+            )
+        curvature_mismatch = np.abs(normal_curvatures[0] - orientation * normal_curvatures[1])
+
+    return ContinuityAuditReport(shared_edges, t, data["S"][0], gap, angle, curvature_mismatch)
+
+
+def _enforce_multiface_worker(method_name: str, target: np.ndarray,
+                              neighbors: typing.Dict[str, typing.Tuple[np.ndarray, str, float]],
+                              kwargs: dict) -> (np.ndarray, OptimizeResult):
+    """
+    Runs a multi-face continuity method on a surface rebuilt from arrays, so that only arrays are sent to and
+    from the worker processes
+
+    Parameters
+    ----------
+    method_name: str
+        Name of the method of :obj:`~aerocaps.geom.surfaces.BezierSurface`
+    target: numpy.ndarray
+        Control points of the surface to modify
+    neighbors: typing.Dict[str, typing.Tuple[numpy.ndarray, str, float]]
+        Control points of the adjacent surface, name of its shared edge, and initial tangent proportionality factor
+        for each shared edge of the surface to modify, by edge name
+    kwargs: dict
+        Additional keyword arguments of the method
+
+    Returns
+    -------
+    numpy.ndarray, OptimizeResult
+        Modified control points and result of the method
+    """
+    surf = BezierSurface(target)
+    edge_kwargs = {}
+    for edge_name, (P, other_edge_name, f_initial) in neighbors.items():
+        edge_kwargs[f"adjacent_surf_{edge_name}"] = BezierSurface(P)
+        edge_kwargs[f"other_edge_{edge_name}"] = SurfaceEdge[other_edge_name]
+        edge_kwargs[f"f_{edge_name}_initial"] = f_initial
+    res = getattr(surf, method_name)(**edge_kwargs, **kwargs)
+    return surf.get_control_point_array(), res
+
+
+def enforce_multiface_parallel(graph: "PatchAdjacencyGraph",
+                               names: typing.Iterable[str] = None,
+                               continuity: int = 1,
+                               n_deriv_points: int = 10,
+                               method: str = "bfgs",
+                               n_f_iterations: int = 0,
+                               num_workers: int = None) -> typing.Dict[str, OptimizeResult]:
+    """
+    Runs :obj:`~aerocaps.geom.surfaces.BezierSurface.enforce_g0g1_multiface` or
+    :obj:`~aerocaps.geom.surfaces.BezierSurface.enforce_g0g1g2_multiface` on many surfaces of a patch network in
+    parallel. Each of these methods modifies one surface and only reads the surfaces sharing an edge with it, so the
+    graph of the surfaces to modify is colored (see :obj:`~aerocaps.geom.topology.PatchAdjacencyGraph.color`) and
+    the surfaces of each color are processed concurrently in a process pool, one color after the other. The result
+    is the same as calling the methods sequentially in order of color.
+
+    Only the control point arrays are sent to the worker processes and back. The modified control points are
+    written back to the surfaces after each color, before the next color (whose surfaces may read them) is started.
+
+    Parameters
+    ----------
+    graph: PatchAdjacencyGraph
+        Adjacency graph of the network, for example from :obj:`~aerocaps.geom.topology.find_shared_edges`
+    names: typing.Iterable[str]
+        Names of the surfaces to modify. If not specified, every Bézier surface with at least one shared edge is
+        modified. Default: ``None``
+    continuity: int
+        ``1`` to call ``enforce_g0g1_multiface`` or ``2`` to call ``enforce_g0g1g2_multiface``. Default: ``1``
+    n_deriv_points: int
+        Number of discrete locations where the continuity error will be evaluated. Default: ``10``
+    method: str
+        Solution method of the multi-face method (``"bfgs"`` or ``"linear"``). Default: ``"bfgs"``
+    n_f_iterations: int
+        Number of tangent proportionality factor updates if ``method`` is ``"linear"``. Default: ``0``
+    num_workers: int
+        Number of processes. If not specified, the number of CPUs is used. If ``1``, the methods are called in the
+        current process. Default: ``None``
+
+    Returns
+    -------
+    typing.Dict[str, OptimizeResult]
+        Result of the method for each modified surface
+    """
+    if continuity not in (1, 2):
+        raise ValueError(f"Invalid continuity order {continuity}. Must be 1 or 2")
+    method_name = "enforce_g0g1_multiface" if continuity == 1 else "enforce_g0g1g2_multiface"
+    if names is None:
+        names = [name for name, surf in graph.surfaces.items()
+                 if isinstance(surf, BezierSurface) and graph.edges_of(name)]
+    colors = graph.color(names)
+    kwargs = dict(n_deriv_points=n_deriv_points, method=method, n_f_iterations=n_f_iterations)
+
+    # The surfaces are rebuilt from their control points in the worker processes, which is only valid for Bézier
+    # surfaces, so every surface is checked before any of them is modified
+    for name in colors:
+        for surf_name in [name] + graph.neighbors(name):
+            if not isinstance(graph.surfaces[surf_name], BezierSurface):
+                raise ValueError(f"Multi-face continuity enforcement requires Bézier surfaces, but '{surf_name}' "
+                                 f"is a {type(graph.surfaces[surf_name]).__name__}")
+
+    def get_job(name: str) -> tuple:
+        multiface_kwargs = graph.multiface_kwargs(name)
+        neighbors = {
+            edge.name: (multiface_kwargs[f"adjacent_surf_{edge.name}"].get_control_point_array(),
+                        multiface_kwargs[f"other_edge_{edge.name}"].name, multiface_kwargs[f"f_{edge.name}_initial"])
+            for edge in SurfaceEdge if f"adjacent_surf_{edge.name}" in multiface_kwargs
+        }
+        return method_name, graph.surfaces[name].get_control_point_array(), neighbors, kwargs
+
+    results = {}
+    num_workers = os.cpu_count() if num_workers is None else num_workers
+    executor = ProcessPoolExecutor(max_workers=num_workers) if num_workers > 1 else None
+    try:
+        for color in range(max(colors.values(), default=-1) + 1):
+            color_names = [name for name in colors if colors[name] == color]
+            jobs = [get_job(name) for name in color_names]
+            if executor is None or len(jobs) == 1:
+                outputs = [_enforce_multiface_worker(*job) for job in jobs]
+            else:
+                outputs = list(executor.map(_enforce_multiface_worker, *zip(*jobs)))
+            for name, (P, res) in zip(color_names, outputs):
+                graph.surfaces[name].points = P
+                results[name] = res
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return {name: results[name] for name in colors}
+
+
+# Continuity order of the rows written by each continuity enforcement method of BezierSurface
+_RELATION_CONTINUITY = {
+    "enforce_g0": 0,
+    "enforce_c0": 0,
+    "enforce_g0g1": 1,
+    "enforce_c0c1": 1,
+    "enforce_g0g1g2": 2,
+    "enforce_c0c1c2": 2,
+    "enforce_g0g1_multiface": 1,
+    "enforce_g0g1g2_multiface": 2
+}
+
+
+class _TrackedRelation:
+    """Call of a continuity enforcement method recorded by a :obj:`~aerocaps.geom.continuity.ContinuityTracker`"""
+    def __init__(self, name: str, method_name: str, arguments: dict,
+                 reads: typing.Set[typing.Tuple[str, int, int]], writes: typing.Set[typing.Tuple[str, int, int]]):
+        self.name = name
+        self.method_name = method_name
+        self.arguments = arguments
+        self.reads = reads
+        self.writes = writes
+        self.result = None
+
+    def call(self, surfaces: typing.Dict[str, BezierSurface]) -> OptimizeResult or None:
+        """
+        Calls the method again. The multi-face methods start from the tangent proportionality factors of their
+        previous result.
+        """
+        arguments = dict(self.arguments)
+        if self.method_name.endswith("_multiface") and self.result is not None:
+            for edge, f in zip((SurfaceEdge.u0, SurfaceEdge.u1, SurfaceEdge.v0, SurfaceEdge.v1), self.result.x[-4:]):
+                arguments[f"f_{edge.name}_initial"] = f
+        self.result = getattr(surfaces[self.name], self.method_name)(**arguments)
+        return self.result
+
+
+class ContinuityTracker:
+    """Continuity relations of a patch network, re-enforced incrementally after local edits"""
+    def __init__(self,
+                 surfaces: typing.Dict[str, BezierSurface],
+                 shared_edges: typing.List[SharedEdge] = (),
+                 fixed: typing.Iterable[str] = (),
+                 n_deriv_points: int = 10,
+                 solve_factors: bool = True,
+                 max_iterations: int = 20,
+                 tol: float = 1e-12):
+        """
+        Continuity relations of a patch network along with the rows of control points each of them depends on.
+        Two kinds of relations are tracked:
+
+        * The shared edges given to the constructor, which are enforced simultaneously with
+          :obj:`~aerocaps.geom.continuity.enforce_network_continuity`
+        * Calls of the continuity enforcement methods of the surfaces (``enforce_c0c1``, ``enforce_g0g1g2``,
+          ``enforce_g0g1_multiface``, etc.) made through :obj:`~aerocaps.geom.continuity.ContinuityTracker.record`
+
+        After an edit, :obj:`~aerocaps.geom.continuity.ContinuityTracker.update` finds the modified control points
+        and only enforces the relations that depend on them again. The affected shared edges are solved first,
+        starting from the tangent proportionality factors of the previous solution. The shared edges that share
+        control points with them are included as constraints with their own control points frozen, so their
+        continuity is preserved. The affected method calls are then repeated in the order in which they were
+        recorded, and the rows they write count as modified for the calls recorded after them. The multi-face
+        methods start from the tangent proportionality factors of their previous result.
+
+        .. code-block:: python
+
+            tracker = ContinuityTracker(surfaces, graph.shared_edges)
+            tracker.enforce()
+            tracker.record("fairing", "enforce_c0c1", surfaces["wing_upper_1"], SurfaceEdge.v0, SurfaceEdge.v1)
+            P = surfaces["wing_upper_1"].get_control_point_array()
+            P[-2, 3] += np.array([0.0, 0.0, 0.01])
+            surfaces["wing_upper_1"].points = P
+            res = tracker.update()
+
+        Parameters
+        ----------
+        surfaces: typing.Dict[str, BezierSurface]
+            Surfaces of the network by name. The degrees of the surfaces must not change after the tracker is
+            created
+        shared_edges: typing.List[SharedEdge]
+            Shared edges of the network and the continuity required across each of them. Default: ``()``
+        fixed: typing.Iterable[str]
+            Names of the surfaces whose control points must not be modified by the solutions of the shared edges.
+            Default: ``()``
+        n_deriv_points: int
+            Number of locations along each shared edge where the cross-derivatives are compared. Default: ``10``
+        solve_factors: bool
+            Whether the tangent proportionality factors are solved for along with the control points.
+            Default: ``True``
+        max_iterations: int
+            Maximum number of Gauss-Newton iterations of each solution. Default: ``20``
+        tol: float
+            Convergence tolerance of each solution. Default: ``1e-12``
+        """
+        self.surfaces = surfaces
+        self.shared_edges = list(shared_edges)
+        self.fixed = set(fixed)
+        self.solver_kwargs = dict(n_deriv_points=n_deriv_points, solve_factors=solve_factors,
+                                  max_iterations=max_iterations, tol=tol)
+        self.factors = np.array([shared_edge.f_initial for shared_edge in self.shared_edges], dtype=float)
+        self.result = None
+        self._names = {id(surf): name for name, surf in self.surfaces.items()}
+        self._relations = []
+
+        # Shared edges depending on each control point
+        self._edge_points = []
+        self._dependents = {}
+        for edge_idx, shared_edge in enumerate(self.shared_edges):
+            keys = self._edge_keys(shared_edge.surface_a, shared_edge.edge_a, shared_edge.continuity)
+            keys += self._edge_keys(shared_edge.surface_b, shared_edge.edge_b, shared_edge.continuity)
+            self._edge_points.append(list(dict.fromkeys(keys)))
+            for key in self._edge_points[-1]:
+                self._dependents.setdefault(key, []).append(edge_idx)
+        self._tracked_points = set(self._dependents)
+
+        # Control points of the tracked surfaces at the last solution, along with the versions of the surfaces for
+        # which every tracked control point of the snapshot is up to date
+        self._snapshot, self._snapshot_versions = {}, {}
+        self._track_surfaces(key[0] for key in self._dependents)
+
+    def _edge_keys(self, name: str, edge: SurfaceEdge, continuity: int) -> typing.List[typing.Tuple[str, int, int]]:
+        if not isinstance(self.surfaces.get(name), BezierSurface):
+            raise ValueError(f"Incremental continuity enforcement requires Bézier surfaces, but '{name}' is "
+                             f"not a Bézier surface in the network")
+        return [(name, *ij) for ij in _edge_point_ijs(self.surfaces[name], edge, continuity)]
+
+    def _track_surfaces(self, names: typing.Iterable[str]):
+        for name in names:
+            if name not in self._snapshot:
+                self._snapshot[name] = self.surfaces[name].get_control_point_array()
+                self._snapshot_versions[name] = self.surfaces[name].version
+
+    def record(self, name: str, method_name: str, *args, **kwargs) -> OptimizeResult or None:
+        """
+        Calls a continuity enforcement method of a surface of the network and records the call, so that it is
+        repeated by :obj:`~aerocaps.geom.continuity.ContinuityTracker.update` whenever the rows of control points it
+        reads (along the edges of the other surfaces) or writes (along the edges of the surface) are modified
+
+        .. code-block:: python
+
+            tracker.record("p10", "enforce_g0g1g2", surfaces["p00"], 1.0, SurfaceEdge.u0, SurfaceEdge.u1)
+            tracker.record("p11", "enforce_g0g1_multiface", **graph.multiface_kwargs("p11"))
+
+        Parameters
+        ----------
+        name: str
+            Name of the surface whose method is called
+        method_name: str
+            Name of the method: ``"enforce_g0"``, ``"enforce_c0"``, ``"enforce_g0g1"``, ``"enforce_c0c1"``,
+            ``"enforce_g0g1g2"``, ``"enforce_c0c1c2"``, ``"enforce_g0g1_multiface"``, or
+            ``"enforce_g0g1g2_multiface"``
+        args
+            Positional arguments of the method. The other surfaces must be surfaces of the network
+        kwargs
+            Keyword arguments of the method
+
+        Returns
+        -------
+        OptimizeResult or None
+            Return value of the method
+        """
+        if method_name not in _RELATION_CONTINUITY:
+            raise ValueError(f"Invalid continuity enforcement method '{method_name}'. Must be one of "
+                             f"{list(_RELATION_CONTINUITY)}")
+        if not isinstance(self.surfaces.get(name), BezierSurface):
+            raise ValueError(f"Incremental continuity enforcement requires Bézier surfaces, but '{name}' is "
+                             f"not a Bézier surface in the network")
+        arguments = inspect.signature(getattr(self.surfaces[name], method_name)).bind(*args, **kwargs).arguments
+        continuity = _RELATION_CONTINUITY[method_name]
+        if method_name.endswith("_multiface"):
+            sides = [(arguments.get(f"adjacent_surf_{edge.name}"), arguments.get(f"other_edge_{edge.name}"), edge)
+                     for edge in SurfaceEdge]
+        else:
+            sides = [(arguments["other"], arguments["other_surface_edge"], arguments["surface_edge"])]
+        reads, writes = set(), set()
+        for other, other_edge, edge in sides:
+            if other is None:
+                continue
+            if id(other) not in self._names:
+                raise ValueError(f"The surfaces adjacent to '{name}' must be surfaces of the network")
+            reads.update(self._edge_keys(self._names[id(other)], other_edge, continuity))
+            writes.update(self._edge_keys(name, edge, continuity))
+        relation = _TrackedRelation(name, method_name, arguments, reads, writes)
+        new_points = (reads | writes) - self._tracked_points
+        self._tracked_points |= new_points
+        self._track_surfaces([name] + [key[0] for key in new_points])
+        self._refresh_snapshot(new_points)
+
+        # Only the rows written by the method are brought up to date, so that earlier edits are still detected
+        up_to_date = self.surfaces[name].version == self._snapshot_versions[name]
+        res = relation.call(self.surfaces)
+        self._relations.append(relation)
+        self._refresh_snapshot(writes, [name] if up_to_date else [])
+        return res
+
+    def enforce(self) -> OptimizeResult:
+        """
+        Enforces continuity across every shared edge of the network, then repeats every recorded method call
+
+        Returns
+        -------
+        OptimizeResult
+            Result of :obj:`~aerocaps.geom.continuity.enforce_network_continuity`, with the indices of the solved
+            shared edges in ``shared_edge_indices`` and the indices of the repeated method calls (in order of
+            recording) in ``relation_indices``
+        """
+        res = self._solve(list(range(len(self.shared_edges))), [], set()) if self.shared_edges else \
+            self._empty_result("No shared edge")
+        for relation in self._relations:
+            relation.call(self.surfaces)
+        res.relation_indices = list(range(len(self._relations)))
+        self._refresh_snapshot(self._tracked_points, self._snapshot.keys())
+        return res
+
+    def changed_points(self, names: typing.Iterable[str] = None) -> typing.List[typing.Tuple[str, int, int]]:
+        """
+        Finds the control points involved in continuity relations that were modified since the last solution (or since
+        the tracker was created). Surfaces whose :obj:`~aerocaps.geom.Geometry.version` did not change are skipped.
+
+        Parameters
+        ----------
+        names: typing.Iterable[str]
+            Names of the surfaces to check. If not specified, every surface of the network is checked.
+            Default: ``None``
+
+        Returns
+        -------
+        typing.List[typing.Tuple[str, int, int]]
+            Name of the surface and :math:`(i,j)`-index of each modified control point
+        """
+        points = []
+        for name in self._checked_names(names):
+            surf = self.surfaces[name]
+            if surf.version == self._snapshot_versions[name]:
+                continue
+            changed = np.any(surf._control_point_array() != self._snapshot[name], axis=2)
+            points.extend((name, int(i), int(j)) for i, j in np.argwhere(changed)
+                          if (name, i, j) in self._tracked_points)
+        return points
+
+    def affected_edges(self, points: typing.Iterable[typing.Tuple[str, int, int]]) -> typing.List[int]:
+        """
+        Finds the shared edges whose continuity depends on a set of control points
+
+        Parameters
+        ----------
+        points: typing.Iterable[typing.Tuple[str, int, int]]
+            Name of the surface and :math:`(i,j)`-index of each control point
+
+        Returns
+        -------
+        typing.List[int]
+            Sorted indices of the shared edges
+        """
+        return sorted({edge_idx for point in points for edge_idx in self._dependents.get(tuple(point), [])})
+
+    def update(self, names: typing.Iterable[str] = None) -> OptimizeResult:
+        """
+        Re-enforces continuity across the shared edges and repeats the recorded method calls affected by the control
+        points modified since the last solution. The control points that only influence the other relations are not
+        modified. Like the full solution, the modified control points may be moved to restore continuity (add their
+        surfaces to ``fixed`` to keep them in place across the shared edges).
+
+        Parameters
+        ----------
+        names: typing.Iterable[str]
+            Names of the edited surfaces. If not specified, every surface of the network is checked for edits.
+            Default: ``None``
+
+        Returns
+        -------
+        OptimizeResult
+            Result of :obj:`~aerocaps.geom.continuity.enforce_network_continuity` for the re-solved shared edges,
+            whose indices are given in ``shared_edge_indices``, with the indices of the repeated method calls (in
+            order of recording) in ``relation_indices``
+        """
+        checked_names = self._checked_names(names)
+        points = self.changed_points(checked_names)
+        changed = set(points)
+        edge_indices = self.affected_edges(points)
+        if edge_indices:
+            free = {key for edge_idx in edge_indices for key in self._edge_points[edge_idx]}
+            constraint_indices = sorted({other_idx for key in free for other_idx in self._dependents[key]} -
+                                        set(edge_indices))
+            frozen = {key for edge_idx in constraint_indices for key in self._edge_points[edge_idx]} - free
+            res = self._solve(edge_indices, constraint_indices, frozen)
+            changed.update(key for edge_idx in res.shared_edge_indices for key in self._edge_points[edge_idx])
+        else:
+            res = self._empty_result("No shared edge affected")
+
+        res.relation_indices = []
+        for relation_idx, relation in enumerate(self._relations):
+            if changed.isdisjoint(relation.reads) and changed.isdisjoint(relation.writes):
+                continue
+            relation.call(self.surfaces)
+            changed.update(relation.writes)
+            res.relation_indices.append(relation_idx)
+        self._refresh_snapshot(changed, checked_names)
+        return res
+
+    @staticmethod
+    def _empty_result(message: str) -> OptimizeResult:
+        return OptimizeResult(x=np.zeros(0), fun=0.0, nit=0, success=True, status=0, factors=np.zeros(0),
+                              shared_edge_indices=[], message=message)
+
+    def _checked_names(self, names: typing.Iterable[str] = None) -> typing.List[str]:
+        return list(self._snapshot) if names is None else [name for name in names if name in self._snapshot]
+
+    def _solve(self, edge_indices: typing.List[int], constraint_indices: typing.List[int],
+               frozen: typing.Set[typing.Tuple[str, int, int]]) -> OptimizeResult:
+        indices = edge_indices + constraint_indices
+        # Warm start from the tangent proportionality factors of the previous solution. The control points of the
+        # previous solution are the current control points, except for the edited ones
+        shared_edges = []
+        for edge_idx in indices:
+            shared_edge = self.shared_edges[edge_idx]
+            shared_edges.append(SharedEdge(shared_edge.surface_a, shared_edge.edge_a, shared_edge.surface_b,
+                                           shared_edge.edge_b, continuity=shared_edge.continuity,
+                                           reverse=shared_edge.reverse, f_initial=self.factors[edge_idx]))
+        res = enforce_network_continuity(self.surfaces, shared_edges, fixed=self.fixed, fixed_points=frozen,
+                                         **self.solver_kwargs)
+        self.factors[indices] = res.factors
+        res.shared_edge_indices = indices
+        self.result = res
+        return res
+
+    def _refresh_snapshot(self, points: typing.Iterable[typing.Tuple[str, int, int]],
+                          up_to_date: typing.Iterable[str] = ()):
+        """
+        Copies the current values of a set of control points to the snapshot, reading the control points of each
+        surface once. The snapshot of the surfaces in ``up_to_date``, whose other tracked control points are known
+        to be unchanged, is also marked as matching the current version of the surface.
+        """
+        rows = {}
+        for name, i, j in points:
+            rows.setdefault(name, []).append((i, j))
+        for name, ijs in rows.items():
+            i, j = np.array(ijs).T
+            self._snapshot[name][i, j] = self.surfaces[name]._control_point_array()[i, j]
+        for name in up_to_date:
+            self._snapshot_versions[name] = self.surfaces[name].version
@@ -0,0 +1,173 @@
+"""
+Curvature analysis of parametric surfaces
+"""
+import typing
+
+import numpy as np
+import pyvista as pv
+
+from aerocaps.geom.surfaces import SurfaceDerivativeData
+
+__all__ = [
+    "SurfaceCurvatureData"
+]
+
+
+class SurfaceCurvatureData:
+    """Normals and curvatures of a surface computed from its first and second fundamental forms"""
+
+    scalar_fields = ("gaussian_curvature", "mean_curvature", "max_principal_curvature", "min_principal_curvature")
+
+    def __init__(self,
+                 S: np.ndarray,
+                 Su: np.ndarray,
+                 Sv: np.ndarray,
+                 Suu: np.ndarray,
+                 Suv: np.ndarray,
+                 Svv: np.ndarray):
+        r"""
+        Normals and curvatures of a surface computed from its first and second fundamental forms. The inputs
+        may be of any shape as long as the last dimension has size :math:`3`
+        (e.g., :math:`N_u \times N_v \times 3` for a grid of points), and every computed quantity has the same
+        leading dimensions.
+
+        The coefficients of the first fundamental form are
+
+        .. math::
+
+            E = \mathbf{S}_u \cdot \mathbf{S}_u, \quad F = \mathbf{S}_u \cdot \mathbf{S}_v, \quad
+            G = \mathbf{S}_v \cdot \mathbf{S}_v
+
+        and the coefficients of the second fundamental form are
+
+        .. math::
+
+            L = \mathbf{S}_{uu} \cdot \hat{\mathbf{n}}, \quad M = \mathbf{S}_{uv} \cdot \hat{\mathbf{n}}, \quad
+            N = \mathbf{S}_{vv} \cdot \hat{\mathbf{n}}
+
+        where :math:`\hat{\mathbf{n}} = \mathbf{S}_u \times \mathbf{S}_v / \lVert \mathbf{S}_u \times \mathbf{S}_v
+        \rVert` is the unit normal. The Gaussian, mean, and principal curvatures are then
+
+        .. math::
+
+            K = \frac{LN - M^2}{EG - F^2}, \quad H = \frac{EN - 2FM + GL}{2(EG - F^2)}, \quad
+            \kappa_{1,2} = H \pm \sqrt{H^2 - K}
+
+        Curvatures are positive where the surface bends toward the unit normal. Quantities are ``nan`` where the
+        surface is degenerate (:math:`\mathbf{S}_u \times \mathbf{S}_v = \mathbf{0}`).
+
+        Parameters
+        ----------
+        S: numpy.ndarray
+            Points on the surface
+        Su: numpy.ndarray
+            First derivative with respect to :math:`u`
+        Sv: numpy.ndarray
+            First derivative with respect to :math:`v`
+        Suu: numpy.ndarray
+            Second derivative with respect to :math:`u`
+        Suv: numpy.ndarray
+            Mixed second derivative with respect to :math:`u` and :math:`v`
+        Svv: numpy.ndarray
+            Second derivative with respect to :math:`v`
+        """
+        self.S = S
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Unit normal
+            cross = np.cross(Su, Sv)
+            self.normal = cross / np.linalg.norm(cross, axis=-1, keepdims=True)
+
+            # First and second fundamental forms
+            self.E = np.einsum("...i,...i->...", Su, Su)
+            self.F = np.einsum("...i,...i->...", Su, Sv)
+            self.G = np.einsum("...i,...i->...", Sv, Sv)
+            self.L = np.einsum("...i,...i->...", Suu, self.normal)
+            self.M = np.einsum("...i,...i->...", Suv, self.normal)
+            self.N = np.einsum("...i,...i->...", Svv, self.normal)
+
+            # Gaussian, mean, and principal curvatures
+            metric_determinant = self.E * self.G - self.F ** 2
+            self.gaussian_curvature = (self.L * self.N - self.M ** 2) / metric_determinant
+            self.mean_curvature = (self.E * self.N - 2.0 * self.F * self.M + self.G * self.L) / (
+                    2.0 * metric_determinant)
+            discriminant = np.sqrt(np.maximum(self.mean_curvature ** 2 - self.gaussian_curvature, 0.0))
+            self.max_principal_curvature = self.mean_curvature + discriminant
+            self.min_principal_curvature = self.mean_curvature - discriminant
+
+            # Principal directions
+            self.max_principal_direction = self._compute_principal_direction(self.max_principal_curvature, Su, Sv)
+            self.min_principal_direction = np.cross(self.normal, self.max_principal_direction)
+
+    @classmethod
+    def from_derivatives(cls, data: SurfaceDerivativeData) -> "SurfaceCurvatureData":
+        """
+        Computes the curvature data from the output of a surface's ``evaluate_derivatives`` method
+
+        Parameters
+        ----------
+        data: SurfaceDerivativeData
+            Point and partial derivatives of a surface up to (at least) second order
+
+        Returns
+        -------
+        SurfaceCurvatureData
+            Curvature data at the same parameter values
+        """
+        if data.Suu is None:
+            raise ValueError("Curvature analysis requires second derivatives. Evaluate the derivatives with order=2")
+        return cls(data.S, data.Su, data.Sv, data.Suu, data.Suv, data.Svv)
+
+    def _compute_principal_direction(self, k: np.ndarray, Su: np.ndarray, Sv: np.ndarray) -> np.ndarray:
+        r"""
+        Computes the unit principal direction associated with the principal curvature :math:`\kappa` by solving
+        :math:`(L - \kappa E) \, du + (M - \kappa F) \, dv = 0` (or the equivalent equation from the second row of the
+        shape operator, whichever is better conditioned) and mapping :math:`(du, dv)` to
+        :math:`du \, \mathbf{S}_u + dv \, \mathbf{S}_v`. At umbilic points, where every direction is principal, the
+        direction of :math:`\mathbf{S}_u` is used.
+        """
+        a = self.L - k * self.E
+        b = self.M - k * self.F
+        c = self.N - k * self.G
+        use_first_row = (a ** 2 + b ** 2) >= (b ** 2 + c ** 2)
+        du = np.where(use_first_row, b, c)
+        dv = np.where(use_first_row, -a, -b)
+        scale = np.abs(self.L) + np.abs(self.M) + np.abs(self.N) + np.abs(k) * (self.E + np.abs(self.F) + self.G)
+        umbilic = np.maximum(np.maximum(np.abs(a), np.abs(b)), np.abs(c)) <= 1e-8 * scale
+        direction = du[..., np.newaxis] * Su + dv[..., np.newaxis] * Sv
+        direction = np.where(umbilic[..., np.newaxis], Su, direction)
+        return direction / np.linalg.norm(direction, axis=-1, keepdims=True)
+
+    def to_pyvista(self) -> pv.StructuredGrid:
+        r"""
+        Converts curvature data evaluated on an :math:`N_u \times N_v` grid to a :obj:`pyvista.StructuredGrid`
+        with the unit normals, principal directions, and each of the curvatures in
+        :obj:`~aerocaps.geom.curvature.SurfaceCurvatureData.scalar_fields` stored as point data
+
+        Returns
+        -------
+        pyvista.StructuredGrid
+            Structured grid with point data arrays named ``"normal"``, ``"max_principal_direction"``,
+            ``"min_principal_direction"``, ``"gaussian_curvature"``, ``"mean_curvature"``,
+            ``"max_principal_curvature"``, and ``"min_principal_curvature"``
+        """
+        if self.S.ndim != 3:
+            raise ValueError("Conversion to a structured grid requires curvature data evaluated on a grid")
+
+        grid = pv.StructuredGrid(self.S[:, :, 0], self.S[:, :, 1], self.S[:, :, 2])
+
+        # Structured grid points are stored in Fortran order
+        for name in self.scalar_fields:
+            grid.point_data[name] = getattr(self, name).ravel(order="F")
+        for name in ("normal", "max_principal_direction", "min_principal_direction"):
+            grid.point_data[name] = getattr(self, name).reshape((-1, 3), order="F")
+
+        grid.set_active_scalars("mean_curvature")
+        return grid
+
+    def _subset(self, index: int or slice or typing.Tuple) -> "SurfaceCurvatureData":
+        """Creates a new curvature data object from the same index of every array (e.g., one surface of a batch)"""
+        subset = object.__new__(SurfaceCurvatureData)
+        for name, value in self.__dict__.items():
+            setattr(subset, name, value[index])
+        return subset
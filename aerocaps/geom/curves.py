@@ -9,20 +9,23 @@ from copy import deepcopy
 import numpy as np
 import pyvista as pv
 from matplotlib import pyplot as plt
-from scipy.optimize import fsolve
 from rust_nurbs import *
+from scipy.spatial import cKDTree
 
 import aerocaps.iges
 import aerocaps.iges.curves
 import aerocaps.iges.entity
 from aerocaps.geom import Geometry2D, Geometry3D, NegativeWeightError
-from aerocaps.geom.point import Point2D, Point3D
+from aerocaps.geom.basis import bspline_basis_matrices, bspline_to_bezier_segments, de_casteljau_split
+from aerocaps.geom.point import Point2D, Point3D, PointArray3D, Point3DSequenceView, point3d_sequence_to_array
 from aerocaps.geom.transformation import Transformation2D, Transformation3D
 from aerocaps.geom.vector import Vector3D, Vector2D
 from aerocaps.units.angle import Angle
 from aerocaps.units.length import Length
+from aerocaps.utils.math import newton_bisection
 
 __all__ = [
+    "ArcLengthTable",
     "PCurveData2D",
     "PCurveData3D",
     "PCurve2D",
@@ -46,6 +49,512 @@ _projection_dict = {
 }
 
 
+def _find_bezier_roots(coefficients: np.ndarray, max_depth: int = 40) -> (np.ndarray, np.ndarray, np.ndarray,
+                                                                        np.ndarray, np.ndarray):
+    r"""
+    Isolates the roots in :math:`[0,1]` of a set of polynomials in Bernstein form by recursive subdivision. Each
+    row of ``coefficients`` is subdivided at its midpoint using the de Casteljau algorithm until the number of sign
+    variations of its coefficients is zero (no roots by the variation-diminishing property) or one (exactly one
+    root inside the interval). Intervals that still have multiple sign variations after ``max_depth`` subdivisions
+    (tangent roots) are reported as roots at their midpoints, as are exact zeros at the subdivision points.
+
+    Parameters
+    ----------
+    coefficients: numpy.ndarray
+        Array of size :math:`K \times (n+1)` containing the Bernstein coefficients of :math:`K` polynomials of
+        degree :math:`n`
+    max_depth: int
+        Maximum number of subdivisions. Default: ``40``
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray
+        Lower bounds, upper bounds, signs just above the lower bounds, and polynomial indices of the brackets
+        containing exactly one root, followed by an array of size :math:`M \times 2` containing the polynomial
+        index and parameter value of each root found directly
+    """
+    coefficients = np.array(coefficients, dtype=float)
+    num_polys, num_coefficients = coefficients.shape
+    atol = 1e-14 * np.max(np.abs(coefficients), axis=1)
+
+    # Roots at the ends of the parameter range
+    exact_roots = []
+    for end, t_end in ((0, 0.0), (-1, 1.0)):
+        zero_at_end = np.flatnonzero(np.abs(coefficients[:, end]) <= atol)
+        exact_roots.append(np.column_stack((zero_at_end, np.full(zero_at_end.shape, t_end))))
+
+    C = coefficients
+    a = np.zeros(num_polys)
+    b = np.ones(num_polys)
+    owner = np.arange(num_polys)
+    brackets = []
+    for depth in range(max_depth + 1):
+        if owner.size == 0:
+            break
+
+        # Count the sign variations of each row, ignoring zero coefficients
+        signs = np.where(np.abs(C) <= atol[owner, np.newaxis], 0.0, np.sign(C))
+        last_nonzero = np.maximum.accumulate(np.where(signs != 0.0, np.arange(num_coefficients), 0), axis=1)
+        filled = np.take_along_axis(signs, last_nonzero, axis=1)
+        variations = np.count_nonzero(filled[:, :-1] * filled[:, 1:] < 0.0, axis=1)
+
+        isolated = variations == 1
+        first_nonzero = np.argmax(signs != 0.0, axis=1)
+        brackets.append((a[isolated], b[isolated], signs[isolated, first_nonzero[isolated]], owner[isolated]))
+
+        split = variations > 1
+        if depth == max_depth:
+            exact_roots.append(np.column_stack((owner[split], 0.5 * (a[split] + b[split]))))
+            break
+        C, a, b, owner = C[split], a[split], b[split], owner[split]
+
+        # Split each remaining interval at its midpoint
+        left, right = de_casteljau_split(C, axis=1)
+        mid = 0.5 * (a + b)
+        zero_at_mid = np.abs(left[:, -1]) <= atol[owner]
+        exact_roots.append(np.column_stack((owner[zero_at_mid], mid[zero_at_mid])))
+
+        C = np.concatenate((left, right))
+        a, b = np.concatenate((a, mid)), np.concatenate((mid, b))
+        owner = np.concatenate((owner, owner))
+
+    lo, hi, sign_lo, bracket_owner = (np.concatenate(arrays) for arrays in zip(*brackets))
+    return lo, hi, sign_lo, bracket_owner.astype(int), np.concatenate(exact_roots)
+
+
+def _compute_t_corresponding_to_coordinate(curve: "PCurve2D" or "PCurve3D", P: np.ndarray, weights: np.ndarray,
+                                           coordinate: int, seek: float or np.ndarray, t0: float, all_roots: bool,
+                                           tol: float = 1e-12, max_iterations: int = 50
+                                           ) -> float or np.ndarray or typing.List[np.ndarray]:
+    r"""
+    Computes the :math:`t`-values at which one coordinate of a Bézier or rational Bézier curve takes each of the
+    seek values. The roots of :math:`\sum_i w_i (P_{i,c} - s) B_{i,n}(t)`, whose signs match those of
+    :math:`C_c(t) - s` because the weights are non-negative, are isolated using Bézier subdivision and refined using
+    :obj:`~aerocaps.utils.math.newton_bisection` with the derivatives from the curve's ``dcdt`` method.
+
+    Parameters
+    ----------
+    curve: PCurve2D or PCurve3D
+        Curve to evaluate
+    P: numpy.ndarray
+        Control point array of the curve
+    weights: numpy.ndarray
+        Weights of the control points, or ``None`` for a non-rational curve
+    coordinate: int
+        Index of the coordinate (``0`` for :math:`x`, ``1`` for :math:`y`, ``2`` for :math:`z`)
+    seek: float or numpy.ndarray
+        Value or array of values of the coordinate
+    t0: float
+        Parameter value used to choose between multiple roots if ``all_roots`` is ``False``
+    all_roots: bool
+        Whether to return every root in :math:`[0,1]` for each seek value
+    tol: float
+        Convergence tolerance on the parameter values. Default: ``1e-12``
+    max_iterations: int
+        Maximum number of Newton-bisection iterations. Default: ``50``
+
+    Returns
+    -------
+    float or numpy.ndarray or typing.List[numpy.ndarray]
+        If ``all_roots`` is ``False``, the root closest to ``t0`` for each seek value (``nan`` if there is no root),
+        with the same shape as ``seek``. Otherwise, a sorted array of roots for a scalar ``seek`` or a list of
+        sorted arrays of roots for an array ``seek``
+    """
+    seek_array = np.atleast_1d(np.asarray(seek, dtype=float))
+    flat_seek = seek_array.ravel()
+    w = np.ones(P.shape[0]) if weights is None else np.asarray(weights, dtype=float)
+    lo, hi, sign_lo, owner, exact_roots = _find_bezier_roots(w * (P[:, coordinate] - flat_seek[:, np.newaxis]))
+
+    def func(t: np.ndarray, indices: np.ndarray) -> (np.ndarray, np.ndarray):
+        return (curve.evaluate(t)[:, coordinate] - flat_seek[owner[indices]],
+                curve.dcdt(t)[:, coordinate])
+
+    t = newton_bisection(func, lo, hi, sign_lo=sign_lo, tol=tol, max_iterations=max_iterations)
+    owner = np.concatenate((owner, exact_roots[:, 0].astype(int)))
+    t = np.concatenate((t, exact_roots[:, 1]))
+
+    if all_roots:
+        order = np.lexsort((t, owner))
+        roots = np.split(t[order], np.searchsorted(owner[order], np.arange(1, flat_seek.shape[0])))
+        return roots[0] if np.ndim(seek) == 0 else roots
+
+    result = np.full(flat_seek.shape[0], np.nan)
+    order = np.lexsort((np.abs(t - t0), owner))
+    first = np.unique(owner[order], return_index=True)[1]
+    result[owner[order][first]] = t[order][first]
+    return float(result[0]) if np.ndim(seek) == 0 else result.reshape(seek_array.shape)
+
+
+def _bezier_segments(curve: "PCurve2D" or "PCurve3D") -> (np.ndarray, np.ndarray, np.ndarray) or None:
+    r"""
+    Represents a curve as a set of rational Bézier segments in homogeneous coordinates, or returns ``None`` if the
+    curve has no such representation (e.g., a circular arc parametrized by angle)
+
+    Parameters
+    ----------
+    curve: PCurve2D or PCurve3D
+        Curve to represent
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray, numpy.ndarray or None
+        Homogeneous control points of the segments (size :math:`S \times (p+1) \times (d+1)`), and the starting
+        and ending parameter values of the segments (size :math:`S`)
+    """
+    if isinstance(curve, (Line2D, Line3D)):
+        P, weights = np.array([curve.evaluate(0.0), curve.evaluate(1.0)]), np.ones(2)
+    elif isinstance(curve, (BezierCurve2D, BezierCurve3D)):
+        P = curve.get_control_point_array()
+        weights = np.ones(P.shape[0])
+    elif isinstance(curve, (RationalBezierCurve2D, RationalBezierCurve3D)):
+        P, weights = curve.get_control_point_array(), np.asarray(curve.weights, dtype=float)
+    elif isinstance(curve, (BSplineCurve3D, NURBSCurve3D)):
+        knots, degree = np.asarray(curve.knot_vector, dtype=float), curve.degree
+        if np.any(knots[:degree + 1] != knots[0]) or np.any(knots[-degree - 1:] != knots[-1]):
+            return None
+        Pw = np.column_stack((curve.get_control_point_array() * curve.weights[:, np.newaxis], curve.weights))
+        return bspline_to_bezier_segments(Pw, knots, degree)
+    else:
+        return None
+    Pw = np.column_stack((P * weights[:, np.newaxis], weights))
+    return Pw[np.newaxis], np.zeros(1), np.ones(1)
+
+
+def _project_points_onto_curve(curve: "PCurve2D" or "PCurve3D", points: np.ndarray, max_depth: int = 30,
+                               flatness: float = 1e-2, num_samples: int = 200, tol: float = 1e-12,
+                               max_iterations: int = 50) -> (np.ndarray, np.ndarray):
+    r"""
+    Finds the globally closest point on a curve to each of :math:`N` points. The curve is represented as a set of
+    rational Bézier segments, and each segment is recursively subdivided using the de Casteljau algorithm. A
+    segment is discarded for a given point when the distance from the point to the bounding box of the segment's
+    control points (which contains the segment by the convex hull property) exceeds the distance to the nearest
+    curve point found so far. Segments are no longer subdivided once their control polygons are flat, and the
+    stationary point of the squared distance inside each remaining segment,
+
+    .. math::
+
+        \mathbf{C}'(t) \cdot \left[\mathbf{C}(t) - \mathbf{p}\right] = 0,
+
+    is found using :obj:`~aerocaps.utils.math.newton_bisection`. Curves with no rational Bézier representation are
+    sampled at ``num_samples`` points instead, and the stationary point is sought next to the nearest sample.
+
+    Parameters
+    ----------
+    curve: PCurve2D or PCurve3D
+        Curve onto which the points are projected
+    points: numpy.ndarray
+        Array of size :math:`N \times d`, where :math:`d` is the curve dimension
+    max_depth: int
+        Maximum number of subdivisions of each segment. Default: ``30``
+    flatness: float
+        Maximum distance of the control points of a segment from its chord, relative to the chord length, for
+        the segment to be considered flat. Default: ``1e-2``
+    num_samples: int
+        Number of samples used for curves with no rational Bézier representation. Default: ``200``
+    tol: float
+        Convergence tolerance on the parameter values. Default: ``1e-12``
+    max_iterations: int
+        Maximum number of Newton-bisection iterations. Default: ``50``
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray
+        Parameter values of the closest points and distances from the points to the curve (each of size :math:`N`)
+    """
+    points = np.asarray(points, dtype=float)
+    dim = points.shape[-1]
+    points = points.reshape((-1, dim))
+    num_points = points.shape[0]
+    segments = _bezier_segments(curve)
+
+    if segments is None:
+        # Bracket the closest sample of the curve
+        t_samples = np.linspace(0.0, 1.0, num_samples)
+        samples = curve.evaluate(t_samples)
+        _, nearest = cKDTree(samples).query(points)
+        i_lo, i_hi = np.maximum(nearest - 1, 0), np.minimum(nearest + 1, num_samples - 1)
+        owner = np.arange(num_points)
+        lo, hi, t_guess = t_samples[i_lo], t_samples[i_hi], t_samples[nearest]
+        end_points = np.stack((samples[i_lo], samples[i_hi]), axis=1)
+        g_lo = np.einsum("ij,ij->i", curve.dcdt(lo), samples[i_lo] - points)
+        g_hi = np.einsum("ij,ij->i", curve.dcdt(hi), samples[i_hi] - points)
+    else:
+        Pw, t_start, t_end = segments
+        num_segments = Pw.shape[0]
+        owner = np.repeat(np.arange(num_points), num_segments)
+        Pw = np.tile(Pw, (num_points, 1, 1))
+        a = np.tile(t_start, num_points)
+        b = np.tile(t_end, num_points)
+
+        # The segment end control points lie on the curve and bound the closest distance from above
+        upper = np.full(num_points, np.inf)
+        for end in (0, -1):
+            np.minimum.at(upper, owner, np.linalg.norm(Pw[:, end, :dim] / Pw[:, end, dim:] - points[owner], axis=1))
+
+        finished = []
+        for depth in range(max_depth + 1):
+            P = Pw[:, :, :dim] / Pw[:, :, dim:]
+            q = points[owner]
+
+            # Discard segments whose bounding boxes are farther from the point than the nearest curve point
+            box_distance = np.linalg.norm(q - np.clip(q, P.min(axis=1), P.max(axis=1)), axis=1)
+            keep = box_distance <= upper[owner] * (1.0 + 1e-9)
+            P, q, a, b, owner = P[keep], q[keep], a[keep], b[keep], owner[keep]
+            Pw = Pw[keep]
+
+            # Stop subdividing segments with flat control polygons, estimating the parameter value of the closest
+            # point in each flat segment from the projection of the point onto the chord
+            chord = P[:, -1] - P[:, 0]
+            chord_length = np.linalg.norm(chord, axis=1)
+            offsets = P - P[:, :1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                unit_chord = np.where(chord_length[:, np.newaxis] > 0.0, chord / chord_length[:, np.newaxis], 0.0)
+                along = np.einsum("ijk,ik->ij", offsets, unit_chord)
+                deviation = np.linalg.norm(offsets - along[:, :, np.newaxis] * unit_chord[:, np.newaxis], axis=2)
+                flat = (np.max(deviation, axis=1) <= flatness * chord_length) | (depth == max_depth)
+                fraction = np.einsum("ij,ij->i", q[flat] - P[flat, 0], unit_chord[flat]) / chord_length[flat]
+            fraction = np.where(np.isfinite(fraction), np.clip(fraction, 0.0, 1.0), 0.5)
+            finished.append((a[flat], b[flat], a[flat] + fraction * (b[flat] - a[flat]), owner[flat], P[flat]))
+
+            Pw, a, b, owner = Pw[~flat], a[~flat], b[~flat], owner[~flat]
+            if owner.size == 0:
+                break
+
+            # Split the remaining segments at their midpoints
+            left, right = de_casteljau_split(Pw, axis=1)
+            np.minimum.at(upper, owner, np.linalg.norm(left[:, -1, :dim] / left[:, -1, dim:] - points[owner], axis=1))
+
+            mid = 0.5 * (a + b)
+            Pw = np.concatenate((left, right))
+            a, b = np.concatenate((a, mid)), np.concatenate((mid, b))
+            owner = np.concatenate((owner, owner))
+
+        lo, hi, t_guess, owner, P = (np.concatenate(arrays) for arrays in zip(*finished))
+        end_points = P[:, [0, -1]]
+
+        # The derivative of a (rational) Bézier segment at each end is a positive multiple of the end leg of its
+        # control polygon
+        g_lo = np.einsum("ij,ij->i", P[:, 1] - P[:, 0], P[:, 0] - points[owner])
+        g_hi = np.einsum("ij,ij->i", P[:, -1] - P[:, -2], P[:, -1] - points[owner])
+
+    # The minimum of the squared distance over each candidate interval is at one of its ends unless the derivative
+    # of the squared distance changes sign from negative to positive inside the interval
+    interior = np.flatnonzero((g_lo < 0.0) & (g_hi > 0.0))
+
+    def distance_derivatives(t: np.ndarray, indices: np.ndarray) -> (np.ndarray, np.ndarray):
+        r = curve.evaluate(t) - points[owner[interior[indices]]]
+        dcdt = curve.dcdt(t)
+        return (np.einsum("ij,ij->i", dcdt, r),
+                np.einsum("ij,ij->i", dcdt, dcdt) + np.einsum("ij,ij->i", curve.d2cdt2(t), r))
+
+    t_interior = newton_bisection(distance_derivatives, lo[interior], hi[interior],
+                                  sign_lo=-np.ones(interior.shape[0]), t0=t_guess[interior], tol=tol,
+                                  max_iterations=max_iterations)
+
+    # Keep the closest of the interval ends and interior minima for each point
+    t = np.concatenate((lo, hi, t_interior))
+    owner = np.concatenate((owner, owner, owner[interior]))
+    curve_points = np.concatenate((end_points[:, 0], end_points[:, 1], curve.evaluate(t_interior).reshape((-1, dim))))
+    distance = np.linalg.norm(curve_points - points[owner], axis=1)
+    order = np.lexsort((distance, owner))
+    first = np.unique(owner[order], return_index=True)[1]
+    return t[order][first], distance[order][first]
+
+
+def _curve_fingerprint(curve: "PCurve2D" or "PCurve3D") -> np.ndarray:
+    """
+    Flattened data defining a curve, used to detect modifications that are not tracked by the version of the curve
+    (e.g., reassigning the control points of a two-dimensional curve)
+    """
+    if isinstance(curve, CircularArc2D):
+        return np.array([curve.center.x.m, curve.center.y.m, curve.radius.m, curve.start_angle.rad,
+                         curve.end_angle.rad, float(curve.complement)])
+    arrays = [curve.get_control_point_array().ravel()]
+    for attr in ("weights", "knot_vector"):
+        value = getattr(curve, attr, None)
+        if value is not None:
+            arrays.append(np.asarray(value, dtype=float).ravel())
+    return np.concatenate(arrays)
+
+
+class ArcLengthTable:
+    """Cumulative arc-length table of a parametric curve"""
+    def __init__(self, curve: "PCurve2D" or "PCurve3D", num_subintervals: int = 4, order: int = 8,
+                 tol: float = 1e-12, max_refinements: int = 30):
+        r"""
+        Tabulates the arc-length of a curve as a function of its parameter. Each knot span of the curve (or the
+        whole parameter range for curves without interior knots) is split into ``num_subintervals`` equal
+        subintervals, and the speed :math:`|\mathbf{C}'(t)|` is sampled at the ``order`` Gauss-Legendre points of
+        each subinterval. The samples define a Legendre expansion of the speed of degree ``order - 1`` on each
+        subinterval, whose integral is the Gauss-Legendre quadrature of the speed. Subintervals whose expansions
+        have not converged (judged from the magnitude of their two highest-degree coefficients) are bisected until
+        the estimated error of each subinterval is below ``tol`` times the length of the curve. Arc-length queries
+        are then answered from the expansions without evaluating the curve again, and every query is vectorized
+        over the input array.
+
+        Tables are usually obtained through :obj:`~aerocaps.geom.curves.PCurve3D.arc_length_table`, which caches
+        the table until the curve is modified.
+
+        Parameters
+        ----------
+        curve: PCurve2D or PCurve3D
+            Curve to tabulate
+        num_subintervals: int
+            Initial number of subintervals in each knot span. Default: ``4``
+        order: int
+            Number of Gauss-Legendre points in each subinterval. Default: ``8``
+        tol: float
+            Relative error tolerance of the arc-length in each subinterval. Default: ``1e-12``
+        max_refinements: int
+            Maximum number of times a subinterval is bisected. Default: ``30``
+        """
+        self.fingerprint = _curve_fingerprint(curve)
+        knots = np.asarray(getattr(curve, "knot_vector", [0.0, 1.0]), dtype=float)
+        breakpoints = np.unique(np.concatenate(([0.0, 1.0], knots[(knots > 0.0) & (knots < 1.0)])))
+        t = np.unique(np.concatenate([
+            np.linspace(a, b, num_subintervals + 1) for a, b in zip(breakpoints[:-1], breakpoints[1:])
+        ]))
+
+        # Legendre coefficients of the speed on each subinterval (mapped to [-1,1]) from the discrete projection at
+        # the Gauss-Legendre points
+        nodes, weights = np.polynomial.legendre.leggauss(order)
+        projection = ((np.polynomial.legendre.legvander(nodes, order - 1) * weights[:, np.newaxis]).T *
+                      (np.arange(order) + 0.5)[:, np.newaxis])
+        t_lo, t_hi = t[:-1], t[1:]
+        accepted_lo, accepted_hi, accepted_coefficients = [], [], []
+        scale = None
+        for refinement in range(max_refinements + 1):
+            half_width = 0.5 * (t_hi - t_lo)
+            t_nodes = (0.5 * (t_lo + t_hi))[:, np.newaxis] + half_width[:, np.newaxis] * nodes
+            speed = np.linalg.norm(curve.dcdt(t_nodes.ravel()), axis=1).reshape(t_nodes.shape)
+            coefficients = projection @ speed.T
+            if scale is None:
+                scale = np.sum(2.0 * half_width * coefficients[0])
+            error = half_width * (np.abs(coefficients[-1]) + np.abs(coefficients[-2]))
+            converged = (error <= tol * scale) | (refinement == max_refinements)
+            accepted_lo.append(t_lo[converged])
+            accepted_hi.append(t_hi[converged])
+            accepted_coefficients.append(coefficients[:, converged])
+            if np.all(converged):
+                break
+            midpoints = 0.5 * (t_lo[~converged] + t_hi[~converged])
+            t_lo, t_hi = (np.concatenate((t_lo[~converged], midpoints)),
+                          np.concatenate((midpoints, t_hi[~converged])))
+
+        order_of_subintervals = np.argsort(np.concatenate(accepted_lo))
+        self.t = np.append(np.concatenate(accepted_lo)[order_of_subintervals], 1.0)
+        self._half_width = 0.5 * (np.concatenate(accepted_hi)[order_of_subintervals] - self.t[:-1])
+        self._speed_coefficients = np.concatenate(accepted_coefficients, axis=1)[:, order_of_subintervals]
+        self._length_coefficients = np.polynomial.legendre.legint(self._speed_coefficients, lbnd=-1.0) * \
+            self._half_width
+        self.s = np.concatenate(([0.0], np.cumsum(2.0 * self._half_width * self._speed_coefficients[0])))
+
+    @property
+    def length(self) -> float:
+        """Total arc-length of the curve"""
+        return float(self.s[-1])
+
+    def _subinterval(self, t_or_s: np.ndarray, table: np.ndarray) -> np.ndarray:
+        """Index of the subinterval of the table containing each parameter value or arc-length"""
+        return np.clip(np.searchsorted(table, t_or_s, side="right") - 1, 0, self.t.shape[0] - 2)
+
+    def _length_and_speed(self, t: np.ndarray, k: np.ndarray) -> (np.ndarray, np.ndarray):
+        """Arc-length and speed at parameter values inside the given subintervals of the table"""
+        x = (t - self.t[k]) / self._half_width[k] - 1.0
+        return (self.s[k] + np.polynomial.legendre.legval(x, self._length_coefficients[:, k], tensor=False),
+                np.polynomial.legendre.legval(x, self._speed_coefficients[:, k], tensor=False))
+
+    def length_at_t(self, t: float or np.ndarray) -> float or np.ndarray:
+        r"""
+        Computes the arc-length of the curve from :math:`t=0` to each of a set of parameter values
+
+        Parameters
+        ----------
+        t: float or numpy.ndarray
+            Parameter value or array of parameter values in :math:`[0,1]`
+
+        Returns
+        -------
+        float or numpy.ndarray
+            Arc-lengths, with the same shape as ``t``
+        """
+        flat_t = np.atleast_1d(np.asarray(t, dtype=float)).ravel()
+        k = self._subinterval(flat_t, self.t)
+        s = self._length_and_speed(flat_t, k)[0]
+        return float(s[0]) if np.ndim(t) == 0 else s.reshape(np.shape(t))
+
+    def t_at_length(self, s: float or np.ndarray, tol: float = 1e-12) -> float or np.ndarray:
+        r"""
+        Finds the parameter values at which the arc-length of the curve from :math:`t=0` reaches each of a set of
+        values. The subinterval of the table containing each arc-length is found by a binary search, and the
+        parameter value inside the subinterval is found for all the arc-lengths at once by applying a bracketed
+        Newton-bisection method to the expansion of the arc-length, starting from linear interpolation of the table.
+
+        Parameters
+        ----------
+        s: float or numpy.ndarray
+            Arc-length or array of arc-lengths. Values outside :math:`[0,L]`, where :math:`L` is the length of the
+            curve, are clipped to this range
+        tol: float
+            Convergence tolerance on the parameter values. Default: ``1e-12``
+
+        Returns
+        -------
+        float or numpy.ndarray
+            Parameter values, with the same shape as ``s``
+        """
+        flat_s = np.clip(np.atleast_1d(np.asarray(s, dtype=float)).ravel(), 0.0, self.s[-1])
+        k = self._subinterval(flat_s, self.s)
+        t_lo, t_hi = self.t[k], self.t[k + 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fraction = np.nan_to_num((flat_s - self.s[k]) / (self.s[k + 1] - self.s[k]))
+
+        def func(t: np.ndarray, indices: np.ndarray) -> (np.ndarray, np.ndarray):
+            length, speed = self._length_and_speed(t, k[indices])
+            return length - flat_s[indices], speed
+
+        t = newton_bisection(func, t_lo, t_hi, sign_lo=-np.ones(flat_s.shape[0]),
+                             t0=t_lo + np.clip(fraction, 0.0, 1.0) * (t_hi - t_lo), tol=tol)
+        t = np.where(flat_s == self.s[k], t_lo, t)
+        return float(t[0]) if np.ndim(s) == 0 else t.reshape(np.shape(s))
+
+    def equal_arc_length_parameters(self, n: int) -> np.ndarray:
+        r"""
+        Finds the parameter values of :math:`n` points equally spaced in arc-length along the curve, including both
+        ends of the curve
+
+        Parameters
+        ----------
+        n: int
+            Number of points (at least ``2``)
+
+        Returns
+        -------
+        numpy.ndarray
+            1-D array of :math:`n` parameter values
+        """
+        if n < 2:
+            raise ValueError("At least two points are required for equal arc-length sampling")
+        t = self.t_at_length(np.linspace(0.0, self.length, n))
+        t[0], t[-1] = 0.0, 1.0
+        return t
+
+
+def _get_arc_length_table(curve: "PCurve2D" or "PCurve3D") -> ArcLengthTable:
+    """
+    Gets the cached arc-length table of a curve. Curves that track their modifications through their version only
+    need the version check done by the cache. For the other curves, if the data defining the curve changed, the
+    curve is marked as modified so that the table (and any other cached data) is recomputed
+    """
+    table = curve._get_cached("arc_length_table", lambda: ArcLengthTable(curve))
+    if isinstance(curve, (BezierCurve3D, RationalBezierCurve3D, BSplineCurve3D, NURBSCurve3D)):
+        return table
+    if not np.array_equal(table.fingerprint, _curve_fingerprint(curve)):
+        curve._mark_modified()
+        table = curve._get_cached("arc_length_table", lambda: ArcLengthTable(curve))
+    return table
+
+
 class PCurveData2D:
     """Data-processing class for 2-D parametric curves"""
     def __init__(self,
@@ -287,6 +796,97 @@ class PCurve2D(Geometry2D):
         """
         pass
 
+    def project_points(self, points: np.ndarray) -> (np.ndarray, np.ndarray):
+        r"""
+        Finds the globally closest point on the curve to each of :math:`N` points. Candidate parameter ranges are
+        found by recursively subdividing the curve and discarding pieces whose convex hulls are farther from a point
+        than the closest curve point found so far, and the closest point in each candidate range is then found for
+        all the points at once using a bracketed Newton-bisection method. Curves that cannot be represented as
+        rational Bézier segments are sampled instead.
+
+        .. code-block:: python
+
+            t, distance = curve.project_points(measured_points)
+            closest_points = curve.evaluate(t)
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            Array of size :math:`N \times 2`
+
+        Returns
+        -------
+        numpy.ndarray, numpy.ndarray
+            Parameter values of the closest points and distances from the points to the curve (each of size
+            :math:`N`)
+        """
+        return _project_points_onto_curve(self, points)
+
+    def arc_length_table(self) -> ArcLengthTable:
+        """
+        Gets the arc-length table of the curve, which is computed on first use and cached until the curve is
+        modified
+
+        Returns
+        -------
+        ArcLengthTable
+            Arc-length table
+        """
+        return _get_arc_length_table(self)
+
+    def length(self) -> float:
+        """
+        Computes the arc-length of the curve using Gauss-Legendre quadrature on each knot span
+
+        Returns
+        -------
+        float
+            Arc-length of the curve
+        """
+        return self.arc_length_table().length
+
+    def t_at_length(self, s: float or np.ndarray) -> float or np.ndarray:
+        r"""
+        Finds the parameter values at which the arc-length of the curve from :math:`t=0` reaches each of a set of
+        values. See :obj:`~aerocaps.geom.curves.ArcLengthTable.t_at_length` for details.
+
+        .. code-block:: python
+
+            t = curve.t_at_length(0.25 * curve.length())
+
+        Parameters
+        ----------
+        s: float or numpy.ndarray
+            Arc-length or array of arc-lengths
+
+        Returns
+        -------
+        float or numpy.ndarray
+            Parameter values, with the same shape as ``s``
+        """
+        return self.arc_length_table().t_at_length(s)
+
+    def equal_arc_length_parameters(self, n: int) -> np.ndarray:
+        r"""
+        Finds the parameter values of :math:`n` points equally spaced in arc-length along the curve, including both
+        ends of the curve
+
+        .. code-block:: python
+
+            points = curve.evaluate(curve.equal_arc_length_parameters(101))
+
+        Parameters
+        ----------
+        n: int
+            Number of points (at least ``2``)
+
+        Returns
+        -------
+        numpy.ndarray
+            1-D array of :math:`n` parameter values
+        """
+        return self.arc_length_table().equal_arc_length_parameters(n)
+
     @staticmethod
     def _get_linear_tvec(nt: int) -> np.ndarray:
         r"""
@@ -500,6 +1100,24 @@ class PCurveData3D:
 
 class PCurve3D(Geometry3D):
     """Three-dimensional abstract parametric curve class"""
+    def _control_point_array(self) -> np.ndarray:
+        """
+        Read-only control point array, cached until the curve is modified. Used internally to avoid copying the
+        array on every evaluation.
+        """
+        return self._get_cached_array("control_point_array", self._control_points.copy)
+
+    def _control_point_list(self) -> list:
+        """
+        Control point array converted to a nested list, which is the fastest input format for the ``rust_nurbs``
+        evaluation functions. The list is cached until the curve is modified.
+        """
+        return self._get_cached("control_point_list", self._control_points.tolist)
+
+    def _weight_list(self) -> list:
+        """Weight array converted to a list and cached until the curve is modified"""
+        return self._get_cached("weight_list", self._weights.tolist)
+
     @abstractmethod
     def evaluate_point3d(self, t: float or int or np.ndarray) -> Point3D or typing.List[Point3D]:
         r"""
@@ -596,6 +1214,97 @@ class PCurve3D(Geometry3D):
         """
         pass
 
+    def project_points(self, points: np.ndarray) -> (np.ndarray, np.ndarray):
+        r"""
+        Finds the globally closest point on the curve to each of :math:`N` points. Candidate parameter ranges are
+        found by recursively subdividing the curve and discarding pieces whose convex hulls are farther from a point
+        than the closest curve point found so far, and the closest point in each candidate range is then found for
+        all the points at once using a bracketed Newton-bisection method. Curves that cannot be represented as
+        rational Bézier segments are sampled instead.
+
+        .. code-block:: python
+
+            t, distance = curve.project_points(measured_points)
+            closest_points = curve.evaluate(t)
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            Array of size :math:`N \times 3` (or a :obj:`~aerocaps.geom.point.PointArray3D`)
+
+        Returns
+        -------
+        numpy.ndarray, numpy.ndarray
+            Parameter values of the closest points and distances from the points to the curve (each of size
+            :math:`N`)
+        """
+        return _project_points_onto_curve(self, points)
+
+    def arc_length_table(self) -> ArcLengthTable:
+        """
+        Gets the arc-length table of the curve, which is computed on first use and cached until the curve is
+        modified
+
+        Returns
+        -------
+        ArcLengthTable
+            Arc-length table
+        """
+        return _get_arc_length_table(self)
+
+    def length(self) -> float:
+        """
+        Computes the arc-length of the curve using Gauss-Legendre quadrature on each knot span
+
+        Returns
+        -------
+        float
+            Arc-length of the curve
+        """
+        return self.arc_length_table().length
+
+    def t_at_length(self, s: float or np.ndarray) -> float or np.ndarray:
+        r"""
+        Finds the parameter values at which the arc-length of the curve from :math:`t=0` reaches each of a set of
+        values. See :obj:`~aerocaps.geom.curves.ArcLengthTable.t_at_length` for details.
+
+        .. code-block:: python
+
+            t = curve.t_at_length(0.25 * curve.length())
+
+        Parameters
+        ----------
+        s: float or numpy.ndarray
+            Arc-length or array of arc-lengths
+
+        Returns
+        -------
+        float or numpy.ndarray
+            Parameter values, with the same shape as ``s``
+        """
+        return self.arc_length_table().t_at_length(s)
+
+    def equal_arc_length_parameters(self, n: int) -> np.ndarray:
+        r"""
+        Finds the parameter values of :math:`n` points equally spaced in arc-length along the curve, including both
+        ends of the curve
+
+        .. code-block:: python
+
+            points = curve.evaluate(curve.equal_arc_length_parameters(101))
+
+        Parameters
+        ----------
+        n: int
+            Number of points (at least ``2``)
+
+        Returns
+        -------
+        numpy.ndarray
+            1-D array of :math:`n` parameter values
+        """
+        return self.arc_length_table().equal_arc_length_parameters(n)
+
     @staticmethod
     def _get_linear_tvec(nt: int) -> np.ndarray:
         """
@@ -1245,49 +1954,61 @@ class BezierCurve2D(PCurve2D):
             t=t, x=xy[:, 0], y=xy[:, 1], xp=xpyp[:, 0], yp=xpyp[:, 1], xpp=xppypp[:, 0], ypp=xppypp[:, 1]
         )
 
-    def compute_t_corresponding_to_x(self, x_seek: float, t0: float = 0.5) -> float:
+    def compute_t_corresponding_to_x(self, x_seek: float or np.ndarray, t0: float = 0.5, all_roots: bool = False
+                                      ) -> float or np.ndarray or typing.List[np.ndarray]:
         r"""
-        Computes the :math:`t`-value corresponding to a given :math:`x`-value
+        Computes the :math:`t`-value corresponding to a given :math:`x`-value or array of :math:`x`-values. The
+        roots are isolated using Bézier subdivision and refined using a bracketed Newton-bisection method, so only
+        roots in :math:`[0,1]` are returned, and every crossing of a non-monotonic curve can be found.
 
         Parameters
         ----------
-        x_seek: float
-            :math:`x`-value
+        x_seek: float or numpy.ndarray
+            :math:`x`-value or array of :math:`x`-values
         t0: float
-            Initial guess for the output :math:`t`-value. Default: ``0.5``
+            If the curve crosses a :math:`x`-value more than once, the :math:`t`-value closest to ``t0`` is
+            returned. Ignored if ``all_roots`` is ``True``. Default: ``0.5``
+        all_roots: bool
+            Whether to return all the :math:`t`-values corresponding to each :math:`x`-value. Default: ``False``
 
         Returns
         -------
-        float
-            :math:`t`-value corresponding to ``x_seek``
+        float or numpy.ndarray or typing.List[numpy.ndarray]
+            :math:`t`-value corresponding to ``x_seek`` (``nan`` if the curve does not reach ``x_seek``), or an
+            array of :math:`t`-values if ``x_seek`` is an array. If ``all_roots`` is ``True``, a sorted array of
+            :math:`t`-values, or a list of sorted arrays if ``x_seek`` is an array
         """
-        def bez_root_find_func(t):
-            point = self.evaluate_point2d(t[0])
-            return np.array([point.x.m - x_seek])
-
-        return fsolve(bez_root_find_func, x0=np.array([t0]))[0]
+        return _compute_t_corresponding_to_coordinate(
+            self, self.get_control_point_array(), None, 0, x_seek, t0, all_roots
+        )
 
-    def compute_t_corresponding_to_y(self, y_seek: float, t0: float = 0.5) -> float:
+    def compute_t_corresponding_to_y(self, y_seek: float or np.ndarray, t0: float = 0.5, all_roots: bool = False
+                                      ) -> float or np.ndarray or typing.List[np.ndarray]:
         r"""
-        Computes the :math:`t`-value corresponding to a given :math:`y`-value
+        Computes the :math:`t`-value corresponding to a given :math:`y`-value or array of :math:`y`-values. The
+        roots are isolated using Bézier subdivision and refined using a bracketed Newton-bisection method, so only
+        roots in :math:`[0,1]` are returned, and every crossing of a non-monotonic curve can be found.
 
         Parameters
         ----------
-        y_seek: float
-            :math:`y`-value
+        y_seek: float or numpy.ndarray
+            :math:`y`-value or array of :math:`y`-values
         t0: float
-            Initial guess for the output :math:`t`-value. Default: ``0.5``
+            If the curve crosses a :math:`y`-value more than once, the :math:`t`-value closest to ``t0`` is
+            returned. Ignored if ``all_roots`` is ``True``. Default: ``0.5``
+        all_roots: bool
+            Whether to return all the :math:`t`-values corresponding to each :math:`y`-value. Default: ``False``
 
         Returns
         -------
-        float
-            :math:`t`-value corresponding to ``y_seek``
+        float or numpy.ndarray or typing.List[numpy.ndarray]
+            :math:`t`-value corresponding to ``y_seek`` (``nan`` if the curve does not reach ``y_seek``), or an
+            array of :math:`t`-values if ``y_seek`` is an array. If ``all_roots`` is ``True``, a sorted array of
+            :math:`t`-values, or a list of sorted arrays if ``y_seek`` is an array
         """
-        def bez_root_find_func(t):
-            point = self.evaluate_point2d(t[0])
-            return np.array([point.y.m - y_seek])
-
-        return fsolve(bez_root_find_func, x0=np.array([t0]))[0]
+        return _compute_t_corresponding_to_coordinate(
+            self, self.get_control_point_array(), None, 1, y_seek, t0, all_roots
+        )
 
     def convert_to_3d(self, plane: str = "XY") -> "BezierCurve3D":
         """
@@ -1431,13 +2152,35 @@ class BezierCurve3D(PCurve3D):
             Whether this is a geometry used only for construction of other geometries. If ``True``, this
             geometry will not be exported or plotted. Default: ``False``
         """
-        self.control_points = [Point3D.from_array(p) for p in control_points] if isinstance(
-            control_points, np.ndarray) else control_points
+        self.control_points = control_points
         super().__init__(name=name, construction=construction)
 
+    @property
+    def control_points(self) -> Point3DSequenceView:
+        """
+        Control points as a sequence of point objects. Each point is a view into the control point array owned
+        by the curve, so ``curve.control_points[i].x.m = 1.0`` and ``curve.control_points[i] = point`` both modify
+        the curve and increment :obj:`~aerocaps.geom.Geometry.version`.
+
+        .. warning::
+
+            Point objects passed to the constructor or assigned to ``control_points`` are copied into the array,
+            not referenced. Modifying them afterward does not modify the curve.
+        """
+        return Point3DSequenceView(self._control_points, on_modify=self._mark_modified)
+
+    @control_points.setter
+    def control_points(self, control_points: typing.List[Point3D] or np.ndarray):
+        r"""
+        Sets the control points from a list of point objects or an array of size :math:`N \times 3`. The values
+        are copied into a new array owned by the curve.
+        """
+        self._control_points = point3d_sequence_to_array(control_points)
+        self._mark_modified()
+
     @property
     def degree(self):
-        return len(self.control_points) - 1
+        return self._control_points.shape[0] - 1
 
     @degree.setter
     def degree(self, value):
@@ -1447,7 +2190,7 @@ class BezierCurve3D(PCurve3D):
 
     def to_iges(self, *args, **kwargs) -> aerocaps.iges.entity.IGESEntity:
         return aerocaps.iges.curves.BezierIGES(
-            control_points_XYZ=self.get_control_point_array(),
+            control_points_XYZ=self._control_point_array(),
         )
 
     def reverse(self) -> "BezierCurve3D":
@@ -1487,7 +2230,8 @@ class BezierCurve3D(PCurve3D):
         BezierCurve2D
             Projected curve
         """
-        return BezierCurve2D(control_points=[pt.projection_on_principal_plane(plane) for pt in self.control_points])
+        projected_points = PointArray3D(self._control_points).projection_array_on_principal_plane(plane)
+        return BezierCurve2D(control_points=projected_points)
 
     def get_control_point_array(self, unit: str = "m") -> np.ndarray:
         r"""
@@ -1501,12 +2245,15 @@ class BezierCurve3D(PCurve3D):
         Returns
         -------
         numpy.ndarray
-            Array of size :math:`(n+1)\times 3` where :math:`n` is the curve degree
+            Array of size :math:`(n+1)\times 3` where :math:`n` is the curve degree. If ``unit`` is ``"m"``, the
+            array is a copy, so modifying it does not modify the curve.
         """
+        if unit == "m":
+            return self._control_points.copy()
         return np.array([p.as_array(unit=unit) for p in self.control_points])
 
     def evaluate(self, t: float or int or np.ndarray) -> np.ndarray:
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if isinstance(t, float):
             return np.array(bezier_curve_eval(P, t))
         if isinstance(t, int):
@@ -1521,7 +2268,7 @@ class BezierCurve3D(PCurve3D):
         return [Point3D.from_array(curve_point) for curve_point in curve]
 
     def dcdt(self, t: float or int or np.ndarray) -> np.ndarray:
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if isinstance(t, float):
             return np.array(bezier_curve_dcdt(P, t))
         if isinstance(t, int):
@@ -1529,7 +2276,7 @@ class BezierCurve3D(PCurve3D):
         return np.array(bezier_curve_dcdt_tvec(P, t))
 
     def d2cdt2(self, t: float or int or np.ndarray) -> np.ndarray:
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if isinstance(t, float):
             return np.array(bezier_curve_d2cdt2(P, t))
         if isinstance(t, int):
@@ -1547,71 +2294,89 @@ class BezierCurve3D(PCurve3D):
             xpp=xppyppzpp[:, 0], ypp=xppyppzpp[:, 1], zpp=xppyppzpp[:, 2]
         )
 
-    def compute_t_corresponding_to_x(self, x_seek: float, t0: float = 0.5):
+    def compute_t_corresponding_to_x(self, x_seek: float or np.ndarray, t0: float = 0.5, all_roots: bool = False
+                                      ) -> float or np.ndarray or typing.List[np.ndarray]:
         r"""
-        Computes the :math:`t`-value corresponding to a given :math:`x`-value
+        Computes the :math:`t`-value corresponding to a given :math:`x`-value or array of :math:`x`-values. The
+        roots are isolated using Bézier subdivision and refined using a bracketed Newton-bisection method, so only
+        roots in :math:`[0,1]` are returned, and every crossing of a non-monotonic curve can be found.
 
         Parameters
         ----------
-        x_seek: float
-            :math:`x`-value
+        x_seek: float or numpy.ndarray
+            :math:`x`-value or array of :math:`x`-values
         t0: float
-            Initial guess for the output :math:`t`-value. Default: ``0.5``
+            If the curve crosses a :math:`x`-value more than once, the :math:`t`-value closest to ``t0`` is
+            returned. Ignored if ``all_roots`` is ``True``. Default: ``0.5``
+        all_roots: bool
+            Whether to return all the :math:`t`-values corresponding to each :math:`x`-value. Default: ``False``
 
         Returns
         -------
-        float
-            :math:`t`-value corresponding to ``x_seek``
+        float or numpy.ndarray or typing.List[numpy.ndarray]
+            :math:`t`-value corresponding to ``x_seek`` (``nan`` if the curve does not reach ``x_seek``), or an
+            array of :math:`t`-values if ``x_seek`` is an array. If ``all_roots`` is ``True``, a sorted array of
+            :math:`t`-values, or a list of sorted arrays if ``x_seek`` is an array
         """
-        def bez_root_find_func(t):
-            point = self.evaluate_point3d(t[0])
-            return np.array([point.x.m - x_seek])
-
-        return fsolve(bez_root_find_func, x0=np.array([t0]))[0]
+        return _compute_t_corresponding_to_coordinate(
+            self, self._control_point_array(), None, 0, x_seek, t0, all_roots
+        )
 
-    def compute_t_corresponding_to_y(self, y_seek: float, t0: float = 0.5):
+    def compute_t_corresponding_to_y(self, y_seek: float or np.ndarray, t0: float = 0.5, all_roots: bool = False
+                                      ) -> float or np.ndarray or typing.List[np.ndarray]:
         r"""
-        Computes the :math:`t`-value corresponding to a given :math:`y`-value
+        Computes the :math:`t`-value corresponding to a given :math:`y`-value or array of :math:`y`-values. The
+        roots are isolated using Bézier subdivision and refined using a bracketed Newton-bisection method, so only
+        roots in :math:`[0,1]` are returned, and every crossing of a non-monotonic curve can be found.
 
         Parameters
         ----------
-        y_seek: float
-            :math:`y`-value
+        y_seek: float or numpy.ndarray
+            :math:`y`-value or array of :math:`y`-values
         t0: float
-            Initial guess for the output :math:`t`-value. Default: ``0.5``
+            If the curve crosses a :math:`y`-value more than once, the :math:`t`-value closest to ``t0`` is
+            returned. Ignored if ``all_roots`` is ``True``. Default: ``0.5``
+        all_roots: bool
+            Whether to return all the :math:`t`-values corresponding to each :math:`y`-value. Default: ``False``
 
         Returns
         -------
-        float
-            :math:`t`-value corresponding to ``y_seek``
+        float or numpy.ndarray or typing.List[numpy.ndarray]
+            :math:`t`-value corresponding to ``y_seek`` (``nan`` if the curve does not reach ``y_seek``), or an
+            array of :math:`t`-values if ``y_seek`` is an array. If ``all_roots`` is ``True``, a sorted array of
+            :math:`t`-values, or a list of sorted arrays if ``y_seek`` is an array
         """
-        def bez_root_find_func(t):
-            point = self.evaluate_point3d(t[0])
-            return np.array([point.y.m - y_seek])
-
-        return fsolve(bez_root_find_func, x0=np.array([t0]))[0]
+        return _compute_t_corresponding_to_coordinate(
+            self, self._control_point_array(), None, 1, y_seek, t0, all_roots
+        )
 
-    def compute_t_corresponding_to_z(self, z_seek: float, t0: float = 0.5):
+    def compute_t_corresponding_to_z(self, z_seek: float or np.ndarray, t0: float = 0.5, all_roots: bool = False
+                                      ) -> float or np.ndarray or typing.List[np.ndarray]:
         r"""
-        Computes the :math:`t`-value corresponding to a given :math:`z`-value
+        Computes the :math:`t`-value corresponding to a given :math:`z`-value or array of :math:`z`-values. The
+        roots are isolated using Bézier subdivision and refined using a bracketed Newton-bisection method, so only
+        roots in :math:`[0,1]` are returned, and every crossing of a non-monotonic curve can be found.
 
         Parameters
         ----------
-        z_seek: float
-            :math:`z`-value
+        z_seek: float or numpy.ndarray
+            :math:`z`-value or array of :math:`z`-values
         t0: float
-            Initial guess for the output :math:`t`-value. Default: ``0.5``
+            If the curve crosses a :math:`z`-value more than once, the :math:`t`-value closest to ``t0`` is
+            returned. Ignored if ``all_roots`` is ``True``. Default: ``0.5``
+        all_roots: bool
+            Whether to return all the :math:`t`-values corresponding to each :math:`z`-value. Default: ``False``
 
         Returns
         -------
-        float
-            :math:`t`-value corresponding to ``z_seek``
+        float or numpy.ndarray or typing.List[numpy.ndarray]
+            :math:`t`-value corresponding to ``z_seek`` (``nan`` if the curve does not reach ``z_seek``), or an
+            array of :math:`t`-values if ``z_seek`` is an array. If ``all_roots`` is ``True``, a sorted array of
+            :math:`t`-values, or a list of sorted arrays if ``z_seek`` is an array
         """
-        def bez_root_find_func(t):
-            point = self.evaluate_point3d(t[0])
-            return np.array([point.z.m - z_seek])
-
-        return fsolve(bez_root_find_func, x0=np.array([t0]))[0]
+        return _compute_t_corresponding_to_coordinate(
+            self, self._control_point_array(), None, 2, z_seek, t0, all_roots
+        )
 
     def transform(self, **transformation_kwargs) -> "BezierCurve3D":
         """
@@ -1629,7 +2394,7 @@ class BezierCurve3D(PCurve3D):
         """
         transformation = Transformation3D(**transformation_kwargs)
         return BezierCurve3D(
-            transformation.transform(self.get_control_point_array()),
+            transformation.transform(self._control_point_array()),
             name=self.name,
             construction=self.construction
         )
@@ -1645,7 +2410,7 @@ class BezierCurve3D(PCurve3D):
             A new Bézier curve with identical shape to the current one but with one additional control point.
         """
         n = self.degree
-        P = self.get_control_point_array()
+        P = self._control_point_array()
 
         # New array has one additional control point (current array only has n+1 control points)
         new_control_points = np.zeros((P.shape[0] + 1, P.shape[1]))
@@ -1677,7 +2442,7 @@ class BezierCurve3D(PCurve3D):
         # Number of control points, curve degree, control point array
         n_ctrl_points = len(self.control_points)
         degree = n_ctrl_points - 1
-        P = np.array([p.as_array() for p in self.control_points])
+        P = self._control_points
 
         def de_casteljau(i: int, j: int) -> np.ndarray:
             """
@@ -1908,51 +2673,61 @@ class RationalBezierCurve2D(PCurve2D):
             xpp=xppypp[:, 0], ypp=xppypp[:, 1]
         )
 
-    def compute_t_corresponding_to_x(self, x_seek: float, t0: float = 0.5):
+    def compute_t_corresponding_to_x(self, x_seek: float or np.ndarray, t0: float = 0.5, all_roots: bool = False
+                                      ) -> float or np.ndarray or typing.List[np.ndarray]:
         r"""
-        Computes the :math:`t`-value corresponding to a given :math:`x`-value
+        Computes the :math:`t`-value corresponding to a given :math:`x`-value or array of :math:`x`-values. The
+        roots are isolated using Bézier subdivision and refined using a bracketed Newton-bisection method, so only
+        roots in :math:`[0,1]` are returned, and every crossing of a non-monotonic curve can be found.
 
         Parameters
         ----------
-        x_seek: float
-            :math:`x`-value
+        x_seek: float or numpy.ndarray
+            :math:`x`-value or array of :math:`x`-values
         t0: float
-            Initial guess for the output :math:`t`-value. Default: ``0.5``
+            If the curve crosses a :math:`x`-value more than once, the :math:`t`-value closest to ``t0`` is
+            returned. Ignored if ``all_roots`` is ``True``. Default: ``0.5``
+        all_roots: bool
+            Whether to return all the :math:`t`-values corresponding to each :math:`x`-value. Default: ``False``
 
         Returns
         -------
-        float
-            :math:`t`-value corresponding to ``x_seek``
+        float or numpy.ndarray or typing.List[numpy.ndarray]
+            :math:`t`-value corresponding to ``x_seek`` (``nan`` if the curve does not reach ``x_seek``), or an
+            array of :math:`t`-values if ``x_seek`` is an array. If ``all_roots`` is ``True``, a sorted array of
+            :math:`t`-values, or a list of sorted arrays if ``x_seek`` is an array
         """
+        return _compute_t_corresponding_to_coordinate(
+            self, self.get_control_point_array(), self.weights, 0, x_seek, t0, all_roots
+        )
 
-        def bez_root_find_func(t):
-            point = self.evaluate_point2d(t[0])
-            return np.array([point.x.m - x_seek])
-
-        return fsolve(bez_root_find_func, x0=np.array([t0]))[0]
-
-    def compute_t_corresponding_to_y(self, y_seek: float, t0: float = 0.5):
+    def compute_t_corresponding_to_y(self, y_seek: float or np.ndarray, t0: float = 0.5, all_roots: bool = False
+                                      ) -> float or np.ndarray or typing.List[np.ndarray]:
         r"""
-        Computes the :math:`t`-value corresponding to a given :math:`y`-value
+        Computes the :math:`t`-value corresponding to a given :math:`y`-value or array of :math:`y`-values. The
+        roots are isolated using Bézier subdivision and refined using a bracketed Newton-bisection method, so only
+        roots in :math:`[0,1]` are returned, and every crossing of a non-monotonic curve can be found.
 
         Parameters
         ----------
-        y_seek: float
-            :math:`y`-value
+        y_seek: float or numpy.ndarray
+            :math:`y`-value or array of :math:`y`-values
         t0: float
-            Initial guess for the output :math:`t`-value. Default: ``0.5``
+            If the curve crosses a :math:`y`-value more than once, the :math:`t`-value closest to ``t0`` is
+            returned. Ignored if ``all_roots`` is ``True``. Default: ``0.5``
+        all_roots: bool
+            Whether to return all the :math:`t`-values corresponding to each :math:`y`-value. Default: ``False``
 
         Returns
         -------
-        float
-            :math:`t`-value corresponding to ``y_seek``
+        float or numpy.ndarray or typing.List[numpy.ndarray]
+            :math:`t`-value corresponding to ``y_seek`` (``nan`` if the curve does not reach ``y_seek``), or an
+            array of :math:`t`-values if ``y_seek`` is an array. If ``all_roots`` is ``True``, a sorted array of
+            :math:`t`-values, or a list of sorted arrays if ``y_seek`` is an array
         """
-
-        def bez_root_find_func(t):
-            point = self.evaluate_point2d(t[0])
-            return np.array([point.y.m - y_seek])
-
-        return fsolve(bez_root_find_func, x0=np.array([t0]))[0]
+        return _compute_t_corresponding_to_coordinate(
+            self, self.get_control_point_array(), self.weights, 1, y_seek, t0, all_roots
+        )
 
     def transform(self, **transformation_kwargs) -> "RationalBezierCurve2D":
         """
@@ -2084,8 +2859,7 @@ class RationalBezierCurve3D(PCurve3D):
             Whether this is a geometry used only for construction of other geometries. If ``True``, this
             geometry will not be exported or plotted. Default: ``False``
         """
-        self.control_points = [Point3D.from_array(p) for p in control_points] if isinstance(
-            control_points, np.ndarray) else control_points
+        self.control_points = control_points
         assert weights.ndim == 1
         assert len(control_points) == len(weights)
 
@@ -2095,7 +2869,7 @@ class RationalBezierCurve3D(PCurve3D):
                 raise NegativeWeightError("All weights must be non-negative")
 
         self.dim = 3
-        self.weights = np.array(weights)
+        self.weights = weights
         self.knot_vector = np.zeros(2 * len(control_points))
         self.knot_vector[len(control_points):] = 1.0
         self.degree = len(control_points) - 1
@@ -2103,11 +2877,49 @@ class RationalBezierCurve3D(PCurve3D):
         assert len(self.knot_vector) == len(control_points) + self.degree + 1
         super().__init__(name=name, construction=construction)
 
+    @property
+    def control_points(self) -> Point3DSequenceView:
+        """
+        Control points as a sequence of point objects. Each point is a view into the control point array owned
+        by the curve, so ``curve.control_points[i].x.m = 1.0`` and ``curve.control_points[i] = point`` both modify
+        the curve and increment :obj:`~aerocaps.geom.Geometry.version`.
+
+        .. warning::
+
+            Point objects passed to the constructor or assigned to ``control_points`` are copied into the array,
+            not referenced. Modifying them afterward does not modify the curve.
+        """
+        return Point3DSequenceView(self._control_points, on_modify=self._mark_modified)
+
+    @control_points.setter
+    def control_points(self, control_points: typing.List[Point3D] or np.ndarray):
+        r"""
+        Sets the control points from a list of point objects or an array of size :math:`N \times 3`. The values
+        are copied into a new array owned by the curve.
+        """
+        self._control_points = point3d_sequence_to_array(control_points)
+        self._mark_modified()
+
+    @property
+    def weights(self) -> np.ndarray:
+        """
+        Weight vector. The returned array is a read-only view; assign a new vector to this property to change
+        the weights.
+        """
+        weights = self._weights.view()
+        weights.flags.writeable = False
+        return weights
+
+    @weights.setter
+    def weights(self, weights: np.ndarray):
+        self._weights = np.array(weights, dtype=float)
+        self._mark_modified()
+
     def to_iges(self, *args, **kwargs) -> aerocaps.iges.entity.IGESEntity:
         return aerocaps.iges.curves.RationalBSplineCurveIGES(
             knots=self.knot_vector,
             weights=self.weights,
-            control_points_XYZ=self.get_control_point_array(),
+            control_points_XYZ=self._control_point_array(),
             degree=self.degree
         )
 
@@ -2133,7 +2945,7 @@ class RationalBezierCurve3D(PCurve3D):
             A new rational Bézier curve with identical shape to the current one but with one additional control point.
         """
         n = self.degree
-        Pw = self.get_homogeneous_control_points()
+        Pw = self._homogeneous_control_point_array()
 
         # New array has one additional control point (current array only has n+1 control points)
         new_homogeneous_control_points = np.zeros((Pw.shape[0] + 1, Pw.shape[1]))
@@ -2164,8 +2976,11 @@ class RationalBezierCurve3D(PCurve3D):
         Returns
         -------
         numpy.ndarray
-            Array of size :math:`(n+1)\times 3` where :math:`n` is the curve degree
+            Array of size :math:`(n+1)\times 3` where :math:`n` is the curve degree. If ``unit`` is ``"m"``, the
+            array is a copy, so modifying it does not modify the curve.
         """
+        if unit == "m":
+            return self._control_points.copy()
         return np.array([p.as_array(unit=unit) for p in self.control_points])
 
     def get_homogeneous_control_points(self) -> np.ndarray:
@@ -2179,18 +2994,22 @@ class RationalBezierCurve3D(PCurve3D):
             represent the :math:`x`-coordinate, :math:`y`-coordinate, :math:`z`-coordinate, and weight of each
             control point.
         """
-        return np.column_stack((
-            self.get_control_point_array() * np.repeat(self.weights[:, np.newaxis], 3, axis=1),
-            self.weights
-        ))
+        return self._homogeneous_control_point_array().copy()
+
+    def _homogeneous_control_point_array(self) -> np.ndarray:
+        """Read-only array of control points in homogeneous coordinates, cached until the curve is modified"""
+        return self._get_cached_array("homogeneous_control_points", lambda: np.column_stack((
+            self._control_points * np.repeat(self._weights[:, np.newaxis], 3, axis=1),
+            self._weights
+        )))
 
     @classmethod
     def generate_from_array(cls, P: np.ndarray, weights: np.ndarray):
         return cls([Point3D(x=Length(m=xyz[0]), y=Length(m=xyz[1]), z=Length(m=xyz[2])) for xyz in P], weights)
 
     def evaluate(self, t: float or int or np.ndarray) -> np.ndarray:
-        P = self.get_control_point_array()
-        w = self.weights
+        P = self._control_point_list()
+        w = self._weight_list()
         if isinstance(t, float):
             return np.array(rational_bezier_curve_eval(P, w, t))
         if isinstance(t, int):
@@ -2204,8 +3023,8 @@ class RationalBezierCurve3D(PCurve3D):
         return [Point3D.from_array(curve_point) for curve_point in curve]
 
     def dcdt(self, t: float or int or np.ndarray) -> np.ndarray:
-        P = self.get_control_point_array()
-        w = self.weights
+        P = self._control_point_list()
+        w = self._weight_list()
         if isinstance(t, float):
             return np.array(rational_bezier_curve_dcdt(P, w, t))
         if isinstance(t, int):
@@ -2213,8 +3032,8 @@ class RationalBezierCurve3D(PCurve3D):
         return np.array(rational_bezier_curve_dcdt_tvec(P, w, t))
 
     def d2cdt2(self, t: float or int or np.ndarray) -> np.ndarray:
-        P = self.get_control_point_array()
-        w = self.weights
+        P = self._control_point_list()
+        w = self._weight_list()
         if isinstance(t, float):
             return np.array(rational_bezier_curve_d2cdt2(P, w, t))
         if isinstance(t, int):
@@ -2232,74 +3051,89 @@ class RationalBezierCurve3D(PCurve3D):
             xpp=xppyppzpp[:, 0], ypp=xppyppzpp[:, 1], zpp=xppyppzpp[:, 2]
         )
 
-    def compute_t_corresponding_to_x(self, x_seek: float, t0: float = 0.5):
+    def compute_t_corresponding_to_x(self, x_seek: float or np.ndarray, t0: float = 0.5, all_roots: bool = False
+                                      ) -> float or np.ndarray or typing.List[np.ndarray]:
         r"""
-        Computes the :math:`t`-value corresponding to a given :math:`x`-value
+        Computes the :math:`t`-value corresponding to a given :math:`x`-value or array of :math:`x`-values. The
+        roots are isolated using Bézier subdivision and refined using a bracketed Newton-bisection method, so only
+        roots in :math:`[0,1]` are returned, and every crossing of a non-monotonic curve can be found.
 
         Parameters
         ----------
-        x_seek: float
-            :math:`x`-value
+        x_seek: float or numpy.ndarray
+            :math:`x`-value or array of :math:`x`-values
         t0: float
-            Initial guess for the output :math:`t`-value. Default: ``0.5``
+            If the curve crosses a :math:`x`-value more than once, the :math:`t`-value closest to ``t0`` is
+            returned. Ignored if ``all_roots`` is ``True``. Default: ``0.5``
+        all_roots: bool
+            Whether to return all the :math:`t`-values corresponding to each :math:`x`-value. Default: ``False``
 
         Returns
         -------
-        float
-            :math:`t`-value corresponding to ``x_seek``
+        float or numpy.ndarray or typing.List[numpy.ndarray]
+            :math:`t`-value corresponding to ``x_seek`` (``nan`` if the curve does not reach ``x_seek``), or an
+            array of :math:`t`-values if ``x_seek`` is an array. If ``all_roots`` is ``True``, a sorted array of
+            :math:`t`-values, or a list of sorted arrays if ``x_seek`` is an array
         """
+        return _compute_t_corresponding_to_coordinate(
+            self, self._control_point_array(), self.weights, 0, x_seek, t0, all_roots
+        )
 
-        def bez_root_find_func(t):
-            point = self.evaluate_point3d(t[0])
-            return np.array([point.x.m - x_seek])
-
-        return fsolve(bez_root_find_func, x0=np.array([t0]))[0]
-
-    def compute_t_corresponding_to_y(self, y_seek: float, t0: float = 0.5):
+    def compute_t_corresponding_to_y(self, y_seek: float or np.ndarray, t0: float = 0.5, all_roots: bool = False
+                                      ) -> float or np.ndarray or typing.List[np.ndarray]:
         r"""
-        Computes the :math:`t`-value corresponding to a given :math:`y`-value
+        Computes the :math:`t`-value corresponding to a given :math:`y`-value or array of :math:`y`-values. The
+        roots are isolated using Bézier subdivision and refined using a bracketed Newton-bisection method, so only
+        roots in :math:`[0,1]` are returned, and every crossing of a non-monotonic curve can be found.
 
         Parameters
         ----------
-        y_seek: float
-            :math:`y`-value
+        y_seek: float or numpy.ndarray
+            :math:`y`-value or array of :math:`y`-values
         t0: float
-            Initial guess for the output :math:`t`-value. Default: ``0.5``
+            If the curve crosses a :math:`y`-value more than once, the :math:`t`-value closest to ``t0`` is
+            returned. Ignored if ``all_roots`` is ``True``. Default: ``0.5``
+        all_roots: bool
+            Whether to return all the :math:`t`-values corresponding to each :math:`y`-value. Default: ``False``
 
         Returns
         -------
-        float
-            :math:`t`-value corresponding to ``y_seek``
+        float or numpy.ndarray or typing.List[numpy.ndarray]
+            :math:`t`-value corresponding to ``y_seek`` (``nan`` if the curve does not reach ``y_seek``), or an
+            array of :math:`t`-values if ``y_seek`` is an array. If ``all_roots`` is ``True``, a sorted array of
+            :math:`t`-values, or a list of sorted arrays if ``y_seek`` is an array
         """
+        return _compute_t_corresponding_to_coordinate(
+            self, self._control_point_array(), self.weights, 1, y_seek, t0, all_roots
+        )
 
-        def bez_root_find_func(t):
-            point = self.evaluate_point3d(t[0])
-            return np.array([point.y.m - y_seek])
-
-        return fsolve(bez_root_find_func, x0=np.array([t0]))[0]
-
-    def compute_t_corresponding_to_z(self, z_seek: float, t0: float = 0.5):
+    def compute_t_corresponding_to_z(self, z_seek: float or np.ndarray, t0: float = 0.5, all_roots: bool = False
+                                      ) -> float or np.ndarray or typing.List[np.ndarray]:
         r"""
-        Computes the :math:`t`-value corresponding to a given :math:`z`-value
+        Computes the :math:`t`-value corresponding to a given :math:`z`-value or array of :math:`z`-values. The
+        roots are isolated using Bézier subdivision and refined using a bracketed Newton-bisection method, so only
+        roots in :math:`[0,1]` are returned, and every crossing of a non-monotonic curve can be found.
 
         Parameters
         ----------
-        z_seek: float
-            :math:`z`-value
+        z_seek: float or numpy.ndarray
+            :math:`z`-value or array of :math:`z`-values
         t0: float
-            Initial guess for the output :math:`t`-value. Default: ``0.5``
+            If the curve crosses a :math:`z`-value more than once, the :math:`t`-value closest to ``t0`` is
+            returned. Ignored if ``all_roots`` is ``True``. Default: ``0.5``
+        all_roots: bool
+            Whether to return all the :math:`t`-values corresponding to each :math:`z`-value. Default: ``False``
 
         Returns
         -------
-        float
-            :math:`t`-value corresponding to ``z_seek``
+        float or numpy.ndarray or typing.List[numpy.ndarray]
+            :math:`t`-value corresponding to ``z_seek`` (``nan`` if the curve does not reach ``z_seek``), or an
+            array of :math:`t`-values if ``z_seek`` is an array. If ``all_roots`` is ``True``, a sorted array of
+            :math:`t`-values, or a list of sorted arrays if ``z_seek`` is an array
         """
-
-        def bez_root_find_func(t):
-            point = self.evaluate_point3d(t[0])
-            return np.array([point.z.m - z_seek])
-
-        return fsolve(bez_root_find_func, x0=np.array([t0]))[0]
+        return _compute_t_corresponding_to_coordinate(
+            self, self._control_point_array(), self.weights, 2, z_seek, t0, all_roots
+        )
 
     def transform(self, **transformation_kwargs) -> "RationalBezierCurve3D":
         """
@@ -2317,7 +3151,7 @@ class RationalBezierCurve3D(PCurve3D):
         """
         transformation = Transformation3D(**transformation_kwargs)
         return RationalBezierCurve3D(
-            transformation.transform(self.get_control_point_array()),
+            transformation.transform(self._control_point_array()),
             weights=deepcopy(self.weights), 
             name=self.name, 
             construction=self.construction
@@ -2371,7 +3205,7 @@ class RationalBezierCurve3D(PCurve3D):
             :obj:`pyvista.Plotter.add_lines`
         """
         projection = "XYZ" if projection is None else projection
-        cps = self.get_control_point_array()
+        cps = self._control_point_array()
         args = tuple([cps[:, _projection_dict[axis]] for axis in projection])
         ax.plot(*args, **plt_kwargs)
 
@@ -2435,28 +3269,107 @@ class BSplineCurve3D(PCurve3D):
             Whether this is a geometry used only for construction of other geometries. If ``True``, this
             geometry will not be exported or plotted. Default: ``False``
         """
-        control_points = [Point3D.from_array(p) for p in control_points] if isinstance(
-            control_points, np.ndarray) else control_points
         assert knot_vector.ndim == 1
         assert len(knot_vector) == len(control_points) + degree + 1
 
         self.control_points = control_points
         self.dim = 3
         self.knot_vector = np.array(knot_vector)
-        self.weights = np.ones(len(self.control_points))
+        self._weights = np.ones(len(self.control_points))
         self.degree = degree
         super().__init__(name=name, construction=construction)
 
+    @property
+    def control_points(self) -> Point3DSequenceView:
+        """
+        Control points as a sequence of point objects. Each point is a view into the control point array owned
+        by the curve, so ``curve.control_points[i].x.m = 1.0`` and ``curve.control_points[i] = point`` both modify
+        the curve and increment :obj:`~aerocaps.geom.Geometry.version`.
+
+        .. warning::
+
+            Point objects passed to the constructor or assigned to ``control_points`` are copied into the array,
+            not referenced. Modifying them afterward does not modify the curve.
+        """
+        return Point3DSequenceView(self._control_points, on_modify=self._mark_modified)
+
+    @control_points.setter
+    def control_points(self, control_points: typing.List[Point3D] or np.ndarray):
+        r"""
+        Sets the control points from a list of point objects or an array of size :math:`N \times 3`. The values
+        are copied into a new array owned by the curve.
+        """
+        self._control_points = point3d_sequence_to_array(control_points)
+        self._mark_modified()
+
+    @property
+    def weights(self) -> np.ndarray:
+        """Weight vector (all ones for this curve type)"""
+        return self._weights
+
+    @property
+    def knot_vector(self) -> np.ndarray:
+        """
+        Knot vector. The returned array is a read-only view; assign a new vector to this property to change
+        the knots.
+        """
+        knot_vector = self._knot_vector.view()
+        knot_vector.flags.writeable = False
+        return knot_vector
+
+    @knot_vector.setter
+    def knot_vector(self, knot_vector: np.ndarray):
+        self._knot_vector = np.array(knot_vector, dtype=float)
+        self._mark_modified()
+
+    @classmethod
+    def interpolate_points(cls, points: np.ndarray, degree: int = 3, parameters: np.ndarray = None,
+                           name: str = "BSplineCurve3D", construction: bool = False) -> "BSplineCurve3D":
+        r"""
+        Creates a clamped B-spline curve passing through a sequence of points (global interpolation). The knots are
+        placed by averaging the parameter values of the points so that the interpolation matrix is well-conditioned.
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            Array of size :math:`N \times 3`
+        degree: int
+            Degree of the curve, which is reduced to :math:`N-1` if fewer than :math:`p+1` points are given.
+            Default: ``3``
+        parameters: numpy.ndarray
+            Increasing parameter values in :math:`[0,1]` at which the curve passes through the points. If not
+            specified, chord-length parameters are used. Default: ``None``
+        name: str
+            Name of the geometric object. Default: 'BSplineCurve3D'
+        construction: bool
+            Whether this is a geometry used only for construction of other geometries. Default: ``False``
+
+        Returns
+        -------
+        BSplineCurve3D
+            Interpolating curve with :math:`N` control points
+        """
+        points = np.asarray(points, dtype=float)
+        degree = min(degree, points.shape[0] - 1)
+        if parameters is None:
+            chord_lengths = np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))))
+            parameters = chord_lengths / chord_lengths[-1]
+        parameters = np.asarray(parameters, dtype=float)
+        averages = [np.mean(parameters[j:j + degree]) for j in range(1, points.shape[0] - degree)]
+        knots = np.concatenate((np.zeros(degree + 1), averages, np.ones(degree + 1)))
+        basis = bspline_basis_matrices(knots, degree, parameters, 0)[0]
+        return cls(np.linalg.solve(basis, points), knots, degree, name=name, construction=construction)
+
     def to_iges(self, *args, **kwargs) -> aerocaps.iges.entity.IGESEntity:
         return aerocaps.iges.curves.RationalBSplineCurveIGES(
             knots=self.knot_vector,
             weights=self.weights,
-            control_points_XYZ=self.control_points,
+            control_points_XYZ=self._control_point_array(),
             degree=self.degree
         )
 
     def reverse(self) -> "BSplineCurve3D":
-        return self.__class__(np.flipud(self.get_control_point_array()),
+        return self.__class__(np.flipud(self._control_point_array()),
                               (1.0 - self.knot_vector)[::-1],
                               self.degree)
 
@@ -2472,12 +3385,15 @@ class BSplineCurve3D(PCurve3D):
         Returns
         -------
         numpy.ndarray
-            Array of size :math:`(n+1)\times 3` where :math:`n` is the curve degree
+            Array of size :math:`(n+1)\times 3` where :math:`n` is the curve degree. If ``unit`` is ``"m"``, the
+            array is a copy, so modifying it does not modify the curve.
         """
+        if unit == "m":
+            return self._control_points.copy()
         return np.array([p.as_array(unit=unit) for p in self.control_points])
 
     def evaluate(self, t: float or int or np.ndarray) -> np.ndarray:
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         k = self.knot_vector
         if isinstance(t, float):
             return np.array(bspline_curve_eval(P, k, t))
@@ -2492,7 +3408,7 @@ class BSplineCurve3D(PCurve3D):
         return [Point3D.from_array(curve_point) for curve_point in curve]
 
     def dcdt(self, t: float or int or np.ndarray) -> np.ndarray:
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         k = self.knot_vector
         if isinstance(t, float):
             return np.array(bspline_curve_dcdt(P, k, t))
@@ -2501,7 +3417,7 @@ class BSplineCurve3D(PCurve3D):
         return np.array(bspline_curve_dcdt_tvec(P, k, t))
 
     def d2cdt2(self, t: float or int or np.ndarray) -> np.ndarray:
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         k = self.knot_vector
         if isinstance(t, float):
             return np.array(bspline_curve_d2cdt2(P, k, t))
@@ -2536,7 +3452,7 @@ class BSplineCurve3D(PCurve3D):
         """
         transformation = Transformation3D(**transformation_kwargs)
         return BSplineCurve3D(
-            transformation.transform(self.get_control_point_array()),
+            transformation.transform(self._control_point_array()),
             knot_vector=deepcopy(self.knot_vector), 
             name=self.name, 
             construction=self.construction
@@ -2603,8 +3519,6 @@ class NURBSCurve3D(PCurve3D):
             Whether this is a geometry used only for construction of other geometries. If ``True``, this
             geometry will not be exported or plotted. Default: ``False``
         """
-        control_points = [Point3D.from_array(p) for p in control_points] if isinstance(
-            control_points, np.ndarray) else control_points
         assert weights.ndim == 1
         assert knot_vector.ndim == 1
         assert len(knot_vector) == len(control_points) + degree + 1
@@ -2616,21 +3530,74 @@ class NURBSCurve3D(PCurve3D):
                 raise NegativeWeightError("All weights must be non-negative")
 
         self.control_points = control_points
-        self.weights = np.array(weights)
+        self.weights = weights
         self.knot_vector = np.array(knot_vector)
         self.degree = degree
         super().__init__(name=name, construction=construction)
 
+    @property
+    def control_points(self) -> Point3DSequenceView:
+        """
+        Control points as a sequence of point objects. Each point is a view into the control point array owned
+        by the curve, so ``curve.control_points[i].x.m = 1.0`` and ``curve.control_points[i] = point`` both modify
+        the curve and increment :obj:`~aerocaps.geom.Geometry.version`.
+
+        .. warning::
+
+            Point objects passed to the constructor or assigned to ``control_points`` are copied into the array,
+            not referenced. Modifying them afterward does not modify the curve.
+        """
+        return Point3DSequenceView(self._control_points, on_modify=self._mark_modified)
+
+    @control_points.setter
+    def control_points(self, control_points: typing.List[Point3D] or np.ndarray):
+        r"""
+        Sets the control points from a list of point objects or an array of size :math:`N \times 3`. The values
+        are copied into a new array owned by the curve.
+        """
+        self._control_points = point3d_sequence_to_array(control_points)
+        self._mark_modified()
+
+    @property
+    def weights(self) -> np.ndarray:
+        """
+        Weight vector. The returned array is a read-only view; assign a new vector to this property to change
+        the weights.
+        """
+        weights = self._weights.view()
+        weights.flags.writeable = False
+        return weights
+
+    @weights.setter
+    def weights(self, weights: np.ndarray):
+        self._weights = np.array(weights, dtype=float)
+        self._mark_modified()
+
+    @property
+    def knot_vector(self) -> np.ndarray:
+        """
+        Knot vector. The returned array is a read-only view; assign a new vector to this property to change
+        the knots.
+        """
+        knot_vector = self._knot_vector.view()
+        knot_vector.flags.writeable = False
+        return knot_vector
+
+    @knot_vector.setter
+    def knot_vector(self, knot_vector: np.ndarray):
+        self._knot_vector = np.array(knot_vector, dtype=float)
+        self._mark_modified()
+
     def to_iges(self, *args, **kwargs) -> aerocaps.iges.entity.IGESEntity:
         return aerocaps.iges.curves.RationalBSplineCurveIGES(
             knots=self.knot_vector,
             weights=self.weights,
-            control_points_XYZ=self.get_control_point_array(),
+            control_points_XYZ=self._control_point_array(),
             degree=self.degree
         )
 
     def reverse(self) -> "NURBSCurve3D":
-        return self.__class__(np.flipud(self.get_control_point_array()),
+        return self.__class__(np.flipud(self._control_point_array()),
                               self.weights[::-1],
                               (1.0 - self.knot_vector)[::-1],
                               self.degree)
@@ -2647,8 +3614,11 @@ class NURBSCurve3D(PCurve3D):
         Returns
         -------
         numpy.ndarray
-            Array of size :math:`(n+1)\times 3` where :math:`n` is the curve degree
+            Array of size :math:`(n+1)\times 3` where :math:`n` is the curve degree. If ``unit`` is ``"m"``, the
+            array is a copy, so modifying it does not modify the curve.
         """
+        if unit == "m":
+            return self._control_points.copy()
         return np.array([p.as_array(unit=unit) for p in self.control_points])
 
     def get_homogeneous_control_points(self) -> np.ndarray:
@@ -2662,14 +3632,18 @@ class NURBSCurve3D(PCurve3D):
             represent the :math:`x`-coordinate, :math:`y`-coordinate, :math:`z`-coordinate, and weight of each
             control point.
         """
-        return np.column_stack((
-            self.get_control_point_array() * np.repeat(self.weights[:, np.newaxis], 3, axis=1),
-            self.weights
-        ))
+        return self._homogeneous_control_point_array().copy()
+
+    def _homogeneous_control_point_array(self) -> np.ndarray:
+        """Read-only array of control points in homogeneous coordinates, cached until the curve is modified"""
+        return self._get_cached_array("homogeneous_control_points", lambda: np.column_stack((
+            self._control_points * np.repeat(self._weights[:, np.newaxis], 3, axis=1),
+            self._weights
+        )))
 
     def evaluate(self, t: float or int or np.ndarray) -> np.ndarray:
-        P = self.get_control_point_array()
-        w = self.weights
+        P = self._control_point_list()
+        w = self._weight_list()
         k = self.knot_vector
         if isinstance(t, float):
             return np.array(nurbs_curve_eval(P, w, k, t))
@@ -2684,8 +3658,8 @@ class NURBSCurve3D(PCurve3D):
         return [Point3D.from_array(curve_point) for curve_point in curve]
 
     def dcdt(self, t: float or int or np.ndarray) -> np.ndarray:
-        P = self.get_control_point_array()
-        w = self.weights
+        P = self._control_point_list()
+        w = self._weight_list()
         k = self.knot_vector
         if isinstance(t, float):
             return np.array(nurbs_curve_dcdt(P, w, k, t))
@@ -2694,8 +3668,8 @@ class NURBSCurve3D(PCurve3D):
         return np.array(nurbs_curve_dcdt_tvec(P, w, k, t))
 
     def d2cdt2(self, t: float or int or np.ndarray) -> np.ndarray:
-        P = self.get_control_point_array()
-        w = self.weights
+        P = self._control_point_list()
+        w = self._weight_list()
         k = self.knot_vector
         if isinstance(t, float):
             return np.array(nurbs_curve_d2cdt2(P, w, k, t))
@@ -2730,7 +3704,7 @@ class NURBSCurve3D(PCurve3D):
         """
         transformation = Transformation3D(**transformation_kwargs)
         return NURBSCurve3D(
-            transformation.transform(self.get_control_point_array()),
+            transformation.transform(self._control_point_array()),
             weights=deepcopy(self.weights),
             knot_vector=deepcopy(self.knot_vector),
             name=self.name, 
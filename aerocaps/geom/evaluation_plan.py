@@ -0,0 +1,270 @@
+"""
+Precomputed evaluation of surfaces at a fixed set of parameter values
+"""
+import typing
+
+import numpy as np
+import scipy.sparse
+
+from aerocaps.geom import Surface
+from aerocaps.geom.basis import bernstein_basis_matrix, bspline_basis_matrices, tensor_product_derivatives
+from aerocaps.geom.surfaces import BezierSurface, RationalBezierSurface, BSplineSurface, NURBSSurface
+
+__all__ = [
+    "SurfaceEvaluationPlan"
+]
+
+
+class SurfaceEvaluationPlan:
+    """
+    Basis matrices of a surface precomputed at a fixed set of parameter values so that the surface and its
+    derivatives can be re-evaluated with new control points using only matrix products
+    """
+    def __init__(self,
+                 u: np.ndarray,
+                 v: np.ndarray,
+                 degree_u: int,
+                 degree_v: int,
+                 knots_u: np.ndarray = None,
+                 knots_v: np.ndarray = None,
+                 max_derivative: int = 2,
+                 sparse: bool = None):
+        r"""
+        Basis matrices of a surface precomputed at a fixed set of parameter values. The basis matrices
+        :math:`\mathbf{B}_u^{(k)}` (size :math:`N_u \times (n+1)`) and :math:`\mathbf{B}_v^{(l)}`
+        (size :math:`N_v \times (m+1)`) and their derivatives up to ``max_derivative`` are computed once, and each
+        subsequent evaluation is just
+
+        .. math::
+
+            \mathbf{S}^{(k,l)} = \mathbf{B}_u^{(k)} \mathbf{P} \left[\mathbf{B}_v^{(l)}\right]^T
+
+        for each coordinate of the control points :math:`\mathbf{P}`. This is much faster than calling the
+        surface evaluation methods when the same parameter values are evaluated many times with different control
+        points (e.g., inside an optimization loop). Bernstein bases are used if the knot vectors are not specified,
+        and B-spline bases otherwise. Because each row of a B-spline basis matrix has at most :math:`p+1` non-zero
+        entries, B-spline basis matrices are stored as sparse matrices by default.
+
+        The plan does not store the control points or weights of any surface; they are passed to each evaluation
+        method instead. Weights are required for rational Bézier and NURBS surfaces.
+
+        .. code-block:: python
+
+            plan = SurfaceEvaluationPlan.from_surface(surf, np.linspace(0.0, 1.0, 50), np.linspace(0.0, 1.0, 50))
+            for _ in range(1000):
+                P = ...  # New control points
+                S = plan.evaluate(P)  # Same as BezierSurface(P).evaluate_grid(50, 50)
+
+        Parameters
+        ----------
+        u: numpy.ndarray
+            1-D array of :math:`N_u` parameter values in the :math:`u`-direction
+        v: numpy.ndarray
+            1-D array of :math:`N_v` parameter values in the :math:`v`-direction
+        degree_u: int
+            Surface degree in the :math:`u`-direction
+        degree_v: int
+            Surface degree in the :math:`v`-direction
+        knots_u: numpy.ndarray
+            Knot vector in the :math:`u`-direction for a B-spline or NURBS surface. Default: ``None``
+        knots_v: numpy.ndarray
+            Knot vector in the :math:`v`-direction for a B-spline or NURBS surface. Default: ``None``
+        max_derivative: int
+            Highest derivative order (in each parametric direction) that can be evaluated using this plan.
+            Default: ``2``
+        sparse: bool
+            Whether to store the basis matrices as :obj:`scipy.sparse.csr_matrix` objects. If not specified,
+            sparse storage is used for B-spline bases and dense storage for Bernstein bases. Default: ``None``
+        """
+        if (knots_u is None) != (knots_v is None):
+            raise ValueError("Either both knot vectors or neither knot vector must be specified")
+
+        self.u = np.array(u, dtype=float)
+        self.v = np.array(v, dtype=float)
+        self.degree_u = degree_u
+        self.degree_v = degree_v
+        self.knots_u = None if knots_u is None else np.array(knots_u, dtype=float)
+        self.knots_v = None if knots_v is None else np.array(knots_v, dtype=float)
+        self.max_derivative = max_derivative
+        self.sparse = knots_u is not None if sparse is None else sparse
+
+        if self.knots_u is None:
+            Bu = [bernstein_basis_matrix(degree_u, self.u, d) for d in range(max_derivative + 1)]
+            Bv = [bernstein_basis_matrix(degree_v, self.v, d) for d in range(max_derivative + 1)]
+        else:
+            Bu = bspline_basis_matrices(self.knots_u, degree_u, self.u, max_derivative)
+            Bv = bspline_basis_matrices(self.knots_v, degree_v, self.v, max_derivative)
+
+        if self.sparse:
+            Bu = [scipy.sparse.csr_matrix(B) for B in Bu]
+            Bv = [scipy.sparse.csr_matrix(B) for B in Bv]
+
+        self.Bu = Bu
+        self.Bv = Bv
+
+    @classmethod
+    def from_surface(cls, surface: Surface, u: np.ndarray, v: np.ndarray, max_derivative: int = 2,
+                     sparse: bool = None) -> "SurfaceEvaluationPlan":
+        r"""
+        Creates an evaluation plan using the degrees (and knot vectors, if applicable) of a surface
+
+        Parameters
+        ----------
+        surface: Surface
+            Bézier, rational Bézier, B-spline, or NURBS surface
+        u: numpy.ndarray
+            1-D array of :math:`N_u` parameter values in the :math:`u`-direction
+        v: numpy.ndarray
+            1-D array of :math:`N_v` parameter values in the :math:`v`-direction
+        max_derivative: int
+            Highest derivative order (in each parametric direction) that can be evaluated using this plan.
+            Default: ``2``
+        sparse: bool
+            Whether to store the basis matrices as sparse matrices. See
+            :obj:`~aerocaps.geom.evaluation_plan.SurfaceEvaluationPlan.__init__`. Default: ``None``
+
+        Returns
+        -------
+        SurfaceEvaluationPlan
+            Evaluation plan for surfaces with the same basis as ``surface``
+        """
+        if isinstance(surface, (BezierSurface, RationalBezierSurface)):
+            return cls(u, v, surface.degree_u, surface.degree_v, max_derivative=max_derivative, sparse=sparse)
+        if isinstance(surface, (BSplineSurface, NURBSSurface)):
+            return cls(u, v, surface.degree_u, surface.degree_v, knots_u=surface.knots_u, knots_v=surface.knots_v,
+                       max_derivative=max_derivative, sparse=sparse)
+        raise TypeError(f"Evaluation plans are not supported for surfaces of type {type(surface).__name__}")
+
+    @property
+    def n_points_u(self) -> int:
+        """Number of control points in the :math:`u`-parametric direction required by this plan"""
+        return self.Bu[0].shape[1]
+
+    @property
+    def n_points_v(self) -> int:
+        """Number of control points in the :math:`v`-parametric direction required by this plan"""
+        return self.Bv[0].shape[1]
+
+    def evaluate_derivatives(self, P: np.ndarray, weights: np.ndarray = None,
+                             orders: typing.Iterable[typing.Tuple[int, int]] = ((0, 0),)
+                             ) -> typing.Dict[typing.Tuple[int, int], np.ndarray]:
+        r"""
+        Evaluates the surface and any of its partial derivatives at the parameter values of the plan
+
+        Parameters
+        ----------
+        P: numpy.ndarray
+            Control points of size :math:`(n+1) \times (m+1) \times 3`. Leading dimensions are allowed for
+            evaluating a stack of surfaces with the same basis at once
+        weights: numpy.ndarray
+            Control point weights of size :math:`(n+1) \times (m+1)` (with the same leading dimensions as ``P``)
+            for rational surfaces, or ``None`` for non-rational surfaces. Default: ``None``
+        orders: typing.Iterable[typing.Tuple[int, int]]
+            Derivative orders :math:`(k,l)` to evaluate, where :math:`k` is the order with respect to :math:`u` and
+            :math:`l` is the order with respect to :math:`v`. Default: ``((0, 0),)``
+
+        Returns
+        -------
+        typing.Dict[typing.Tuple[int, int], numpy.ndarray]
+            Arrays of size :math:`N_u \times N_v \times 3` keyed by derivative order
+        """
+        P = np.asarray(P, dtype=float)
+        if P.shape[-3:-1] != (self.n_points_u, self.n_points_v):
+            raise ValueError(f"Control point array of shape {P.shape} does not match the evaluation plan, which "
+                             f"requires {self.n_points_u} x {self.n_points_v} control points")
+        orders = list(orders)
+        if any(k > self.max_derivative or l > self.max_derivative for k, l in orders):
+            raise ValueError(f"Evaluation plan was created with a maximum derivative order of {self.max_derivative}")
+        return tensor_product_derivatives(
+            P, self.Bu, self.Bv, orders, weights=None if weights is None else np.asarray(weights, dtype=float)
+        )
+
+    def evaluate(self, P: np.ndarray, weights: np.ndarray = None) -> np.ndarray:
+        r"""
+        Evaluates the surface at the parameter values of the plan
+
+        Parameters
+        ----------
+        P: numpy.ndarray
+            Control points of size :math:`(n+1) \times (m+1) \times 3`
+        weights: numpy.ndarray
+            Control point weights of size :math:`(n+1) \times (m+1)` for rational surfaces. Default: ``None``
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N_u \times N_v \times 3`
+        """
+        return self.evaluate_derivatives(P, weights, [(0, 0)])[(0, 0)]
+
+    def dSdu(self, P: np.ndarray, weights: np.ndarray = None) -> np.ndarray:
+        r"""
+        Evaluates the first derivative of the surface with respect to :math:`u` at the parameter values of the plan
+
+        Parameters
+        ----------
+        P: numpy.ndarray
+            Control points of size :math:`(n+1) \times (m+1) \times 3`
+        weights: numpy.ndarray
+            Control point weights of size :math:`(n+1) \times (m+1)` for rational surfaces. Default: ``None``
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N_u \times N_v \times 3`
+        """
+        return self.evaluate_derivatives(P, weights, [(1, 0)])[(1, 0)]
+
+    def dSdv(self, P: np.ndarray, weights: np.ndarray = None) -> np.ndarray:
+        r"""
+        Evaluates the first derivative of the surface with respect to :math:`v` at the parameter values of the plan
+
+        Parameters
+        ----------
+        P: numpy.ndarray
+            Control points of size :math:`(n+1) \times (m+1) \times 3`
+        weights: numpy.ndarray
+            Control point weights of size :math:`(n+1) \times (m+1)` for rational surfaces. Default: ``None``
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N_u \times N_v \times 3`
+        """
+        return self.evaluate_derivatives(P, weights, [(0, 1)])[(0, 1)]
+
+    def d2Sdu2(self, P: np.ndarray, weights: np.ndarray = None) -> np.ndarray:
+        r"""
+        Evaluates the second derivative of the surface with respect to :math:`u` at the parameter values of the plan
+
+        Parameters
+        ----------
+        P: numpy.ndarray
+            Control points of size :math:`(n+1) \times (m+1) \times 3`
+        weights: numpy.ndarray
+            Control point weights of size :math:`(n+1) \times (m+1)` for rational surfaces. Default: ``None``
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N_u \times N_v \times 3`
+        """
+        return self.evaluate_derivatives(P, weights, [(2, 0)])[(2, 0)]
+
+    def d2Sdv2(self, P: np.ndarray, weights: np.ndarray = None) -> np.ndarray:
+        r"""
+        Evaluates the second derivative of the surface with respect to :math:`v` at the parameter values of the plan
+
+        Parameters
+        ----------
+        P: numpy.ndarray
+            Control points of size :math:`(n+1) \times (m+1) \times 3`
+        weights: numpy.ndarray
+            Control point weights of size :math:`(n+1) \times (m+1)` for rational surfaces. Default: ``None``
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N_u \times N_v \times 3`
+        """
+        return self.evaluate_derivatives(P, weights, [(0, 2)])[(0, 2)]
@@ -4,8 +4,17 @@ import typing
 
 import numpy as np
 import pyvista as pv
-
-from aerocaps.geom import Geometry
+from scipy.optimize import OptimizeResult
+
+from aerocaps.geom import Geometry, Surface
+from aerocaps.geom.batch import SurfaceBatch, evaluate_surface_grids
+from aerocaps.geom.bvh import SurfaceBVH
+from aerocaps.geom.continuity import ContinuityAuditReport, SharedEdge, audit_continuity, enforce_network_continuity
+from aerocaps.geom.curvature import SurfaceCurvatureData
+from aerocaps.geom.intersection import RaySurfaceIntersectionData, ray_surface_intersections
+from aerocaps.geom.plane import Plane
+from aerocaps.geom.section import SectionCurve, section_surfaces
+from aerocaps.geom.topology import PatchAdjacencyGraph, find_shared_edges
 from aerocaps.iges.iges_generator import IGESGenerator
 from aerocaps.stl.stl_generator import STLGenerator
 
@@ -170,6 +179,302 @@ class GeometryContainer:
             return list(self._container.keys())
         return [k for k, v in self._container.items() if isinstance(v, geom_type)]
 
+    def evaluate_all(self, Nu: int = 50, Nv: int = 50) -> typing.Dict[str, np.ndarray]:
+        r"""
+        Evaluates every non-construction surface in the container that has an ``evaluate_grid`` method on a uniform
+        :math:`N_u \times N_v` grid of parameter values. Bézier, rational Bézier, B-spline, and NURBS surfaces are
+        evaluated together using a :obj:`~aerocaps.geom.batch.SurfaceBatch`, which is much faster than evaluating
+        each surface separately for containers with many surfaces.
+
+        Parameters
+        ----------
+        Nu: int
+            Number of uniformly spaced parameter values in the :math:`u`-direction. Default: ``50``
+        Nv: int
+            Number of uniformly spaced parameter values in the :math:`v`-direction. Default: ``50``
+
+        Returns
+        -------
+        typing.Dict[str, numpy.ndarray]
+            Arrays of size :math:`N_u \times N_v \times 3` keyed by geometry name
+        """
+        surfs = {name: geom for name, geom in self._container.items()
+                 if isinstance(geom, Surface) and not geom.construction and hasattr(geom, "evaluate_grid")}
+        return dict(zip(surfs.keys(), evaluate_surface_grids(surfs.values(), Nu, Nv)))
+
+    def evaluate_curvature(self, Nu: int = 50, Nv: int = 50) -> typing.Dict[str, SurfaceCurvatureData]:
+        r"""
+        Computes the unit normals and the Gaussian, mean, and principal curvatures (with principal directions) of
+        every non-construction Bézier, rational Bézier, B-spline, and NURBS surface in the container on a uniform
+        :math:`N_u \times N_v` grid of parameter values. The surface derivatives are evaluated for all the surfaces
+        at once using a :obj:`~aerocaps.geom.batch.SurfaceBatch`.
+
+        Parameters
+        ----------
+        Nu: int
+            Number of uniformly spaced parameter values in the :math:`u`-direction. Default: ``50``
+        Nv: int
+            Number of uniformly spaced parameter values in the :math:`v`-direction. Default: ``50``
+
+        Returns
+        -------
+        typing.Dict[str, SurfaceCurvatureData]
+            Curvature data (with arrays of size :math:`N_u \times N_v` or :math:`N_u \times N_v \times 3`)
+            keyed by geometry name
+        """
+        surfs = {name: geom for name, geom in self._container.items()
+                 if isinstance(geom, SurfaceBatch.supported_types) and not geom.construction}
+        if not surfs:
+            return {}
+        derivatives = SurfaceBatch(surfs.values()).evaluate_derivatives_grid(Nu, Nv)
+        curvature = SurfaceCurvatureData.from_derivatives(derivatives)
+        return {name: curvature._subset(surf_idx) for surf_idx, name in enumerate(surfs.keys())}
+
+    def build_bvh(self, max_depth: int = 4, flatness: float = 1e-2, leaf_size: int = 4) -> SurfaceBVH:
+        """
+        Builds a bounding-volume hierarchy over every non-construction Bézier, rational Bézier, B-spline, and NURBS
+        surface in the container for broad-phase culling in ray casting, closest-point, intersection, and clash
+        queries. The hierarchy is not updated when the surfaces are modified, so it should be rebuilt afterward.
+
+        Parameters
+        ----------
+        max_depth: int
+            Maximum number of times each Bézier patch is split into four. Default: ``4``
+        flatness: float
+            Relative flatness tolerance below which patches are no longer split. See
+            :obj:`~aerocaps.geom.bvh.SurfaceBVH.__init__`. Default: ``1e-2``
+        leaf_size: int
+            Maximum number of leaf patches in each bottom-level node of the tree. Default: ``4``
+
+        Returns
+        -------
+        SurfaceBVH
+            Bounding-volume hierarchy whose ``names`` are the geometry names of the surfaces
+        """
+        surfs = {name: geom for name, geom in self._container.items()
+                 if isinstance(geom, SurfaceBatch.supported_types) and not geom.construction}
+        return SurfaceBVH(surfs.values(), names=surfs.keys(), max_depth=max_depth, flatness=flatness,
+                          leaf_size=leaf_size)
+
+    def ray_intersect(self, origins: np.ndarray, directions: np.ndarray, t_min: float = 0.0, t_max: float = np.inf,
+                      all_hits: bool = False, bvh: SurfaceBVH = None,
+                      num_workers: int = None) -> RaySurfaceIntersectionData:
+        r"""
+        Intersects a set of rays :math:`\mathbf{o} + t \mathbf{d}` with every non-construction Bézier, rational
+        Bézier, B-spline, and NURBS surface in the container. See
+        :obj:`~aerocaps.geom.intersection.ray_surface_intersections` for details.
+
+        .. code-block:: python
+
+            hits = container.ray_intersect(origins, directions)
+            blocking_surfaces = hits.hit_surface_names()
+
+        Parameters
+        ----------
+        origins: numpy.ndarray
+            Ray origins (size :math:`N \times 3`)
+        directions: numpy.ndarray
+            Ray directions (size :math:`N \times 3`), which need not be normalized
+        t_min: float
+            Minimum ray parameter. Default: ``0.0``
+        t_max: float
+            Maximum ray parameter. Default: ``numpy.inf``
+        all_hits: bool
+            Whether to return every intersection of each ray rather than only the first. Default: ``False``
+        bvh: SurfaceBVH
+            Bounding-volume hierarchy from :obj:`~aerocaps.geom.geometry_container.GeometryContainer.build_bvh` to
+            reuse across calls. If not specified, a new one is built. Default: ``None``
+        num_workers: int
+            Number of worker processes. The BVH is sent once to each worker by the pool initializer rather than with
+            every chunk of rays. If not specified, the number of CPUs is used. Default: ``None``
+
+        Returns
+        -------
+        RaySurfaceIntersectionData
+            Intersections, with ``surface_names`` set to the geometry names of the surfaces
+        """
+        return ray_surface_intersections(self.build_bvh() if bvh is None else bvh, origins, directions, t_min=t_min,
+                                         t_max=t_max, all_hits=all_hits, num_workers=num_workers)
+
+    def section(self, planes: typing.Iterable[Plane], max_depth: int = 3, samples_per_leaf: int = 4,
+                join_tolerance: float = None, num_workers: int = None) -> typing.List[typing.List[SectionCurve]]:
+        """
+        Cuts every non-construction Bézier, rational Bézier, B-spline, and NURBS surface in the container by a set of
+        planes. See :obj:`~aerocaps.geom.section.section_surfaces` for details.
+
+        .. code-block:: python
+
+            sections = container.section([Plane.plane_parallel_X(Length(m=x)) for x in stations])
+            fuselage_frames = [[curve.fit() for curve in station] for station in sections]
+
+        Parameters
+        ----------
+        planes: typing.Iterable[Plane]
+            Cutting planes
+        max_depth: int
+            Number of times each Bézier patch of each surface is split into four. Default: ``3``
+        samples_per_leaf: int
+            Number of sample points along each edge of each leaf patch. Default: ``4``
+        join_tolerance: float
+            Maximum distance between the ends of polylines that are joined. Default: ``None``
+        num_workers: int
+            Number of worker processes. If not specified, the number of CPUs is used. Default: ``None``
+
+        Returns
+        -------
+        typing.List[typing.List[SectionCurve]]
+            Section curves of each plane, with ``surface_names`` set to the geometry names of the surfaces
+        """
+        surfs = {name: geom for name, geom in self._container.items()
+                 if isinstance(geom, SurfaceBatch.supported_types) and not geom.construction}
+        return section_surfaces(surfs.values(), planes, names=surfs.keys(), max_depth=max_depth,
+                                samples_per_leaf=samples_per_leaf, join_tolerance=join_tolerance,
+                                num_workers=num_workers)
+
+    def find_shared_edges(self, tol: float = 1e-6, n_samples: int = 5, continuity: int = 1) -> PatchAdjacencyGraph:
+        """
+        Finds the coincident edges of every non-construction Bézier, rational Bézier, B-spline, and NURBS surface in
+        the container. See :obj:`~aerocaps.geom.topology.find_shared_edges` for details.
+
+        .. code-block:: python
+
+            graph = container.find_shared_edges(continuity=2)
+            container.enforce_continuity(graph.shared_edges)
+
+        Parameters
+        ----------
+        tol: float
+            Maximum distance between corresponding samples of coincident edges. Default: ``1e-6``
+        n_samples: int
+            Number of samples along each edge. Default: ``5``
+        continuity: int
+            Order of continuity assigned to every shared edge. Default: ``1``
+
+        Returns
+        -------
+        PatchAdjacencyGraph
+            Adjacency graph whose surfaces are referenced by their geometry names
+        """
+        surfs = {name: geom for name, geom in self._container.items()
+                 if isinstance(geom, SurfaceBatch.supported_types) and not geom.construction}
+        return find_shared_edges(surfs.values(), names=surfs.keys(), tol=tol, n_samples=n_samples,
+                                 continuity=continuity)
+
+    def enforce_continuity(self, shared_edges: typing.List[SharedEdge], fixed: typing.Iterable[str] = (),
+                           n_deriv_points: int = 10, solve_factors: bool = True, max_iterations: int = 20,
+                           tol: float = 1e-12) -> OptimizeResult:
+        """
+        Enforces continuity across every shared edge of a network of Bézier surfaces in the container simultaneously.
+        See :obj:`~aerocaps.geom.continuity.enforce_network_continuity` for details.
+
+        .. code-block:: python
+
+            shared_edges = [SharedEdge("BezierSurface", SurfaceEdge.u1, "BezierSurface.1", SurfaceEdge.u0)]
+            res = container.enforce_continuity(shared_edges)
+
+        Parameters
+        ----------
+        shared_edges: typing.List[SharedEdge]
+            Shared edges, with the surfaces referenced by their geometry names
+        fixed: typing.Iterable[str]
+            Names of the surfaces whose control points must not be modified. Default: ``()``
+        n_deriv_points: int
+            Number of locations along each shared edge where the cross-derivatives are compared. Default: ``10``
+        solve_factors: bool
+            Whether the tangent proportionality factors are solved for along with the control points. Default: ``True``
+        max_iterations: int
+            Maximum number of Gauss-Newton iterations. Default: ``20``
+        tol: float
+            Convergence tolerance on the relative norm of the correction. Default: ``1e-12``
+
+        Returns
+        -------
+        OptimizeResult
+            Solution of the continuity problem
+        """
+        return enforce_network_continuity(self._container, shared_edges, fixed=fixed, n_deriv_points=n_deriv_points,
+                                          solve_factors=solve_factors, max_iterations=max_iterations, tol=tol)
+
+    def audit_continuity(self, shared_edges: typing.List[SharedEdge] = None, n_samples: int = 20,
+                         tol: float = 1e-6) -> ContinuityAuditReport:
+        """
+        Measures the continuity errors along the shared edges of the surfaces in the container. See
+        :obj:`~aerocaps.geom.continuity.audit_continuity` for details.
+
+        .. code-block:: python
+
+            report = container.audit_continuity()
+            assert not report.failures(gap_tol=1e-8, angle_tol=np.radians(0.05))
+
+        Parameters
+        ----------
+        shared_edges: typing.List[SharedEdge]
+            Shared edges to audit, with the surfaces referenced by their geometry names. If not specified, the
+            shared edges found by :obj:`~aerocaps.geom.geometry_container.GeometryContainer.find_shared_edges` are
+            audited. Default: ``None``
+        n_samples: int
+            Number of samples along each edge. Default: ``20``
+        tol: float
+            Tolerance used to find the shared edges if ``shared_edges`` is not specified. Default: ``1e-6``
+
+        Returns
+        -------
+        ContinuityAuditReport
+            Errors at every sample of every edge
+        """
+        if shared_edges is None:
+            shared_edges = self.find_shared_edges(tol=tol).shared_edges
+        return audit_continuity(self._container, shared_edges, n_samples=n_samples)
+
+    def plot_curvature(self,
+                       quantity: str = "mean",
+                       show: bool = True,
+                       Nu: int = 50,
+                       Nv: int = 50,
+                       **mesh_kwargs) -> pv.Plotter:
+        """
+        Plots a curvature scalar field over every non-construction Bézier, rational Bézier, B-spline, and NURBS
+        surface in the container onto a :obj:`pyvista.Plotter` scene. A shared color scale is used for all the
+        surfaces.
+
+        Parameters
+        ----------
+        quantity: str
+            Curvature to plot. One of ``"gaussian"``, ``"mean"``, ``"max_principal"``, or ``"min_principal"``.
+            Default: ``"mean"``
+        show: bool
+            Whether to show the plot. Default: ``True``
+        Nu: int
+            The number of points in the :math:`u`-direction of each surface to evaluate. Default: ``50``
+        Nv: int
+            The number of points in the :math:`v`-direction of each surface to evaluate. Default: ``50``
+        mesh_kwargs:
+            Keyword arguments to pass to :obj:`pyvista.Plotter.add_mesh` (e.g., ``cmap`` or ``clim``)
+
+        Returns
+        -------
+        pyvista.Plotter
+            The plotter containing the curvature field
+        """
+        scalar_name = f"{quantity}_curvature"
+        if scalar_name not in SurfaceCurvatureData.scalar_fields:
+            raise ValueError(f"Invalid curvature quantity '{quantity}'. Must be one of 'gaussian', 'mean', "
+                             f"'max_principal', or 'min_principal'")
+
+        curvature = self.evaluate_curvature(Nu, Nv)
+        if "clim" not in mesh_kwargs and curvature:
+            values = np.concatenate([getattr(c, scalar_name).ravel() for c in curvature.values()])
+            mesh_kwargs["clim"] = [np.nanmin(values), np.nanmax(values)]
+
+        plot = pv.Plotter()
+        for name, curvature_data in curvature.items():
+            plot.add_mesh(curvature_data.to_pyvista(), scalars=scalar_name, **mesh_kwargs)
+        plot.add_axes()
+
+        if show:
+            plot.show()
+        return plot
+
     def plot(self,
              show: bool = True,
              Nu: int = 50,
@@ -247,13 +552,16 @@ class GeometryContainer:
             rng = np.random.default_rng(seed=color_seed)
             color_array = rng.uniform(low=0.0, high=1.0, size=(num_geoms, 3))
 
-        for geom_idx, geom in enumerate(self._container.values()):
+        # Evaluate all the untrimmed surfaces at once
+        surface_grids = self.evaluate_all(Nu, Nv)
+
+        for geom_idx, (geom_name, geom) in enumerate(self._container.items()):
             if geom.construction:  # Skip the construction geometries
                 continue
             if hasattr(geom, "plot_surface"):
                 color_kwargs = dict(color=color_array[geom_idx]) if random_colors else {}
                 try:
-                    grid = geom.plot_surface(plot, Nu, Nv, **color_kwargs)
+                    grid = geom.plot_surface(plot, Nu, Nv, XYZ=surface_grids.get(geom_name), **color_kwargs)
                     grid.aerocaps_surf = geom
                 except TypeError:
                     grid = geom.plot_surface(plot, Nt=Nt, **color_kwargs)
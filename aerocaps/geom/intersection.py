@@ -1,11 +1,29 @@
-from aerocaps.geom.curves import Line3D
+"""
+Intersections between lines, rays, planes, and surfaces
+"""
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from aerocaps.geom import Surface
+from aerocaps.geom.basis import bernstein_basis_matrix
+from aerocaps.geom.bvh import SurfaceBVH
+from aerocaps.geom.curves import BSplineCurve3D, CurveOnParametricSurface, Line3D
 from aerocaps.geom.plane import Plane
 from aerocaps.geom.point import Point3D
 from aerocaps.geom.vector import Vector3D
 
 
 __all__ = [
-    "intersection_of_line_and_plane"
+    "intersection_of_line_and_plane",
+    "RaySurfaceIntersectionData",
+    "ray_surface_intersections",
+    "points_inside_closed_surfaces",
+    "SurfaceIntersectionCurve",
+    "surface_surface_intersections"
 ]
 
 
@@ -21,3 +39,787 @@ def intersection_of_line_and_plane(line: Line3D, plane: Plane):
     l_ab_val = l_ab.value()
     l_ab_t = Point3D(x=l_ab_val[0] * t, y=l_ab_val[1] * t, z=l_ab_val[2] * t)
     return line.p0 + l_ab_t
+
+
+class RaySurfaceIntersectionData:
+    """Intersections of a set of rays with a set of surfaces"""
+    def __init__(self,
+                 ray_index: np.ndarray,
+                 surface_index: np.ndarray,
+                 u: np.ndarray,
+                 v: np.ndarray,
+                 t: np.ndarray,
+                 point: np.ndarray,
+                 normal: np.ndarray,
+                 surface_names: typing.List[str]):
+        r"""
+        Intersections of a set of rays :math:`\mathbf{o} + t \mathbf{d}` with a set of surfaces, stored as one entry
+        per intersection. Entries with a ``surface_index`` of :math:`-1` are rays that do not hit any surface, and
+        their parameter values, points, and normals are ``nan``.
+
+        Parameters
+        ----------
+        ray_index: numpy.ndarray
+            Index of the ray of each intersection
+        surface_index: numpy.ndarray
+            Index of the surface hit by the ray, or :math:`-1` for a miss
+        u: numpy.ndarray
+            :math:`u`-parameter value of each intersection on its surface
+        v: numpy.ndarray
+            :math:`v`-parameter value of each intersection on its surface
+        t: numpy.ndarray
+            Ray parameter of each intersection
+        point: numpy.ndarray
+            Intersection points (size :math:`N \times 3`)
+        normal: numpy.ndarray
+            Unit surface normals :math:`\mathbf{S}_u \times \mathbf{S}_v / \lVert \mathbf{S}_u \times \mathbf{S}_v
+            \rVert` at the intersection points (size :math:`N \times 3`)
+        surface_names: typing.List[str]
+            Names of the surfaces, indexed by ``surface_index``
+        """
+        self.ray_index = ray_index
+        self.surface_index = surface_index
+        self.u = u
+        self.v = v
+        self.t = t
+        self.point = point
+        self.normal = normal
+        self.surface_names = surface_names
+
+    @property
+    def hit(self) -> np.ndarray:
+        """Boolean mask of the entries that are intersections rather than misses"""
+        return self.surface_index >= 0
+
+    def hit_surface_names(self) -> typing.List[str or None]:
+        """
+        Gets the name of the surface hit in each entry
+
+        Returns
+        -------
+        typing.List[str or None]
+            Surface names, with ``None`` for misses
+        """
+        return [self.surface_names[i] if i >= 0 else None for i in self.surface_index]
+
+    def num_hits_per_ray(self, num_rays: int) -> np.ndarray:
+        """
+        Counts the intersections of each ray
+
+        Parameters
+        ----------
+        num_rays: int
+            Total number of rays
+
+        Returns
+        -------
+        numpy.ndarray
+            Integer array of size ``num_rays``
+        """
+        return np.bincount(self.ray_index[self.hit], minlength=num_rays)
+
+
+def _evaluate_patches(Pw: np.ndarray, s: np.ndarray, t: np.ndarray) -> (np.ndarray, np.ndarray, np.ndarray):
+    r"""
+    Evaluates rational Bézier patches and their first derivatives, each at its own local parameter values
+
+    Parameters
+    ----------
+    Pw: numpy.ndarray
+        Homogeneous control points of the patches (size :math:`K \times (p+1) \times (q+1) \times 4`)
+    s: numpy.ndarray
+        Local :math:`u`-parameter value for each patch (size :math:`K`)
+    t: numpy.ndarray
+        Local :math:`v`-parameter value for each patch (size :math:`K`)
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray, numpy.ndarray
+        Points and first derivatives with respect to :math:`s` and :math:`t` (each of size :math:`K \times 3`)
+    """
+    Bs = [bernstein_basis_matrix(Pw.shape[1] - 1, s, d) for d in (0, 1)]
+    Bt = [bernstein_basis_matrix(Pw.shape[2] - 1, t, d) for d in (0, 1)]
+    C = np.einsum("ki,kijc->kjc", Bs[0], Pw)
+    Cs = np.einsum("ki,kijc->kjc", Bs[1], Pw)
+    A = np.einsum("kj,kjc->kc", Bt[0], C)
+    As = np.einsum("kj,kjc->kc", Bt[0], Cs)
+    At = np.einsum("kj,kjc->kc", Bt[1], C)
+    w = A[:, 3:]
+    S = A[:, :3] / w
+    return S, (As[:, :3] - S * As[:, 3:]) / w, (At[:, :3] - S * At[:, 3:]) / w
+
+
+def _solve_ray_leaf_pairs(bvh: SurfaceBVH, origins: np.ndarray, directions: np.ndarray, leaf: np.ndarray,
+                          t_enter: np.ndarray, t_min: float, t_max: float, scale: float, tol: float,
+                          max_iterations: int) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+    r"""
+    Solves :math:`\mathbf{S}(s,t) - \mathbf{o} - \tau \mathbf{d} = \mathbf{0}` with Newton's method for pairs of
+    rays and leaf patches of a bounding-volume hierarchy, starting from the intersection of each ray with the plane
+    of the corners of its leaf
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray
+        Mask of the pairs with a converged solution inside the leaf and inside the ray parameter range, and the local
+        parameters (size :math:`K \times 2`), ray parameters, and points of the solutions
+    """
+    st = np.empty((leaf.shape[0], 2))
+    tau = np.empty(leaf.shape[0])
+    point = np.empty((leaf.shape[0], 3))
+    accepted = np.zeros(leaf.shape[0], dtype=bool)
+
+    # Leaf patches of different degrees are solved separately
+    net_shapes = np.array([net.shape[:2] for net in bvh.control_nets])
+    for net_shape in np.unique(net_shapes[leaf], axis=0):
+        group = np.flatnonzero(np.all(net_shapes[leaf] == net_shape, axis=1))
+        Pw = np.array([bvh.control_nets[i] for i in leaf[group]])
+        o, d = origins[group], directions[group]
+
+        # Initial guess from the plane through the corners of each leaf
+        corners = Pw[:, [0, 0, -1, -1], [0, -1, 0, -1]]
+        corners = corners[..., :3] / corners[..., 3:]
+        e_s = 0.5 * (corners[:, 2] - corners[:, 0] + corners[:, 3] - corners[:, 1])
+        e_t = 0.5 * (corners[:, 1] - corners[:, 0] + corners[:, 3] - corners[:, 2])
+        center = corners.mean(axis=1)
+        n = np.cross(e_s, e_t)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            g_tau = np.einsum("ij,ij->i", center - o, n) / np.einsum("ij,ij->i", d, n)
+            g_tau = np.where(np.isfinite(g_tau), g_tau, t_enter[group])
+            r = o + g_tau[:, np.newaxis] * d - center
+            a, b, c = (np.einsum("ij,ij->i", e_s, e_s), np.einsum("ij,ij->i", e_s, e_t),
+                       np.einsum("ij,ij->i", e_t, e_t))
+            r_s, r_t = np.einsum("ij,ij->i", e_s, r), np.einsum("ij,ij->i", e_t, r)
+            det = a * c - b * b
+            g_s = np.clip(np.nan_to_num(0.5 + (c * r_s - b * r_t) / det, nan=0.5), 0.0, 1.0)
+            g_t = np.clip(np.nan_to_num(0.5 + (a * r_t - b * r_s) / det, nan=0.5), 0.0, 1.0)
+
+        # Newton's method on all the pairs at once, solving each 3x3 system by Cramer's rule
+        active = np.arange(group.shape[0])
+        converged = np.zeros(group.shape[0], dtype=bool)
+        S = np.empty((group.shape[0], 3))
+        for _ in range(max_iterations):
+            S_a, S_s, S_t = _evaluate_patches(Pw[active], g_s[active], g_t[active])
+            S[active] = S_a
+            F = o[active] + g_tau[active, np.newaxis] * d[active] - S_a
+            done = np.linalg.norm(F, axis=1) <= tol * scale
+            converged[active[done]] = True
+            active, F, S_s, S_t = active[~done], F[~done], S_s[~done], S_t[~done]
+            if active.shape[0] == 0:
+                break
+            minus_d = -d[active]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                det = np.einsum("ij,ij->i", S_s, np.cross(S_t, minus_d))
+                delta_s = np.einsum("ij,ij->i", F, np.cross(S_t, minus_d)) / det
+                delta_t = np.einsum("ij,ij->i", S_s, np.cross(F, minus_d)) / det
+                delta_tau = np.einsum("ij,ij->i", S_s, np.cross(S_t, F)) / det
+            finite = np.isfinite(delta_s) & np.isfinite(delta_t) & np.isfinite(delta_tau)
+            active, delta_s, delta_t, delta_tau = active[finite], delta_s[finite], delta_t[finite], delta_tau[finite]
+
+            # Keep the iterates near the leaf, since solutions far outside of it belong to other leaves
+            g_s[active] = np.clip(g_s[active] + delta_s, -0.5, 1.5)
+            g_t[active] = np.clip(g_t[active] + delta_t, -0.5, 1.5)
+            g_tau[active] += delta_tau
+
+        inside = (g_s >= -1e-9) & (g_s <= 1.0 + 1e-9) & (g_t >= -1e-9) & (g_t <= 1.0 + 1e-9)
+        in_range = (g_tau >= t_min - tol * scale) & (g_tau <= t_max + tol * scale)
+        accepted[group] = converged & inside & in_range
+        st[group] = np.column_stack((np.clip(g_s, 0.0, 1.0), np.clip(g_t, 0.0, 1.0)))
+        tau[group] = g_tau
+        point[group] = S
+    return accepted, st, tau, point
+
+
+def _intersect_rays_with_leaves(bvh: SurfaceBVH, origins: np.ndarray, directions: np.ndarray, t_min: float,
+                                t_max: float, all_hits: bool, tol: float, max_iterations: int
+                                ) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+    """
+    Intersects rays with the leaf patches of a bounding-volume hierarchy. Only the first intersection of each ray
+    is needed if ``all_hits`` is ``False``, so the (ray, leaf) pairs are then solved in rounds in the order in which
+    the rays enter the leaf boxes, and pairs whose boxes lie beyond an intersection that has already been found are
+    skipped.
+
+    Returns the ray indices, leaf indices, local parameters, ray parameters, and points of the accepted
+    intersections, sorted by ray and ray parameter, with duplicates (from rays crossing shared leaf edges) removed
+    """
+    ray, leaf, t_enter = bvh.query_rays(origins, directions, t_min, t_max)
+    scale = max(np.linalg.norm(bvh._node_max[0][0] - bvh._node_min[0][0]), 1.0) if bvh.num_leaves else 1.0
+    accepted = np.zeros(ray.shape[0], dtype=bool)
+    st = np.empty((ray.shape[0], 2))
+    tau = np.empty(ray.shape[0])
+    point = np.empty((ray.shape[0], 3))
+
+    def solve(pairs: np.ndarray):
+        accepted[pairs], st[pairs], tau[pairs], point[pairs] = _solve_ray_leaf_pairs(
+            bvh, origins[ray[pairs]], directions[ray[pairs]], leaf[pairs], t_enter[pairs], t_min, t_max, scale, tol,
+            max_iterations
+        )
+
+    if all_hits:
+        solve(np.arange(ray.shape[0]))
+    else:
+        # Pairs are sorted by ray and then by entry parameter, so the rank of each pair within its ray is its round
+        first_pair = np.searchsorted(ray, ray, side="left")
+        rank = np.arange(ray.shape[0]) - first_pair
+        best_tau = np.full(origins.shape[0], np.inf)
+        for round_index in range(rank.max(initial=-1) + 1):
+            pairs = np.flatnonzero(rank == round_index)
+            pairs = pairs[t_enter[pairs] <= best_tau[ray[pairs]]]
+            if pairs.shape[0] == 0:
+                break
+            solve(pairs)
+            hits = pairs[accepted[pairs]]
+            np.minimum.at(best_tau, ray[hits], tau[hits])
+
+    ray, leaf, st, tau, point = ray[accepted], leaf[accepted], st[accepted], tau[accepted], point[accepted]
+    order = np.lexsort((tau, ray))
+    ray, leaf, st, tau, point = ray[order], leaf[order], st[order], tau[order], point[order]
+
+    # Remove repeated intersections, which occur where rays cross edges shared by leaves or surfaces
+    same_ray = np.diff(ray) == 0
+    if all_hits:
+        repeated = same_ray & (np.linalg.norm(np.diff(point, axis=0), axis=1) <= 1e3 * tol * scale)
+    else:
+        repeated = same_ray
+    keep = np.concatenate(([True], ~repeated))[:ray.shape[0]]
+    return ray[keep], leaf[keep], st[keep, 0], st[keep, 1], tau[keep], point[keep]
+
+
+_worker_bvh = None
+
+
+def _set_worker_bvh(bvh: SurfaceBVH):
+    """Stores the bounding-volume hierarchy sent once to each worker process"""
+    global _worker_bvh
+    _worker_bvh = bvh
+
+
+def _intersect_ray_chunk(start: int, origins: np.ndarray, directions: np.ndarray, t_min: float, t_max: float,
+                         all_hits: bool, tol: float, max_iterations: int, bvh: SurfaceBVH = None
+                         ) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+    """
+    Intersects a chunk of rays starting at ray index ``start`` with the leaf patches of a bounding-volume hierarchy
+    (by default, the one stored in the worker process)
+    """
+    ray, leaf, s, t, tau, point = _intersect_rays_with_leaves(
+        _worker_bvh if bvh is None else bvh, origins, directions, t_min, t_max, all_hits, tol, max_iterations
+    )
+    return ray + start, leaf, s, t, tau, point
+
+
+def ray_surface_intersections(surfaces: typing.Iterable[Surface] or SurfaceBVH,
+                              origins: np.ndarray,
+                              directions: np.ndarray,
+                              t_min: float = 0.0,
+                              t_max: float = np.inf,
+                              all_hits: bool = False,
+                              tol: float = 1e-12,
+                              max_iterations: int = 20,
+                              chunk_size: int = 50000,
+                              num_workers: int = None) -> RaySurfaceIntersectionData:
+    r"""
+    Intersects a set of rays :math:`\mathbf{o} + t \mathbf{d}`, :math:`t_\text{min} \leq t \leq t_\text{max}`, with a
+    set of Bézier, rational Bézier, B-spline, or NURBS surfaces. The surfaces are subdivided into nearly flat Bézier
+    patches held in a :obj:`~aerocaps.geom.bvh.SurfaceBVH`, every (ray, patch) pair whose bounding box is crossed by
+    the ray is refined using Newton's method on the patch, and only the solutions inside the patch are kept. The
+    rays are processed in chunks, and the chunks are distributed across a pool of processes, so that the Python-level
+    loops of each chunk run on separate cores.
+
+    Setting ``all_hits=True`` returns every intersection of every ray, which is useful for inside/outside tests on
+    closed shells (see :obj:`~aerocaps.geom.intersection.points_inside_closed_surfaces`). Each intersection is
+    reported once, even where a ray crosses an edge shared by two patches or two surfaces.
+
+    .. code-block:: python
+
+        hits = ray_surface_intersections([wing, fuselage], origins, directions)
+        blocked = hits.hit
+        first_surface = hits.hit_surface_names()
+
+    Parameters
+    ----------
+    surfaces: typing.Iterable[Surface] or SurfaceBVH
+        Surfaces to intersect, or a bounding-volume hierarchy already built over them (which is much faster when
+        the same surfaces are intersected many times)
+    origins: numpy.ndarray
+        Ray origins (size :math:`N \times 3`)
+    directions: numpy.ndarray
+        Ray directions (size :math:`N \times 3`), which need not be normalized
+    t_min: float
+        Minimum ray parameter. Default: ``0.0``
+    t_max: float
+        Maximum ray parameter. Default: ``numpy.inf``
+    all_hits: bool
+        Whether to return every intersection of each ray. If ``False``, only the intersection of each ray with the
+        smallest ray parameter is returned. Default: ``False``
+    tol: float
+        Convergence tolerance on the distance between the ray and the surface point, relative to the size of the
+        bounding box of the surfaces. Default: ``1e-12``
+    max_iterations: int
+        Maximum number of Newton iterations. Default: ``20``
+    chunk_size: int
+        Number of rays processed together by each process. Default: ``50000``
+    num_workers: int
+        Number of processes. If not specified, the number of CPUs is used. If ``1``, or if there is only one chunk,
+        the rays are processed in the current process. Default: ``None``
+
+    Returns
+    -------
+    RaySurfaceIntersectionData
+        If ``all_hits`` is ``False``, one entry per ray (in order), with a ``surface_index`` of :math:`-1` for rays
+        that do not hit any surface. Otherwise, one entry per intersection, sorted by ray and ray parameter.
+    """
+    bvh = surfaces if isinstance(surfaces, SurfaceBVH) else SurfaceBVH(surfaces)
+    origins = np.asarray(origins, dtype=float).reshape((-1, 3))
+    directions = np.asarray(directions, dtype=float).reshape((-1, 3))
+    num_rays = origins.shape[0]
+
+    chunk_args = [(start, origins[start:start + chunk_size], directions[start:start + chunk_size], t_min, t_max,
+                   all_hits, tol, max_iterations) for start in range(0, num_rays, chunk_size)]
+    num_workers = os.cpu_count() if num_workers is None else num_workers
+    if num_workers > 1 and len(chunk_args) > 1:
+        # Only the arrays of the hierarchy are sent, once to each process
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(chunk_args)), initializer=_set_worker_bvh,
+                                 initargs=(bvh._detached(),)) as executor:
+            chunks = list(executor.map(_intersect_ray_chunk, *zip(*chunk_args)))
+    else:
+        chunks = [_intersect_ray_chunk(*args, bvh=bvh) for args in chunk_args]
+    if chunks:
+        ray, leaf, s, t, tau, point = [np.concatenate(arrays) for arrays in zip(*chunks)]
+    else:
+        ray, leaf = np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+        s, t, tau, point = np.zeros(0), np.zeros(0), np.zeros(0), np.zeros((0, 3))
+
+    # Map the local patch parameters to the surface parameters and compute the normals
+    uv_bounds = bvh.uv_bounds[leaf]
+    u = uv_bounds[:, 0] + s * (uv_bounds[:, 1] - uv_bounds[:, 0])
+    v = uv_bounds[:, 2] + t * (uv_bounds[:, 3] - uv_bounds[:, 2])
+    normal = np.empty((ray.shape[0], 3))
+    for net_shape in {bvh.control_nets[i].shape for i in np.unique(leaf)}:
+        group = np.flatnonzero([bvh.control_nets[i].shape == net_shape for i in leaf])
+        _, S_s, S_t = _evaluate_patches(np.array([bvh.control_nets[i] for i in leaf[group]]), s[group], t[group])
+        normal[group] = np.cross(S_s, S_t)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normal /= np.linalg.norm(normal, axis=1, keepdims=True)
+    surface_index = bvh.surface_index[leaf]
+
+    if not all_hits:
+        # One entry per ray, with misses filled in
+        def fill(values: np.ndarray, fill_value) -> np.ndarray:
+            filled = np.full((num_rays,) + values.shape[1:], fill_value, dtype=values.dtype)
+            filled[ray] = values
+            return filled
+
+        surface_index, u, v, tau = fill(surface_index, -1), fill(u, np.nan), fill(v, np.nan), fill(tau, np.nan)
+        point, normal = fill(point, np.nan), fill(normal, np.nan)
+        ray = np.arange(num_rays)
+
+    return RaySurfaceIntersectionData(ray, surface_index, u, v, tau, point, normal, list(bvh.names))
+
+
+def points_inside_closed_surfaces(surfaces: typing.Iterable[Surface] or SurfaceBVH, points: np.ndarray,
+                                  direction: np.ndarray = None, num_workers: int = None) -> np.ndarray:
+    r"""
+    Determines whether points lie inside a closed shell made of surfaces by counting the intersections of a ray cast
+    from each point (an odd count means that the point is inside)
+
+    Parameters
+    ----------
+    surfaces: typing.Iterable[Surface] or SurfaceBVH
+        Surfaces forming a closed shell, or a bounding-volume hierarchy built over them
+    points: numpy.ndarray
+        Array of size :math:`N \times 3`
+    direction: numpy.ndarray
+        Direction of the rays. An oblique direction is used by default to avoid rays that run exactly along the
+        edges of surfaces aligned with the coordinate axes. Default: ``None``
+    num_workers: int
+        Number of processes. If not specified, the number of CPUs is used. Default: ``None``
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean array of size :math:`N`
+    """
+    points = np.asarray(points, dtype=float).reshape((-1, 3))
+    direction = np.array([0.5773502691896258, 0.5780316511258137, 0.5766681852282537]) if direction is None \
+        else np.asarray(direction, dtype=float)
+    hits = ray_surface_intersections(surfaces, points, np.tile(direction, (points.shape[0], 1)), all_hits=True,
+                                     num_workers=num_workers)
+    return hits.num_hits_per_ray(points.shape[0]) % 2 == 1
+
+
+class SurfaceIntersectionCurve:
+    """Intersection curve of two surfaces traced as a sequence of points"""
+    def __init__(self,
+                 surface_a: Surface,
+                 surface_b: Surface,
+                 points: np.ndarray,
+                 uv_a: np.ndarray,
+                 uv_b: np.ndarray,
+                 closed: bool):
+        r"""
+        Intersection curve of two surfaces traced as a sequence of :math:`N` points lying on both surfaces. The
+        model-space curve and the parameter-space curves (pcurves) on each surface are created by interpolating the
+        points with B-spline curves that share the same chord-length parameterization, so that a parameter value
+        :math:`t` corresponds to the same point on all three curves (up to the interpolation error between the
+        traced points). The pcurves are three-dimensional curves lying in the :math:`z=0` plane with
+        :math:`(x,y)=(u,v)`, as required by :obj:`~aerocaps.geom.curves.CurveOnParametricSurface`.
+
+        Parameters
+        ----------
+        surface_a: Surface
+            First surface
+        surface_b: Surface
+            Second surface
+        points: numpy.ndarray
+            Points on the intersection curve (size :math:`N \times 3`)
+        uv_a: numpy.ndarray
+            Parameter values of the points on the first surface (size :math:`N \times 2`)
+        uv_b: numpy.ndarray
+            Parameter values of the points on the second surface (size :math:`N \times 2`)
+        closed: bool
+            Whether the curve is a closed loop, in which case the first and last points are the same
+        """
+        self.surface_a = surface_a
+        self.surface_b = surface_b
+        self.points = points
+        self.uv_a = uv_a
+        self.uv_b = uv_b
+        self.closed = closed
+
+    @property
+    def parameters(self) -> np.ndarray:
+        """Normalized chord-length parameter values of the points"""
+        chord_lengths = np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(self.points, axis=0), axis=1))))
+        return chord_lengths / chord_lengths[-1]
+
+    def model_space_curve(self, degree: int = 3) -> BSplineCurve3D:
+        """
+        Interpolates the points of the intersection curve with a B-spline curve
+
+        Parameters
+        ----------
+        degree: int
+            Degree of the curve. Default: ``3``
+
+        Returns
+        -------
+        BSplineCurve3D
+            Model-space intersection curve
+        """
+        return BSplineCurve3D.interpolate_points(self.points, degree, self.parameters)
+
+    def parametric_curve_a(self, degree: int = 3) -> BSplineCurve3D:
+        """
+        Interpolates the parameter values of the intersection curve on the first surface with a B-spline curve
+
+        Parameters
+        ----------
+        degree: int
+            Degree of the curve. Default: ``3``
+
+        Returns
+        -------
+        BSplineCurve3D
+            Pcurve on the first surface, with points :math:`(u,v,0)`
+        """
+        return BSplineCurve3D.interpolate_points(np.column_stack((self.uv_a, np.zeros(self.uv_a.shape[0]))),
+                                                 degree, self.parameters)
+
+    def parametric_curve_b(self, degree: int = 3) -> BSplineCurve3D:
+        """
+        Interpolates the parameter values of the intersection curve on the second surface with a B-spline curve
+
+        Parameters
+        ----------
+        degree: int
+            Degree of the curve. Default: ``3``
+
+        Returns
+        -------
+        BSplineCurve3D
+            Pcurve on the second surface, with points :math:`(u,v,0)`
+        """
+        return BSplineCurve3D.interpolate_points(np.column_stack((self.uv_b, np.zeros(self.uv_b.shape[0]))),
+                                                 degree, self.parameters)
+
+    def curve_on_surface_a(self, degree: int = 3) -> CurveOnParametricSurface:
+        """
+        Creates the intersection curve as a curve on the first surface (e.g., for use as a trimming boundary)
+
+        Parameters
+        ----------
+        degree: int
+            Degree of the model-space curve and the pcurve. Default: ``3``
+
+        Returns
+        -------
+        CurveOnParametricSurface
+            Curve on the first surface
+        """
+        return CurveOnParametricSurface(self.surface_a, self.parametric_curve_a(degree), self.model_space_curve(degree))
+
+    def curve_on_surface_b(self, degree: int = 3) -> CurveOnParametricSurface:
+        """
+        Creates the intersection curve as a curve on the second surface (e.g., for use as a trimming boundary)
+
+        Parameters
+        ----------
+        degree: int
+            Degree of the model-space curve and the pcurve. Default: ``3``
+
+        Returns
+        -------
+        CurveOnParametricSurface
+            Curve on the second surface
+        """
+        return CurveOnParametricSurface(self.surface_b, self.parametric_curve_b(degree), self.model_space_curve(degree))
+
+
+def _find_intersection_seeds(surface_a: Surface, surface_b: Surface, scale: float, tol: float,
+                             max_iterations: int) -> np.ndarray:
+    r"""
+    Finds points on the intersection of two surfaces by subdividing both surfaces into bounding-volume hierarchies
+    and refining the centers of each pair of leaf patches with overlapping boxes onto the intersection using the
+    minimum-norm Gauss-Newton step for the :math:`3 \times 4` system :math:`\mathbf{S}_a(u_a,v_a) -
+    \mathbf{S}_b(u_b,v_b) = \mathbf{0}`
+
+    Returns
+    -------
+    numpy.ndarray
+        Parameter values :math:`(u_a,v_a,u_b,v_b)` of the seed points (size :math:`K \times 4`)
+    """
+    bvh_a, bvh_b = SurfaceBVH([surface_a]), SurfaceBVH([surface_b])
+    leaf_a, leaf_b = bvh_a.query_overlapping_leaves(bvh_b)
+    x = np.column_stack((
+        bvh_a.uv_bounds[leaf_a][:, [0, 2]] + 0.5 * np.diff(bvh_a.uv_bounds[leaf_a], axis=1)[:, [0, 2]],
+        bvh_b.uv_bounds[leaf_b][:, [0, 2]] + 0.5 * np.diff(bvh_b.uv_bounds[leaf_b], axis=1)[:, [0, 2]]
+    ))
+    converged = np.zeros(x.shape[0], dtype=bool)
+    active = np.arange(x.shape[0])
+    for _ in range(max_iterations):
+        d_a = surface_a.evaluate_derivatives_pairs(x[active, :2], order=1)
+        d_b = surface_b.evaluate_derivatives_pairs(x[active, 2:], order=1)
+        F = d_a.S - d_b.S
+        done = np.linalg.norm(F, axis=1) <= tol * scale
+        converged[active[done]] = True
+        keep = ~done
+        active, F = active[keep], F[keep]
+        if active.shape[0] == 0:
+            break
+        J = np.stack((d_a.Su[keep], d_a.Sv[keep], -d_b.Su[keep], -d_b.Sv[keep]), axis=2)
+        x[active] = np.clip(x[active] - np.einsum("kij,kj->ki", np.linalg.pinv(J), F), 0.0, 1.0)
+    return x[converged]
+
+
+def _evaluate_surface_pair(surface_a: Surface, surface_b: Surface, x: np.ndarray):
+    """Evaluates the points and first derivatives of two surfaces at parameter values :math:`(u_a,v_a,u_b,v_b)`"""
+    return (surface_a.evaluate_derivatives_pairs(x[np.newaxis, :2], order=1),
+            surface_b.evaluate_derivatives_pairs(x[np.newaxis, 2:], order=1))
+
+
+def _intersection_tangent(d_a, d_b) -> np.ndarray or None:
+    """Unit tangent of the intersection curve, or ``None`` where the surfaces are tangent to each other"""
+    n_a = np.cross(d_a.Su[0], d_a.Sv[0])
+    n_b = np.cross(d_b.Su[0], d_b.Sv[0])
+    T = np.cross(n_a, n_b)
+    norm = np.linalg.norm(T)
+    if not norm > 1e-10 * np.linalg.norm(n_a) * np.linalg.norm(n_b):
+        return None
+    return T / norm
+
+
+def _parameter_direction(d, T: np.ndarray) -> np.ndarray:
+    """Rate of change of :math:`(u,v)` along a model-space direction tangent to a surface"""
+    Su, Sv = d.Su[0], d.Sv[0]
+    G = np.array([[Su @ Su, Su @ Sv], [Su @ Sv, Sv @ Sv]])
+    return np.linalg.solve(G, np.array([Su @ T, Sv @ T]))
+
+
+def _correct_intersection_point(surface_a: Surface, surface_b: Surface, x: np.ndarray, plane_point: np.ndarray,
+                                plane_normal: np.ndarray, fixed: typing.Tuple[int, float] or None, tol: float,
+                                max_iterations: int = 10):
+    r"""
+    Moves a predicted point onto the intersection of two surfaces with Newton's method. The fourth equation is
+    either that the point lies on a plane perpendicular to the marching direction or (if ``fixed`` is given as
+    ``(index, value)``) that one of the parameters :math:`(u_a,v_a,u_b,v_b)` is fixed on the boundary of its
+    domain. Returns ``None`` if Newton's method does not converge.
+    """
+    for _ in range(max_iterations):
+        d_a, d_b = _evaluate_surface_pair(surface_a, surface_b, x)
+        F = d_a.S[0] - d_b.S[0]
+        if fixed is None:
+            g = (d_a.S[0] - plane_point) @ plane_normal
+            row = np.array([d_a.Su[0] @ plane_normal, d_a.Sv[0] @ plane_normal, 0.0, 0.0])
+        else:
+            g = x[fixed[0]] - fixed[1]
+            row = np.eye(4)[fixed[0]]
+        if np.linalg.norm(F) <= tol and abs(g) <= tol:
+            return x, d_a, d_b
+        J = np.vstack((np.column_stack((d_a.Su[0], d_a.Sv[0], -d_b.Su[0], -d_b.Sv[0])), row))
+        try:
+            x = x + np.linalg.solve(J, -np.append(F, g))
+        except np.linalg.LinAlgError:
+            return None
+        if not np.all(np.isfinite(x)) or np.any(np.abs(x - 0.5) > 1.0):
+            return None
+    return None
+
+
+def _march_intersection(surface_a: Surface, surface_b: Surface, x: np.ndarray, direction: float, step: float,
+                        chord_tolerance: float, tol: float, max_points: int) -> (typing.List[np.ndarray], bool):
+    """
+    Traces an intersection curve of two surfaces from a point in one direction with an adaptive step until the curve
+    leaves the domain of either surface, the surfaces become tangent, or the curve closes on its starting point.
+    The step is limited so that the deviation of each chord from the curve is at most ``chord_tolerance``
+    based on the change in the tangent direction over the previous step.
+
+    Returns the parameter values :math:`(u_a,v_a,u_b,v_b)` of the traced points and whether the curve closed
+    """
+    d_a, d_b = _evaluate_surface_pair(surface_a, surface_b, x)
+    T = _intersection_tangent(d_a, d_b)
+    path = [x]
+    if T is None:
+        return path, False
+    T = direction * T
+    start = d_a.S[0]
+    P = start
+    arc_length = 0.0
+    h = step
+    min_step = 1e-6 * step
+    while len(path) < max_points:
+        # Predictor along the tangent in the parameter space of both surfaces
+        try:
+            dx = np.concatenate((_parameter_direction(d_a, T), _parameter_direction(d_b, T)))
+        except np.linalg.LinAlgError:
+            break
+        x_predicted = x + h * dx
+        fixed = None
+        if np.any((x_predicted < 0.0) | (x_predicted > 1.0)):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                fraction = np.where(dx > 0.0, (1.0 - x) / (h * dx), np.where(dx < 0.0, -x / (h * dx), np.inf))
+            k = int(np.argmin(fraction))
+            fixed = (k, 1.0 if dx[k] > 0.0 else 0.0)
+            x_predicted = x + max(fraction[k], 0.0) * h * dx
+            x_predicted[k] = fixed[1]
+        result = _correct_intersection_point(surface_a, surface_b, x_predicted, P + h * T, T, fixed, tol)
+        if result is not None and fixed is None and np.any((result[0] < 0.0) | (result[0] > 1.0)):
+            # The corrected point left the domain, so end the curve on the boundary that it crossed
+            violation = np.maximum(-result[0], result[0] - 1.0)
+            k = int(np.argmax(violation))
+            fixed = (k, 0.0 if result[0][k] < 0.0 else 1.0)
+            result = _correct_intersection_point(surface_a, surface_b, np.clip(result[0], 0.0, 1.0), P, T, fixed,
+                                                 tol)
+        if result is None:
+            h *= 0.5
+            if h < min_step:
+                break
+            continue
+        x_new, d_a_new, d_b_new = result
+        P_new = d_a_new.S[0]
+        chord = np.linalg.norm(P_new - P)
+        T_new = _intersection_tangent(d_a_new, d_b_new)
+        if T_new is not None:
+            T_new = T_new if T_new @ T >= 0.0 else -T_new
+            angle = np.arccos(np.clip(T @ T_new, -1.0, 1.0))
+            if angle > 0.25 and h > min_step:
+                h *= 0.5
+                continue
+        else:
+            angle = 0.0
+
+        # Closed loop
+        if len(path) > 2 and arc_length > 2.0 * step:
+            segment = P_new - P
+            s = np.clip((start - P) @ segment / (segment @ segment), 0.0, 1.0)
+            if np.linalg.norm(P + s * segment - start) <= 0.1 * h + tol:
+                path.append(path[0])
+                return path, True
+
+        path.append(x_new)
+        if fixed is not None or T_new is None:
+            break
+        arc_length += chord
+        x, d_a, d_b, P, T = x_new, d_a_new, d_b_new, P_new, T_new
+        curvature = angle / max(chord, min_step)
+        h = min(step, 2.0 * h, np.sqrt(8.0 * chord_tolerance / curvature) if curvature > 0.0 else step)
+    return path, False
+
+
+def surface_surface_intersections(surface_a: Surface,
+                                  surface_b: Surface,
+                                  step: float = None,
+                                  chord_tolerance: float = None,
+                                  tol: float = 1e-12,
+                                  max_points: int = 10000) -> typing.List[SurfaceIntersectionCurve]:
+    r"""
+    Computes the intersection curves of two Bézier, rational Bézier, B-spline, or NURBS surfaces (e.g., a wing and
+    a fuselage) by marching. Seed points are found by subdividing both surfaces into nearly flat patches and
+    refining each pair of patches with overlapping bounding boxes onto the intersection. Each intersection curve is
+    then traced in both directions from a seed point using a predictor step along the tangent
+    :math:`\mathbf{n}_a \times \mathbf{n}_b` and a Newton corrector onto both surfaces, with a step size adapted to
+    the curvature of the intersection curve. Tracing stops where the curve leaves the domain of either surface (the
+    end point is placed exactly on the boundary), where the surfaces become tangent, or where the curve closes on
+    itself. Seed points lying on a traced curve are discarded.
+
+    .. code-block:: python
+
+        for curve in surface_surface_intersections(wing, fuselage):
+            trim_curve = curve.curve_on_surface_b()
+            wing_root = curve.model_space_curve()
+
+    Parameters
+    ----------
+    surface_a: Surface
+        First surface
+    surface_b: Surface
+        Second surface
+    step: float
+        Maximum distance between consecutive points of the traced curves. If not specified, :math:`1/50` of the
+        diagonal of the bounding box of both surfaces is used. Default: ``None``
+    chord_tolerance: float
+        Maximum deviation of the chord between consecutive points from the intersection curve. If not specified,
+        :math:`10^{-4}` times the diagonal of the bounding box of both surfaces is used. Default: ``None``
+    tol: float
+        Convergence tolerance on the distance between the surface points, relative to the diagonal of the bounding
+        box of both surfaces. Default: ``1e-12``
+    max_points: int
+        Maximum number of points traced in each direction from a seed point. Default: ``10000``
+
+    Returns
+    -------
+    typing.List[SurfaceIntersectionCurve]
+        Traced intersection curves
+    """
+    P_a, P_b = surface_a.get_control_point_array(), surface_b.get_control_point_array()
+    P = np.concatenate((P_a.reshape((-1, 3)), P_b.reshape((-1, 3))))
+    scale = max(np.linalg.norm(P.max(axis=0) - P.min(axis=0)), 1e-300)
+    step = scale / 50.0 if step is None else step
+    chord_tolerance = 1e-4 * scale if chord_tolerance is None else chord_tolerance
+    tol = tol * scale
+
+    seeds = _find_intersection_seeds(surface_a, surface_b, scale, tol / scale, max_iterations=20)
+    if seeds.shape[0] == 0:
+        return []
+    seed_points = surface_a.evaluate_pairs(seeds[:, :2])
+    remaining = np.ones(seeds.shape[0], dtype=bool)
+    curves = []
+    for seed_idx in range(seeds.shape[0]):
+        if not remaining[seed_idx]:
+            continue
+        forward, closed = _march_intersection(surface_a, surface_b, seeds[seed_idx], 1.0, step, chord_tolerance,
+                                              tol, max_points)
+        if closed:
+            path = forward
+        else:
+            backward, _ = _march_intersection(surface_a, surface_b, seeds[seed_idx], -1.0, step, chord_tolerance,
+                                              tol, max_points)
+            path = backward[:0:-1] + forward
+        path = np.array(path)
+        points = surface_a.evaluate_pairs(path[:, :2])
+
+        # Discard the seeds that lie on this curve
+        distance, _ = cKDTree(points).query(seed_points)
+        remaining &= distance > 0.6 * step
+        remaining[seed_idx] = False
+        if path.shape[0] > 1:
+            curves.append(SurfaceIntersectionCurve(surface_a, surface_b, points, path[:, :2], path[:, 2:], closed))
+    return curves
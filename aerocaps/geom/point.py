@@ -1,9 +1,11 @@
+import typing
+from collections.abc import Sequence
 from copy import deepcopy
 
 import numpy as np
 import pyvista as pv
 
-from aerocaps.units.length import Length
+from aerocaps.units.length import Length, ArrayBackedLength, LengthArray, length_conversions_to_m
 from aerocaps.geom import Geometry2D, Geometry3D
 import aerocaps.iges.entity
 import aerocaps.iges.point
@@ -12,6 +14,12 @@ import aerocaps.iges.point
 __all__ = [
     "Point2D",
     "Point3D",
+    "ArrayBackedPoint3D",
+    "Point3DSequenceView",
+    "Point3DNetView",
+    "PointArray3D",
+    "point3d_sequence_to_array",
+    "point3d_net_to_array",
     "Origin2D",
     "Origin3D"
 ]
@@ -19,6 +27,8 @@ __all__ = [
 
 class Point2D(Geometry2D):
     """Two-dimensional point class"""
+    __slots__ = ("x", "y")
+
     def __init__(self, x: Length, y: Length, name: str = "Point2D", construction: bool = False):
         """
         Two-dimensional point class
@@ -65,6 +75,8 @@ class Point3D(Geometry3D):
     """
     Three-dimensional point class
     """
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: Length, y: Length, z: Length, name: str = "Point3D", construction: bool = False):
         """
         Three-dimensional point class
@@ -128,6 +140,405 @@ class Point3D(Geometry3D):
         return self.__mul__(other)
 
 
+class ArrayBackedPoint3D(Point3D):
+    """
+    Three-dimensional point whose coordinates are stored (in meters) in a row of a float array owned by another
+    object, such as the control point array of a surface. Reading a coordinate reads from the array, and assigning
+    a coordinate (either ``p.x = Length(m=1.0)`` or ``p.x.m = 1.0``) writes to the array.
+    """
+    __slots__ = ("_buffer", "_on_modify")
+
+    def __init__(self, buffer: np.ndarray, name: str = "Point3D", construction: bool = False,
+                 on_modify: typing.Callable[[], None] = None):
+        """
+        Three-dimensional point view into a row of a float array
+
+        Parameters
+        ----------
+        buffer: numpy.ndarray
+            1-D array view with three elements holding the :math:`x`-, :math:`y`-, and :math:`z`-coordinates
+            of the point in meters
+        name: str
+            Name of the geometric object. Default: 'Point3D'
+        construction: bool
+            Whether this is a geometry used only for construction of other geometries. Default: ``False``
+        on_modify: typing.Callable[[], None]
+            Optional function called with no arguments each time the array is written through this view.
+            Default: ``None``
+        """
+        self._buffer = buffer
+        self._on_modify = on_modify
+        Geometry3D.__init__(self, name=name, construction=construction)
+
+    @property
+    def x(self) -> Length:
+        return ArrayBackedLength(self._buffer, 0, on_modify=self._on_modify)
+
+    @x.setter
+    def x(self, x: Length):
+        self._buffer[0] = x.m
+        self._notify()
+
+    @property
+    def y(self) -> Length:
+        return ArrayBackedLength(self._buffer, 1, on_modify=self._on_modify)
+
+    @y.setter
+    def y(self, y: Length):
+        self._buffer[1] = y.m
+        self._notify()
+
+    @property
+    def z(self) -> Length:
+        return ArrayBackedLength(self._buffer, 2, on_modify=self._on_modify)
+
+    @z.setter
+    def z(self, z: Length):
+        self._buffer[2] = z.m
+        self._notify()
+
+    def _notify(self):
+        if self._on_modify is not None:
+            self._on_modify()
+
+    def as_array(self, unit: str = "m"):
+        if unit == "m":
+            return self._buffer.copy()
+        return super().as_array(unit=unit)
+
+    def __copy__(self) -> Point3D:
+        return Point3D.from_array(self._buffer)
+
+    def __deepcopy__(self, memo) -> Point3D:
+        return Point3D.from_array(self._buffer)
+
+
+class Point3DSequenceView(Sequence):
+    r"""
+    List-like view of an :math:`N \times 3` float array as a sequence of
+    :obj:`~aerocaps.geom.point.ArrayBackedPoint3D` objects. Assigning a point to an index writes its coordinates
+    into the array. The number of points cannot be changed through the view.
+    """
+    def __init__(self, array: np.ndarray, on_modify: typing.Callable[[], None] = None):
+        r"""
+        List-like view of an :math:`N \times 3` float array
+
+        Parameters
+        ----------
+        array: numpy.ndarray
+            Array of size :math:`N \times 3` holding point coordinates in meters
+        on_modify: typing.Callable[[], None]
+            Optional function called with no arguments each time the array is written through this view or through
+            any point obtained from it. Default: ``None``
+        """
+        self._array = array
+        self._on_modify = on_modify
+
+    def __len__(self) -> int:
+        return self._array.shape[0]
+
+    def __getitem__(self, index: int or slice) -> ArrayBackedPoint3D or typing.List[ArrayBackedPoint3D]:
+        if isinstance(index, slice):
+            return [ArrayBackedPoint3D(self._array[i], on_modify=self._on_modify)
+                    for i in range(*index.indices(len(self)))]
+        return ArrayBackedPoint3D(self._array[index], on_modify=self._on_modify)
+
+    def __setitem__(self, index: int or slice, value: Point3D or typing.List[Point3D]):
+        if isinstance(index, slice):
+            self._array[index] = point3d_sequence_to_array(value)
+        else:
+            self._array[index] = value.as_array()
+        if self._on_modify is not None:
+            self._on_modify()
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array(self._array, dtype=dtype)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._array.tolist()})"
+
+
+class Point3DNetView(Sequence):
+    r"""
+    Nested-list-like view of an :math:`N \times M \times 3` float array as a sequence of rows, where each row
+    is a :obj:`~aerocaps.geom.point.Point3DSequenceView`. This is the form in which surfaces expose their
+    control points: ``surf.points[i][j]`` is a point object that reads from and writes to the control point array.
+    """
+    def __init__(self, array: np.ndarray, on_modify: typing.Callable[[], None] = None):
+        r"""
+        Nested-list-like view of an :math:`N \times M \times 3` float array
+
+        Parameters
+        ----------
+        array: numpy.ndarray
+            Array of size :math:`N \times M \times 3` holding point coordinates in meters
+        on_modify: typing.Callable[[], None]
+            Optional function called with no arguments each time the array is written through this view or through
+            any point obtained from it. Default: ``None``
+        """
+        self._array = array
+        self._on_modify = on_modify
+
+    def __len__(self) -> int:
+        return self._array.shape[0]
+
+    def __getitem__(self, index: int or slice) -> Point3DSequenceView or typing.List[Point3DSequenceView]:
+        if isinstance(index, slice):
+            return [Point3DSequenceView(self._array[i], on_modify=self._on_modify)
+                    for i in range(*index.indices(len(self)))]
+        return Point3DSequenceView(self._array[index], on_modify=self._on_modify)
+
+    def __setitem__(self, index: int, value: typing.List[Point3D] or np.ndarray):
+        self._array[index] = point3d_sequence_to_array(value)
+        if self._on_modify is not None:
+            self._on_modify()
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array(self._array, dtype=dtype)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._array.tolist()})"
+
+
+class PointArray3D(Geometry3D):
+    r"""
+    Collection of three-dimensional points stored as a single :math:`N \times 3` float array with a length unit
+    tag and an optional table of point names. Offers the point operations of :obj:`~aerocaps.geom.point.Point3D`
+    (arithmetic, ``as_array``, ``almost_equals``, and ``projection_on_principal_plane``) applied to all the points
+    at once, so that bulk geometry operations do not need to create a point object per point. Indexing with an
+    integer gives a detached :obj:`~aerocaps.geom.point.Point3D`.
+    """
+    def __init__(self, points: np.ndarray, unit: str = "m", point_names: typing.List[str] = None,
+                 name: str = "PointArray3D", construction: bool = False):
+        r"""
+        Collection of three-dimensional points stored as a single array
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            Array of size :math:`N \times 3` (or any array with :math:`3N` elements) containing the
+            :math:`x`-, :math:`y`-, and :math:`z`-coordinates of each point. The values are copied
+        unit: str
+            Length unit of the values in ``points``. Default: ``"m"``
+        point_names: typing.List[str]
+            Optional list of :math:`N` names, one for each point. Default: ``None``
+        name: str
+            Name of the geometric object. May be re-assigned a unique name when added to a
+            :obj:`~aerocaps.geom.geometry_container.GeometryContainer`. Default: 'PointArray3D'
+        construction: bool
+            Whether this is a geometry used only for construction of other geometries. If ``True``, this
+            geometry will not be exported or plotted. Default: ``False``
+        """
+        if unit not in length_conversions_to_m:
+            raise ValueError(f"Invalid length unit '{unit}'. Valid units are {list(length_conversions_to_m.keys())}")
+        self._array = np.array(points, dtype=float).reshape((-1, 3))
+        self.unit = unit
+        if point_names is not None and len(point_names) != len(self._array):
+            raise ValueError(f"Number of point names ({len(point_names)}) does not match the number of points "
+                             f"({len(self._array)})")
+        self.point_names = None if point_names is None else list(point_names)
+        super().__init__(name=name, construction=construction)
+
+    @classmethod
+    def from_array(cls, arr: np.ndarray, unit: str = "m") -> "PointArray3D":
+        return cls(arr, unit=unit)
+
+    @classmethod
+    def from_points(cls, points: typing.Iterable[Point3D], unit: str = "m") -> "PointArray3D":
+        """
+        Creates a point array from a sequence of point objects, keeping the name of each point in the name table
+
+        Parameters
+        ----------
+        points: typing.Iterable[Point3D]
+            Points to store
+        unit: str
+            Length unit in which to store the coordinates. Default: ``"m"``
+
+        Returns
+        -------
+        PointArray3D
+            Point array
+        """
+        points = list(points)
+        return cls(np.array([p.as_array(unit=unit) for p in points]).reshape((-1, 3)), unit=unit,
+                   point_names=[p.name for p in points])
+
+    def to_points(self) -> typing.List[Point3D]:
+        """
+        Converts the point array to a list of independent point objects
+
+        Returns
+        -------
+        typing.List[Point3D]
+            One point object per row of the array
+        """
+        if self.point_names is None:
+            return [self[i] for i in range(len(self))]
+        return [Point3D(x=Length(**{self.unit: xyz[0]}), y=Length(**{self.unit: xyz[1]}),
+                        z=Length(**{self.unit: xyz[2]}), name=point_name)
+                for xyz, point_name in zip(self._array.tolist(), self.point_names)]
+
+    @property
+    def x(self) -> LengthArray:
+        """:math:`x`-coordinates of the points (a detached copy)"""
+        return LengthArray(**{self.unit: self._array[:, 0]})
+
+    @property
+    def y(self) -> LengthArray:
+        """:math:`y`-coordinates of the points (a detached copy)"""
+        return LengthArray(**{self.unit: self._array[:, 1]})
+
+    @property
+    def z(self) -> LengthArray:
+        """:math:`z`-coordinates of the points (a detached copy)"""
+        return LengthArray(**{self.unit: self._array[:, 2]})
+
+    def as_array(self, unit: str = "m") -> np.ndarray:
+        r"""
+        Gets the coordinates of the points in a given length unit
+
+        Parameters
+        ----------
+        unit: str
+            Length unit of the output values. Default: ``"m"``
+
+        Returns
+        -------
+        numpy.ndarray
+            New array of size :math:`N \times 3`
+        """
+        if unit == self.unit:
+            return self._array.copy()
+        return self._array * (length_conversions_to_m[self.unit] / length_conversions_to_m[unit])
+
+    def almost_equals(self, other: "PointArray3D" or Point3D) -> np.ndarray:
+        """
+        Checks which points are approximately equal to the corresponding points of another point array
+        (or to a single point)
+
+        Parameters
+        ----------
+        other: PointArray3D or Point3D
+            Point array of the same length, or a single point to compare against every point
+
+        Returns
+        -------
+        numpy.ndarray
+            1-D boolean array with one element per point
+        """
+        return np.all(np.isclose(self.as_array(), other.as_array()), axis=-1)
+
+    def projection_array_on_principal_plane(self, plane: str = "XY", unit: str = "m") -> np.ndarray:
+        r"""
+        Projects the points onto a principal plane. Unlike
+        :obj:`~aerocaps.geom.point.Point3D.projection_on_principal_plane`, which returns a point object, the
+        projected points are returned as a plain array
+
+        Parameters
+        ----------
+        plane: str
+            Plane on which to project the points. Either 'XY', 'XZ', or 'YZ'. Default: 'XY'
+        unit: str
+            Length unit of the output values. Default: ``"m"``
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 2` containing the in-plane coordinates of the projected points
+        """
+        columns = {"XY": [0, 1], "XZ": [0, 2], "YZ": [1, 2]}
+        if plane not in columns:
+            raise ValueError("Invalid plane")
+        return self.as_array(unit=unit)[:, columns[plane]]
+
+    def to_iges(self, *args, **kwargs) -> typing.List[aerocaps.iges.entity.IGESEntity]:
+        return [aerocaps.iges.point.PointIGES(xyz) for xyz in self.as_array()]
+
+    def plot(self, plot: pv.Plotter, **point_kwargs):
+        plot.add_points(self.as_array(), **point_kwargs)
+
+    def __len__(self) -> int:
+        return self._array.shape[0]
+
+    def __getitem__(self, index: int or slice or np.ndarray) -> Point3D or "PointArray3D":
+        if isinstance(index, (int, np.integer)):
+            xyz = self._array[index]
+            point_name = "Point3D" if self.point_names is None else self.point_names[index]
+            return Point3D(x=Length(**{self.unit: float(xyz[0])}), y=Length(**{self.unit: float(xyz[1])}),
+                           z=Length(**{self.unit: float(xyz[2])}), name=point_name)
+        point_names = None if self.point_names is None else np.array(self.point_names, dtype=object)[index].tolist()
+        return PointArray3D(self._array[index], unit=self.unit, point_names=point_names)
+
+    def __iter__(self) -> typing.Iterator[Point3D]:
+        return (self[i] for i in range(len(self)))
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array(self.as_array(), dtype=dtype)
+
+    def __add__(self, other: "PointArray3D" or Point3D) -> "PointArray3D":
+        return PointArray3D(self._array + other.as_array(unit=self.unit), unit=self.unit)
+
+    def __sub__(self, other: "PointArray3D" or Point3D) -> "PointArray3D":
+        return PointArray3D(self._array - other.as_array(unit=self.unit), unit=self.unit)
+
+    def __mul__(self, other: float or int or np.ndarray) -> "PointArray3D":
+        if isinstance(other, np.ndarray) and other.ndim == 1:
+            other = other[:, np.newaxis]  # One scale factor per point
+        elif not isinstance(other, (float, int, np.ndarray)):
+            raise ValueError("Only multiplication between point arrays and scalars or arrays of scalars is "
+                             "currently supported")
+        return PointArray3D(self._array * other, unit=self.unit)
+
+    def __rmul__(self, other: float or int or np.ndarray) -> "PointArray3D":
+        return self.__mul__(other)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._array.tolist()}, unit='{self.unit}')"
+
+
+def point3d_sequence_to_array(points: typing.List[Point3D] or np.ndarray or PointArray3D) -> np.ndarray:
+    r"""
+    Converts a list of points (or an existing array or point view) into a new :math:`N \times 3` float array
+    with coordinates in meters
+
+    Parameters
+    ----------
+    points: typing.List[Point3D] or numpy.ndarray or PointArray3D
+        Points to convert
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of size :math:`N \times 3`
+    """
+    if isinstance(points, (np.ndarray, Point3DSequenceView)):
+        return np.array(points, dtype=float)
+    if isinstance(points, PointArray3D):
+        return points.as_array()
+    return np.array([(p.x.m, p.y.m, p.z.m) for p in points], dtype=float).reshape((len(points), 3))
+
+
+def point3d_net_to_array(points: typing.List[typing.List[Point3D]] or np.ndarray) -> np.ndarray:
+    r"""
+    Converts a nested list of points (or an existing array or point net view) into a new
+    :math:`N \times M \times 3` float array with coordinates in meters
+
+    Parameters
+    ----------
+    points: typing.List[typing.List[Point3D]] or numpy.ndarray
+        Points to convert
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of size :math:`N \times M \times 3`
+    """
+    if isinstance(points, (np.ndarray, Point3DNetView)):
+        return np.array(points, dtype=float)
+    return np.array([point3d_sequence_to_array(row) for row in points], dtype=float)
+
+
 class Origin2D(Point2D):
     """Two-dimensional origin point class"""
     def __init__(self, name: str = "Origin2D", construction: bool = False):
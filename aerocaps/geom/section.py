@@ -0,0 +1,402 @@
+"""
+Planar sections of surfaces at many stations
+"""
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from aerocaps.geom import Surface
+from aerocaps.geom.bvh import SurfaceBVH
+from aerocaps.geom.curves import BSplineCurve3D
+from aerocaps.geom.plane import Plane
+from aerocaps.utils.math import newton_bisection
+
+__all__ = [
+    "SectionCurve",
+    "section_surfaces"
+]
+
+
+class SectionCurve:
+    """Ordered polyline along the intersection of a plane with one or more surfaces"""
+    def __init__(self,
+                 plane_index: int,
+                 points: np.ndarray,
+                 uv: np.ndarray,
+                 surface_index: np.ndarray,
+                 closed: bool,
+                 surface_names: typing.List[str]):
+        r"""
+        Ordered polyline along the intersection of a plane with one or more surfaces. Every point lies exactly on
+        the plane and on one of the surfaces (to within the root-finding tolerance). Polylines crossing from one
+        surface to another through a shared edge are joined into a single section curve.
+
+        Parameters
+        ----------
+        plane_index: int
+            Index of the cutting plane
+        points: numpy.ndarray
+            Points of the polyline (size :math:`N \times 3`)
+        uv: numpy.ndarray
+            Parameter values of the points on their surfaces (size :math:`N \times 2`)
+        surface_index: numpy.ndarray
+            Index of the surface containing each point (size :math:`N`)
+        closed: bool
+            Whether the polyline is a closed loop, in which case the first and last points are the same
+        surface_names: typing.List[str]
+            Names of the surfaces, indexed by ``surface_index``
+        """
+        self.plane_index = plane_index
+        self.points = points
+        self.uv = uv
+        self.surface_index = surface_index
+        self.closed = closed
+        self.surface_names = surface_names
+
+    def fit(self, degree: int = 3) -> BSplineCurve3D:
+        """
+        Interpolates the points of the section with a B-spline curve using chord-length parameters
+
+        Parameters
+        ----------
+        degree: int
+            Degree of the curve. Default: ``3``
+
+        Returns
+        -------
+        BSplineCurve3D
+            Section curve
+        """
+        return BSplineCurve3D.interpolate_points(self.points, degree)
+
+
+# Segments of each marching-squares cell as pairs of cell edges (bottom, right, top, left), indexed by the case
+# (one bit per non-negative corner, counterclockwise from the lower-left corner) and by whether the cell center is
+# non-negative. The two ambiguous cases are resolved using the sign at the cell center
+_SEGMENT_TABLE = np.full((16, 2, 2, 2), -1, dtype=int)
+for _case in range(1, 15):
+    _crossed = [e for e in range(4) if ((_case >> e) & 1) != ((_case >> ((e + 1) % 4)) & 1)]
+    if len(_crossed) == 2:
+        _SEGMENT_TABLE[_case, :, 0] = _crossed
+_SEGMENT_TABLE[5, 1] = [[0, 1], [2, 3]]
+_SEGMENT_TABLE[5, 0] = [[3, 0], [1, 2]]
+_SEGMENT_TABLE[10, 1] = [[3, 0], [1, 2]]
+_SEGMENT_TABLE[10, 0] = [[0, 1], [2, 3]]
+
+
+class _SectionGrids:
+    """
+    Sample grids of a set of surfaces aligned with the leaf patches of a bounding-volume hierarchy built with a
+    uniform subdivision depth, stored as one flat array of points
+    """
+    def __init__(self, surfaces: typing.List[Surface], max_depth: int, samples_per_leaf: int):
+        self.surfaces = surfaces
+        bvh = SurfaceBVH(surfaces, max_depth=max_depth, flatness=-1.0)
+        m = samples_per_leaf
+        points, uv, node_surface, node_stride, offsets = [], [], [], [], [0]
+        leaf_row = np.empty(bvh.num_leaves, dtype=int)
+        leaf_col = np.empty(bvh.num_leaves, dtype=int)
+        for surf_idx, surf in enumerate(surfaces):
+            leaves = np.flatnonzero(bvh.surface_index == surf_idx)
+            u_breaks = np.unique(bvh.uv_bounds[leaves, :2])
+            v_breaks = np.unique(bvh.uv_bounds[leaves, 2:])
+            u = np.concatenate([np.linspace(a, b, m)[:-1] for a, b in zip(u_breaks[:-1], u_breaks[1:])] +
+                               [u_breaks[-1:]])
+            v = np.concatenate([np.linspace(a, b, m)[:-1] for a, b in zip(v_breaks[:-1], v_breaks[1:])] +
+                               [v_breaks[-1:]])
+            U, V = np.meshgrid(u, v, indexing="ij")
+            grid_uv = np.column_stack((U.ravel(), V.ravel()))
+            points.append(surf.evaluate_pairs(grid_uv))
+            uv.append(grid_uv)
+            node_surface.append(np.full(grid_uv.shape[0], surf_idx))
+            node_stride.append(np.full(grid_uv.shape[0], v.shape[0]))
+            leaf_row[leaves] = np.searchsorted(u_breaks, bvh.uv_bounds[leaves, 0]) * (m - 1)
+            leaf_col[leaves] = np.searchsorted(v_breaks, bvh.uv_bounds[leaves, 2]) * (m - 1)
+            offsets.append(offsets[-1] + grid_uv.shape[0])
+
+        self.points = np.concatenate(points)
+        self.uv = np.concatenate(uv)
+        self.node_surface = np.concatenate(node_surface)
+        self.node_stride = np.concatenate(node_stride)
+
+        # Flat indices of the sample points of each leaf (size L x m x m)
+        stride = self.node_stride[np.array(offsets[:-1])][bvh.surface_index]
+        first = np.array(offsets[:-1])[bvh.surface_index] + leaf_row * stride + leaf_col
+        a = np.arange(m)
+        self.leaf_nodes = (first[:, np.newaxis, np.newaxis] + a[np.newaxis, :, np.newaxis] * stride[:, np.newaxis,
+                           np.newaxis] + a[np.newaxis, np.newaxis, :])
+
+        # Control points of each leaf, padded by repeating the first control point
+        nets = [net[..., :3] / net[..., 3:] for net in bvh.control_nets]
+        max_points = max(net.shape[0] * net.shape[1] for net in nets)
+        self.leaf_control_points = np.array([
+            np.concatenate((net.reshape((-1, 3)), np.tile(net[0, 0], (max_points - net.shape[0] * net.shape[1], 1))))
+            for net in nets
+        ])
+        self.leaf_center = 0.5 * (bvh.box_min + bvh.box_max)
+        self.leaf_half_extent = 0.5 * (bvh.box_max - bvh.box_min)
+
+    def candidate_leaves(self, origins: np.ndarray, normals: np.ndarray) -> (np.ndarray, np.ndarray):
+        """
+        Finds the (plane, leaf) pairs for which the plane cuts the leaf, first by testing the bounding boxes of the
+        leaves and then by testing the control points (by the convex hull property, a plane only cuts a leaf if it
+        separates its control points)
+        """
+        offset = np.einsum("kj,kj->k", origins, normals)
+        distance = self.leaf_center @ normals.T - offset
+        radius = self.leaf_half_extent @ np.abs(normals).T
+        plane, leaf = np.nonzero((np.abs(distance) <= radius).T)
+        control_point_distance = (np.einsum("lpj,lj->lp", self.leaf_control_points[leaf], normals[plane]) -
+                                  offset[plane, np.newaxis])
+        cut = (control_point_distance.min(axis=1) <= 0.0) & (control_point_distance.max(axis=1) >= 0.0)
+        return plane[cut], leaf[cut]
+
+
+def _section_planes(grids: _SectionGrids, origins: np.ndarray, normals: np.ndarray, tol: float,
+                    join_tolerance: float) -> typing.List[typing.List[typing.Tuple]]:
+    """
+    Sections the surfaces by a set of planes using marching squares on the sample grids of the leaves cut by each
+    plane. Each crossing of a grid edge is refined onto the plane with Newton's method along the edge, and the
+    crossings are chained into polylines, which are joined across surfaces where their ends coincide.
+
+    Returns, for each plane, a list of ``(points, uv, surface_index, closed)`` tuples
+    """
+    num_planes = origins.shape[0]
+    plane, leaf = grids.candidate_leaves(origins, normals)
+    if plane.shape[0] == 0:
+        return [[] for _ in range(num_planes)]
+    offset = np.einsum("kj,kj->k", origins, normals)
+    nodes = grids.leaf_nodes[leaf]
+    f = np.einsum("cabj,cj->cab", grids.points[nodes], normals[plane]) - offset[plane, np.newaxis, np.newaxis]
+
+    # Marching squares on every cell of the candidate leaves
+    corners = [f[:, :-1, :-1], f[:, 1:, :-1], f[:, 1:, 1:], f[:, :-1, 1:]]
+    case = sum((c >= 0.0).astype(int) << bit for bit, c in enumerate(corners)).ravel()
+    center = (0.25 * sum(corners) >= 0.0).astype(int).ravel()
+    p00, p10, p01 = nodes[:, :-1, :-1].ravel(), nodes[:, 1:, :-1].ravel(), nodes[:, :-1, 1:].ravel()
+    num_edges = 2 * grids.points.shape[0]
+    cell_plane = np.repeat(plane, (nodes.shape[1] - 1) ** 2)
+    cell_edges = np.column_stack((2 * p00, 2 * p10 + 1, 2 * p01, 2 * p00 + 1)) + (cell_plane * num_edges)[:, None]
+    segments = _SEGMENT_TABLE[case, center]
+    cell, slot = np.nonzero(segments[:, :, 0] >= 0)
+    segment_keys = np.column_stack((cell_edges[cell, segments[cell, slot, 0]],
+                                    cell_edges[cell, segments[cell, slot, 1]]))
+    keys, segment_nodes = np.unique(segment_keys, return_inverse=True)
+    segment_nodes = segment_nodes.reshape((-1, 2))
+
+    # Refine each crossing along its grid edge, from the negative end to the non-negative end
+    key_plane, edge = keys // num_edges, keys % num_edges
+    p = edge // 2
+    q = p + np.where(edge % 2 == 0, grids.node_stride[p], 1)
+    f_p = np.einsum("kj,kj->k", grids.points[p], normals[key_plane]) - offset[key_plane]
+    f_q = np.einsum("kj,kj->k", grids.points[q], normals[key_plane]) - offset[key_plane]
+    negative, positive = np.where(f_p < 0.0, p, q), np.where(f_p < 0.0, q, p)
+    f_negative, f_positive = np.minimum(f_p, f_q), np.maximum(f_p, f_q)
+    uv = np.empty((keys.shape[0], 2))
+    points = np.empty((keys.shape[0], 3))
+    surface_index = grids.node_surface[p]
+    for surf_idx, surf in enumerate(grids.surfaces):
+        group = np.flatnonzero(surface_index == surf_idx)
+        if group.shape[0] == 0:
+            continue
+        uv_0 = grids.uv[negative[group]]
+        duv = grids.uv[positive[group]] - uv_0
+        n, d = normals[key_plane[group]], offset[key_plane[group]]
+
+        def func(t: np.ndarray, indices: np.ndarray) -> (np.ndarray, np.ndarray):
+            derivatives = surf.evaluate_derivatives_pairs(uv_0[indices] + t[:, np.newaxis] * duv[indices], order=1)
+            tangent = derivatives.Su * duv[indices, 0:1] + derivatives.Sv * duv[indices, 1:2]
+            return (np.einsum("ij,ij->i", derivatives.S, n[indices]) - d[indices],
+                    np.einsum("ij,ij->i", tangent, n[indices]))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t0 = np.nan_to_num(f_negative[group] / (f_negative[group] - f_positive[group]), nan=0.5)
+        t = newton_bisection(func, np.zeros(group.shape[0]), np.ones(group.shape[0]),
+                             sign_lo=-np.ones(group.shape[0]), t0=np.clip(t0, 0.0, 1.0), tol=tol)
+        uv[group] = uv_0 + t[:, np.newaxis] * duv
+        points[group] = surf.evaluate_pairs(uv[group])
+
+    # Chain the segments into polylines. Every crossing belongs to one or two segments
+    neighbors = np.full((keys.shape[0], 2), -1)
+    ends = segment_nodes.ravel()
+    others = segment_nodes[:, ::-1].ravel()
+    order = np.argsort(ends, kind="stable")
+    ends, others = ends[order], others[order]
+    first = np.concatenate(([True], ends[1:] != ends[:-1]))
+    neighbors[ends[first], 0] = others[first]
+    neighbors[ends[~first], 1] = others[~first]
+    visited = np.zeros(keys.shape[0], dtype=bool)
+    polylines = [[] for _ in range(num_planes)]
+    starts = np.concatenate((np.flatnonzero(neighbors[:, 1] < 0), np.arange(keys.shape[0])))
+    for start in starts.tolist():
+        if visited[start]:
+            continue
+        chain = [start]
+        visited[start] = True
+        previous, current = -1, start
+        closed = False
+        while True:
+            a, b = neighbors[current]
+            following = a if a != previous else b
+            if following < 0:
+                break
+            if following == start:
+                closed = True
+                chain.append(start)
+                break
+            if visited[following]:
+                break
+            chain.append(following)
+            visited[following] = True
+            previous, current = current, following
+        chain = np.array(chain)
+        polylines[key_plane[start]].append([points[chain], uv[chain], surface_index[chain], closed])
+
+    return [_join_polylines(plane_polylines, join_tolerance) for plane_polylines in polylines]
+
+
+def _join_polylines(polylines: typing.List[list], tol: float) -> typing.List[typing.Tuple]:
+    """
+    Joins open polylines whose ends coincide (e.g., where a section crosses an edge shared by two surfaces),
+    closes polylines whose ends coincide, and removes repeated consecutive points
+    """
+    closed_lines = [line for line in polylines if line[3]]
+    open_lines = [line for line in polylines if not line[3]]
+    joined = True
+    while joined:
+        joined = False
+        for i in range(len(open_lines)):
+            for j in range(i + 1, len(open_lines)):
+                a, b = open_lines[i], open_lines[j]
+                for flip_a, flip_b in ((True, False), (False, True), (True, True), (False, False)):
+                    end_a = a[0][-1] if flip_a else a[0][0]
+                    end_b = b[0][0] if flip_b else b[0][-1]
+                    if np.linalg.norm(end_a - end_b) > tol:
+                        continue
+                    # Join so that the matching ends meet in the middle
+                    first = a if flip_a else [array[::-1] for array in a[:3]] + [False]
+                    second = b if flip_b else [array[::-1] for array in b[:3]] + [False]
+                    open_lines[i] = [np.concatenate((x, y[1:])) for x, y in zip(first[:3], second[:3])] + [False]
+                    del open_lines[j]
+                    joined = True
+                    break
+                if joined:
+                    break
+            if joined:
+                break
+
+    result = []
+    for points, uv, surface_index, closed in closed_lines + open_lines:
+        if not closed and points.shape[0] > 2 and np.linalg.norm(points[0] - points[-1]) <= tol:
+            points, uv, surface_index = points.copy(), uv.copy(), surface_index.copy()
+            points[-1], uv[-1], surface_index[-1] = points[0], uv[0], surface_index[0]
+            closed = True
+        keep = np.concatenate(([True], np.linalg.norm(np.diff(points, axis=0), axis=1) > tol))
+        if closed:
+            keep[-1] = True
+        # Sections that collapse to a point (e.g., where a plane touches a surface) are dropped
+        if np.count_nonzero(keep) > (2 if closed else 1):
+            result.append((points[keep], uv[keep], surface_index[keep], closed))
+    return result
+
+
+_worker_grids = None
+
+
+def _set_worker_grids(grids: _SectionGrids):
+    """Stores the sample grids sent once to each worker process"""
+    global _worker_grids
+    _worker_grids = grids
+
+
+def _section_chunk(origins: np.ndarray, normals: np.ndarray, tol: float, join_tolerance: float,
+                   grids: _SectionGrids = None) -> typing.List[typing.List[typing.Tuple]]:
+    """Sections the surfaces by a chunk of planes using the given sample grids (by default, those of the worker)"""
+    return _section_planes(_worker_grids if grids is None else grids, origins, normals, tol, join_tolerance)
+
+
+def section_surfaces(surfaces: typing.Iterable[Surface],
+                     planes: typing.Iterable[Plane],
+                     names: typing.Iterable[str] = None,
+                     max_depth: int = 3,
+                     samples_per_leaf: int = 4,
+                     join_tolerance: float = None,
+                     tol: float = 1e-12,
+                     chunk_size: int = 16,
+                     num_workers: int = None) -> typing.List[typing.List[SectionCurve]]:
+    r"""
+    Cuts a set of Bézier, rational Bézier, B-spline, or NURBS surfaces by many planes at once (e.g., spanwise or
+    fuselage stations). Each surface is subdivided into a uniform grid of leaf patches in a
+    :obj:`~aerocaps.geom.bvh.SurfaceBVH`, and only the leaves whose bounding boxes and control points are cut by a
+    plane are processed for that plane. Inside these leaves, marching squares on a grid of
+    ``samples_per_leaf`` :math:`\times` ``samples_per_leaf`` sample points finds the grid edges crossed by the plane,
+    each crossing is refined onto the exact intersection of the plane and the edge of the grid using Newton's method,
+    and the crossings are chained into ordered polylines. Polylines on different surfaces whose ends coincide are
+    joined. The planes are processed in chunks, and the chunks are distributed across a pool of processes, so that
+    the chaining and joining of the polylines, which run in Python, proceed on separate cores.
+
+    Features of the section smaller than the sample grid spacing (e.g., a plane grazing a surface) may be missed, so
+    ``max_depth`` or ``samples_per_leaf`` should be increased for finer sections.
+
+    .. code-block:: python
+
+        stations = [Plane.plane_parallel_Y(Length(m=y)) for y in np.linspace(0.1, 10.0, 200)]
+        sections = section_surfaces([upper_wing_surface, lower_wing_surface], stations)
+        airfoil_curves = [[curve.fit() for curve in station] for station in sections]
+
+    Parameters
+    ----------
+    surfaces: typing.Iterable[Surface]
+        Surfaces to section
+    planes: typing.Iterable[Plane]
+        Cutting planes
+    names: typing.Iterable[str]
+        Names of the surfaces. If not specified, the ``name`` attribute of each surface is used. Default: ``None``
+    max_depth: int
+        Number of times each Bézier patch of each surface is split into four. Default: ``3``
+    samples_per_leaf: int
+        Number of sample points along each edge of each leaf patch (at least ``2``). Default: ``4``
+    join_tolerance: float
+        Maximum distance between the ends of polylines that are joined. If not specified, :math:`10^{-8}` times the
+        diagonal of the bounding box of the surfaces is used. Default: ``None``
+    tol: float
+        Convergence tolerance on the parameter along each crossed grid edge. Default: ``1e-12``
+    chunk_size: int
+        Number of planes processed together by each process. Default: ``16``
+    num_workers: int
+        Number of processes. If not specified, the number of CPUs is used. If ``1``, or if there is only one chunk,
+        the planes are processed in the current process. Default: ``None``
+
+    Returns
+    -------
+    typing.List[typing.List[SectionCurve]]
+        Section curves of each plane
+    """
+    surfaces = list(surfaces)
+    planes = list(planes)
+    names = [surface.name for surface in surfaces] if names is None else list(names)
+    if not surfaces or not planes:
+        return [[] for _ in planes]
+    grids = _SectionGrids(surfaces, max_depth, samples_per_leaf)
+    origins = np.array([plane.p0.as_array() for plane in planes])
+    normals = np.array([plane.compute_normal().as_array() for plane in planes])
+    if join_tolerance is None:
+        join_tolerance = 1e-8 * np.linalg.norm(grids.points.max(axis=0) - grids.points.min(axis=0))
+
+    starts = range(0, len(planes), chunk_size)
+    chunk_args = [(origins[start:start + chunk_size], normals[start:start + chunk_size], tol, join_tolerance)
+                  for start in starts]
+    num_workers = os.cpu_count() if num_workers is None else num_workers
+    if num_workers > 1 and len(chunk_args) > 1:
+        # The sample grids (and the surfaces, used to refine the crossings) are sent once to each process
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(chunk_args)), initializer=_set_worker_grids,
+                                 initargs=(grids,)) as executor:
+            chunks = list(executor.map(_section_chunk, *zip(*chunk_args)))
+    else:
+        chunks = [_section_chunk(*args, grids=grids) for args in chunk_args]
+    return [
+        [SectionCurve(start + plane_idx, *polyline, surface_names=names) for polyline in plane_polylines]
+        for start, chunk in zip(starts, chunks) for plane_idx, plane_polylines in enumerate(chunk)
+    ]
@@ -11,26 +11,32 @@ import pyvista as pv
 import shapely
 from rust_nurbs import *
 from scipy.optimize import fsolve, minimize, OptimizeResult
+from scipy.sparse import csr_matrix, diags, vstack
+from scipy.spatial import cKDTree
 
 import aerocaps.iges.curves
 import aerocaps.iges.entity
 import aerocaps.iges.surfaces
 from aerocaps.geom.transformation import transform_points_into_coordinate_system, Transformation3D
 from aerocaps.geom import Surface, InvalidGeometryError, NegativeWeightError, Geometry3D
+from aerocaps.geom.basis import bernstein_basis_matrix, bspline_basis_matrices, paired_derivatives, \
+    tensor_product_derivatives
 from aerocaps.geom.curves import BezierCurve3D, Line3D, RationalBezierCurve3D, NURBSCurve3D, BSplineCurve3D, \
     CurveOnParametricSurface, CompositeCurve3D
 from aerocaps.geom.plane import Plane
-from aerocaps.geom.point import Point3D
-from aerocaps.geom.tools import project_point_onto_line, measure_distance_point_line, rotate_point_about_axis, \
-    add_vector_to_point, concave_hull
+from aerocaps.geom.point import Point3D, Point3DNetView, PointArray3D, point3d_net_to_array
+from aerocaps.geom.tools import project_points_onto_line, rotate_points_about_axis, add_vector_to_point, \
+    concave_hull
 from aerocaps.geom.vector import Vector3D, IHat3D, JHat3D, KHat3D
 from aerocaps.units.angle import Angle
 from aerocaps.units.length import Length
 from aerocaps.utils.array import unique_with_tolerance
+from aerocaps.utils.math import newton_bisection, sparse_least_squares
 
 __all__ = [
     "SurfaceEdge",
     "SurfaceCorner",
+    "SurfaceDerivativeData",
     "BezierSurface",
     "RationalBezierSurface",
     "BSplineSurface",
@@ -63,6 +69,414 @@ class SurfaceCorner(Enum):
     u1v0 = 3
 
 
+def _get_control_point_net_segments(control_points: np.ndarray) -> np.ndarray:
+    r"""
+    Gets the line segments connecting each control point of a tensor-product surface to its neighbors in the
+    :math:`u`- and :math:`v`-directions
+
+    Parameters
+    ----------
+    control_points: numpy.ndarray
+        Control point array of size :math:`N_u \times N_v \times 3`
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of size :math:`N_\text{seg} \times 2 \times 3` containing the start and end point of each segment,
+        where :math:`N_\text{seg} = (N_u - 1) N_v + N_u (N_v - 1)`
+    """
+    u_segments = np.stack((control_points[:-1, :], control_points[1:, :]), axis=-2).reshape((-1, 2, 3))
+    v_segments = np.stack((control_points[:, :-1], control_points[:, 1:]), axis=-2).reshape((-1, 2, 3))
+    return np.concatenate((u_segments, v_segments))
+
+
+def _revolve_control_points(control_points: np.ndarray, axis: Line3D,
+                            angles: typing.List[Angle]) -> (np.ndarray, np.ndarray):
+    r"""
+    Computes the control points and weights of the surface generated by revolving a curve about an axis. All the
+    curve control points are revolved at once.
+
+    Parameters
+    ----------
+    control_points: numpy.ndarray
+        Array of size :math:`N \times 3` containing the control points of the curve to revolve
+    axis: Line3D
+        Axis of revolution
+    angles: typing.List[Angle]
+        Odd number of evenly spaced angles (:math:`M`). Even indices represent the "through" control points
+        and odd indices represent the "corner" control points of each circular arc segment
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray
+        Control point array of size :math:`N \times M \times 3` and weight array of size :math:`N \times M`
+    """
+    axis_projections = project_points_onto_line(control_points, axis)
+    radii = np.linalg.norm(control_points - axis_projections, axis=1)
+    off_axis = radii != 0.0  # Points on the axis of revolution are left in place
+
+    new_points = np.repeat(control_points[:, np.newaxis, :], len(angles), axis=1)
+    weights = np.ones(new_points.shape[:2])
+    for idx, angle in enumerate(angles):
+        rotated_points = rotate_points_about_axis(control_points[off_axis], axis, angle)
+        if idx % 2:  # Odd indices are pushed outward so that the rational arcs pass through the "through" points
+            sine_half_angle = np.sin(0.5 * np.pi - 0.5 * (angles[idx + 1].rad - angles[idx - 1].rad))
+            directions = rotated_points - axis_projections[off_axis]
+            directions /= np.linalg.norm(directions, axis=1)[:, np.newaxis]
+            rotated_points = (axis_projections[off_axis] +
+                              (radii[off_axis] / sine_half_angle)[:, np.newaxis] * directions)
+            weights[:, idx] = sine_half_angle
+        new_points[off_axis, idx, :] = rotated_points
+
+    return new_points, weights
+
+
+class SurfaceDerivativeData:
+    """Point and partial derivatives of a surface evaluated at the same parameter values"""
+    def __init__(self,
+                 u: float or np.ndarray,
+                 v: float or np.ndarray,
+                 S: np.ndarray,
+                 Su: np.ndarray = None,
+                 Sv: np.ndarray = None,
+                 Suu: np.ndarray = None,
+                 Suv: np.ndarray = None,
+                 Svv: np.ndarray = None):
+        r"""
+        Point and partial derivatives of a surface evaluated at the same parameter values. Each array has size
+        :math:`3` if ``u`` and ``v`` are floats or :math:`N_u \times N_v \times 3` if ``u`` and ``v`` are vectors.
+        Derivatives above the order that was requested are ``None``.
+
+        Parameters
+        ----------
+        u: float or numpy.ndarray
+            :math:`u`-value or vector at which the surface was evaluated
+        v: float or numpy.ndarray
+            :math:`v`-value or vector at which the surface was evaluated
+        S: numpy.ndarray
+            Point(s) on the surface
+        Su: numpy.ndarray
+            First derivative with respect to :math:`u`. Default: ``None``
+        Sv: numpy.ndarray
+            First derivative with respect to :math:`v`. Default: ``None``
+        Suu: numpy.ndarray
+            Second derivative with respect to :math:`u`. Default: ``None``
+        Suv: numpy.ndarray
+            Mixed second derivative with respect to :math:`u` and :math:`v`. Default: ``None``
+        Svv: numpy.ndarray
+            Second derivative with respect to :math:`v`. Default: ``None``
+        """
+        self.u = u
+        self.v = v
+        self.S = S
+        self.Su = Su
+        self.Sv = Sv
+        self.Suu = Suu
+        self.Suv = Suv
+        self.Svv = Svv
+
+
+def _surface_basis_matrices(degree: int, knots: np.ndarray or None, t: np.ndarray,
+                            max_derivative: int) -> typing.List[np.ndarray]:
+    """
+    Computes the Bernstein (if ``knots`` is ``None``) or B-spline basis matrices of one parametric direction of a
+    surface and their derivatives up to ``max_derivative``, indexed by derivative order
+    """
+    if knots is None:
+        return [bernstein_basis_matrix(degree, t, d) for d in range(max_derivative + 1)]
+    return bspline_basis_matrices(knots, degree, t, max_derivative)
+
+
+def _evaluate_surface_pairs(control_points: np.ndarray, weights: np.ndarray or None,
+                            degree_u: int, degree_v: int,
+                            knots_u: np.ndarray or None, knots_v: np.ndarray or None,
+                            uv: np.ndarray,
+                            orders: typing.List[typing.Tuple[int, int]]
+                            ) -> typing.Dict[typing.Tuple[int, int], np.ndarray]:
+    r"""
+    Evaluates a tensor-product surface and the requested partial derivatives at :math:`N` scattered
+    :math:`(u_i,v_i)` pairs. The arguments other than ``uv`` and ``orders`` are the same as for
+    :obj:`~aerocaps.geom.surfaces._evaluate_surface_derivatives`.
+
+    Parameters
+    ----------
+    uv: numpy.ndarray
+        Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+    orders: typing.List[typing.Tuple[int, int]]
+        Derivative orders :math:`(k,l)` to evaluate
+
+    Returns
+    -------
+    typing.Dict[typing.Tuple[int, int], numpy.ndarray]
+        Arrays of size :math:`N \times 3` keyed by derivative order
+    """
+    uv = np.asarray(uv, dtype=float)
+    if uv.ndim != 2 or uv.shape[1] != 2:
+        raise ValueError(f"Parameter pairs must be an array of size N x 2 (found shape {uv.shape})")
+    Bu = _surface_basis_matrices(degree_u, knots_u, uv[:, 0], max(k for k, _ in orders))
+    Bv = _surface_basis_matrices(degree_v, knots_v, uv[:, 1], max(l for _, l in orders))
+    return paired_derivatives(control_points, Bu, Bv, orders, weights=weights)
+
+
+def _evaluate_surface_derivatives(control_points: np.ndarray, weights: np.ndarray or None,
+                                  degree_u: int, degree_v: int,
+                                  knots_u: np.ndarray or None, knots_v: np.ndarray or None,
+                                  u: float or np.ndarray, v: float or np.ndarray,
+                                  order: int) -> SurfaceDerivativeData:
+    r"""
+    Evaluates a tensor-product surface and its partial derivatives up to second order from a single set of
+    basis matrices in each parametric direction. Bernstein bases are used when the knot vectors are ``None``, and
+    the surface is treated as non-rational when ``weights`` is ``None``.
+
+    Parameters
+    ----------
+    control_points: numpy.ndarray
+        Control point array of size :math:`(n+1) \times (m+1) \times 3`
+    weights: numpy.ndarray or None
+        Weight array of size :math:`(n+1) \times (m+1)` or ``None``
+    degree_u: int
+        Surface degree in the :math:`u`-direction
+    degree_v: int
+        Surface degree in the :math:`v`-direction
+    knots_u: numpy.ndarray or None
+        Knot vector in the :math:`u`-direction or ``None``
+    knots_v: numpy.ndarray or None
+        Knot vector in the :math:`v`-direction or ``None``
+    u: float or numpy.ndarray
+        :math:`u`-value or 1-D vector of :math:`u`-values
+    v: float or numpy.ndarray
+        :math:`v`-value or 1-D vector of :math:`v`-values
+    order: int
+        Highest derivative order to evaluate (``0``, ``1``, or ``2``)
+
+    Returns
+    -------
+    SurfaceDerivativeData
+        Point and partial derivatives of the surface
+    """
+    if order not in (0, 1, 2):
+        raise ValueError(f"Derivative order must be 0, 1, or 2 (found {order = })")
+
+    scalar_input = np.ndim(u) == 0 and np.ndim(v) == 0
+    u_vec = np.atleast_1d(np.asarray(u, dtype=float))
+    v_vec = np.atleast_1d(np.asarray(v, dtype=float))
+
+    Bu = _surface_basis_matrices(degree_u, knots_u, u_vec, order)
+    Bv = _surface_basis_matrices(degree_v, knots_v, v_vec, order)
+    orders = [(0, 0), (1, 0), (0, 1), (2, 0), (1, 1), (0, 2)][:{0: 1, 1: 3, 2: 6}[order]]
+    results = tensor_product_derivatives(control_points, Bu, Bv, orders, weights=weights)
+    if scalar_input:
+        results = {key: value[0, 0] for key, value in results.items()}
+
+    return SurfaceDerivativeData(
+        u, v, results[(0, 0)],
+        Su=results.get((1, 0)), Sv=results.get((0, 1)),
+        Suu=results.get((2, 0)), Suv=results.get((1, 1)), Svv=results.get((0, 2))
+    )
+
+
+def _project_points_onto_surface(surface: Surface, points: np.ndarray, Nu: int, Nv: int, max_iterations: int,
+                                 tol: float) -> (np.ndarray, np.ndarray, np.ndarray):
+    r"""
+    Finds the closest point on a surface to each of :math:`N` points. Each point is first matched to the nearest
+    point of a uniform :math:`N_u \times N_v` grid evaluated on the surface using a KD-tree, and the parameter
+    values of all the points are then refined at once using Newton's method on the squared distance
+
+    .. math::
+
+        f(u,v) = \frac{1}{2} \lVert \mathbf{S}(u,v) - \mathbf{p} \rVert^2
+
+    with the parameter values clamped to :math:`[0,1]`. Where the Hessian of :math:`f` is not positive definite,
+    the Gauss-Newton approximation of the Hessian is used instead, and each step is halved until it does not increase
+    the distance. The surface must have ``evaluate_grid`` and ``evaluate_derivatives_pairs`` methods.
+
+    Parameters
+    ----------
+    surface: Surface
+        Surface onto which the points are projected
+    points: numpy.ndarray
+        Array of size :math:`N \times 3`
+    Nu: int
+        Number of seed grid points in the :math:`u`-direction
+    Nv: int
+        Number of seed grid points in the :math:`v`-direction
+    max_iterations: int
+        Maximum number of Newton iterations
+    tol: float
+        Convergence tolerance on the cosine of the angle between each surface tangent and the vector from the
+        surface to the point (or on the size of the parameter step)
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray, numpy.ndarray
+        Parameter values of the closest points (size :math:`N \times 2`), distances from the points to the
+        surface (size :math:`N`), and convergence flags (size :math:`N`)
+    """
+    points = np.asarray(points, dtype=float).reshape((-1, 3))
+
+    # Seed the parameter values from the nearest grid point
+    grid = surface.evaluate_grid(Nu, Nv)
+    _, nearest = cKDTree(grid.reshape((-1, 3))).query(points)
+    uv = np.column_stack((np.linspace(0.0, 1.0, Nu)[nearest // Nv], np.linspace(0.0, 1.0, Nv)[nearest % Nv]))
+
+    converged = np.zeros(points.shape[0], dtype=bool)
+    active = np.arange(points.shape[0])
+    data = surface.evaluate_derivatives_pairs(uv)
+    r = data.S - points
+    for _ in range(max_iterations):
+        Su, Sv, r_active = data.Su[active], data.Sv[active], r[active]
+        gu = np.einsum("ij,ij->i", Su, r_active)
+        gv = np.einsum("ij,ij->i", Sv, r_active)
+
+        # Convergence check, treating a parameter pinned at a boundary with the gradient pointing outward as converged
+        r_norm = np.linalg.norm(r_active, axis=1)
+        u_free = ~(((uv[active, 0] <= 0.0) & (gu > 0.0)) | ((uv[active, 0] >= 1.0) & (gu < 0.0)))
+        v_free = ~(((uv[active, 1] <= 0.0) & (gv > 0.0)) | ((uv[active, 1] >= 1.0) & (gv < 0.0)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cos_u = np.abs(gu) / (np.linalg.norm(Su, axis=1) * r_norm)
+            cos_v = np.abs(gv) / (np.linalg.norm(Sv, axis=1) * r_norm)
+        done = (r_norm == 0.0) | (((cos_u <= tol) | ~u_free) & ((cos_v <= tol) | ~v_free))
+        converged[active[done]] = True
+        active = active[~done]
+        if active.size == 0:
+            break
+        Su, Sv, r_active = Su[~done], Sv[~done], r_active[~done]
+        gu, gv = gu[~done], gv[~done]
+
+        # Newton step from the 2 x 2 Hessian of the squared distance (Gauss-Newton where not positive definite)
+        Huu = np.einsum("ij,ij->i", Su, Su)
+        Huv = np.einsum("ij,ij->i", Su, Sv)
+        Hvv = np.einsum("ij,ij->i", Sv, Sv)
+        Huu_full = Huu + np.einsum("ij,ij->i", data.Suu[active], r_active)
+        Huv_full = Huv + np.einsum("ij,ij->i", data.Suv[active], r_active)
+        Hvv_full = Hvv + np.einsum("ij,ij->i", data.Svv[active], r_active)
+        positive_definite = (Huu_full > 0.0) & (Huu_full * Hvv_full - Huv_full ** 2 > 0.0)
+        Huu = np.where(positive_definite, Huu_full, Huu)
+        Huv = np.where(positive_definite, Huv_full, Huv)
+        Hvv = np.where(positive_definite, Hvv_full, Hvv)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            determinant = Huu * Hvv - Huv ** 2
+            step = -np.column_stack((Hvv * gu - Huv * gv, Huu * gv - Huv * gu)) / determinant[:, np.newaxis]
+            # Parameters pinned at a boundary are held fixed, and the other parameter takes a 1-D Newton step
+            u_pinned = ~u_free[~done]
+            v_pinned = ~v_free[~done]
+            step[u_pinned] = np.column_stack((np.zeros(np.count_nonzero(u_pinned)), -gv[u_pinned] / Hvv[u_pinned]))
+            step[v_pinned] = np.column_stack((-gu[v_pinned] / Huu[v_pinned], np.zeros(np.count_nonzero(v_pinned))))
+        step = np.nan_to_num(step, nan=0.0, posinf=0.0, neginf=0.0)
+
+        # Backtrack until the distance does not increase
+        old_distance = np.linalg.norm(r_active, axis=1)
+        new_uv = np.clip(uv[active] + step, 0.0, 1.0)
+        new_data = surface.evaluate_derivatives_pairs(new_uv)
+        new_distance = np.linalg.norm(new_data.S - points[active], axis=1)
+        for _ in range(5):
+            worse = new_distance > old_distance
+            if not np.any(worse):
+                break
+            step[worse] *= 0.5
+            new_uv[worse] = np.clip(uv[active[worse]] + step[worse], 0.0, 1.0)
+            worse_data = surface.evaluate_derivatives_pairs(new_uv[worse])
+            for name in ("S", "Su", "Sv", "Suu", "Suv", "Svv"):
+                getattr(new_data, name)[worse] = getattr(worse_data, name)
+            new_distance[worse] = np.linalg.norm(worse_data.S - points[active[worse]], axis=1)
+
+        # Update the parameter values and derivatives. Points whose parameter values no longer change are converged.
+        stalled = np.all(np.abs(new_uv - uv[active]) <= tol, axis=1)
+        uv[active] = new_uv
+        for name in ("S", "Su", "Sv", "Suu", "Suv", "Svv"):
+            getattr(data, name)[active] = getattr(new_data, name)
+        r[active] = new_data.S - points[active]
+        converged[active[stalled]] = True
+        active = active[~stalled]
+        if active.size == 0:
+            break
+
+    distance = np.linalg.norm(data.S - points, axis=1)
+    return uv, distance, converged
+
+
+def _solve_for_u_or_v_given_xyz(surface: Surface, u: float or np.ndarray or None, v: float or np.ndarray or None,
+                                coordinate: int, targets: float or np.ndarray, uv_guess: float, tol: float,
+                                max_iterations: int, num_brackets: int = 16) -> np.ndarray:
+    r"""
+    Solves for the :math:`u`-values (if ``u`` is ``None``) or :math:`v`-values (if ``v`` is ``None``) at which one
+    coordinate of a surface takes each of the target values along the corresponding isoparametric curves. All the
+    targets are solved at once. The parameter range :math:`[0,1]` of each target is split into ``num_brackets``
+    intervals, and the interval with a sign change closest to ``uv_guess`` is refined using
+    :obj:`~aerocaps.utils.math.newton_bisection` with the analytic derivative. The surface must have
+    ``evaluate_pairs`` and ``evaluate_derivatives_pairs`` methods.
+
+    Parameters
+    ----------
+    surface: Surface
+        Surface to evaluate
+    u: float or numpy.ndarray or None
+        Fixed :math:`u`-values, or ``None`` to solve for :math:`u`
+    v: float or numpy.ndarray or None
+        Fixed :math:`v`-values, or ``None`` to solve for :math:`v`
+    coordinate: int
+        Index of the coordinate (``0`` for :math:`x`, ``1`` for :math:`y`, ``2`` for :math:`z`)
+    targets: float or numpy.ndarray
+        Target values of the coordinate, broadcast against the fixed parameter values
+    uv_guess: float
+        Parameter value used to choose between multiple roots
+    tol: float
+        Convergence tolerance on the parameter value
+    max_iterations: int
+        Maximum number of Newton-bisection iterations
+    num_brackets: int
+        Number of intervals used to search for sign changes. Default: ``16``
+
+    Returns
+    -------
+    numpy.ndarray
+        Solved parameter values with the broadcast shape of the fixed parameter values and targets. Targets that
+        could not be bracketed in :math:`[0,1]` give ``nan``
+    """
+    solve_for_u = u is None
+    fixed, targets = np.broadcast_arrays(np.asarray(v if solve_for_u else u, dtype=float),
+                                         np.asarray(targets, dtype=float))
+    shape = targets.shape
+    fixed = fixed.ravel()
+    targets = targets.ravel()
+    num_targets = targets.shape[0]
+
+    def pairs(t: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        return np.column_stack((t, fixed[indices]) if solve_for_u else (fixed[indices], t))
+
+    # Find the sign change closest to the guess for each target
+    samples = np.linspace(0.0, 1.0, num_brackets + 1)
+    sample_indices = np.repeat(np.arange(num_targets), num_brackets + 1)
+    f = (surface.evaluate_pairs(pairs(np.tile(samples, num_targets), sample_indices))[:, coordinate] -
+         targets[sample_indices]).reshape((num_targets, num_brackets + 1))
+    sign_change = f[:, :-1] * f[:, 1:] <= 0.0
+    midpoints = 0.5 * (samples[:-1] + samples[1:])
+    guess_distance = np.where(sign_change, np.abs(midpoints - uv_guess), np.inf)
+    bracket = np.argmin(guess_distance, axis=1)
+    rows = np.arange(num_targets)
+    found = np.isfinite(guess_distance[rows, bracket])
+
+    lo = samples[bracket[found]]
+    hi = samples[bracket[found] + 1]
+    f_lo = f[rows[found], bracket[found]]
+    f_hi = f[rows[found], bracket[found] + 1]
+
+    # Start from the secant estimate inside each bracket
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t0 = lo - f_lo * (hi - lo) / (f_hi - f_lo)
+    t0 = np.where(np.isfinite(t0), np.clip(t0, lo, hi), 0.5 * (lo + hi))
+
+    def func(t: np.ndarray, indices: np.ndarray) -> (np.ndarray, np.ndarray):
+        target_indices = rows[found][indices]
+        data = surface.evaluate_derivatives_pairs(pairs(t, target_indices), order=1)
+        return data.S[:, coordinate] - targets[target_indices], (data.Su if solve_for_u else data.Sv)[:, coordinate]
+
+    result = np.full(num_targets, np.nan)
+    result[found] = newton_bisection(func, lo, hi, sign_lo=np.where(f_lo == 0.0, -np.sign(f_hi), np.sign(f_lo)),
+                                     t0=t0, tol=tol, max_iterations=max_iterations)
+    return result.reshape(shape)
+
+
 class BezierSurface(Surface):
     """
     Bézier surface class. A NURBS surface with no internal knots and all weights equal to unity.
@@ -142,20 +556,45 @@ class BezierSurface(Surface):
             Whether this is a geometry used only for construction of other geometries. If ``True``, this
             geometry will not be exported or plotted. Default: ``False``
         """
-        if isinstance(points, np.ndarray):
-            points = [[Point3D.from_array(pt_row) for pt_row in pt_mat] for pt_mat in points]
         self.points = points
         super().__init__(name=name, construction=construction)
 
+    @property
+    def points(self) -> Point3DNetView:
+        """
+        Control points as a nested sequence of point objects. Each point is a view into the control point array
+        owned by the surface, so ``surf.points[i][j].x.m = 1.0`` and ``surf.points[i][j] = point`` both modify
+        the surface. The points are created on demand; the array is the only stored representation. Modifications
+        made through the points increment :obj:`~aerocaps.geom.Geometry.version`.
+
+        .. warning::
+
+            Point objects passed to the constructor or assigned to ``points`` are copied into the array, not
+            referenced. Modifying them afterward does not modify the surface, and a point object shared by several
+            surfaces or curves no longer ties them together. Modify the surface through ``surf.points`` or assign
+            ``surf.points`` again instead.
+        """
+        return Point3DNetView(self._control_points, on_modify=self._mark_modified)
+
+    @points.setter
+    def points(self, points: typing.List[typing.List[Point3D]] or np.ndarray):
+        r"""
+        Sets the control points from a nested list of point objects or an array of size
+        :math:`N_u \times N_v \times 3`. The values are copied into a new array owned by the surface, so the point
+        objects passed in are not tied to the surface.
+        """
+        self._control_points = point3d_net_to_array(points)
+        self._mark_modified()
+
     @property
     def n_points_u(self) -> int:
         """Number of control points in the :math:`u`-parametric direction"""
-        return len(self.points)
+        return self._control_points.shape[0]
 
     @property
     def n_points_v(self) -> int:
         """Number of control points in the :math:`v`-parametric direction"""
-        return len(self.points[0])
+        return self._control_points.shape[1]
 
     @property
     def degree_u(self) -> int:
@@ -196,7 +635,7 @@ class BezierSurface(Surface):
         Converts the Bézier surface to an IGES entity. To add this IGES entity to an ``.igs`` file,
         use an :obj:`~aerocaps.iges.iges_generator.IGESGenerator`.
         """
-        return aerocaps.iges.surfaces.BezierSurfaceIGES(self.get_control_point_array())
+        return aerocaps.iges.surfaces.BezierSurfaceIGES(self._control_point_array())
 
     def to_rational_bezier_surface(self) -> "RationalBezierSurface":
         """
@@ -211,14 +650,14 @@ class BezierSurface(Surface):
 
     def get_control_point_array(self) -> np.ndarray:
         """
-        Converts the nested list of control points to a 3-D :obj:`~numpy.ndarray`.
+        Gets a copy of the control point array. Modifying the returned array does not modify the surface.
 
         Returns
         -------
         numpy.ndarray
             3-D array
         """
-        return np.array([np.array([p.as_array() for p in p_arr]) for p_arr in self.points])
+        return self._control_points.copy()
 
     @classmethod
     def from_curve_extrude(cls, curve: BezierCurve3D, distance: Length, extrude_axis: Vector3D = None,
@@ -297,7 +736,7 @@ class BezierSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_dsdu(P, u, v))
 
     def dSdu_grid(self, Nu: int, Nv: int) -> np.ndarray:
@@ -317,7 +756,7 @@ class BezierSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_dsdu_grid(P, Nu, Nv))
 
     def dSdu_uvvecs(self, u: np.ndarray, v: np.ndarray):
@@ -337,7 +776,7 @@ class BezierSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_dsdu_uvvecs(P, u, v))
 
     def dSdv(self, u: float or np.ndarray, v: float or np.ndarray):
@@ -356,7 +795,7 @@ class BezierSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_dsdv(P, u, v))
 
     def dSdv_grid(self, Nu: int, Nv: int) -> np.ndarray:
@@ -376,7 +815,7 @@ class BezierSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_dsdv_grid(P, Nu, Nv))
 
     def dSdv_uvvecs(self, u: np.ndarray, v: np.ndarray):
@@ -396,7 +835,7 @@ class BezierSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_dsdv_uvvecs(P, u, v))
 
     def d2Sdu2(self, u: float, v: float) -> np.ndarray:
@@ -415,7 +854,7 @@ class BezierSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_d2sdu2(P, u, v))
 
     def d2Sdu2_grid(self, Nu: int, Nv: int) -> np.ndarray:
@@ -435,7 +874,7 @@ class BezierSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_d2sdu2_grid(P, Nu, Nv))
 
     def d2Sdu2_uvvecs(self, u: np.ndarray, v: np.ndarray):
@@ -455,7 +894,7 @@ class BezierSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_d2sdu2_uvvecs(P, u, v))
 
     def d2Sdv2(self, u: float or np.ndarray, v: float or np.ndarray):
@@ -474,7 +913,7 @@ class BezierSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_d2sdv2(P, u, v))
 
     def d2Sdv2_grid(self, Nu: int, Nv: int) -> np.ndarray:
@@ -494,7 +933,7 @@ class BezierSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_d2sdv2_grid(P, Nu, Nv))
 
     def d2Sdv2_uvvecs(self, u: np.ndarray, v: np.ndarray):
@@ -514,7 +953,7 @@ class BezierSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_d2sdv2_uvvecs(P, u, v))
 
     def get_edge(self, edge: SurfaceEdge, n_points: int = 10) -> np.ndarray:
@@ -533,7 +972,7 @@ class BezierSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if edge == SurfaceEdge.v1:
             return np.array(bezier_surf_eval_iso_v(P, n_points, 1.0))
         elif edge == SurfaceEdge.v0:
@@ -567,7 +1006,7 @@ class BezierSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if edge == SurfaceEdge.v1:
             return np.array(bezier_surf_dsdv_iso_v(P, n_points, 1.0)) if perp else np.array(
                 bezier_surf_dsdu_iso_v(P, n_points, 1.0))
@@ -623,6 +1062,38 @@ class BezierSurface(Surface):
         else:
             raise ValueError(f"No edge called {edge}")
 
+    def get_first_deriv_cp_sens_matrix(self, edge: SurfaceEdge, point_ijs: typing.List[typing.Tuple[int, int]],
+                                       n_points: int = 10, perp: bool = True) -> csr_matrix:
+        r"""
+        Gets the sensitivities of the first :math:`u`- or :math:`v`-derivative along an edge with respect to a set
+        of control points as a sparse matrix. The derivative is linear in the control points with the same
+        coefficient for each coordinate, so entry :math:`(k,l)` is the sensitivity of every coordinate of the
+        derivative at the :math:`k`-th point along the edge to the same coordinate of control point
+        ``point_ijs[l]``. Control points that are not in the two rows closest to the edge have no influence on the
+        derivative and have empty columns.
+
+        Parameters
+        ----------
+        edge: SurfaceEdge
+            Edge along which to evaluate
+        point_ijs: typing.List[typing.Tuple[int, int]]
+            :math:`(i,j)`-indices of the control points
+        n_points: int
+            Number of evenly-spaced parameter locations at which to evaluate the derivative. Default: 10
+        perp: bool
+            Whether to evaluate the cross-derivative. If ``False``, the derivative along the parameter direction
+            parallel to the edge will be evaluated instead. Default: ``True``
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Sparse matrix of size :math:`n_\text{points} \times \text{len}(\text{point\_ijs})`
+        """
+        sens = np.zeros((n_points, len(point_ijs)))
+        for col, (i, j) in enumerate(point_ijs):
+            sens[:, col] = self.get_first_deriv_cp_sens_along_edge(edge, i, j, n_points=n_points, perp=perp)[:, 0]
+        return csr_matrix(sens)
+
     def get_second_derivs_along_edge(self, edge: SurfaceEdge, n_points: int = 10, perp: bool = True) -> np.ndarray:
         r"""
         Evaluates the parallel or perpendicular second derivative along a surface edge at ``n_points`` parameter
@@ -645,7 +1116,7 @@ class BezierSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if edge == SurfaceEdge.v1:
             return np.array(bezier_surf_d2sdv2_iso_v(P, n_points, 1.0)) if perp else np.array(
                 bezier_surf_d2sdu2_iso_v(P, n_points, 1.0))
@@ -701,6 +1172,35 @@ class BezierSurface(Surface):
         else:
             raise ValueError(f"No edge called {edge}")
 
+    def get_second_deriv_cp_sens_matrix(self, edge: SurfaceEdge, point_ijs: typing.List[typing.Tuple[int, int]],
+                                        n_points: int = 10, perp: bool = True) -> csr_matrix:
+        r"""
+        Gets the sensitivities of the second :math:`u`- or :math:`v`-derivative along an edge with respect to a set
+        of control points as a sparse matrix. See
+        :obj:`~aerocaps.geom.surfaces.BezierSurface.get_first_deriv_cp_sens_matrix` for the layout of the matrix.
+
+        Parameters
+        ----------
+        edge: SurfaceEdge
+            Edge along which to evaluate
+        point_ijs: typing.List[typing.Tuple[int, int]]
+            :math:`(i,j)`-indices of the control points
+        n_points: int
+            Number of evenly-spaced parameter locations at which to evaluate the derivative. Default: 10
+        perp: bool
+            Whether to evaluate the cross-derivative. If ``False``, the derivative along the parameter direction
+            parallel to the edge will be evaluated instead. Default: ``True``
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Sparse matrix of size :math:`n_\text{points} \times \text{len}(\text{point\_ijs})`
+        """
+        sens = np.zeros((n_points, len(point_ijs)))
+        for col, (i, j) in enumerate(point_ijs):
+            sens[:, col] = self.get_second_deriv_cp_sens_along_edge(edge, i, j, n_points=n_points, perp=perp)[:, 0]
+        return csr_matrix(sens)
+
     def verify_g0(self, other: "BezierSurface", surface_edge: SurfaceEdge, other_surface_edge: SurfaceEdge,
                   n_points: int = 10):
         r"""
@@ -810,7 +1310,7 @@ class BezierSurface(Surface):
         numpy.ndarray
             1-D array of the form ``array([x, y, z])`` representing the evaluated point on the surface
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_eval(P, u, v))
 
     def evaluate_point3d(self, u: float, v: float) -> Point3D:
@@ -847,9 +1347,256 @@ class BezierSurface(Surface):
         numpy.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_eval_grid(P, Nu, Nv))
 
+    def evaluate_derivatives(self, u: float or np.ndarray, v: float or np.ndarray,
+                             order: int = 2) -> SurfaceDerivativeData:
+        r"""
+        Evaluates the Bézier surface and its partial derivatives up to second order
+        (:math:`\mathbf{S}`, :math:`\mathbf{S}_u`, :math:`\mathbf{S}_v`, :math:`\mathbf{S}_{uu}`,
+        :math:`\mathbf{S}_{uv}`, and :math:`\mathbf{S}_{vv}`) in a single pass. The basis functions in each
+        parametric direction are computed only once and shared by all the derivatives, which makes this much faster
+        than calling each of the derivative methods separately.
+
+        Parameters
+        ----------
+        u: float or numpy.ndarray
+            Parameter value in the :math:`u`-direction, or a 1-D array of :math:`N_u` parameter values
+        v: float or numpy.ndarray
+            Parameter value in the :math:`v`-direction, or a 1-D array of :math:`N_v` parameter values
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Derivatives above this order are
+            ``None`` in the output. Default: ``2``
+
+        Returns
+        -------
+        SurfaceDerivativeData
+            Point and partial derivatives of the surface. Each array has size :math:`3` for float inputs or
+            :math:`N_u \times N_v \times 3` for array inputs (evaluated at each combination of :math:`u` and
+            :math:`v`)
+        """
+        return _evaluate_surface_derivatives(
+            self._control_point_array(), None, self.degree_u, self.degree_v, None, None, u, v, order
+        )
+
+    def evaluate_derivatives_grid(self, Nu: int, Nv: int, order: int = 2) -> SurfaceDerivativeData:
+        r"""
+        Evaluates the Bézier surface and its partial derivatives up to second order on a uniform
+        :math:`N_u \times N_v` grid of parameter values in a single pass. See
+        :obj:`~aerocaps.geom.surfaces.BezierSurface.evaluate_derivatives`.
+
+        Parameters
+        ----------
+        Nu: int
+            Number of uniformly spaced parameter values in the :math:`u`-direction
+        Nv: int
+            Number of uniformly spaced parameter values in the :math:`v`-direction
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Default: ``2``
+
+        Returns
+        -------
+        SurfaceDerivativeData
+            Point and partial derivatives of the surface, each of size :math:`N_u \times N_v \times 3`
+        """
+        return self.evaluate_derivatives(np.linspace(0.0, 1.0, Nu), np.linspace(0.0, 1.0, Nv), order=order)
+
+    def evaluate_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the Bézier surface at :math:`N` arbitrary :math:`(u,v)` pairs. Unlike
+        :obj:`~aerocaps.geom.surfaces.BezierSurface.evaluate_uvvecs`, which evaluates every combination of the
+        :math:`u`- and :math:`v`-values, only the given pairs are evaluated.
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), None, self.degree_u, self.degree_v, None, None, uv, [(0, 0)]
+        )[(0, 0)]
+
+    def dSdu_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the first derivative of the Bézier surface with respect to :math:`u` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), None, self.degree_u, self.degree_v, None, None, uv, [(1, 0)]
+        )[(1, 0)]
+
+    def dSdv_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the first derivative of the Bézier surface with respect to :math:`v` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), None, self.degree_u, self.degree_v, None, None, uv, [(0, 1)]
+        )[(0, 1)]
+
+    def d2Sdu2_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the second derivative of the Bézier surface with respect to :math:`u` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), None, self.degree_u, self.degree_v, None, None, uv, [(2, 0)]
+        )[(2, 0)]
+
+    def d2Sdv2_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the second derivative of the Bézier surface with respect to :math:`v` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), None, self.degree_u, self.degree_v, None, None, uv, [(0, 2)]
+        )[(0, 2)]
+
+    def evaluate_derivatives_pairs(self, uv: np.ndarray, order: int = 2) -> SurfaceDerivativeData:
+        r"""
+        Evaluates the Bézier surface and its partial derivatives up to second order at :math:`N` arbitrary
+        :math:`(u,v)` pairs in a single pass. See :obj:`~aerocaps.geom.surfaces.BezierSurface.evaluate_derivatives`.
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Default: ``2``
+
+        Returns
+        -------
+        SurfaceDerivativeData
+            Point and partial derivatives of the surface, each of size :math:`N \times 3`
+        """
+        if order not in (0, 1, 2):
+            raise ValueError(f"Derivative order must be 0, 1, or 2 (found {order = })")
+        orders = [(0, 0), (1, 0), (0, 1), (2, 0), (1, 1), (0, 2)][:{0: 1, 1: 3, 2: 6}[order]]
+        results = _evaluate_surface_pairs(
+            self._control_point_array(), None, self.degree_u, self.degree_v, None, None, uv, orders
+        )
+        uv = np.asarray(uv, dtype=float)
+        return SurfaceDerivativeData(
+            uv[:, 0], uv[:, 1], results[(0, 0)],
+            Su=results.get((1, 0)), Sv=results.get((0, 1)),
+            Suu=results.get((2, 0)), Suv=results.get((1, 1)), Svv=results.get((0, 2))
+        )
+
+    def project_points(self, points: np.ndarray, Nu: int = 50, Nv: int = 50, max_iterations: int = 20,
+                       tol: float = 1e-10) -> (np.ndarray, np.ndarray, np.ndarray):
+        r"""
+        Finds the closest point on the Bézier surface to each of :math:`N` points (point inversion). Each point is
+        seeded from the nearest point of a uniform :math:`N_u \times N_v` grid on the surface using a KD-tree, and
+        all the points are then refined together using vectorized Newton iterations.
+
+        .. code-block:: python
+
+            uv, distance, converged = surf.project_points(point_cloud)
+            closest_points = surf.evaluate_pairs(uv)
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            Array of size :math:`N \times 3` (or a :obj:`~aerocaps.geom.point.PointArray3D`)
+        Nu: int
+            Number of seed grid points in the :math:`u`-direction. Default: ``50``
+        Nv: int
+            Number of seed grid points in the :math:`v`-direction. Default: ``50``
+        max_iterations: int
+            Maximum number of Newton iterations. Default: ``20``
+        tol: float
+            Convergence tolerance on the cosine of the angle between each surface tangent and the vector from the
+            surface to the point. Default: ``1e-10``
+
+        Returns
+        -------
+        numpy.ndarray, numpy.ndarray, numpy.ndarray
+            Parameter values of the closest points (size :math:`N \times 2`), distances from the points to the
+            surface (size :math:`N`), and a boolean array (size :math:`N`) indicating which points converged
+        """
+        return _project_points_onto_surface(self, points, Nu, Nv, max_iterations, tol)
+
+    def ray_intersect(self, origins: np.ndarray, directions: np.ndarray, t_min: float = 0.0, t_max: float = np.inf,
+                      all_hits: bool = False, num_workers: int = None):
+        r"""
+        Intersects a set of rays :math:`\mathbf{o} + t \mathbf{d}` with the Bézier surface. See
+        :obj:`~aerocaps.geom.intersection.ray_surface_intersections` for details.
+
+        .. code-block:: python
+
+            hits = surf.ray_intersect(origins, directions)
+            uv = np.column_stack((hits.u, hits.v))[hits.hit]
+
+        Parameters
+        ----------
+        origins: numpy.ndarray
+            Ray origins (size :math:`N \times 3`)
+        directions: numpy.ndarray
+            Ray directions (size :math:`N \times 3`), which need not be normalized
+        t_min: float
+            Minimum ray parameter. Default: ``0.0``
+        t_max: float
+            Maximum ray parameter. Default: ``numpy.inf``
+        all_hits: bool
+            Whether to return every intersection of each ray rather than only the first. Default: ``False``
+        num_workers: int
+            Number of worker processes. If not specified, the number of CPUs is used. Default: ``None``
+
+        Returns
+        -------
+        RaySurfaceIntersectionData
+            Surface parameter values, ray parameters, points, and unit normals of the intersections
+        """
+        from aerocaps.geom.intersection import ray_surface_intersections  # Avoid circular import
+        return ray_surface_intersections([self], origins, directions, t_min=t_min, t_max=t_max, all_hits=all_hits,
+                                         num_workers=num_workers)
+
     def evaluate_uvvecs(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
         r"""
         Evaluates the Bézier surface at arbitrary vectors of :math:`u` and :math:`v`-values.
@@ -866,7 +1613,7 @@ class BezierSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_eval_uvvecs(P, u, v))
 
     def extract_edge_curve(self, surface_edge: SurfaceEdge) -> BezierCurve3D:
@@ -884,7 +1631,7 @@ class BezierSurface(Surface):
         BezierCurve3D
             Bézier curve with control points corresponding to the control points along the edge of the surface
         """
-        P = self.get_control_point_array()
+        P = self._control_points
 
         if surface_edge == SurfaceEdge.u0:
             return BezierCurve3D(P[0, :, :])
@@ -915,7 +1662,7 @@ class BezierSurface(Surface):
         """
         n = self.degree_u
         m = self.degree_v
-        P = self.get_control_point_array()
+        P = self._control_points
 
         # New array has one additional control point (current array only has n+1 control points)
         new_control_points = np.zeros((P.shape[0] + 1, P.shape[1], P.shape[2]))
@@ -949,7 +1696,7 @@ class BezierSurface(Surface):
         """
         n = self.degree_u
         m = self.degree_v
-        P = self.get_control_point_array()
+        P = self._control_points
 
         # New array has one additional control point (current array only has n+1 control points)
         new_control_points = np.zeros((P.shape[0], P.shape[1] + 1, P.shape[2]))
@@ -1002,7 +1749,7 @@ class BezierSurface(Surface):
             Array of size :math:`N_u \times 3` representing the :math:`x`-, :math:`y`-, and :math:`z`-coordinates
             of the points evaluated along the isoparametric curve
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bezier_surf_eval_iso_v(P, Nu, v))
 
     def get_parallel_degree(self, surface_edge: SurfaceEdge) -> int:
@@ -1145,11 +1892,11 @@ class BezierSurface(Surface):
             Point indices used to enforce :math:`G^x` continuity, where :math:`x` is the value of ``continuity_index``
         """
         if surface_edge == SurfaceEdge.v1:
-            return row_index, len(self.points[0]) - (continuity_index + 1)
+            return row_index, self.n_points_v - (continuity_index + 1)
         elif surface_edge == SurfaceEdge.v0:
             return row_index, continuity_index
         elif surface_edge == SurfaceEdge.u1:
-            return len(self.points) - (continuity_index + 1), row_index
+            return self.n_points_u - (continuity_index + 1), row_index
         elif surface_edge == SurfaceEdge.u0:
             return continuity_index, row_index
         else:
@@ -1192,24 +1939,18 @@ class BezierSurface(Surface):
             Edge of the surface along which to retrieve the control point
         """
         if surface_edge == SurfaceEdge.v1:
-            self.points[row_index][-(continuity_index + 1)].x.m = point.x.m
-            self.points[row_index][-(continuity_index + 1)].y.m = point.y.m
-            self.points[row_index][-(continuity_index + 1)].z.m = point.z.m
+            self._control_points[row_index, -(continuity_index + 1)] = point.as_array()
         elif surface_edge == SurfaceEdge.v0:
-            self.points[row_index][continuity_index].x.m = point.x.m
-            self.points[row_index][continuity_index].y.m = point.y.m
-            self.points[row_index][continuity_index].z.m = point.z.m
+            self._control_points[row_index, continuity_index] = point.as_array()
         elif surface_edge == SurfaceEdge.u1:
-            self.points[-(continuity_index + 1)][row_index].x.m = point.x.m
-            self.points[-(continuity_index + 1)][row_index].y.m = point.y.m
-            self.points[-(continuity_index + 1)][row_index].z.m = point.z.m
+            self._control_points[-(continuity_index + 1), row_index] = point.as_array()
         elif surface_edge == SurfaceEdge.u0:
-            self.points[continuity_index][row_index].x.m = point.x.m
-            self.points[continuity_index][row_index].y.m = point.y.m
-            self.points[continuity_index][row_index].z.m = point.z.m
+            self._control_points[continuity_index, row_index] = point.as_array()
         else:
             raise ValueError("Invalid surface_edge value")
 
+        self._mark_modified()
+
     @staticmethod
     def _evaluate_f_sign(surf_edge_1: SurfaceEdge, surf_edge_2: SurfaceEdge) -> float:
         """
@@ -1355,6 +2096,137 @@ class BezierSurface(Surface):
         """
         self.enforce_g0g1(other, 1.0, surface_edge, other_surface_edge)
 
+    def _get_multiface_linear_system(self, surf_edge_mapping: dict, mod_ijs: typing.List[typing.Tuple[int, int]],
+                                     n_deriv_points: int, max_order: int) -> (typing.List[int], list, list, list):
+        """
+        Expresses the cross-derivatives of the surface along every edge of a multi-face continuity problem that has
+        an adjacent surface as linear functions of the modified control points. For each derivative order up to
+        ``max_order``, the derivatives along the active edges are stacked as ``sens @ P_mod + d_fixed``, where
+        ``sens`` holds the constant control point sensitivities and ``d_fixed`` is the contribution of the control
+        points that are not modified.
+
+        Parameters
+        ----------
+        surf_edge_mapping: dict
+            Mapping from each edge of the surface to the adjacent surface (or ``None``), the edge of the adjacent
+            surface, and the initial tangent proportionality factor
+        mod_ijs: typing.List[typing.Tuple[int, int]]
+            :math:`(i,j)`-indices of the modified control points
+        n_deriv_points: int
+            Number of locations along each edge where the derivatives are evaluated
+        max_order: int
+            Highest derivative order (``1`` or ``2``)
+
+        Returns
+        -------
+        typing.List[int], list, list, list
+            Indices of the active edges in ``surf_edge_mapping``, and for each derivative order the sparse
+            sensitivity matrix, the stacked derivatives of the adjacent surfaces, and the stacked contributions of
+            the fixed control points
+        """
+        edges = list(surf_edge_mapping.keys())
+        active_edges = [edge_idx for edge_idx, data in enumerate(surf_edge_mapping.values()) if data[0] is not None]
+        mod_i, mod_j = np.array(mod_ijs).T
+        sens, d_other, d_fixed = [], [], []
+        for order in range(1, max_order + 1):
+            get_sens = self.get_first_deriv_cp_sens_matrix if order == 1 else self.get_second_deriv_cp_sens_matrix
+            order_sens = vstack([
+                get_sens(edges[edge_idx], mod_ijs, n_points=n_deriv_points) for edge_idx in active_edges
+            ]).tocsr()
+            sens.append(order_sens)
+            d_other.append(np.concatenate([
+                getattr(surf_edge_mapping[edges[edge_idx]][0], "get_first_derivs_along_edge" if order == 1 else
+                        "get_second_derivs_along_edge")(surf_edge_mapping[edges[edge_idx]][1], n_points=n_deriv_points)
+                for edge_idx in active_edges
+            ]))
+            d_fixed.append(np.concatenate([
+                (self.get_first_derivs_along_edge if order == 1 else self.get_second_derivs_along_edge)(
+                    edges[edge_idx], n_points=n_deriv_points)
+                for edge_idx in active_edges
+            ]) - order_sens @ self._control_points[mod_i, mod_j])
+        return active_edges, sens, d_other, d_fixed
+
+    def _solve_multiface_linear(self, mod_ijs: typing.List[typing.Tuple[int, int]], x0: np.ndarray,
+                                active_edges: typing.List[int], f_signs: np.ndarray, sens: list, d_other: list,
+                                d_fixed: list, n_deriv_points: int, n_f_iterations: int) -> OptimizeResult:
+        r"""
+        Solves a multi-face continuity problem with fixed tangent proportionality factors. With the factors fixed,
+        the continuity residuals of every derivative order are linear in the modified control points, so the
+        control points are found in one sparse linear least-squares solve. Optionally, the factor of each edge is
+        then updated by minimizing the residual of that edge with the control points fixed, and the control points
+        are solved for again, ``n_f_iterations`` times.
+
+        Parameters
+        ----------
+        mod_ijs: typing.List[typing.Tuple[int, int]]
+            :math:`(i,j)`-indices of the modified control points
+        x0: numpy.ndarray
+            Initial design variables: the flattened modified control points followed by the four tangent
+            proportionality factors
+        active_edges: typing.List[int]
+            Indices of the edges with an adjacent surface
+        f_signs: numpy.ndarray
+            Sign of the tangent proportionality factor of each active edge
+        sens: list
+            Sparse control point sensitivity matrix of each derivative order
+        d_other: list
+            Stacked derivatives of the adjacent surfaces for each derivative order
+        d_fixed: list
+            Stacked contributions of the fixed control points for each derivative order
+        n_deriv_points: int
+            Number of locations along each edge where the derivatives are evaluated
+        n_f_iterations: int
+            Number of updates of the tangent proportionality factors
+
+        Returns
+        -------
+        OptimizeResult
+            Solution, with the design variables in ``x``, the sum of the squares of the residuals in ``fun``, and
+            the number of factor updates in ``nit``
+        """
+        n_mod = len(mod_ijs)
+        P = x0[:3 * n_mod].reshape((n_mod, 3))
+        f = np.abs(x0[3 * n_mod + np.array(active_edges)])
+
+        def residuals(P: np.ndarray, f: np.ndarray) -> typing.List[np.ndarray]:
+            return [d_other_k + (np.repeat(-f_signs / f ** (k + 1), n_deriv_points)[:, np.newaxis] *
+                                 (sens_k @ P + d_fixed_k))
+                    for k, (sens_k, d_other_k, d_fixed_k) in enumerate(zip(sens, d_other, d_fixed))]
+
+        def update_factor(edge_idx: int, P: np.ndarray, f_e: float) -> float:
+            # The residual of the edge is sum_k |a_k - g^(k+1) b_k|^2 with g = 1 / f, a polynomial in g whose
+            # positive stationary points are candidates for the minimum
+            rows = slice(edge_idx * n_deriv_points, (edge_idx + 1) * n_deriv_points)
+            objective = np.zeros(2 * len(sens) + 1)  # Polynomial coefficients in increasing order of degree
+            for k, (sens_k, d_other_k, d_fixed_k) in enumerate(zip(sens, d_other, d_fixed)):
+                a, b = d_other_k[rows], f_signs[edge_idx] * (sens_k[rows] @ P + d_fixed_k[rows])
+                objective[0] += np.sum(a * a)
+                objective[k + 1] -= 2.0 * np.sum(a * b)
+                objective[2 * k + 2] += np.sum(b * b)
+            roots = np.roots(np.polynomial.polynomial.polyder(objective)[::-1])
+            g = roots.real[(np.abs(roots.imag) <= 1e-12 * np.abs(roots)) & (roots.real > 0.0)]
+            if g.shape[0] == 0:
+                return f_e
+            return 1.0 / g[np.argmin(np.polynomial.polynomial.polyval(g, objective))]
+
+        for iteration in range(n_f_iterations + 1):
+            # Solve for the correction to the control points that minimizes the residuals with the factors fixed
+            matrix = vstack([
+                diags(np.repeat(-f_signs / f ** (k + 1), n_deriv_points)) @ sens_k for k, sens_k in enumerate(sens)
+            ])
+            P = P + sparse_least_squares(matrix, -np.concatenate(residuals(P, f)))
+            if iteration == n_f_iterations:
+                break
+
+            # Update the factor of each edge with the control points fixed
+            f = np.array([update_factor(edge_idx, P, f_e) for edge_idx, f_e in enumerate(f)])
+
+        x = x0.copy()
+        x[:3 * n_mod] = P.flatten()
+        x[3 * n_mod + np.array(active_edges)] = f
+        return OptimizeResult(x=x, fun=sum(np.sum(r ** 2) for r in residuals(P, f)), nit=n_f_iterations,
+                              success=True, status=0, message="Linear least-squares solution found")
+
     def enforce_g0g1_multiface(self,
                                adjacent_surf_u0: "BezierSurface" = None,
                                adjacent_surf_u1: "BezierSurface" = None,
@@ -1369,6 +2241,8 @@ class BezierSurface(Surface):
                                f_v0_initial: float = 1.0,
                                f_v1_initial: float = 1.0,
                                n_deriv_points: int = 10,
+                               method: str = "bfgs",
+                               n_f_iterations: int = 0
                                ) -> OptimizeResult:
         r"""
         .. warning::
@@ -1449,6 +2323,15 @@ class BezierSurface(Surface):
             selected by the optimizer will be different from this value. Default: ``1.0``
         n_deriv_points: int
             Number of discrete locations where the continuity error will be evaluated. Default: ``10``
+        method: str
+            Either ``"bfgs"`` to minimize the cost function over the control points and the tangent proportionality
+            factors with :obj:`scipy.optimize.minimize`, or ``"linear"`` to keep the factors fixed at their initial
+            values, in which case the :math:`G^1` error is linear in the control points and is minimized directly
+            with a sparse linear least-squares solve. Default: ``"bfgs"``
+        n_f_iterations: int
+            Number of times the tangent proportionality factors are updated (each to the exact minimizer of its edge
+            residual with the control points fixed) followed by a new linear solve for the control points if ``method``
+            is ``"linear"``. Default: ``0``
 
         Returns
         -------
@@ -1466,6 +2349,8 @@ class BezierSurface(Surface):
             raise ValueError("For continuity enforcement with only one other surface, use 'enforce_g0g1' instead")
         if len(adjacent_surfs) != len(other_edges):
             raise ValueError("Must specify one 'other_edge' for every 'adjacent_surf'")
+        if method not in ("bfgs", "linear"):
+            raise ValueError(f"Invalid method '{method}'. Must be either 'bfgs' or 'linear'")
 
         # Create a mapping between the surfaces and edges
         surf_edge_mapping = {
@@ -1489,11 +2374,6 @@ class BezierSurface(Surface):
                 data[0], surface_edge=self_edge, other_surface_edge=data[1]
             )
 
-        d1_other = {
-            self_edge: data[0].get_first_derivs_along_edge(data[1], n_points=n_deriv_points) if data[0] else None
-            for self_edge, data in surf_edge_mapping.items()
-        }
-
         def get_point_ijs_to_update() -> typing.List[typing.Tuple[int]]:
             """Gets the indices of the points in the target surface that will be updated during the optimization"""
             point_ijs_to_update = []
@@ -1511,10 +2391,21 @@ class BezierSurface(Surface):
                    for self_edge, data in surf_edge_mapping.items() if data is not None}
         f_vals = {self_edge: data[2] for self_edge, data in surf_edge_mapping.items() if data is not None}
         mod_ijs = get_point_ijs_to_update()
-        mod_points = [self.points[i][j] for i, j in mod_ijs]
-        x0 = np.array([p.as_array() for p in mod_points]).flatten()
+        mod_i, mod_j = np.array(mod_ijs).T
+        x0 = self._control_points[mod_i, mod_j].flatten()
         x0 = np.append(x0, np.array(list(f_vals.values())))
 
+        # The cross-derivatives are linear in the control points, so the derivatives along all the active edges are
+        # stacked as d1_self = sens @ P_mod + d1_fixed, where the sparse matrix sens holds the (constant) control
+        # point sensitivities and d1_fixed is the contribution of the control points that are not modified
+        active_edges, (sens,), (d1_other_stacked,), (d1_fixed,) = self._get_multiface_linear_system(
+            surf_edge_mapping, mod_ijs, n_deriv_points, max_order=1
+        )
+        sens_transpose = sens.T.tocsr()
+        active_f_signs = np.array([f_signs[list(surf_edge_mapping.keys())[edge_idx]] for edge_idx in active_edges])
+        f_sign_rows = np.repeat(active_f_signs, n_deriv_points)
+        f_cols = 3 * len(mod_ijs) + np.array(active_edges)
+
         def obj_fun_and_jac(x: np.ndarray) -> (float, np.ndarray):
             """
             Computes the objective function as the sum of the squares of the :math:`G^1` continuity error, along
@@ -1530,50 +2421,24 @@ class BezierSurface(Surface):
             float, np.ndarray
                 The objective function value and the Jacobian (a 1-D array of sensitivities)
             """
-            x_reshaped = x[:3 * len(mod_ijs)].reshape((len(mod_points), 3))
-            jac_arr = np.zeros(x.shape)
-            # Update the points in-place
-            for i in range(x_reshaped.shape[0]):
-                mod_points[i].x.m = x_reshaped[i, 0]
-                mod_points[i].y.m = x_reshaped[i, 1]
-                mod_points[i].z.m = x_reshaped[i, 2]
+            f = np.repeat(x[f_cols], n_deriv_points)
+            A = (-f_sign_rows / np.abs(f))[:, np.newaxis]
+            dA = (f_sign_rows / f ** 2)[:, np.newaxis]
+            d1_self = sens @ x[:3 * len(mod_ijs)].reshape((len(mod_ijs), 3)) + d1_fixed
+            residual = d1_other_stacked + A * d1_self
 
-            # Evaluate the objective function and Jacobian
-            obj_fun_val = 0.0
-            for edge_idx, (target_edge, multiface_data) in enumerate(surf_edge_mapping.items()):
-                if surf_edge_mapping[target_edge][0] is None:
-                    continue
-                f = x[3 * len(mod_ijs) + edge_idx]
-                f_sign = f_signs[target_edge]
-                A = -f_sign * 1 / abs(f)
-                dA = f_sign * 1 / f ** 2
-                d1_self = self.get_first_derivs_along_edge(target_edge, n_points=n_deriv_points)
-
-                # Objective function value update
-                obj_fun_val += np.sum((d1_other[target_edge] + A * d1_self) ** 2)
-
-                # Jacobian update loop
-                start_xyz = 0
-                for mod_ij in mod_ijs:
-                    d1_sens_self = self.get_first_deriv_cp_sens_along_edge(
-                        target_edge,
-                        mod_ij[0],
-                        mod_ij[1],
-                        n_points=n_deriv_points
-                    )
-                    # Jacobian array update
-                    for k in range(3):
-                        jac_arr[start_xyz + k] += np.sum(
-                            2 * (d1_other[target_edge][:, k] + A * d1_self[:, k]) * A * d1_sens_self[:, k]
-                        )
-                    start_xyz += 3
-                jac_arr[3 * len(mod_ijs) + edge_idx] = np.sum(
-                    2 * (d1_other[target_edge] + A * d1_self) * dA * d1_self
-                )
-
-            return obj_fun_val, jac_arr
+            jac_arr = np.zeros(x.shape)
+            jac_arr[:3 * len(mod_ijs)] = (sens_transpose @ (2 * residual * A)).flatten()
+            jac_arr[f_cols] = np.sum((2 * residual * dA * d1_self).reshape((len(active_edges), -1)), axis=1)
+            return np.sum(residual ** 2), jac_arr
 
-        res = minimize(obj_fun_and_jac, x0, jac=True)
+        if method == "linear":
+            res = self._solve_multiface_linear(mod_ijs, x0, active_edges, active_f_signs, [sens], [d1_other_stacked],
+                                               [d1_fixed], n_deriv_points, n_f_iterations)
+        else:
+            res = minimize(obj_fun_and_jac, x0, jac=True)
+        self._control_points[mod_i, mod_j] = res.x[:3 * len(mod_ijs)].reshape((len(mod_ijs), 3))
+        self._mark_modified()
         return res
 
     def enforce_g0g1g2(self, other: "BezierSurface", f: float,
@@ -1657,6 +2522,8 @@ class BezierSurface(Surface):
                                  f_v0_initial: float = 1.0,
                                  f_v1_initial: float = 1.0,
                                  n_deriv_points: int = 10,
+                                 method: str = "bfgs",
+                                 n_f_iterations: int = 0
                                  ) -> OptimizeResult:
         r"""
         .. warning::
@@ -1732,6 +2599,15 @@ class BezierSurface(Surface):
             selected by the optimizer will be different from this value. Default: ``1.0``
         n_deriv_points: int
             Number of discrete locations where the continuity error will be evaluated. Default: ``10``
+        method: str
+            Either ``"bfgs"`` to minimize the cost function over the control points and the tangent proportionality
+            factors with :obj:`scipy.optimize.minimize`, or ``"linear"`` to keep the factors fixed at their initial
+            values, in which case the :math:`G^1` and :math:`G^2` errors are linear in the control points and are
+            minimized directly with a sparse linear least-squares solve. Default: ``"bfgs"``
+        n_f_iterations: int
+            Number of times the tangent proportionality factors are updated (each to the exact minimizer of its edge
+            residual with the control points fixed) followed by a new linear solve for the control points if ``method``
+            is ``"linear"``. Default: ``0``
 
         Returns
         -------
@@ -1749,6 +2625,8 @@ class BezierSurface(Surface):
             raise ValueError("For continuity enforcement with only one other surface, use 'enforce_g0g1' instead")
         if len(adjacent_surfs) != len(other_edges):
             raise ValueError("Must specify one 'other_edge' for every 'adjacent_surf'")
+        if method not in ("bfgs", "linear"):
+            raise ValueError(f"Invalid method '{method}'. Must be either 'bfgs' or 'linear'")
 
         # Create a mapping between the surfaces and edges
         surf_edge_mapping = {
@@ -1772,15 +2650,6 @@ class BezierSurface(Surface):
                 data[0], surface_edge=self_edge, other_surface_edge=data[1]
             )
 
-        d1_other = {
-            self_edge: data[0].get_first_derivs_along_edge(data[1], n_points=n_deriv_points) if data[0] else None
-            for self_edge, data in surf_edge_mapping.items()
-        }
-        d2_other = {
-            self_edge: data[0].get_second_derivs_along_edge(data[1], n_points=n_deriv_points) if data[0] else None
-            for self_edge, data in surf_edge_mapping.items()
-        }
-
         def get_point_ijs_to_update() -> typing.List[typing.Tuple[int]]:
             """Gets the indices of the points in the target surface that will be updated during the optimization"""
             point_ijs_to_update = []
@@ -1804,14 +2673,23 @@ class BezierSurface(Surface):
                    for self_edge, data in surf_edge_mapping.items() if data is not None}
         f_vals = {self_edge: data[2] for self_edge, data in surf_edge_mapping.items() if data is not None}
         mod_ijs = get_point_ijs_to_update()
-        mod_points = [self.points[i][j] for i, j in mod_ijs]
-        x0 = np.array([p.as_array() for p in mod_points]).flatten()
+        mod_i, mod_j = np.array(mod_ijs).T
+        x0 = self._control_points[mod_i, mod_j].flatten()
         x0 = np.append(x0, np.array(list(f_vals.values())))
 
+        # The cross-derivatives are linear in the control points, so the first and second derivatives along all the
+        # active edges are stacked as d_self = sens @ P_mod + d_fixed (see enforce_g0g1_multiface)
+        active_edges, (sens_1, sens_2), (d1_other_stacked, d2_other_stacked), (d1_fixed, d2_fixed) = \
+            self._get_multiface_linear_system(surf_edge_mapping, mod_ijs, n_deriv_points, max_order=2)
+        sens_1_transpose, sens_2_transpose = sens_1.T.tocsr(), sens_2.T.tocsr()
+        active_f_signs = np.array([f_signs[list(surf_edge_mapping.keys())[edge_idx]] for edge_idx in active_edges])
+        f_sign_rows = np.repeat(active_f_signs, n_deriv_points)
+        f_cols = 3 * len(mod_ijs) + np.array(active_edges)
+
         def obj_fun_and_jac(x: np.ndarray) -> (float, np.ndarray):
             """
-            Computes the objective function as the sum of the squares of the :math:`G^1` continuity error, along
-            with the Jacobian
+            Computes the objective function as the sum of the squares of the :math:`G^1` and :math:`G^2` continuity
+            error, along with the Jacobian
 
             Parameters
             ----------
@@ -1823,63 +2701,23 @@ class BezierSurface(Surface):
             float, np.ndarray
                 The objective function value and the Jacobian (a 1-D array of sensitivities)
             """
-            x_reshaped = x[:3 * len(mod_ijs)].reshape((len(mod_points), 3))
-            jac_arr = np.zeros(x.shape)
-            # Update the points in-place
-            for i in range(x_reshaped.shape[0]):
-                mod_points[i].x.m = x_reshaped[i, 0]
-                mod_points[i].y.m = x_reshaped[i, 1]
-                mod_points[i].z.m = x_reshaped[i, 2]
+            f = np.repeat(x[f_cols], n_deriv_points)
+            A = (-f_sign_rows / np.abs(f))[:, np.newaxis]
+            A2 = (-f_sign_rows / f ** 2)[:, np.newaxis]
+            dA = (f_sign_rows / f ** 2)[:, np.newaxis]
+            dA2 = (2 * f_sign_rows / np.abs(f) ** 3)[:, np.newaxis]
+            P_mod = x[:3 * len(mod_ijs)].reshape((len(mod_ijs), 3))
+            d1_self = sens_1 @ P_mod + d1_fixed
+            d2_self = sens_2 @ P_mod + d2_fixed
+            residual_1 = d1_other_stacked + A * d1_self
+            residual_2 = d2_other_stacked + A2 * d2_self
 
-            # Evaluate the objective function and Jacobian
-            obj_fun_val = 0.0
-            for edge_idx, (target_edge, multiface_data) in enumerate(surf_edge_mapping.items()):
-                if surf_edge_mapping[target_edge][0] is None:
-                    continue
-                f = x[3 * len(mod_ijs) + edge_idx]
-                f_sign = f_signs[target_edge]
-                A = -f_sign * 1 / abs(f)
-                A2 = -f_sign * (1 / f) ** 2
-                dA = f_sign * (1 / f) ** 2
-                dA2 = 2 * f_sign * (1 / abs(f)) ** 3
-                d1_self = self.get_first_derivs_along_edge(target_edge, n_points=n_deriv_points)
-                d2_self = self.get_second_derivs_along_edge(target_edge, n_points=n_deriv_points)
-
-                # Objective function value update
-                obj_fun_val += np.sum((d1_other[target_edge] + A * d1_self) ** 2)
-                obj_fun_val += np.sum((d2_other[target_edge] + A2 * d2_self) ** 2)
-
-                # Jacobian update loop
-                start_xyz = 0  # Jacobian array starting index
-                for mod_ij_idx, mod_ij in enumerate(mod_ijs):
-                    d1_sens_self = self.get_first_deriv_cp_sens_along_edge(
-                        target_edge,
-                        mod_ij[0],
-                        mod_ij[1],
-                        n_points=n_deriv_points
-                    )
-                    d2_sens_self = self.get_second_deriv_cp_sens_along_edge(
-                        target_edge,
-                        mod_ij[0],
-                        mod_ij[1],
-                        n_points=n_deriv_points
-                    )
-                    # Jacobian array update
-                    for k in range(3):
-                        jac_arr[start_xyz + k] += 2 * np.sum(
-                            (d1_other[target_edge][:, k] + A * d1_self[:, k]) * A * d1_sens_self[:, k] + (
-                                    d2_other[target_edge][:, k] + A2 * d2_self[:, k]
-                            ) * A2 * d2_sens_self[:, k]
-                        )
-                    # Increment the starting Jacobian index
-                    start_xyz += 3
-
-                jac_arr[3 * len(mod_ijs) + edge_idx] = np.sum(
-                    2 * (d1_other[target_edge] + A * d1_self) * dA * d1_self +
-                    2 * (d2_other[target_edge] + A2 * d2_self) * dA2 * d2_self
-                )
-
-            return obj_fun_val, jac_arr
+            jac_arr = np.zeros(x.shape)
+            jac_arr[:3 * len(mod_ijs)] = (sens_1_transpose @ (2 * residual_1 * A) +
+                                          sens_2_transpose @ (2 * residual_2 * A2)).flatten()
+            jac_arr[f_cols] = np.sum((2 * residual_1 * dA * d1_self + 2 * residual_2 * dA2 * d2_self).reshape(
+                (len(active_edges), -1)), axis=1)
+            return np.sum(residual_1 ** 2) + np.sum(residual_2 ** 2), jac_arr
 
         # bounds = np.zeros((x0.shape[0], 2))
         # bounds[-4:, 0] = 0.05
@@ -1895,7 +2733,14 @@ class BezierSurface(Surface):
         #     xyz_start_iii += 3
 
         # res = minimize(obj_fun_and_jac, x0, jac=True, bounds=bounds)
-        res = minimize(obj_fun_and_jac, x0, jac=True)
+        if method == "linear":
+            res = self._solve_multiface_linear(mod_ijs, x0, active_edges, active_f_signs, [sens_1, sens_2],
+                                               [d1_other_stacked, d2_other_stacked], [d1_fixed, d2_fixed],
+                                               n_deriv_points, n_f_iterations)
+        else:
+            res = minimize(obj_fun_and_jac, x0, jac=True)
+        self._control_points[mod_i, mod_j] = res.x[:3 * len(mod_ijs)].reshape((len(mod_ijs), 3))
+        self._mark_modified()
         return res
 
     def get_u_or_v_given_uvxyz(self, u: float = None, v: float = None, uv_guess: float = 0.5,
@@ -1971,11 +2816,65 @@ class BezierSurface(Surface):
             return fsolve(root_find_func_v, x0=np.array([uv_guess]))[0]
         raise ValueError("Did not detect a u or v input")
 
+    def get_u_or_v_given_uvxyz_array(self, u: float or np.ndarray = None, v: float or np.ndarray = None,
+                                     uv_guess: float = 0.5, x: Length = None, y: Length = None, z: Length = None,
+                                     tol: float = 1e-12, max_iterations: int = 50) -> np.ndarray:
+        """
+        Array version of :obj:`~aerocaps.geom.surfaces.BezierSurface.get_u_or_v_given_uvxyz`. Computes the
+        :math:`u`-values (if ``v`` is specified) or :math:`v`-values (if ``u`` is specified) corresponding to an array
+        of :math:`x`-, :math:`y`-, or :math:`z`-locations along an array of isoparametric curves. The fixed parameter
+        values and locations are broadcast against each other, and all the values are solved at once using a
+        bracketed Newton-bisection method with the analytic surface derivatives. As an example, the
+        :math:`u`-parameters corresponding to several spanwise stations along the :math:`v=0.8` isoparametric curve
+        can be computed using
+
+        .. code-block:: python
+
+            u = surf.get_u_or_v_given_uvxyz_array(v=0.8, y=LengthArray(m=[0.5, 1.0, 1.4]))
+
+        Unlike :obj:`~aerocaps.geom.surfaces.BezierSurface.get_u_or_v_given_uvxyz`, the solved values always lie in
+        :math:`[0,1]`. If the isoparametric curve crosses a location more than once, the root closest to ``uv_guess``
+        is returned.
+
+        Parameters
+        ----------
+        u: float or numpy.ndarray or None
+            Values of :math:`u` to specify, or ``None`` to solve for :math:`u`. Default: ``None``
+        v: float or numpy.ndarray or None
+            Values of :math:`v` to specify, or ``None`` to solve for :math:`v`. Default: ``None``
+        uv_guess: float
+            Parameter value used to choose between multiple roots. Default: ``0.5``
+        x: Length or None
+            :math:`x`-locations (e.g., a :obj:`~aerocaps.units.length.LengthArray`). If unspecified, either
+            :math:`y` or :math:`z` must be specified. Default: ``None``
+        y: Length or None
+            :math:`y`-locations. If unspecified, either :math:`x` or :math:`z` must be specified. Default: ``None``
+        z: Length or None
+            :math:`z`-locations. If unspecified, either :math:`x` or :math:`y` must be specified. Default: ``None``
+        tol: float
+            Convergence tolerance on the solved parameter values. Default: ``1e-12``
+        max_iterations: int
+            Maximum number of Newton-bisection iterations. Default: ``50``
+
+        Returns
+        -------
+        numpy.ndarray
+            The values of :math:`u` if :math:`v` is specified or :math:`v` if :math:`u` is specified, with the
+            broadcast shape of the inputs. Locations not reached by the isoparametric curve give ``nan``
+        """
+        if u is None and v is None or (u is not None and v is not None):
+            raise ValueError("Must specify exactly one of either u or v")
+        xyz_spec = [xyz for xyz in (x, y, z) if xyz is not None]
+        if len(xyz_spec) != 1:
+            raise ValueError("Must specify exactly one of x, y, or z")
+        coordinate = [x, y, z].index(xyz_spec[0])
+        return _solve_for_u_or_v_given_xyz(self, u, v, coordinate, xyz_spec[0].m, uv_guess, tol, max_iterations)
+
     def split_at_u(self, u0: float) -> ("BezierSurface", "BezierSurface"):
         """
         Splits the Bézier surface at :math:`u=u_0` along the :math:`v`-parametric direction.
         """
-        P = self.get_control_point_array()
+        P = self._control_points
 
         def de_casteljau(i: int, j: int, k: int) -> np.ndarray:
             """
@@ -2026,7 +2925,7 @@ class BezierSurface(Surface):
         """
         Splits the Bézier surface at :math:`v=v_0` along the :math:`u`-parametric direction.
         """
-        P = self.get_control_point_array()
+        P = self._control_points
 
         def de_casteljau(i: int, j: int, k: int) -> np.ndarray:
             """
@@ -2080,51 +2979,30 @@ class BezierSurface(Surface):
             Transformed surface
         """
         transformation = Transformation3D(**transformation_kwargs)
-        initial_control_points = self.get_control_point_array()
+        initial_control_points = self._control_point_array()
         return BezierSurface(
             np.array([transformation.transform(p_arr) for p_arr in initial_control_points]),
             name=self.name, construction=self.construction
         )
 
-    def generate_control_point_net(self) -> (typing.List[Point3D], typing.List[Line3D]):
+    def generate_control_point_net(self) -> (PointArray3D, typing.List[Line3D]):
         """
-        Generates a list of :obj:`~aerocaps.geom.point.Point3D` and :obj:`~aerocaps.geom.curves.Line3D` objects
+        Generates a :obj:`~aerocaps.geom.point.PointArray3D` and a list of :obj:`~aerocaps.geom.curves.Line3D` objects
         representing the Bézier surface's control points and connections between them
 
         Returns
         -------
-        typing.List[Point3D], typing.List[Line3D]
-            Control points and lines between adjacent control points in flattened lists
+        PointArray3D, typing.List[Line3D]
+            Control points and lines between adjacent control points in flattened form
         """
-        points = []
-        lines = []
-        control_points = self.get_control_point_array()
-
-        for i in range(self.n_points_u):
-            for j in range(self.n_points_v):
-                points.append(Point3D.from_array(control_points[i, j, :]))
-
-        for i in range(self.n_points_u - 1):
-            for j in range(self.n_points_v - 1):
-                point_obj_1 = Point3D.from_array(control_points[i, j, :])
-                point_obj_2 = Point3D.from_array(control_points[i + 1, j, :])
-                point_obj_3 = Point3D.from_array(control_points[i, j + 1, :])
-
-                line_1 = Line3D(p0=point_obj_1, p1=point_obj_2)
-                line_2 = Line3D(p0=point_obj_1, p1=point_obj_3)
-                lines.extend([line_1, line_2])
-
-                if i < self.n_points_u - 2 and j < self.n_points_v - 2:
-                    continue
-
-                point_obj_4 = Point3D.from_array(control_points[i + 1, j + 1, :])
-                line_3 = Line3D(p0=point_obj_3, p1=point_obj_4)
-                line_4 = Line3D(p0=point_obj_2, p1=point_obj_4)
-                lines.extend([line_3, line_4])
-
+        control_points = self._control_point_array()
+        points = PointArray3D(control_points)
+        lines = [Line3D(p0=Point3D.from_array(segment[0]), p1=Point3D.from_array(segment[1]))
+                 for segment in _get_control_point_net_segments(control_points)]
         return points, lines
 
-    def plot_surface(self, plot: pv.Plotter, Nu: int = 50, Nv: int = 50, **mesh_kwargs) -> pv.StructuredGrid:
+    def plot_surface(self, plot: pv.Plotter, Nu: int = 50, Nv: int = 50, XYZ: np.ndarray = None,
+                     **mesh_kwargs) -> pv.StructuredGrid:
         """
         Plots the Bézier surface using the `pyvista <https://pyvista.org/>`_ library
 
@@ -2136,6 +3014,10 @@ class BezierSurface(Surface):
             Number of points to evaluate in the :math:`u`-parametric direction. Default: ``50``
         Nv: int
             Number of points to evaluate in the :math:`v`-parametric direction. Default: ``50``
+        XYZ: numpy.ndarray
+            Points already evaluated on the surface, of size :math:`N_u \\times N_v \\times 3` (e.g., from
+            :obj:`~aerocaps.geom.batch.SurfaceBatch.evaluate_grid`). If specified, ``Nu`` and ``Nv`` are ignored
+            and the surface is not re-evaluated. Default: ``None``
         mesh_kwargs:
             Keyword arguments to pass to :obj:`pyvista.Plotter.add_mesh`
 
@@ -2144,7 +3026,8 @@ class BezierSurface(Surface):
         pyvista.core.pointset.StructuredGrid
             The evaluated Bézier surface
         """
-        XYZ = self.evaluate_grid(Nu, Nv)
+        if XYZ is None:
+            XYZ = self.evaluate_grid(Nu, Nv)
         grid = pv.StructuredGrid(XYZ[:, :, 0], XYZ[:, :, 1], XYZ[:, :, 2])
         plot.add_mesh(grid, **mesh_kwargs)
 
@@ -2167,9 +3050,7 @@ class BezierSurface(Surface):
         pv.Actor
             The lines actor
         """
-        _, line_objs = self.generate_control_point_net()
-        line_arr = np.array([[line_obj.p0.as_array(), line_obj.p1.as_array()] for line_obj in line_objs])
-        line_arr = line_arr.reshape((len(line_objs) * 2, 3))
+        line_arr = _get_control_point_net_segments(self._control_point_array()).reshape((-1, 3))
         line_actor = plot.add_lines(line_arr, **line_kwargs)
         return line_actor
 
@@ -2189,8 +3070,7 @@ class BezierSurface(Surface):
         pv.Actor
             The points actor
         """
-        point_objs, _ = self.generate_control_point_net()
-        point_arr = np.array([point_obj.as_array() for point_obj in point_objs])
+        point_arr = self._control_point_array().reshape((-1, 3))
         point_actor = plot.add_points(point_arr, **point_kwargs)
         return point_actor
 
@@ -2222,8 +3102,6 @@ class RationalBezierSurface(Surface):
             Whether this is a geometry used only for construction of other geometries. If ``True``, this
             geometry will not be exported or plotted. Default: ``False``
         """
-        if isinstance(points, np.ndarray):
-            points = [[Point3D.from_array(pt_row) for pt_row in pt_mat] for pt_mat in points]
         self.points = points
         knots_u = np.zeros(2 * len(points))
         knots_v = np.zeros(2 * len(points[0]))
@@ -2247,18 +3125,45 @@ class RationalBezierSurface(Surface):
 
         self._knots_u = knots_u
         self._knots_v = knots_v
-        self.weights = deepcopy(weights)
+        self.weights = weights
         super().__init__(name=name, construction=construction)
 
+    @property
+    def points(self) -> Point3DNetView:
+        """
+        Control points as a nested sequence of point objects. Each point is a view into the control point array
+        owned by the surface, so ``surf.points[i][j].x.m = 1.0`` and ``surf.points[i][j] = point`` both modify
+        the surface. The points are created on demand; the array is the only stored representation. Modifications
+        made through the points increment :obj:`~aerocaps.geom.Geometry.version`.
+
+        .. warning::
+
+            Point objects passed to the constructor or assigned to ``points`` are copied into the array, not
+            referenced. Modifying them afterward does not modify the surface, and a point object shared by several
+            surfaces or curves no longer ties them together. Modify the surface through ``surf.points`` or assign
+            ``surf.points`` again instead.
+        """
+        return Point3DNetView(self._control_points, on_modify=self._mark_modified)
+
+    @points.setter
+    def points(self, points: typing.List[typing.List[Point3D]] or np.ndarray):
+        r"""
+        Sets the control points from a nested list of point objects or an array of size
+        :math:`N_u \times N_v \times 3`. The values are copied into a new array owned by the surface, so the point
+        objects passed in are not tied to the surface.
+        """
+        self._control_points = point3d_net_to_array(points)
+        self._mark_modified()
+
     @property
     def n_points_u(self) -> int:
         """Number of control points in the :math:`u`-parametric direction"""
-        return len(self.points)
+        return self._control_points.shape[0]
 
     @property
     def n_points_v(self) -> int:
         """Number of control points in the :math:`v`-parametric direction"""
-        return len(self.points[0])
+        return self._control_points.shape[1]
 
     @property
     def degree_u(self) -> int:
@@ -2304,9 +3209,25 @@ class RationalBezierSurface(Surface):
         """Knots in the :math:`v`-direction"""
         return self._knots_v
 
+    @property
+    def weights(self) -> np.ndarray:
+        """
+        Weight matrix. The returned array is a read-only view; use
+        :obj:`~aerocaps.geom.surfaces.RationalBezierSurface.set_weight` or assign a new matrix to this property
+        to change the weights.
+        """
+        weights = self._weights.view()
+        weights.flags.writeable = False
+        return weights
+
+    @weights.setter
+    def weights(self, weights: np.ndarray):
+        self._weights = np.array(weights, dtype=float)
+        self._mark_modified()
+
     def to_iges(self, *args, **kwargs) -> aerocaps.iges.entity.IGESEntity:
         return aerocaps.iges.surfaces.RationalBSplineSurfaceIGES(
-            control_points=self.get_control_point_array(),
+            control_points=self._control_point_array(),
             knots_u=self.knots_u,
             knots_v=self.knots_v,
             weights=self.weights,
@@ -2316,14 +3237,14 @@ class RationalBezierSurface(Surface):
 
     def get_control_point_array(self) -> np.ndarray:
         """
-        Converts the nested list of control points to a 3-D :obj:`~numpy.ndarray`.
+        Gets a copy of the control point array. Modifying the returned array does not modify the surface.
 
         Returns
         -------
         numpy.ndarray
             3-D array
         """
-        return np.array([np.array([p.as_array() for p in p_arr]) for p_arr in self.points])
+        return self._control_points.copy()
 
     def get_homogeneous_control_points(self) -> np.ndarray:
         r"""
@@ -2338,10 +3259,14 @@ class RationalBezierSurface(Surface):
             the :math:`x`-coordinate, :math:`y`-coordinate, :math:`z`-coordinate, and weight of each
             control point.
         """
-        return np.dstack((
-            self.get_control_point_array() * np.repeat(self.weights[:, :, np.newaxis], 3, axis=2),
-            self.weights
-        ))
+        return self._homogeneous_control_point_array().copy()
+
+    def _homogeneous_control_point_array(self) -> np.ndarray:
+        """Read-only array of control points in homogeneous coordinates, cached until the surface is modified"""
+        return self._get_cached_array("homogeneous_control_points", lambda: np.dstack((
+            self._control_points * np.repeat(self._weights[:, :, np.newaxis], 3, axis=2),
+            self._weights
+        )))
 
     @staticmethod
     def project_homogeneous_control_points(homogeneous_points: np.ndarray) -> (np.ndarray, np.ndarray):
@@ -2369,7 +3294,7 @@ class RationalBezierSurface(Surface):
         """
         n = self.degree_u
         m = self.degree_v
-        Pw = self.get_homogeneous_control_points()
+        Pw = self._homogeneous_control_point_array()
 
         # New array has one additional control point (current array only has n+1 control points)
         new_Pw = np.zeros((Pw.shape[0] + 1, Pw.shape[1], Pw.shape[2]))
@@ -2400,7 +3325,7 @@ class RationalBezierSurface(Surface):
         """
         n = self.degree_u
         m = self.degree_v
-        Pw = self.get_homogeneous_control_points()
+        Pw = self._homogeneous_control_point_array()
 
         # New array has one additional control point (current array only has n+1 control points)
         new_Pw = np.zeros((Pw.shape[0], Pw.shape[1] + 1, Pw.shape[2]))
@@ -2461,39 +3386,8 @@ class RationalBezierSurface(Surface):
             rad_dist = np.linspace(start_angle.rad, end_angle.rad, N_angles)
             return [Angle(rad=r) for r in rad_dist]
 
-        control_points = []
-        weights = []
         angles = _determine_angle_distribution()
-
-        for point in bezier.control_points:
-
-            axis_projection = project_point_onto_line(point, axis)
-            radius = measure_distance_point_line(point, axis)
-            if radius == 0.0:
-                new_points = [point for _ in angles]
-            else:
-                new_points = [rotate_point_about_axis(point, axis, angle) for angle in angles]
-
-            for idx, rotated_point in enumerate(new_points):
-                if idx == 0:
-                    weights.append([])
-                if not idx % 2:  # Skip even indices (these represent the "through" control points)
-                    weights[-1].append(1.0)
-                    continue
-                sine_half_angle = np.sin(0.5 * np.pi - 0.5 * (angles[idx + 1].rad - angles[idx - 1].rad))
-
-                if radius != 0.0:
-                    distance = radius / sine_half_angle  # radius / sin(half angle)
-                    vector = Vector3D(p0=axis_projection, p1=rotated_point)
-                    new_points[idx] = axis_projection + Point3D.from_array(
-                        distance * np.array(vector.normalized_value()))
-
-                weights[-1].append(sine_half_angle)
-
-            control_points.append(np.array([new_point.as_array() for new_point in new_points]))
-
-        control_points = np.array(control_points)
-        weights = np.array(weights)
+        control_points, weights = _revolve_control_points(bezier.get_control_point_array(), axis, angles)
 
         return cls(control_points, weights)
 
@@ -2621,91 +3515,338 @@ class RationalBezierSurface(Surface):
                 while bottom_curve.degree < top_curve.degree:
                     bottom_curve = bottom_curve.elevate_degree()
 
-        # Retrieve the new homogeneous control points for each (possibly modified) curve
-        left_cps = left_curve.get_homogeneous_control_points()
-        right_cps = right_curve.get_homogeneous_control_points()
-        top_cps = top_curve.get_homogeneous_control_points()
-        bottom_cps = bottom_curve.get_homogeneous_control_points()
+        # Retrieve the new homogeneous control points for each (possibly modified) curve
+        left_cps = left_curve.get_homogeneous_control_points()
+        right_cps = right_curve.get_homogeneous_control_points()
+        top_cps = top_curve.get_homogeneous_control_points()
+        bottom_cps = bottom_curve.get_homogeneous_control_points()
+
+        # Linearly interpolate between the left and right curves, length equal to number of control points
+        # in the top/bottom direction
+        arrays_to_stack = []
+        for t in np.linspace(0.0, 1.0, top_curve.degree + 1):
+            arrays_to_stack.append(left_cps + t * (right_cps - left_cps))
+        Pw = np.array(arrays_to_stack)
+
+        # Displace the control points associated with the top side of the surface
+        for Pw_slice, curve_Pw in zip(Pw[1:-1], bottom_cps[1:-1]):
+            displacement = curve_Pw - Pw_slice[0]
+            for i in range(left_curve.degree):
+                Pw_slice[i] += ((left_curve.degree - i) / left_curve.degree) ** displacement_degree * displacement
+
+        # Displace the control points associated with the bottom side of the surface
+        for Pw_slice, curve_Pw in zip(Pw[1:-1], top_cps[1:-1]):
+            displacement = curve_Pw - Pw_slice[-1]
+            for i in range(left_curve.degree):
+                Pw_slice[-1 - i] += ((left_curve.degree - i) / left_curve.degree) ** displacement_degree * displacement
+
+        # Project the new homogeneous control points onto the w=1 hyperplane
+        new_points, new_weights = RationalBezierSurface.project_homogeneous_control_points(Pw)
+
+        return RationalBezierSurface(new_points, new_weights)
+
+    def evaluate(self, u: float, v: float) -> np.ndarray:
+        r"""
+        Evaluates the surface at a given :math:`(u,v)` parameter pair.
+
+        Parameters
+        ----------
+        u: float
+            Position along :math:`u` in parametric space. Normally in the range :math:`[0,1]`
+        v: float
+            Position along :math:`v` in parametric space. Normally in the range :math:`[0,1]`
+
+        Returns
+        -------
+        numpy.ndarray
+            1-D array of the form ``array([x, y, z])`` representing the evaluated point on the surface
+        """
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_eval(P, self._weight_list(), u, v))
+
+    def evaluate_point3d(self, u: float, v: float) -> Point3D:
+        r"""
+        Evaluates the rational Bézier surface at a single :math:`(u,v)` parameter pair and returns a point object.
+
+        Parameters
+        ----------
+        u: float
+            Position along :math:`u` in parametric space. Normally in the range :math:`[0,1]`
+        v: float
+            Position along :math:`v` in parametric space. Normally in the range :math:`[0,1]`
+
+        Returns
+        -------
+        Point3D
+            Point object corresponding to the :math:`(u,v)` pair
+        """
+        return Point3D.from_array(self.evaluate(u, v))
+
+    def evaluate_grid(self, Nu: int, Nv: int) -> np.ndarray:
+        r"""
+        Evaluates the rational Bézier surface on a uniform :math:`N_u \times N_v` grid of parameter values.
+
+        Parameters
+        ----------
+        Nu: int
+            Number of uniformly spaced parameter values in the :math:`u`-direction
+        Nv: int
+            Number of uniformly spaced parameter values in the :math:`v`-direction
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N_u \times N_v \times 3`
+        """
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_eval_grid(P, self._weight_list(), Nu, Nv))
+
+    def evaluate_derivatives(self, u: float or np.ndarray, v: float or np.ndarray,
+                             order: int = 2) -> SurfaceDerivativeData:
+        r"""
+        Evaluates the rational Bézier surface and its partial derivatives up to second order
+        (:math:`\mathbf{S}`, :math:`\mathbf{S}_u`, :math:`\mathbf{S}_v`, :math:`\mathbf{S}_{uu}`,
+        :math:`\mathbf{S}_{uv}`, and :math:`\mathbf{S}_{vv}`) in a single pass. The basis functions in each
+        parametric direction are computed only once and shared by all the derivatives, which makes this much faster
+        than calling each of the derivative methods separately.
+
+        Parameters
+        ----------
+        u: float or numpy.ndarray
+            Parameter value in the :math:`u`-direction, or a 1-D array of :math:`N_u` parameter values
+        v: float or numpy.ndarray
+            Parameter value in the :math:`v`-direction, or a 1-D array of :math:`N_v` parameter values
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Derivatives above this order are
+            ``None`` in the output. Default: ``2``
+
+        Returns
+        -------
+        SurfaceDerivativeData
+            Point and partial derivatives of the surface. Each array has size :math:`3` for float inputs or
+            :math:`N_u \times N_v \times 3` for array inputs (evaluated at each combination of :math:`u` and
+            :math:`v`)
+        """
+        return _evaluate_surface_derivatives(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, None, None, u, v, order
+        )
+
+    def evaluate_derivatives_grid(self, Nu: int, Nv: int, order: int = 2) -> SurfaceDerivativeData:
+        r"""
+        Evaluates the rational Bézier surface and its partial derivatives up to second order on a uniform
+        :math:`N_u \times N_v` grid of parameter values in a single pass. See
+        :obj:`~aerocaps.geom.surfaces.RationalBezierSurface.evaluate_derivatives`.
+
+        Parameters
+        ----------
+        Nu: int
+            Number of uniformly spaced parameter values in the :math:`u`-direction
+        Nv: int
+            Number of uniformly spaced parameter values in the :math:`v`-direction
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Default: ``2``
+
+        Returns
+        -------
+        SurfaceDerivativeData
+            Point and partial derivatives of the surface, each of size :math:`N_u \times N_v \times 3`
+        """
+        return self.evaluate_derivatives(np.linspace(0.0, 1.0, Nu), np.linspace(0.0, 1.0, Nv), order=order)
+
+    def evaluate_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the rational Bézier surface at :math:`N` arbitrary :math:`(u,v)` pairs. Unlike
+        :obj:`~aerocaps.geom.surfaces.RationalBezierSurface.dSdu_uvvecs` and the other ``uvvecs`` methods, which
+        evaluate every combination of the :math:`u`- and :math:`v`-values, only the given pairs are evaluated.
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, None, None, uv, [(0, 0)]
+        )[(0, 0)]
+
+    def dSdu_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the first derivative of the rational Bézier surface with respect to :math:`u` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
 
-        # Linearly interpolate between the left and right curves, length equal to number of control points
-        # in the top/bottom direction
-        arrays_to_stack = []
-        for t in np.linspace(0.0, 1.0, top_curve.degree + 1):
-            arrays_to_stack.append(left_cps + t * (right_cps - left_cps))
-        Pw = np.array(arrays_to_stack)
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
 
-        # Displace the control points associated with the top side of the surface
-        for Pw_slice, curve_Pw in zip(Pw[1:-1], bottom_cps[1:-1]):
-            displacement = curve_Pw - Pw_slice[0]
-            for i in range(left_curve.degree):
-                Pw_slice[i] += ((left_curve.degree - i) / left_curve.degree) ** displacement_degree * displacement
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, None, None, uv, [(1, 0)]
+        )[(1, 0)]
 
-        # Displace the control points associated with the bottom side of the surface
-        for Pw_slice, curve_Pw in zip(Pw[1:-1], top_cps[1:-1]):
-            displacement = curve_Pw - Pw_slice[-1]
-            for i in range(left_curve.degree):
-                Pw_slice[-1 - i] += ((left_curve.degree - i) / left_curve.degree) ** displacement_degree * displacement
+    def dSdv_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the first derivative of the rational Bézier surface with respect to :math:`v` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
 
-        # Project the new homogeneous control points onto the w=1 hyperplane
-        new_points, new_weights = RationalBezierSurface.project_homogeneous_control_points(Pw)
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
 
-        return RationalBezierSurface(new_points, new_weights)
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, None, None, uv, [(0, 1)]
+        )[(0, 1)]
 
-    def evaluate(self, u: float, v: float) -> np.ndarray:
+    def d2Sdu2_pairs(self, uv: np.ndarray) -> np.ndarray:
         r"""
-        Evaluates the surface at a given :math:`(u,v)` parameter pair.
+        Evaluates the second derivative of the rational Bézier surface with respect to :math:`u` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
 
         Parameters
         ----------
-        u: float
-            Position along :math:`u` in parametric space. Normally in the range :math:`[0,1]`
-        v: float
-            Position along :math:`v` in parametric space. Normally in the range :math:`[0,1]`
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
 
         Returns
         -------
         numpy.ndarray
-            1-D array of the form ``array([x, y, z])`` representing the evaluated point on the surface
+            Array of size :math:`N \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_eval(P, self.weights, u, v))
+        return _evaluate_surface_pairs(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, None, None, uv, [(2, 0)]
+        )[(2, 0)]
 
-    def evaluate_point3d(self, u: float, v: float) -> Point3D:
+    def d2Sdv2_pairs(self, uv: np.ndarray) -> np.ndarray:
         r"""
-        Evaluates the rational Bézier surface at a single :math:`(u,v)` parameter pair and returns a point object.
+        Evaluates the second derivative of the rational Bézier surface with respect to :math:`v` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
 
         Parameters
         ----------
-        u: float
-            Position along :math:`u` in parametric space. Normally in the range :math:`[0,1]`
-        v: float
-            Position along :math:`v` in parametric space. Normally in the range :math:`[0,1]`
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
 
         Returns
         -------
-        Point3D
-            Point object corresponding to the :math:`(u,v)` pair
+        numpy.ndarray
+            Array of size :math:`N \times 3`
         """
-        return Point3D.from_array(self.evaluate(u, v))
+        return _evaluate_surface_pairs(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, None, None, uv, [(0, 2)]
+        )[(0, 2)]
 
-    def evaluate_grid(self, Nu: int, Nv: int) -> np.ndarray:
+    def evaluate_derivatives_pairs(self, uv: np.ndarray, order: int = 2) -> SurfaceDerivativeData:
         r"""
-        Evaluates the rational Bézier surface on a uniform :math:`N_u \times N_v` grid of parameter values.
+        Evaluates the rational Bézier surface and its partial derivatives up to second order at :math:`N` arbitrary
+        :math:`(u,v)` pairs in a single pass. See :obj:`~aerocaps.geom.surfaces.RationalBezierSurface.evaluate_derivatives`.
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Default: ``2``
+
+        Returns
+        -------
+        SurfaceDerivativeData
+            Point and partial derivatives of the surface, each of size :math:`N \times 3`
+        """
+        if order not in (0, 1, 2):
+            raise ValueError(f"Derivative order must be 0, 1, or 2 (found {order = })")
+        orders = [(0, 0), (1, 0), (0, 1), (2, 0), (1, 1), (0, 2)][:{0: 1, 1: 3, 2: 6}[order]]
+        results = _evaluate_surface_pairs(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, None, None, uv, orders
+        )
+        uv = np.asarray(uv, dtype=float)
+        return SurfaceDerivativeData(
+            uv[:, 0], uv[:, 1], results[(0, 0)],
+            Su=results.get((1, 0)), Sv=results.get((0, 1)),
+            Suu=results.get((2, 0)), Suv=results.get((1, 1)), Svv=results.get((0, 2))
+        )
+
+    def project_points(self, points: np.ndarray, Nu: int = 50, Nv: int = 50, max_iterations: int = 20,
+                       tol: float = 1e-10) -> (np.ndarray, np.ndarray, np.ndarray):
+        r"""
+        Finds the closest point on the rational Bézier surface to each of :math:`N` points (point inversion). Each point is
+        seeded from the nearest point of a uniform :math:`N_u \times N_v` grid on the surface using a KD-tree, and
+        all the points are then refined together using vectorized Newton iterations.
+
+        .. code-block:: python
+
+            uv, distance, converged = surf.project_points(point_cloud)
+            closest_points = surf.evaluate_pairs(uv)
 
         Parameters
         ----------
+        points: numpy.ndarray
+            Array of size :math:`N \times 3` (or a :obj:`~aerocaps.geom.point.PointArray3D`)
         Nu: int
-            Number of uniformly spaced parameter values in the :math:`u`-direction
+            Number of seed grid points in the :math:`u`-direction. Default: ``50``
         Nv: int
-            Number of uniformly spaced parameter values in the :math:`v`-direction
+            Number of seed grid points in the :math:`v`-direction. Default: ``50``
+        max_iterations: int
+            Maximum number of Newton iterations. Default: ``20``
+        tol: float
+            Convergence tolerance on the cosine of the angle between each surface tangent and the vector from the
+            surface to the point. Default: ``1e-10``
 
         Returns
         -------
-        numpy.ndarray
-            Array of size :math:`N_u \times N_v \times 3`
+        numpy.ndarray, numpy.ndarray, numpy.ndarray
+            Parameter values of the closest points (size :math:`N \times 2`), distances from the points to the
+            surface (size :math:`N`), and a boolean array (size :math:`N`) indicating which points converged
+        """
+        return _project_points_onto_surface(self, points, Nu, Nv, max_iterations, tol)
+
+    def ray_intersect(self, origins: np.ndarray, directions: np.ndarray, t_min: float = 0.0, t_max: float = np.inf,
+                      all_hits: bool = False, num_workers: int = None):
+        r"""
+        Intersects a set of rays :math:`\mathbf{o} + t \mathbf{d}` with the rational Bézier surface. See
+        :obj:`~aerocaps.geom.intersection.ray_surface_intersections` for details.
+
+        .. code-block:: python
+
+            hits = surf.ray_intersect(origins, directions)
+            uv = np.column_stack((hits.u, hits.v))[hits.hit]
+
+        Parameters
+        ----------
+        origins: numpy.ndarray
+            Ray origins (size :math:`N \times 3`)
+        directions: numpy.ndarray
+            Ray directions (size :math:`N \times 3`), which need not be normalized
+        t_min: float
+            Minimum ray parameter. Default: ``0.0``
+        t_max: float
+            Maximum ray parameter. Default: ``numpy.inf``
+        all_hits: bool
+            Whether to return every intersection of each ray rather than only the first. Default: ``False``
+        num_workers: int
+            Number of worker processes. If not specified, the number of CPUs is used. Default: ``None``
+
+        Returns
+        -------
+        RaySurfaceIntersectionData
+            Surface parameter values, ray parameters, points, and unit normals of the intersections
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_eval_grid(P, self.weights, Nu, Nv))
+        from aerocaps.geom.intersection import ray_surface_intersections  # Avoid circular import
+        return ray_surface_intersections([self], origins, directions, t_min=t_min, t_max=t_max, all_hits=all_hits,
+                                         num_workers=num_workers)
 
     def extract_edge_curve(self, surface_edge: SurfaceEdge) -> RationalBezierCurve3D:
         """
@@ -2722,7 +3863,7 @@ class RationalBezierSurface(Surface):
         RationalBezierCurve3D
             Rational Bézier curve with control points corresponding to the control points along the edge of the surface
         """
-        P = self.get_control_point_array()
+        P = self._control_points
         w = self.weights
 
         if surface_edge == SurfaceEdge.u0:
@@ -2738,13 +3879,13 @@ class RationalBezierSurface(Surface):
 
     def reverse_u(self) -> "RationalBezierSurface":
         """Reverses the surface in the :math:`u`-direction"""
-        P = self.get_control_point_array()[::-1, :, :]
+        P = self._control_points[::-1, :, :]
         w = self.weights[::-1, :]
         return RationalBezierSurface(P, w)
 
     def reverse_v(self) -> "RationalBezierSurface":
         """Reverses the surface in the :math:`v`-direction"""
-        P = self.get_control_point_array()[:, ::-1, :]
+        P = self._control_points[:, ::-1, :]
         w = self.weights[:, ::-1]
         return RationalBezierSurface(P, w)
 
@@ -2913,11 +4054,11 @@ class RationalBezierSurface(Surface):
             Point indices used to enforce :math:`G^x` continuity, where :math:`x` is the value of ``continuity_index``
         """
         if surface_edge == SurfaceEdge.v1:
-            return row_index, len(self.points[0]) - (continuity_index + 1)
+            return row_index, self.n_points_v - (continuity_index + 1)
         elif surface_edge == SurfaceEdge.v0:
             return row_index, continuity_index
         elif surface_edge == SurfaceEdge.u1:
-            return len(self.points) - (continuity_index + 1), row_index
+            return self.n_points_u - (continuity_index + 1), row_index
         elif surface_edge == SurfaceEdge.u0:
             return continuity_index, row_index
         else:
@@ -2960,24 +4101,18 @@ class RationalBezierSurface(Surface):
             Edge of the surface along which to retrieve the control point
         """
         if surface_edge == SurfaceEdge.v1:
-            self.points[row_index][-(continuity_index + 1)].x.m = point.x.m
-            self.points[row_index][-(continuity_index + 1)].y.m = point.y.m
-            self.points[row_index][-(continuity_index + 1)].z.m = point.z.m
+            self._control_points[row_index, -(continuity_index + 1)] = point.as_array()
         elif surface_edge == SurfaceEdge.v0:
-            self.points[row_index][continuity_index].x.m = point.x.m
-            self.points[row_index][continuity_index].y.m = point.y.m
-            self.points[row_index][continuity_index].z.m = point.z.m
+            self._control_points[row_index, continuity_index] = point.as_array()
         elif surface_edge == SurfaceEdge.u1:
-            self.points[-(continuity_index + 1)][row_index].x.m = point.x.m
-            self.points[-(continuity_index + 1)][row_index].y.m = point.y.m
-            self.points[-(continuity_index + 1)][row_index].z.m = point.z.m
+            self._control_points[-(continuity_index + 1), row_index] = point.as_array()
         elif surface_edge == SurfaceEdge.u0:
-            self.points[continuity_index][row_index].x.m = point.x.m
-            self.points[continuity_index][row_index].y.m = point.y.m
-            self.points[continuity_index][row_index].z.m = point.z.m
+            self._control_points[continuity_index, row_index] = point.as_array()
         else:
             raise ValueError("Invalid surface_edge value")
 
+        self._mark_modified()
+
     def get_weight(self, row_index: int, continuity_index: int, surface_edge: SurfaceEdge) -> float:
         r"""
         Gets the weight corresponding to a particular index along the edge curve with perpendicular index
@@ -3061,16 +4196,18 @@ class RationalBezierSurface(Surface):
             Edge of the surface along which to retrieve the weight
         """
         if surface_edge == SurfaceEdge.v1:
-            self.weights[row_index][-(continuity_index + 1)] = weight
+            self._weights[row_index][-(continuity_index + 1)] = weight
         elif surface_edge == SurfaceEdge.v0:
-            self.weights[row_index][continuity_index] = weight
+            self._weights[row_index][continuity_index] = weight
         elif surface_edge == SurfaceEdge.u1:
-            self.weights[-(continuity_index + 1)][row_index] = weight
+            self._weights[-(continuity_index + 1)][row_index] = weight
         elif surface_edge == SurfaceEdge.u0:
-            self.weights[continuity_index][row_index] = weight
+            self._weights[continuity_index][row_index] = weight
         else:
             raise ValueError("Invalid surface_edge value")
 
+        self._mark_modified()
+
     @staticmethod
     def _evaluate_f_sign(surf_edge_1: SurfaceEdge, surf_edge_2: SurfaceEdge) -> float:
         """
@@ -3497,8 +4634,8 @@ class RationalBezierSurface(Surface):
                    for self_edge, data in surf_edge_mapping.items() if data is not None}
         f_vals = {self_edge: data[2] for self_edge, data in surf_edge_mapping.items() if data is not None}
         mod_ijs = get_point_ijs_to_update()
-        mod_points = [self.points[i][j] for i, j in mod_ijs]
-        x0 = np.array([p.as_array() for p in mod_points]).flatten()
+        mod_i, mod_j = np.array(mod_ijs).T
+        x0 = self._control_points[mod_i, mod_j].flatten()
         x0 = np.append(x0, np.array(list(f_vals.values())))
 
         def obj_fun_and_jac(x: np.ndarray) -> (float, np.ndarray):
@@ -3516,13 +4653,11 @@ class RationalBezierSurface(Surface):
             float, np.ndarray
                 The objective function value and the Jacobian (a 1-D array of sensitivities)
             """
-            x_reshaped = x[:3 * len(mod_ijs)].reshape((len(mod_points), 3))
+            x_reshaped = x[:3 * len(mod_ijs)].reshape((len(mod_ijs), 3))
             jac_arr = np.zeros(x.shape)
             # Update the points in-place
-            for i in range(x_reshaped.shape[0]):
-                mod_points[i].x.m = x_reshaped[i, 0]
-                mod_points[i].y.m = x_reshaped[i, 1]
-                mod_points[i].z.m = x_reshaped[i, 2]
+            self._control_points[mod_i, mod_j] = x_reshaped
+            self._mark_modified()
 
             # Evaluate the objective function and Jacobian
             obj_fun_val = 0.0
@@ -3593,8 +4728,8 @@ class RationalBezierSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_dsdu(P, self.weights, u, v))
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_dsdu(P, self._weight_list(), u, v))
 
     def dSdu_grid(self, Nu: int, Nv: int) -> np.ndarray:
         r"""
@@ -3613,8 +4748,8 @@ class RationalBezierSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_dsdu_grid(P, self.weights, Nu, Nv))
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_dsdu_grid(P, self._weight_list(), Nu, Nv))
 
     def dSdu_uvvecs(self, u: np.ndarray, v: np.ndarray):
         r"""
@@ -3633,8 +4768,8 @@ class RationalBezierSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_dsdu_uvvecs(P, self.weights, u, v))
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_dsdu_uvvecs(P, self._weight_list(), u, v))
 
     def dSdv(self, u: float or np.ndarray, v: float or np.ndarray):
         r"""
@@ -3652,8 +4787,8 @@ class RationalBezierSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_dsdv(P, self.weights, u, v))
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_dsdv(P, self._weight_list(), u, v))
 
     def dSdv_grid(self, Nu: int, Nv: int) -> np.ndarray:
         r"""
@@ -3672,8 +4807,8 @@ class RationalBezierSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_dsdv_grid(P, self.weights, Nu, Nv))
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_dsdv_grid(P, self._weight_list(), Nu, Nv))
 
     def dSdv_uvvecs(self, u: np.ndarray, v: np.ndarray):
         r"""
@@ -3692,8 +4827,8 @@ class RationalBezierSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_dsdv_uvvecs(P, self.weights, u, v))
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_dsdv_uvvecs(P, self._weight_list(), u, v))
 
     def d2Sdu2(self, u: float, v: float) -> np.ndarray:
         r"""
@@ -3711,8 +4846,8 @@ class RationalBezierSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_d2sdu2(P, self.weights, u, v))
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_d2sdu2(P, self._weight_list(), u, v))
 
     def d2Sdu2_grid(self, Nu: int, Nv: int) -> np.ndarray:
         r"""
@@ -3731,8 +4866,8 @@ class RationalBezierSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_d2sdu2_grid(P, self.weights, Nu, Nv))
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_d2sdu2_grid(P, self._weight_list(), Nu, Nv))
 
     def d2Sdu2_uvvecs(self, u: np.ndarray, v: np.ndarray):
         r"""
@@ -3751,8 +4886,8 @@ class RationalBezierSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_d2sdu2_uvvecs(P, self.weights, u, v))
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_d2sdu2_uvvecs(P, self._weight_list(), u, v))
 
     def d2Sdv2(self, u: float or np.ndarray, v: float or np.ndarray):
         r"""
@@ -3770,8 +4905,8 @@ class RationalBezierSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_d2sdv2(P, self.weights, u, v))
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_d2sdv2(P, self._weight_list(), u, v))
 
     def d2Sdv2_grid(self, Nu: int, Nv: int) -> np.ndarray:
         r"""
@@ -3790,8 +4925,8 @@ class RationalBezierSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_d2sdv2_grid(P, self.weights, Nu, Nv))
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_d2sdv2_grid(P, self._weight_list(), Nu, Nv))
 
     def d2Sdv2_uvvecs(self, u: np.ndarray, v: np.ndarray):
         r"""
@@ -3810,8 +4945,8 @@ class RationalBezierSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(rational_bezier_surf_d2sdv2_uvvecs(P, self.weights, u, v))
+        P = self._control_point_list()
+        return np.array(rational_bezier_surf_d2sdv2_uvvecs(P, self._weight_list(), u, v))
 
     def get_edge(self, edge: SurfaceEdge, n_points: int = 10) -> np.ndarray:
         r"""
@@ -3829,15 +4964,15 @@ class RationalBezierSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if edge == SurfaceEdge.v1:
-            return np.array(rational_bezier_surf_eval_iso_v(P, self.weights, n_points, 1.0))
+            return np.array(rational_bezier_surf_eval_iso_v(P, self._weight_list(), n_points, 1.0))
         elif edge == SurfaceEdge.v0:
-            return np.array(rational_bezier_surf_eval_iso_v(P, self.weights, n_points, 0.0))
+            return np.array(rational_bezier_surf_eval_iso_v(P, self._weight_list(), n_points, 0.0))
         elif edge == SurfaceEdge.u1:
-            return np.array(rational_bezier_surf_eval_iso_u(P, self.weights, 1.0, n_points))
+            return np.array(rational_bezier_surf_eval_iso_u(P, self._weight_list(), 1.0, n_points))
         elif edge == SurfaceEdge.u0:
-            return np.array(rational_bezier_surf_eval_iso_u(P, self.weights, 0.0, n_points))
+            return np.array(rational_bezier_surf_eval_iso_u(P, self._weight_list(), 0.0, n_points))
         else:
             raise ValueError(f"No edge called {edge}")
 
@@ -3863,19 +4998,19 @@ class RationalBezierSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if edge == SurfaceEdge.v1:
-            return np.array(rational_bezier_surf_dsdv_iso_v(P, self.weights, n_points, 1.0)) if perp else np.array(
-                rational_bezier_surf_dsdu_iso_v(P, self.weights, n_points, 1.0))
+            return np.array(rational_bezier_surf_dsdv_iso_v(P, self._weight_list(), n_points, 1.0)) if perp else np.array(
+                rational_bezier_surf_dsdu_iso_v(P, self._weight_list(), n_points, 1.0))
         elif edge == SurfaceEdge.v0:
-            return np.array(rational_bezier_surf_dsdv_iso_v(P, self.weights, n_points, 0.0)) if perp else np.array(
-                rational_bezier_surf_dsdu_iso_v(P, self.weights, n_points, 0.0))
+            return np.array(rational_bezier_surf_dsdv_iso_v(P, self._weight_list(), n_points, 0.0)) if perp else np.array(
+                rational_bezier_surf_dsdu_iso_v(P, self._weight_list(), n_points, 0.0))
         elif edge == SurfaceEdge.u1:
-            return np.array(rational_bezier_surf_dsdu_iso_u(P, self.weights, 1.0, n_points)) if perp else np.array(
-                rational_bezier_surf_dsdv_iso_u(P, self.weights, 1.0, n_points))
+            return np.array(rational_bezier_surf_dsdu_iso_u(P, self._weight_list(), 1.0, n_points)) if perp else np.array(
+                rational_bezier_surf_dsdv_iso_u(P, self._weight_list(), 1.0, n_points))
         elif edge == SurfaceEdge.u0:
-            return np.array(rational_bezier_surf_dsdu_iso_u(P, self.weights, 0.0, n_points)) if perp else np.array(
-                rational_bezier_surf_dsdv_iso_u(P, self.weights, 0.0, n_points))
+            return np.array(rational_bezier_surf_dsdu_iso_u(P, self._weight_list(), 0.0, n_points)) if perp else np.array(
+                rational_bezier_surf_dsdv_iso_u(P, self._weight_list(), 0.0, n_points))
         else:
             raise ValueError(f"No edge called {edge}")
 
@@ -3904,7 +5039,7 @@ class RationalBezierSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        w = self.weights
+        w = self._weight_list()
         if edge == SurfaceEdge.v1:
             return np.array(
                 rational_bezier_surf_dsdv_dp_iso_v(w, i, j, self.n, self.m, 3, n_points, 1.0)) if perp else np.array(
@@ -3946,19 +5081,19 @@ class RationalBezierSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if edge == SurfaceEdge.v1:
-            return np.array(rational_bezier_surf_d2sdv2_iso_v(P, self.weights, n_points, 1.0)) if perp else np.array(
-                rational_bezier_surf_d2sdu2_iso_v(P, self.weights, n_points, 1.0))
+            return np.array(rational_bezier_surf_d2sdv2_iso_v(P, self._weight_list(), n_points, 1.0)) if perp else np.array(
+                rational_bezier_surf_d2sdu2_iso_v(P, self._weight_list(), n_points, 1.0))
         elif edge == SurfaceEdge.v0:
-            return np.array(rational_bezier_surf_d2sdv2_iso_v(P, self.weights, n_points, 0.0)) if perp else np.array(
-                rational_bezier_surf_d2sdu2_iso_v(P, self.weights, n_points, 0.0))
+            return np.array(rational_bezier_surf_d2sdv2_iso_v(P, self._weight_list(), n_points, 0.0)) if perp else np.array(
+                rational_bezier_surf_d2sdu2_iso_v(P, self._weight_list(), n_points, 0.0))
         elif edge == SurfaceEdge.u1:
-            return np.array(rational_bezier_surf_d2sdu2_iso_u(P, self.weights, 1.0, n_points)) if perp else np.array(
-                rational_bezier_surf_d2sdv2_iso_u(P, self.weights, 1.0, n_points))
+            return np.array(rational_bezier_surf_d2sdu2_iso_u(P, self._weight_list(), 1.0, n_points)) if perp else np.array(
+                rational_bezier_surf_d2sdv2_iso_u(P, self._weight_list(), 1.0, n_points))
         elif edge == SurfaceEdge.u0:
-            return np.array(rational_bezier_surf_d2sdu2_iso_u(P, self.weights, 0.0, n_points)) if perp else np.array(
-                rational_bezier_surf_d2sdv2_iso_u(P, self.weights, 0.0, n_points))
+            return np.array(rational_bezier_surf_d2sdu2_iso_u(P, self._weight_list(), 0.0, n_points)) if perp else np.array(
+                rational_bezier_surf_d2sdv2_iso_u(P, self._weight_list(), 0.0, n_points))
         else:
             raise ValueError(f"No edge called {edge}")
 
@@ -3987,7 +5122,7 @@ class RationalBezierSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        w = self.weights
+        w = self._weight_list()
         if edge == SurfaceEdge.v1:
             return np.array(
                 rational_bezier_surf_d2sdv2_dp_iso_v(w, i, j, self.n, self.m, 3, n_points, 1.0)) if perp else np.array(
@@ -4184,11 +5319,65 @@ class RationalBezierSurface(Surface):
             return fsolve(root_find_func_v, x0=np.array([uv_guess]))[0]
         raise ValueError("Did not detect a u or v input")
 
+    def get_u_or_v_given_uvxyz_array(self, u: float or np.ndarray = None, v: float or np.ndarray = None,
+                                     uv_guess: float = 0.5, x: Length = None, y: Length = None, z: Length = None,
+                                     tol: float = 1e-12, max_iterations: int = 50) -> np.ndarray:
+        """
+        Array version of :obj:`~aerocaps.geom.surfaces.RationalBezierSurface.get_u_or_v_given_uvxyz`. Computes the
+        :math:`u`-values (if ``v`` is specified) or :math:`v`-values (if ``u`` is specified) corresponding to an array
+        of :math:`x`-, :math:`y`-, or :math:`z`-locations along an array of isoparametric curves. The fixed parameter
+        values and locations are broadcast against each other, and all the values are solved at once using a
+        bracketed Newton-bisection method with the analytic surface derivatives. As an example, the
+        :math:`u`-parameters corresponding to several spanwise stations along the :math:`v=0.8` isoparametric curve
+        can be computed using
+
+        .. code-block:: python
+
+            u = surf.get_u_or_v_given_uvxyz_array(v=0.8, y=LengthArray(m=[0.5, 1.0, 1.4]))
+
+        Unlike :obj:`~aerocaps.geom.surfaces.RationalBezierSurface.get_u_or_v_given_uvxyz`, the solved values always lie in
+        :math:`[0,1]`. If the isoparametric curve crosses a location more than once, the root closest to ``uv_guess``
+        is returned.
+
+        Parameters
+        ----------
+        u: float or numpy.ndarray or None
+            Values of :math:`u` to specify, or ``None`` to solve for :math:`u`. Default: ``None``
+        v: float or numpy.ndarray or None
+            Values of :math:`v` to specify, or ``None`` to solve for :math:`v`. Default: ``None``
+        uv_guess: float
+            Parameter value used to choose between multiple roots. Default: ``0.5``
+        x: Length or None
+            :math:`x`-locations (e.g., a :obj:`~aerocaps.units.length.LengthArray`). If unspecified, either
+            :math:`y` or :math:`z` must be specified. Default: ``None``
+        y: Length or None
+            :math:`y`-locations. If unspecified, either :math:`x` or :math:`z` must be specified. Default: ``None``
+        z: Length or None
+            :math:`z`-locations. If unspecified, either :math:`x` or :math:`y` must be specified. Default: ``None``
+        tol: float
+            Convergence tolerance on the solved parameter values. Default: ``1e-12``
+        max_iterations: int
+            Maximum number of Newton-bisection iterations. Default: ``50``
+
+        Returns
+        -------
+        numpy.ndarray
+            The values of :math:`u` if :math:`v` is specified or :math:`v` if :math:`u` is specified, with the
+            broadcast shape of the inputs. Locations not reached by the isoparametric curve give ``nan``
+        """
+        if u is None and v is None or (u is not None and v is not None):
+            raise ValueError("Must specify exactly one of either u or v")
+        xyz_spec = [xyz for xyz in (x, y, z) if xyz is not None]
+        if len(xyz_spec) != 1:
+            raise ValueError("Must specify exactly one of x, y, or z")
+        coordinate = [x, y, z].index(xyz_spec[0])
+        return _solve_for_u_or_v_given_xyz(self, u, v, coordinate, xyz_spec[0].m, uv_guess, tol, max_iterations)
+
     def split_at_u(self, u0: float) -> ("RationalBezierSurface", "RationalBezierSurface"):
         """
         Splits the rational Bezier surface at :math:`u=u_0` along the :math:`v`-parametric direction.
         """
-        Pw = self.get_homogeneous_control_points()
+        Pw = self._homogeneous_control_point_array()
 
         def de_casteljau(i: int, j: int, k: int) -> np.ndarray:
             """
@@ -4237,7 +5426,7 @@ class RationalBezierSurface(Surface):
         """
         Splits the rational Bezier surface at :math:`v=v_0` along the :math:`u`-parametric direction.
         """
-        Pw = self.get_homogeneous_control_points()
+        Pw = self._homogeneous_control_point_array()
 
         def de_casteljau(i: int, j: int, k: int) -> np.ndarray:
             """
@@ -4294,52 +5483,31 @@ class RationalBezierSurface(Surface):
             Transformed surface
         """
         transformation = Transformation3D(**transformation_kwargs)
-        initial_control_points = self.get_control_point_array()
+        initial_control_points = self._control_point_array()
         return RationalBezierSurface(
             np.array([transformation.transform(p_arr) for p_arr in initial_control_points]),
             weights=deepcopy(self.weights),
             name=self.name, construction=self.construction
         )
 
-    def generate_control_point_net(self) -> (typing.List[Point3D], typing.List[Line3D]):
+    def generate_control_point_net(self) -> (PointArray3D, typing.List[Line3D]):
         """
-        Generates a list of :obj:`~aerocaps.geom.point.Point3D` and :obj:`~aerocaps.geom.curves.Line3D` objects
+        Generates a :obj:`~aerocaps.geom.point.PointArray3D` and a list of :obj:`~aerocaps.geom.curves.Line3D` objects
         representing the rational Bézier surface's control points and connections between them
 
         Returns
         -------
-        typing.List[Point3D], typing.List[Line3D]
-            Control points and lines between adjacent control points in flattened lists
+        PointArray3D, typing.List[Line3D]
+            Control points and lines between adjacent control points in flattened form
         """
-        control_points = self.get_control_point_array()
-        points = []
-        lines = []
-
-        for i in range(self.n_points_u):
-            for j in range(self.n_points_v):
-                points.append(Point3D.from_array(control_points[i, j, :]))
-
-        for i in range(self.n_points_u - 1):
-            for j in range(self.n_points_v - 1):
-                point_obj_1 = Point3D.from_array(control_points[i, j, :])
-                point_obj_2 = Point3D.from_array(control_points[i + 1, j, :])
-                point_obj_3 = Point3D.from_array(control_points[i, j + 1, :])
-
-                line_1 = Line3D(p0=point_obj_1, p1=point_obj_2)
-                line_2 = Line3D(p0=point_obj_1, p1=point_obj_3)
-                lines.extend([line_1, line_2])
-
-                if i < self.n_points_u - 2 and j < self.n_points_v - 2:
-                    continue
-
-                point_obj_4 = Point3D.from_array(control_points[i + 1, j + 1, :])
-                line_3 = Line3D(p0=point_obj_3, p1=point_obj_4)
-                line_4 = Line3D(p0=point_obj_2, p1=point_obj_4)
-                lines.extend([line_3, line_4])
-
+        control_points = self._control_point_array()
+        points = PointArray3D(control_points)
+        lines = [Line3D(p0=Point3D.from_array(segment[0]), p1=Point3D.from_array(segment[1]))
+                 for segment in _get_control_point_net_segments(control_points)]
         return points, lines
 
-    def plot_surface(self, plot: pv.Plotter, Nu: int = 50, Nv: int = 50, **mesh_kwargs):
+    def plot_surface(self, plot: pv.Plotter, Nu: int = 50, Nv: int = 50, XYZ: np.ndarray = None,
+                     **mesh_kwargs):
         """
         Plots the rational Bézier surface using the `pyvista <https://pyvista.org/>`_ library
 
@@ -4351,6 +5519,10 @@ class RationalBezierSurface(Surface):
             Number of points to evaluate in the :math:`u`-parametric direction. Default: ``50``
         Nv: int
             Number of points to evaluate in the :math:`v`-parametric direction. Default: ``50``
+        XYZ: numpy.ndarray
+            Points already evaluated on the surface, of size :math:`N_u \\times N_v \\times 3` (e.g., from
+            :obj:`~aerocaps.geom.batch.SurfaceBatch.evaluate_grid`). If specified, ``Nu`` and ``Nv`` are ignored
+            and the surface is not re-evaluated. Default: ``None``
         mesh_kwargs:
             Keyword arguments to pass to :obj:`pyvista.Plotter.add_mesh`
 
@@ -4359,7 +5531,8 @@ class RationalBezierSurface(Surface):
         pyvista.core.pointset.StructuredGrid
             The evaluated rational Bézier surface
         """
-        XYZ = self.evaluate_grid(Nu, Nv)
+        if XYZ is None:
+            XYZ = self.evaluate_grid(Nu, Nv)
         grid = pv.StructuredGrid(XYZ[:, :, 0], XYZ[:, :, 1], XYZ[:, :, 2])
         plot.add_mesh(grid, **mesh_kwargs)
         return grid
@@ -4381,9 +5554,7 @@ class RationalBezierSurface(Surface):
         pv.Actor
             The lines actor
         """
-        _, line_objs = self.generate_control_point_net()
-        line_arr = np.array([[line_obj.p0.as_array(), line_obj.p1.as_array()] for line_obj in line_objs])
-        line_arr = line_arr.reshape((len(line_objs) * 2, 3))
+        line_arr = _get_control_point_net_segments(self._control_point_array()).reshape((-1, 3))
         line_actor = plot.add_lines(line_arr, **line_kwargs)
         return line_actor
 
@@ -4403,8 +5574,7 @@ class RationalBezierSurface(Surface):
         pv.Actor
             The points actor
         """
-        point_objs, _ = self.generate_control_point_net()
-        point_arr = np.array([point_obj.as_array() for point_obj in point_objs])
+        point_arr = self._control_point_array().reshape((-1, 3))
         point_actor = plot.add_points(point_arr, **point_kwargs)
         return point_actor
 
@@ -4439,8 +5609,6 @@ class BSplineSurface(Surface):
             Whether this is a geometry used only for construction of other geometries. If ``True``, this
             geometry will not be exported or plotted. Default: ``False``
         """
-        if isinstance(points, np.ndarray):
-            points = [[Point3D.from_array(pt_row) for pt_row in pt_mat] for pt_mat in points]
         self.points = points
         assert knots_u.ndim == 1
         assert knots_v.ndim == 1
@@ -4451,15 +5619,42 @@ class BSplineSurface(Surface):
         self._weights = np.ones((len(points), len(points[0])))
         super().__init__(name=name, construction=construction)
 
+    @property
+    def points(self) -> Point3DNetView:
+        """
+        Control points as a nested sequence of point objects. Each point is a view into the control point array
+        owned by the surface, so ``surf.points[i][j].x.m = 1.0`` and ``surf.points[i][j] = point`` both modify
+        the surface. The points are created on demand; the array is the only stored representation. Modifications
+        made through the points increment :obj:`~aerocaps.geom.Geometry.version`.
+
+        .. warning::
+
+            Point objects passed to the constructor or assigned to ``points`` are copied into the array, not
+            referenced. Modifying them afterward does not modify the surface, and a point object shared by several
+            surfaces or curves no longer ties them together. Modify the surface through ``surf.points`` or assign
+            ``surf.points`` again instead.
+        """
+        return Point3DNetView(self._control_points, on_modify=self._mark_modified)
+
+    @points.setter
+    def points(self, points: typing.List[typing.List[Point3D]] or np.ndarray):
+        r"""
+        Sets the control points from a nested list of point objects or an array of size
+        :math:`N_u \times N_v \times 3`. The values are copied into a new array owned by the surface, so the point
+        objects passed in are not tied to the surface.
+        """
+        self._control_points = point3d_net_to_array(points)
+        self._mark_modified()
+
     @property
     def n_points_u(self) -> int:
         """Number of control points in the :math:`u`-parametric direction"""
-        return len(self.points)
+        return self._control_points.shape[0]
 
     @property
     def n_points_v(self) -> int:
         """Number of control points in the :math:`v`-parametric direction"""
-        return len(self.points[0])
+        return self._control_points.shape[1]
 
     @property
     def degree_u(self) -> int:
@@ -4481,104 +5676,352 @@ class BSplineSurface(Surface):
         int
             Surface degree in the :math:`u`-parametric direction
         """
-        return self.degree_u
+        return self.degree_u
+
+    @property
+    def m(self) -> int:
+        """
+        Shorthand for :obj:`~aerocaps.geom.surfaces.BSplineSurface.degree_v`
+
+        Returns
+        -------
+        int
+            Surface degree in the :math:`v`-parametric direction
+        """
+        return self.degree_v
+
+    @property
+    def weights(self) -> np.ndarray:
+        """Weight matrix (all ones for this surface type)"""
+        return self._weights
+
+    def to_iges(self, *args, **kwargs) -> aerocaps.iges.entity.IGESEntity:
+        """
+        Exports the NURBS surface to an IGES entity
+        """
+        return aerocaps.iges.surfaces.RationalBSplineSurfaceIGES(
+            control_points=self._control_point_array(),
+            knots_u=self.knots_u,
+            knots_v=self.knots_v,
+            weights=self.weights,
+            degree_u=self.degree_u,
+            degree_v=self.degree_v
+        )
+
+    def get_control_point_array(self) -> np.ndarray:
+        r"""
+        Gets a copy of the control points in float array form. Modifying the returned array does not modify the
+        surface.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N_u \times N_v \times 3`
+        """
+        return self._control_points.copy()
+
+    def evaluate(self, u: float, v: float) -> np.ndarray:
+        r"""
+        Evaluates the surface at a given :math:`(u,v)` parameter pair.
+
+        Parameters
+        ----------
+        u: float
+            Position along :math:`u` in parametric space. Normally in the range :math:`[0,1]`
+        v: float
+            Position along :math:`v` in parametric space. Normally in the range :math:`[0,1]`
+
+        Returns
+        -------
+        numpy.ndarray
+            1-D array of the form ``array([x, y, z])`` representing the evaluated point on the surface
+        """
+        P = self._control_point_list()
+        return np.array(bspline_surf_eval(P, self.knots_u, self.knots_v, u, v))
+
+    def evaluate_point3d(self, u: float, v: float) -> Point3D:
+        r"""
+        Evaluates the B-spline surface at a single :math:`(u,v)` parameter pair and returns a point object.
+
+        Parameters
+        ----------
+        u: float
+            Position along :math:`u` in parametric space. Normally in the range :math:`[0,1]`
+        v: float
+            Position along :math:`v` in parametric space. Normally in the range :math:`[0,1]`
+
+        Returns
+        -------
+        Point3D
+            Point object corresponding to the :math:`(u,v)` pair
+        """
+        return Point3D.from_array(self.evaluate(u, v))
+
+    def evaluate_grid(self, Nu: int, Nv: int) -> np.ndarray:
+        r"""
+        Evaluates the B-spline surface on a uniform :math:`N_u \times N_v` grid of parameter values.
+
+        Parameters
+        ----------
+        Nu: int
+            Number of uniformly spaced parameter values in the :math:`u`-direction
+        Nv: int
+            Number of uniformly spaced parameter values in the :math:`v`-direction
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N_u \times N_v \times 3`
+        """
+        P = self._control_point_list()
+        return np.array(bspline_surf_eval_grid(P, self.knots_u, self.knots_v, Nu, Nv))
+
+    def evaluate_derivatives(self, u: float or np.ndarray, v: float or np.ndarray,
+                             order: int = 2) -> SurfaceDerivativeData:
+        r"""
+        Evaluates the B-spline surface and its partial derivatives up to second order
+        (:math:`\mathbf{S}`, :math:`\mathbf{S}_u`, :math:`\mathbf{S}_v`, :math:`\mathbf{S}_{uu}`,
+        :math:`\mathbf{S}_{uv}`, and :math:`\mathbf{S}_{vv}`) in a single pass. The basis functions in each
+        parametric direction are computed only once and shared by all the derivatives, which makes this much faster
+        than calling each of the derivative methods separately.
+
+        Parameters
+        ----------
+        u: float or numpy.ndarray
+            Parameter value in the :math:`u`-direction, or a 1-D array of :math:`N_u` parameter values
+        v: float or numpy.ndarray
+            Parameter value in the :math:`v`-direction, or a 1-D array of :math:`N_v` parameter values
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Derivatives above this order are
+            ``None`` in the output. Default: ``2``
+
+        Returns
+        -------
+        SurfaceDerivativeData
+            Point and partial derivatives of the surface. Each array has size :math:`3` for float inputs or
+            :math:`N_u \times N_v \times 3` for array inputs (evaluated at each combination of :math:`u` and
+            :math:`v`)
+        """
+        return _evaluate_surface_derivatives(
+            self._control_point_array(), None, self.degree_u, self.degree_v, self.knots_u, self.knots_v, u, v, order
+        )
+
+    def evaluate_derivatives_grid(self, Nu: int, Nv: int, order: int = 2) -> SurfaceDerivativeData:
+        r"""
+        Evaluates the B-spline surface and its partial derivatives up to second order on a uniform
+        :math:`N_u \times N_v` grid of parameter values in a single pass. See
+        :obj:`~aerocaps.geom.surfaces.BSplineSurface.evaluate_derivatives`.
+
+        Parameters
+        ----------
+        Nu: int
+            Number of uniformly spaced parameter values in the :math:`u`-direction
+        Nv: int
+            Number of uniformly spaced parameter values in the :math:`v`-direction
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Default: ``2``
+
+        Returns
+        -------
+        SurfaceDerivativeData
+            Point and partial derivatives of the surface, each of size :math:`N_u \times N_v \times 3`
+        """
+        return self.evaluate_derivatives(np.linspace(0.0, 1.0, Nu), np.linspace(0.0, 1.0, Nv), order=order)
+
+    def evaluate_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the B-spline surface at :math:`N` arbitrary :math:`(u,v)` pairs. Unlike
+        :obj:`~aerocaps.geom.surfaces.BSplineSurface.evaluate_uvvecs`, which evaluates every combination of the
+        :math:`u`- and :math:`v`-values, only the given pairs are evaluated.
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), None, self.degree_u, self.degree_v, self.knots_u, self.knots_v, uv, [(0, 0)]
+        )[(0, 0)]
 
-    @property
-    def m(self) -> int:
-        """
-        Shorthand for :obj:`~aerocaps.geom.surfaces.BSplineSurface.degree_v`
+    def dSdu_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the first derivative of the B-spline surface with respect to :math:`u` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
 
         Returns
         -------
-        int
-            Surface degree in the :math:`v`-parametric direction
+        numpy.ndarray
+            Array of size :math:`N \times 3`
         """
-        return self.degree_v
+        return _evaluate_surface_pairs(
+            self._control_point_array(), None, self.degree_u, self.degree_v, self.knots_u, self.knots_v, uv, [(1, 0)]
+        )[(1, 0)]
 
-    @property
-    def weights(self) -> np.ndarray:
-        """Weight matrix (all ones for this surface type)"""
-        return self._weights
+    def dSdv_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the first derivative of the B-spline surface with respect to :math:`v` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
 
-    def to_iges(self, *args, **kwargs) -> aerocaps.iges.entity.IGESEntity:
-        """
-        Exports the NURBS surface to an IGES entity
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
         """
-        return aerocaps.iges.surfaces.RationalBSplineSurfaceIGES(
-            control_points=self.get_control_point_array(),
-            knots_u=self.knots_u,
-            knots_v=self.knots_v,
-            weights=self.weights,
-            degree_u=self.degree_u,
-            degree_v=self.degree_v
-        )
+        return _evaluate_surface_pairs(
+            self._control_point_array(), None, self.degree_u, self.degree_v, self.knots_u, self.knots_v, uv, [(0, 1)]
+        )[(0, 1)]
 
-    def get_control_point_array(self) -> np.ndarray:
+    def d2Sdu2_pairs(self, uv: np.ndarray) -> np.ndarray:
         r"""
-        Gets the control points in float array form.
+        Evaluates the second derivative of the B-spline surface with respect to :math:`u` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
 
         Returns
         -------
         numpy.ndarray
-            Array of size :math:`N_u \times N_v \times 3`
+            Array of size :math:`N \times 3`
         """
-        return np.array([np.array([p.as_array() for p in p_arr]) for p_arr in self.points])
+        return _evaluate_surface_pairs(
+            self._control_point_array(), None, self.degree_u, self.degree_v, self.knots_u, self.knots_v, uv, [(2, 0)]
+        )[(2, 0)]
 
-    def evaluate(self, u: float, v: float) -> np.ndarray:
+    def d2Sdv2_pairs(self, uv: np.ndarray) -> np.ndarray:
         r"""
-        Evaluates the surface at a given :math:`(u,v)` parameter pair.
+        Evaluates the second derivative of the B-spline surface with respect to :math:`v` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
 
         Parameters
         ----------
-        u: float
-            Position along :math:`u` in parametric space. Normally in the range :math:`[0,1]`
-        v: float
-            Position along :math:`v` in parametric space. Normally in the range :math:`[0,1]`
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
 
         Returns
         -------
         numpy.ndarray
-            1-D array of the form ``array([x, y, z])`` representing the evaluated point on the surface
+            Array of size :math:`N \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(bspline_surf_eval(P, self.knots_u, self.knots_v, u, v))
+        return _evaluate_surface_pairs(
+            self._control_point_array(), None, self.degree_u, self.degree_v, self.knots_u, self.knots_v, uv, [(0, 2)]
+        )[(0, 2)]
 
-    def evaluate_point3d(self, u: float, v: float) -> Point3D:
+    def evaluate_derivatives_pairs(self, uv: np.ndarray, order: int = 2) -> SurfaceDerivativeData:
         r"""
-        Evaluates the B-spline surface at a single :math:`(u,v)` parameter pair and returns a point object.
+        Evaluates the B-spline surface and its partial derivatives up to second order at :math:`N` arbitrary
+        :math:`(u,v)` pairs in a single pass. See :obj:`~aerocaps.geom.surfaces.BSplineSurface.evaluate_derivatives`.
 
         Parameters
         ----------
-        u: float
-            Position along :math:`u` in parametric space. Normally in the range :math:`[0,1]`
-        v: float
-            Position along :math:`v` in parametric space. Normally in the range :math:`[0,1]`
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Default: ``2``
 
         Returns
         -------
-        Point3D
-            Point object corresponding to the :math:`(u,v)` pair
+        SurfaceDerivativeData
+            Point and partial derivatives of the surface, each of size :math:`N \times 3`
         """
-        return Point3D.from_array(self.evaluate(u, v))
+        if order not in (0, 1, 2):
+            raise ValueError(f"Derivative order must be 0, 1, or 2 (found {order = })")
+        orders = [(0, 0), (1, 0), (0, 1), (2, 0), (1, 1), (0, 2)][:{0: 1, 1: 3, 2: 6}[order]]
+        results = _evaluate_surface_pairs(
+            self._control_point_array(), None, self.degree_u, self.degree_v, self.knots_u, self.knots_v, uv, orders
+        )
+        uv = np.asarray(uv, dtype=float)
+        return SurfaceDerivativeData(
+            uv[:, 0], uv[:, 1], results[(0, 0)],
+            Su=results.get((1, 0)), Sv=results.get((0, 1)),
+            Suu=results.get((2, 0)), Suv=results.get((1, 1)), Svv=results.get((0, 2))
+        )
 
-    def evaluate_grid(self, Nu: int, Nv: int) -> np.ndarray:
+    def project_points(self, points: np.ndarray, Nu: int = 50, Nv: int = 50, max_iterations: int = 20,
+                       tol: float = 1e-10) -> (np.ndarray, np.ndarray, np.ndarray):
         r"""
-        Evaluates the B-spline surface on a uniform :math:`N_u \times N_v` grid of parameter values.
+        Finds the closest point on the B-spline surface to each of :math:`N` points (point inversion). Each point is
+        seeded from the nearest point of a uniform :math:`N_u \times N_v` grid on the surface using a KD-tree, and
+        all the points are then refined together using vectorized Newton iterations.
+
+        .. code-block:: python
+
+            uv, distance, converged = surf.project_points(point_cloud)
+            closest_points = surf.evaluate_pairs(uv)
 
         Parameters
         ----------
+        points: numpy.ndarray
+            Array of size :math:`N \times 3` (or a :obj:`~aerocaps.geom.point.PointArray3D`)
         Nu: int
-            Number of uniformly spaced parameter values in the :math:`u`-direction
+            Number of seed grid points in the :math:`u`-direction. Default: ``50``
         Nv: int
-            Number of uniformly spaced parameter values in the :math:`v`-direction
+            Number of seed grid points in the :math:`v`-direction. Default: ``50``
+        max_iterations: int
+            Maximum number of Newton iterations. Default: ``20``
+        tol: float
+            Convergence tolerance on the cosine of the angle between each surface tangent and the vector from the
+            surface to the point. Default: ``1e-10``
 
         Returns
         -------
-        numpy.ndarray
-            Array of size :math:`N_u \times N_v \times 3`
+        numpy.ndarray, numpy.ndarray, numpy.ndarray
+            Parameter values of the closest points (size :math:`N \times 2`), distances from the points to the
+            surface (size :math:`N`), and a boolean array (size :math:`N`) indicating which points converged
         """
-        P = self.get_control_point_array()
-        return np.array(bspline_surf_eval_grid(P, self.knots_u, self.knots_v, Nu, Nv))
+        return _project_points_onto_surface(self, points, Nu, Nv, max_iterations, tol)
+
+    def ray_intersect(self, origins: np.ndarray, directions: np.ndarray, t_min: float = 0.0, t_max: float = np.inf,
+                      all_hits: bool = False, num_workers: int = None):
+        r"""
+        Intersects a set of rays :math:`\mathbf{o} + t \mathbf{d}` with the B-spline surface. See
+        :obj:`~aerocaps.geom.intersection.ray_surface_intersections` for details.
+
+        .. code-block:: python
+
+            hits = surf.ray_intersect(origins, directions)
+            uv = np.column_stack((hits.u, hits.v))[hits.hit]
+
+        Parameters
+        ----------
+        origins: numpy.ndarray
+            Ray origins (size :math:`N \times 3`)
+        directions: numpy.ndarray
+            Ray directions (size :math:`N \times 3`), which need not be normalized
+        t_min: float
+            Minimum ray parameter. Default: ``0.0``
+        t_max: float
+            Maximum ray parameter. Default: ``numpy.inf``
+        all_hits: bool
+            Whether to return every intersection of each ray rather than only the first. Default: ``False``
+        num_workers: int
+            Number of worker processes. If not specified, the number of CPUs is used. Default: ``None``
+
+        Returns
+        -------
+        RaySurfaceIntersectionData
+            Surface parameter values, ray parameters, points, and unit normals of the intersections
+        """
+        from aerocaps.geom.intersection import ray_surface_intersections  # Avoid circular import
+        return ray_surface_intersections([self], origins, directions, t_min=t_min, t_max=t_max, all_hits=all_hits,
+                                         num_workers=num_workers)
 
     def get_parallel_control_point_length(self, surface_edge: SurfaceEdge) -> int:
         r"""
@@ -4776,24 +6219,18 @@ class BSplineSurface(Surface):
             Edge of the surface along which to retrieve the control point
         """
         if surface_edge == SurfaceEdge.v1:
-            self.points[row_index][-(continuity_index + 1)].x.m = point.x.m
-            self.points[row_index][-(continuity_index + 1)].y.m = point.y.m
-            self.points[row_index][-(continuity_index + 1)].z.m = point.z.m
+            self._control_points[row_index, -(continuity_index + 1)] = point.as_array()
         elif surface_edge == SurfaceEdge.v0:
-            self.points[row_index][continuity_index].x.m = point.x.m
-            self.points[row_index][continuity_index].y.m = point.y.m
-            self.points[row_index][continuity_index].z.m = point.z.m
+            self._control_points[row_index, continuity_index] = point.as_array()
         elif surface_edge == SurfaceEdge.u1:
-            self.points[-(continuity_index + 1)][row_index].x.m = point.x.m
-            self.points[-(continuity_index + 1)][row_index].y.m = point.y.m
-            self.points[-(continuity_index + 1)][row_index].z.m = point.z.m
+            self._control_points[-(continuity_index + 1), row_index] = point.as_array()
         elif surface_edge == SurfaceEdge.u0:
-            self.points[continuity_index][row_index].x.m = point.x.m
-            self.points[continuity_index][row_index].y.m = point.y.m
-            self.points[continuity_index][row_index].z.m = point.z.m
+            self._control_points[continuity_index, row_index] = point.as_array()
         else:
             raise ValueError("Invalid surface_edge value")
 
+        self._mark_modified()
+
     def extract_edge_curve(self, surface_edge: SurfaceEdge) -> BSplineCurve3D:
         """
         Extracts the control points, weights, and knots from one of the four edges of the B-spline surface and
@@ -4810,7 +6247,7 @@ class BSplineSurface(Surface):
             B-spline curve with control points and knots corresponding to the control points and knots
             along the edge of the surface
         """
-        P = self.get_control_point_array()
+        P = self._control_points
 
         if surface_edge == SurfaceEdge.u0:
             return BSplineCurve3D(P[0, :, :], self.knots_v, self.degree_v)
@@ -5037,7 +6474,7 @@ class BSplineSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bspline_surf_dsdu(P, self.knots_u, self.knots_v, u, v))
 
     def dSdu_grid(self, Nu: int, Nv: int) -> np.ndarray:
@@ -5057,7 +6494,7 @@ class BSplineSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bspline_surf_dsdu_grid(P, self.knots_u, self.knots_v, Nu, Nv))
 
     def dSdu_uvvecs(self, u: np.ndarray, v: np.ndarray):
@@ -5077,7 +6514,7 @@ class BSplineSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bspline_surf_dsdu_uvvecs(P, self.knots_u, self.knots_v, u, v))
 
     def dSdv(self, u: float or np.ndarray, v: float or np.ndarray):
@@ -5096,7 +6533,7 @@ class BSplineSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bspline_surf_dsdv(P, self.knots_u, self.knots_v, u, v))
 
     def dSdv_grid(self, Nu: int, Nv: int) -> np.ndarray:
@@ -5116,7 +6553,7 @@ class BSplineSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bspline_surf_dsdv_grid(P, self.knots_u, self.knots_v, Nu, Nv))
 
     def dSdv_uvvecs(self, u: np.ndarray, v: np.ndarray):
@@ -5136,7 +6573,7 @@ class BSplineSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bspline_surf_dsdv_uvvecs(P, self.knots_u, self.knots_v, u, v))
 
     def d2Sdu2(self, u: float, v: float) -> np.ndarray:
@@ -5155,7 +6592,7 @@ class BSplineSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bspline_surf_d2sdu2(P, self.knots_u, self.knots_v, u, v))
 
     def d2Sdu2_grid(self, Nu: int, Nv: int) -> np.ndarray:
@@ -5175,7 +6612,7 @@ class BSplineSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bspline_surf_d2sdu2_grid(P, self.knots_u, self.knots_v, Nu, Nv))
 
     def d2Sdu2_uvvecs(self, u: np.ndarray, v: np.ndarray):
@@ -5195,7 +6632,7 @@ class BSplineSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bspline_surf_d2sdu2_uvvecs(P, self.knots_u, self.knots_v, u, v))
 
     def d2Sdv2(self, u: float or np.ndarray, v: float or np.ndarray):
@@ -5214,7 +6651,7 @@ class BSplineSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bspline_surf_d2sdv2(P, self.knots_u, self.knots_v, u, v))
 
     def d2Sdv2_grid(self, Nu: int, Nv: int) -> np.ndarray:
@@ -5234,7 +6671,7 @@ class BSplineSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bspline_surf_d2sdv2_grid(P, self.knots_u, self.knots_v, Nu, Nv))
 
     def d2Sdv2_uvvecs(self, u: np.ndarray, v: np.ndarray):
@@ -5254,7 +6691,7 @@ class BSplineSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         return np.array(bspline_surf_d2sdv2_uvvecs(P, self.knots_u, self.knots_v, u, v))
 
     def get_edge(self, edge: SurfaceEdge, n_points: int = 10) -> np.ndarray:
@@ -5273,7 +6710,7 @@ class BSplineSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if edge == SurfaceEdge.v1:
             return np.array(bspline_surf_eval_iso_v(P, self.knots_u, self.knots_v, n_points, 1.0))
         elif edge == SurfaceEdge.v0:
@@ -5307,7 +6744,7 @@ class BSplineSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if edge == SurfaceEdge.v1:
             return np.array(bspline_surf_dsdv_iso_v(
                 P, self.knots_u, self.knots_v, n_points, 1.0)) if perp else np.array(
@@ -5349,7 +6786,7 @@ class BSplineSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if edge == SurfaceEdge.v1:
             return np.array(bspline_surf_d2sdv2_iso_v(
                 P, self.knots_u, self.knots_v, n_points, 1.0)) if perp else np.array(
@@ -5489,7 +6926,7 @@ class BSplineSurface(Surface):
             Transformed surface
         """
         transformation = Transformation3D(**transformation_kwargs)
-        initial_control_points = self.get_control_point_array()
+        initial_control_points = self._control_point_array()
         return BSplineSurface(
             np.array([transformation.transform(p_arr) for p_arr in initial_control_points]),
             knots_u=deepcopy(self.knots_u),
@@ -5497,45 +6934,24 @@ class BSplineSurface(Surface):
             name=self.name, construction=self.construction
         )
 
-    def generate_control_point_net(self) -> (typing.List[Point3D], typing.List[Line3D]):
+    def generate_control_point_net(self) -> (PointArray3D, typing.List[Line3D]):
         """
-        Generates a list of :obj:`~aerocaps.geom.point.Point3D` and :obj:`~aerocaps.geom.curves.Line3D` objects
+        Generates a :obj:`~aerocaps.geom.point.PointArray3D` and a list of :obj:`~aerocaps.geom.curves.Line3D` objects
         representing the NURBS surface's control points and connections between them
 
         Returns
         -------
-        typing.List[Point3D], typing.List[Line3D]
-            Control points and lines between adjacent control points in flattened lists
+        PointArray3D, typing.List[Line3D]
+            Control points and lines between adjacent control points in flattened form
         """
-        control_points = self.get_control_point_array()
-        points = []
-        lines = []
-
-        for i in range(self.n_points_u):
-            for j in range(self.n_points_v):
-                points.append(Point3D.from_array(control_points[i, j, :]))
-
-        for i in range(self.n_points_u - 1):
-            for j in range(self.n_points_v - 1):
-                point_obj_1 = Point3D.from_array(control_points[i, j, :])
-                point_obj_2 = Point3D.from_array(control_points[i + 1, j, :])
-                point_obj_3 = Point3D.from_array(control_points[i, j + 1, :])
-
-                line_1 = Line3D(p0=point_obj_1, p1=point_obj_2)
-                line_2 = Line3D(p0=point_obj_1, p1=point_obj_3)
-                lines.extend([line_1, line_2])
-
-                if i < self.n_points_u - 2 and j < self.n_points_v - 2:
-                    continue
-
-                point_obj_4 = Point3D.from_array(control_points[i + 1, j + 1, :])
-                line_3 = Line3D(p0=point_obj_3, p1=point_obj_4)
-                line_4 = Line3D(p0=point_obj_2, p1=point_obj_4)
-                lines.extend([line_3, line_4])
-
+        control_points = self._control_point_array()
+        points = PointArray3D(control_points)
+        lines = [Line3D(p0=Point3D.from_array(segment[0]), p1=Point3D.from_array(segment[1]))
+                 for segment in _get_control_point_net_segments(control_points)]
         return points, lines
 
-    def plot_surface(self, plot: pv.Plotter, Nu: int = 50, Nv: int = 50, **mesh_kwargs):
+    def plot_surface(self, plot: pv.Plotter, Nu: int = 50, Nv: int = 50, XYZ: np.ndarray = None,
+                     **mesh_kwargs):
         """
         Plots the B-spline surface using the `pyvista <https://pyvista.org/>`_ library
 
@@ -5547,6 +6963,10 @@ class BSplineSurface(Surface):
             Number of points to evaluate in the :math:`u`-parametric direction. Default: ``50``
         Nv: int
             Number of points to evaluate in the :math:`v`-parametric direction. Default: ``50``
+        XYZ: numpy.ndarray
+            Points already evaluated on the surface, of size :math:`N_u \\times N_v \\times 3` (e.g., from
+            :obj:`~aerocaps.geom.batch.SurfaceBatch.evaluate_grid`). If specified, ``Nu`` and ``Nv`` are ignored
+            and the surface is not re-evaluated. Default: ``None``
         mesh_kwargs:
             Keyword arguments to pass to :obj:`pyvista.Plotter.add_mesh`
 
@@ -5555,7 +6975,8 @@ class BSplineSurface(Surface):
         pyvista.core.pointset.StructuredGrid
             The evaluated B-spline surface
         """
-        XYZ = self.evaluate_grid(Nu, Nv)
+        if XYZ is None:
+            XYZ = self.evaluate_grid(Nu, Nv)
         grid = pv.StructuredGrid(XYZ[:, :, 0], XYZ[:, :, 1], XYZ[:, :, 2])
         plot.add_mesh(grid, **mesh_kwargs)
         return grid
@@ -5577,9 +6998,7 @@ class BSplineSurface(Surface):
         pv.Actor
             The lines actor
         """
-        _, line_objs = self.generate_control_point_net()
-        line_arr = np.array([[line_obj.p0.as_array(), line_obj.p1.as_array()] for line_obj in line_objs])
-        line_arr = line_arr.reshape((len(line_objs) * 2, 3))
+        line_arr = _get_control_point_net_segments(self._control_point_array()).reshape((-1, 3))
         line_actor = plot.add_lines(line_arr, **line_kwargs)
         return line_actor
 
@@ -5599,8 +7018,7 @@ class BSplineSurface(Surface):
         pv.Actor
             The points actor
         """
-        point_objs, _ = self.generate_control_point_net()
-        point_arr = np.array([point_obj.as_array() for point_obj in point_objs])
+        point_arr = self._control_point_array().reshape((-1, 3))
         point_actor = plot.add_points(point_arr, **point_kwargs)
         return point_actor
 
@@ -5637,8 +7055,6 @@ class NURBSSurface(Surface):
             Whether this is a geometry used only for construction of other geometries. If ``True``, this
             geometry will not be exported or plotted. Default: ``False``
         """
-        if isinstance(points, np.ndarray):
-            points = [[Point3D.from_array(pt_row) for pt_row in pt_mat] for pt_mat in points]
         self.points = points
         assert knots_u.ndim == 1
         assert knots_v.ndim == 1
@@ -5654,18 +7070,45 @@ class NURBSSurface(Surface):
 
         self.knots_u = deepcopy(knots_u)
         self.knots_v = deepcopy(knots_v)
-        self.weights = deepcopy(weights)
+        self.weights = weights
         super().__init__(name=name, construction=construction)
 
+    @property
+    def points(self) -> Point3DNetView:
+        """
+        Control points as a nested sequence of point objects. Each point is a view into the control point array
+        owned by the surface, so ``surf.points[i][j].x.m = 1.0`` and ``surf.points[i][j] = point`` both modify
+        the surface. The points are created on demand; the array is the only stored representation. Modifications
+        made through the points increment :obj:`~aerocaps.geom.Geometry.version`.
+
+        .. warning::
+
+            Point objects passed to the constructor or assigned to ``points`` are copied into the array, not
+            referenced. Modifying them afterward does not modify the surface, and a point object shared by several
+            surfaces or curves no longer ties them together. Modify the surface through ``surf.points`` or assign
+            ``surf.points`` again instead.
+        """
+        return Point3DNetView(self._control_points, on_modify=self._mark_modified)
+
+    @points.setter
+    def points(self, points: typing.List[typing.List[Point3D]] or np.ndarray):
+        r"""
+        Sets the control points from a nested list of point objects or an array of size
+        :math:`N_u \times N_v \times 3`. The values are copied into a new array owned by the surface, so the point
+        objects passed in are not tied to the surface.
+        """
+        self._control_points = point3d_net_to_array(points)
+        self._mark_modified()
+
     @property
     def n_points_u(self) -> int:
         """Number of control points in the :math:`u`-parametric direction"""
-        return len(self.points)
+        return self._control_points.shape[0]
 
     @property
     def n_points_v(self) -> int:
         """Number of control points in the :math:`v`-parametric direction"""
-        return len(self.points[0])
+        return self._control_points.shape[1]
 
     @property
     def degree_u(self) -> int:
@@ -5701,12 +7144,28 @@ class NURBSSurface(Surface):
         """
         return self.degree_v
 
+    @property
+    def weights(self) -> np.ndarray:
+        """
+        Weight matrix. The returned array is a read-only view; use
+        :obj:`~aerocaps.geom.surfaces.NURBSSurface.set_weight` or assign a new matrix to this property
+        to change the weights.
+        """
+        weights = self._weights.view()
+        weights.flags.writeable = False
+        return weights
+
+    @weights.setter
+    def weights(self, weights: np.ndarray):
+        self._weights = np.array(weights, dtype=float)
+        self._mark_modified()
+
     def to_iges(self, *args, **kwargs) -> aerocaps.iges.entity.IGESEntity:
         """
         Exports the NURBS surface to an IGES entity
         """
         return aerocaps.iges.surfaces.RationalBSplineSurfaceIGES(
-            control_points=self.get_control_point_array(),
+            control_points=self._control_point_array(),
             knots_u=self.knots_u,
             knots_v=self.knots_v,
             weights=self.weights,
@@ -5716,14 +7175,15 @@ class NURBSSurface(Surface):
 
     def get_control_point_array(self) -> np.ndarray:
         r"""
-        Gets the control points in float array form.
+        Gets a copy of the control points in float array form. Modifying the returned array does not modify the
+        surface.
 
         Returns
         -------
         numpy.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        return np.array([np.array([p.as_array() for p in p_arr]) for p_arr in self.points])
+        return self._control_points.copy()
 
     def get_homogeneous_control_points(self) -> np.ndarray:
         r"""
@@ -5737,10 +7197,14 @@ class NURBSSurface(Surface):
             the :math:`x`-coordinate, :math:`y`-coordinate, :math:`z`-coordinate, and weight of each
             control point.
         """
-        return np.dstack((
-            self.get_control_point_array() * np.repeat(self.weights[:, :, np.newaxis], 3, axis=2),
-            self.weights
-        ))
+        return self._homogeneous_control_point_array().copy()
+
+    def _homogeneous_control_point_array(self) -> np.ndarray:
+        """Read-only array of control points in homogeneous coordinates, cached until the surface is modified"""
+        return self._get_cached_array("homogeneous_control_points", lambda: np.dstack((
+            self._control_points * np.repeat(self._weights[:, :, np.newaxis], 3, axis=2),
+            self._weights
+        )))
 
     @staticmethod
     def project_homogeneous_control_points(homogeneous_points: np.ndarray) -> (np.ndarray, np.ndarray):
@@ -5794,39 +7258,8 @@ class NURBSSurface(Surface):
             rad_dist = np.linspace(start_angle.rad, end_angle.rad, N_angles)
             return [Angle(rad=r) for r in rad_dist]
 
-        control_points = []
-        weights = []
         angles = _determine_angle_distribution()
-
-        for point in bezier.control_points:
-
-            axis_projection = project_point_onto_line(point, axis)
-            radius = measure_distance_point_line(point, axis)
-            if radius == 0.0:
-                new_points = [point for _ in angles]
-            else:
-                new_points = [rotate_point_about_axis(point, axis, angle) for angle in angles]
-
-            for idx, rotated_point in enumerate(new_points):
-                if idx == 0:
-                    weights.append([])
-                if not idx % 2:  # Skip even indices (these represent the "through" control points)
-                    weights[-1].append(1.0)
-                    continue
-                sine_half_angle = np.sin(0.5 * np.pi - 0.5 * (angles[idx + 1].rad - angles[idx - 1].rad))
-
-                if radius != 0.0:
-                    distance = radius / sine_half_angle  # radius / sin(half angle)
-                    vector = Vector3D(p0=axis_projection, p1=rotated_point)
-                    new_points[idx] = axis_projection + Point3D.from_array(
-                        distance * np.array(vector.normalized_value()))
-
-                weights[-1].append(sine_half_angle)
-
-            control_points.append(np.array([new_point.as_array() for new_point in new_points]))
-
-        control_points = np.array(control_points)
-        weights = np.array(weights)
+        control_points, weights = _revolve_control_points(bezier.get_control_point_array(), axis, angles)
 
         knots_v = np.array([0.0, 0.0, 0.0, 1.0, 1.0, 1.0])
         n_knots_to_insert = len(angles) - 3
@@ -5856,8 +7289,8 @@ class NURBSSurface(Surface):
         numpy.ndarray
             1-D array of the form ``array([x, y, z])`` representing the evaluated point on the surface
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_eval(P, self.weights, self.knots_u, self.knots_v, u, v))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_eval(P, self._weight_list(), self.knots_u, self.knots_v, u, v))
 
     def evaluate_point3d(self, u: float, v: float) -> Point3D:
         r"""
@@ -5893,8 +7326,255 @@ class NURBSSurface(Surface):
         numpy.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_eval_grid(P, self.weights, self.knots_u, self.knots_v, Nu, Nv))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_eval_grid(P, self._weight_list(), self.knots_u, self.knots_v, Nu, Nv))
+
+    def evaluate_derivatives(self, u: float or np.ndarray, v: float or np.ndarray,
+                             order: int = 2) -> SurfaceDerivativeData:
+        r"""
+        Evaluates the NURBS surface and its partial derivatives up to second order
+        (:math:`\mathbf{S}`, :math:`\mathbf{S}_u`, :math:`\mathbf{S}_v`, :math:`\mathbf{S}_{uu}`,
+        :math:`\mathbf{S}_{uv}`, and :math:`\mathbf{S}_{vv}`) in a single pass. The basis functions in each
+        parametric direction are computed only once and shared by all the derivatives, which makes this much faster
+        than calling each of the derivative methods separately.
+
+        Parameters
+        ----------
+        u: float or numpy.ndarray
+            Parameter value in the :math:`u`-direction, or a 1-D array of :math:`N_u` parameter values
+        v: float or numpy.ndarray
+            Parameter value in the :math:`v`-direction, or a 1-D array of :math:`N_v` parameter values
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Derivatives above this order are
+            ``None`` in the output. Default: ``2``
+
+        Returns
+        -------
+        SurfaceDerivativeData
+            Point and partial derivatives of the surface. Each array has size :math:`3` for float inputs or
+            :math:`N_u \times N_v \times 3` for array inputs (evaluated at each combination of :math:`u` and
+            :math:`v`)
+        """
+        return _evaluate_surface_derivatives(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, self.knots_u, self.knots_v, u, v, order
+        )
+
+    def evaluate_derivatives_grid(self, Nu: int, Nv: int, order: int = 2) -> SurfaceDerivativeData:
+        r"""
+        Evaluates the NURBS surface and its partial derivatives up to second order on a uniform
+        :math:`N_u \times N_v` grid of parameter values in a single pass. See
+        :obj:`~aerocaps.geom.surfaces.NURBSSurface.evaluate_derivatives`.
+
+        Parameters
+        ----------
+        Nu: int
+            Number of uniformly spaced parameter values in the :math:`u`-direction
+        Nv: int
+            Number of uniformly spaced parameter values in the :math:`v`-direction
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Default: ``2``
+
+        Returns
+        -------
+        SurfaceDerivativeData
+            Point and partial derivatives of the surface, each of size :math:`N_u \times N_v \times 3`
+        """
+        return self.evaluate_derivatives(np.linspace(0.0, 1.0, Nu), np.linspace(0.0, 1.0, Nv), order=order)
+
+    def evaluate_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the NURBS surface at :math:`N` arbitrary :math:`(u,v)` pairs. Unlike
+        :obj:`~aerocaps.geom.surfaces.NURBSSurface.evaluate_uvvecs`, which evaluates every combination of the
+        :math:`u`- and :math:`v`-values, only the given pairs are evaluated.
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, self.knots_u, self.knots_v, uv, [(0, 0)]
+        )[(0, 0)]
+
+    def dSdu_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the first derivative of the NURBS surface with respect to :math:`u` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, self.knots_u, self.knots_v, uv, [(1, 0)]
+        )[(1, 0)]
+
+    def dSdv_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the first derivative of the NURBS surface with respect to :math:`v` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, self.knots_u, self.knots_v, uv, [(0, 1)]
+        )[(0, 1)]
+
+    def d2Sdu2_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the second derivative of the NURBS surface with respect to :math:`u` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, self.knots_u, self.knots_v, uv, [(2, 0)]
+        )[(2, 0)]
+
+    def d2Sdv2_pairs(self, uv: np.ndarray) -> np.ndarray:
+        r"""
+        Evaluates the second derivative of the NURBS surface with respect to :math:`v` at :math:`N` arbitrary
+        :math:`(u,v)` pairs
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of size :math:`N \times 3`
+        """
+        return _evaluate_surface_pairs(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, self.knots_u, self.knots_v, uv, [(0, 2)]
+        )[(0, 2)]
+
+    def evaluate_derivatives_pairs(self, uv: np.ndarray, order: int = 2) -> SurfaceDerivativeData:
+        r"""
+        Evaluates the NURBS surface and its partial derivatives up to second order at :math:`N` arbitrary
+        :math:`(u,v)` pairs in a single pass. See :obj:`~aerocaps.geom.surfaces.NURBSSurface.evaluate_derivatives`.
+
+        Parameters
+        ----------
+        uv: numpy.ndarray
+            Array of size :math:`N \times 2` containing one :math:`(u,v)` pair per row
+        order: int
+            Highest derivative order to evaluate (``0``, ``1``, or ``2``). Default: ``2``
+
+        Returns
+        -------
+        SurfaceDerivativeData
+            Point and partial derivatives of the surface, each of size :math:`N \times 3`
+        """
+        if order not in (0, 1, 2):
+            raise ValueError(f"Derivative order must be 0, 1, or 2 (found {order = })")
+        orders = [(0, 0), (1, 0), (0, 1), (2, 0), (1, 1), (0, 2)][:{0: 1, 1: 3, 2: 6}[order]]
+        results = _evaluate_surface_pairs(
+            self._control_point_array(), self.weights, self.degree_u, self.degree_v, self.knots_u, self.knots_v, uv, orders
+        )
+        uv = np.asarray(uv, dtype=float)
+        return SurfaceDerivativeData(
+            uv[:, 0], uv[:, 1], results[(0, 0)],
+            Su=results.get((1, 0)), Sv=results.get((0, 1)),
+            Suu=results.get((2, 0)), Suv=results.get((1, 1)), Svv=results.get((0, 2))
+        )
+
+    def project_points(self, points: np.ndarray, Nu: int = 50, Nv: int = 50, max_iterations: int = 20,
+                       tol: float = 1e-10) -> (np.ndarray, np.ndarray, np.ndarray):
+        r"""
+        Finds the closest point on the NURBS surface to each of :math:`N` points (point inversion). Each point is
+        seeded from the nearest point of a uniform :math:`N_u \times N_v` grid on the surface using a KD-tree, and
+        all the points are then refined together using vectorized Newton iterations.
+
+        .. code-block:: python
+
+            uv, distance, converged = surf.project_points(point_cloud)
+            closest_points = surf.evaluate_pairs(uv)
+
+        Parameters
+        ----------
+        points: numpy.ndarray
+            Array of size :math:`N \times 3` (or a :obj:`~aerocaps.geom.point.PointArray3D`)
+        Nu: int
+            Number of seed grid points in the :math:`u`-direction. Default: ``50``
+        Nv: int
+            Number of seed grid points in the :math:`v`-direction. Default: ``50``
+        max_iterations: int
+            Maximum number of Newton iterations. Default: ``20``
+        tol: float
+            Convergence tolerance on the cosine of the angle between each surface tangent and the vector from the
+            surface to the point. Default: ``1e-10``
+
+        Returns
+        -------
+        numpy.ndarray, numpy.ndarray, numpy.ndarray
+            Parameter values of the closest points (size :math:`N \times 2`), distances from the points to the
+            surface (size :math:`N`), and a boolean array (size :math:`N`) indicating which points converged
+        """
+        return _project_points_onto_surface(self, points, Nu, Nv, max_iterations, tol)
+
+    def ray_intersect(self, origins: np.ndarray, directions: np.ndarray, t_min: float = 0.0, t_max: float = np.inf,
+                      all_hits: bool = False, num_workers: int = None):
+        r"""
+        Intersects a set of rays :math:`\mathbf{o} + t \mathbf{d}` with the NURBS surface. See
+        :obj:`~aerocaps.geom.intersection.ray_surface_intersections` for details.
+
+        .. code-block:: python
+
+            hits = surf.ray_intersect(origins, directions)
+            uv = np.column_stack((hits.u, hits.v))[hits.hit]
+
+        Parameters
+        ----------
+        origins: numpy.ndarray
+            Ray origins (size :math:`N \times 3`)
+        directions: numpy.ndarray
+            Ray directions (size :math:`N \times 3`), which need not be normalized
+        t_min: float
+            Minimum ray parameter. Default: ``0.0``
+        t_max: float
+            Maximum ray parameter. Default: ``numpy.inf``
+        all_hits: bool
+            Whether to return every intersection of each ray rather than only the first. Default: ``False``
+        num_workers: int
+            Number of worker processes. If not specified, the number of CPUs is used. Default: ``None``
+
+        Returns
+        -------
+        RaySurfaceIntersectionData
+            Surface parameter values, ray parameters, points, and unit normals of the intersections
+        """
+        from aerocaps.geom.intersection import ray_surface_intersections  # Avoid circular import
+        return ray_surface_intersections([self], origins, directions, t_min=t_min, t_max=t_max, all_hits=all_hits,
+                                         num_workers=num_workers)
 
     def get_parallel_control_point_length(self, surface_edge: SurfaceEdge) -> int:
         r"""
@@ -6092,24 +7772,18 @@ class NURBSSurface(Surface):
             Edge of the surface along which to retrieve the control point
         """
         if surface_edge == SurfaceEdge.v1:
-            self.points[row_index][-(continuity_index + 1)].x.m = point.x.m
-            self.points[row_index][-(continuity_index + 1)].y.m = point.y.m
-            self.points[row_index][-(continuity_index + 1)].z.m = point.z.m
+            self._control_points[row_index, -(continuity_index + 1)] = point.as_array()
         elif surface_edge == SurfaceEdge.v0:
-            self.points[row_index][continuity_index].x.m = point.x.m
-            self.points[row_index][continuity_index].y.m = point.y.m
-            self.points[row_index][continuity_index].z.m = point.z.m
+            self._control_points[row_index, continuity_index] = point.as_array()
         elif surface_edge == SurfaceEdge.u1:
-            self.points[-(continuity_index + 1)][row_index].x.m = point.x.m
-            self.points[-(continuity_index + 1)][row_index].y.m = point.y.m
-            self.points[-(continuity_index + 1)][row_index].z.m = point.z.m
+            self._control_points[-(continuity_index + 1), row_index] = point.as_array()
         elif surface_edge == SurfaceEdge.u0:
-            self.points[continuity_index][row_index].x.m = point.x.m
-            self.points[continuity_index][row_index].y.m = point.y.m
-            self.points[continuity_index][row_index].z.m = point.z.m
+            self._control_points[continuity_index, row_index] = point.as_array()
         else:
             raise ValueError("Invalid surface_edge value")
 
+        self._mark_modified()
+
     def get_weight(self, row_index: int, continuity_index: int, surface_edge: SurfaceEdge):
         r"""
         Gets the weight corresponding to a particular index along the edge curve with perpendicular index
@@ -6193,16 +7867,18 @@ class NURBSSurface(Surface):
             Edge of the surface along which to retrieve the weight
         """
         if surface_edge == SurfaceEdge.v1:
-            self.weights[row_index][-(continuity_index + 1)] = weight
+            self._weights[row_index][-(continuity_index + 1)] = weight
         elif surface_edge == SurfaceEdge.v0:
-            self.weights[row_index][continuity_index] = weight
+            self._weights[row_index][continuity_index] = weight
         elif surface_edge == SurfaceEdge.u1:
-            self.weights[-(continuity_index + 1)][row_index] = weight
+            self._weights[-(continuity_index + 1)][row_index] = weight
         elif surface_edge == SurfaceEdge.u0:
-            self.weights[continuity_index][row_index] = weight
+            self._weights[continuity_index][row_index] = weight
         else:
             raise ValueError("Invalid surface_edge value")
 
+        self._mark_modified()
+
     def extract_edge_curve(self, surface_edge: SurfaceEdge) -> NURBSCurve3D:
         """
         Extracts the control points, weights, and knots from one of the four edges of the NURBS surface and
@@ -6219,7 +7895,7 @@ class NURBSSurface(Surface):
             NURBS curve with control points, weights, and knots corresponding to the control points, weights, and knots
             along the edge of the surface
         """
-        P = self.get_control_point_array()
+        P = self._control_points
         w = self.weights
 
         if surface_edge == SurfaceEdge.u0:
@@ -6542,8 +8218,8 @@ class NURBSSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_dsdu(P, self.weights, self.knots_u, self.knots_v, u, v))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_dsdu(P, self._weight_list(), self.knots_u, self.knots_v, u, v))
 
     def dSdu_grid(self, Nu: int, Nv: int) -> np.ndarray:
         r"""
@@ -6562,8 +8238,8 @@ class NURBSSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_dsdu_grid(P, self.weights, self.knots_u, self.knots_v, Nu, Nv))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_dsdu_grid(P, self._weight_list(), self.knots_u, self.knots_v, Nu, Nv))
 
     def dSdu_uvvecs(self, u: np.ndarray, v: np.ndarray):
         r"""
@@ -6582,8 +8258,8 @@ class NURBSSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_dsdu_uvvecs(P, self.weights, self.knots_u, self.knots_v, u, v))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_dsdu_uvvecs(P, self._weight_list(), self.knots_u, self.knots_v, u, v))
 
     def dSdv(self, u: float or np.ndarray, v: float or np.ndarray):
         r"""
@@ -6601,8 +8277,8 @@ class NURBSSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_dsdv(P, self.weights, self.knots_u, self.knots_v, u, v))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_dsdv(P, self._weight_list(), self.knots_u, self.knots_v, u, v))
 
     def dSdv_grid(self, Nu: int, Nv: int) -> np.ndarray:
         r"""
@@ -6621,8 +8297,8 @@ class NURBSSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_dsdv_grid(P, self.weights, self.knots_u, self.knots_v, Nu, Nv))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_dsdv_grid(P, self._weight_list(), self.knots_u, self.knots_v, Nu, Nv))
 
     def dSdv_uvvecs(self, u: np.ndarray, v: np.ndarray):
         r"""
@@ -6641,8 +8317,8 @@ class NURBSSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_dsdv_uvvecs(P, self.weights, self.knots_u, self.knots_v, u, v))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_dsdv_uvvecs(P, self._weight_list(), self.knots_u, self.knots_v, u, v))
 
     def d2Sdu2(self, u: float, v: float) -> np.ndarray:
         r"""
@@ -6660,8 +8336,8 @@ class NURBSSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_d2sdu2(P, self.weights, self.knots_u, self.knots_v, u, v))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_d2sdu2(P, self._weight_list(), self.knots_u, self.knots_v, u, v))
 
     def d2Sdu2_grid(self, Nu: int, Nv: int) -> np.ndarray:
         r"""
@@ -6680,8 +8356,8 @@ class NURBSSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_d2sdu2_grid(P, self.weights, self.knots_u, self.knots_v, Nu, Nv))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_d2sdu2_grid(P, self._weight_list(), self.knots_u, self.knots_v, Nu, Nv))
 
     def d2Sdu2_uvvecs(self, u: np.ndarray, v: np.ndarray):
         r"""
@@ -6700,8 +8376,8 @@ class NURBSSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_d2sdu2_uvvecs(P, self.weights, self.knots_u, self.knots_v, u, v))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_d2sdu2_uvvecs(P, self._weight_list(), self.knots_u, self.knots_v, u, v))
 
     def d2Sdv2(self, u: float or np.ndarray, v: float or np.ndarray):
         r"""
@@ -6719,8 +8395,8 @@ class NURBSSurface(Surface):
         np.ndarray
             1-D array containing the :math:`x`-, :math:`y`-, and :math:`z`-components of the second derivative
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_d2sdv2(P, self.weights, self.knots_u, self.knots_v, u, v))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_d2sdv2(P, self._weight_list(), self.knots_u, self.knots_v, u, v))
 
     def d2Sdv2_grid(self, Nu: int, Nv: int) -> np.ndarray:
         r"""
@@ -6739,8 +8415,8 @@ class NURBSSurface(Surface):
         np.ndarray
             Array of size :math:`N_u \times N_v \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_d2sdv2_grid(P, self.weights, self.knots_u, self.knots_v, Nu, Nv))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_d2sdv2_grid(P, self._weight_list(), self.knots_u, self.knots_v, Nu, Nv))
 
     def d2Sdv2_uvvecs(self, u: np.ndarray, v: np.ndarray):
         r"""
@@ -6759,8 +8435,8 @@ class NURBSSurface(Surface):
         np.ndarray
             Array of size :math:`\text{len}(u) \times \text{len}(v) \times 3`
         """
-        P = self.get_control_point_array()
-        return np.array(nurbs_surf_d2sdv2_uvvecs(P, self.weights, self.knots_u, self.knots_v, u, v))
+        P = self._control_point_list()
+        return np.array(nurbs_surf_d2sdv2_uvvecs(P, self._weight_list(), self.knots_u, self.knots_v, u, v))
 
     def get_edge(self, edge: SurfaceEdge, n_points: int = 10) -> np.ndarray:
         r"""
@@ -6778,15 +8454,15 @@ class NURBSSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if edge == SurfaceEdge.v1:
-            return np.array(nurbs_surf_eval_iso_v(P, self.weights, self.knots_u, self.knots_v, n_points, 1.0))
+            return np.array(nurbs_surf_eval_iso_v(P, self._weight_list(), self.knots_u, self.knots_v, n_points, 1.0))
         elif edge == SurfaceEdge.v0:
-            return np.array(nurbs_surf_eval_iso_v(P, self.weights, self.knots_u, self.knots_v, n_points, 0.0))
+            return np.array(nurbs_surf_eval_iso_v(P, self._weight_list(), self.knots_u, self.knots_v, n_points, 0.0))
         elif edge == SurfaceEdge.u1:
-            return np.array(nurbs_surf_eval_iso_u(P, self.weights, self.knots_u, self.knots_v, 1.0, n_points))
+            return np.array(nurbs_surf_eval_iso_u(P, self._weight_list(), self.knots_u, self.knots_v, 1.0, n_points))
         elif edge == SurfaceEdge.u0:
-            return np.array(nurbs_surf_eval_iso_u(P, self.weights, self.knots_u, self.knots_v, 0.0, n_points))
+            return np.array(nurbs_surf_eval_iso_u(P, self._weight_list(), self.knots_u, self.knots_v, 0.0, n_points))
         else:
             raise ValueError(f"No edge called {edge}")
 
@@ -6812,23 +8488,23 @@ class NURBSSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if edge == SurfaceEdge.v1:
             return np.array(nurbs_surf_dsdv_iso_v(
                 P, self.weights, self.knots_u, self.knots_v, n_points, 1.0)) if perp else np.array(
-                nurbs_surf_dsdu_iso_v(P, self.weights, self.knots_u, self.knots_v, n_points, 1.0))
+                nurbs_surf_dsdu_iso_v(P, self._weight_list(), self.knots_u, self.knots_v, n_points, 1.0))
         elif edge == SurfaceEdge.v0:
             return np.array(nurbs_surf_dsdv_iso_v(
                 P, self.weights, self.knots_u, self.knots_v, n_points, 0.0)) if perp else np.array(
-                nurbs_surf_dsdu_iso_v(P, self.weights, self.knots_u, self.knots_v, n_points, 0.0))
+                nurbs_surf_dsdu_iso_v(P, self._weight_list(), self.knots_u, self.knots_v, n_points, 0.0))
         elif edge == SurfaceEdge.u1:
             return np.array(nurbs_surf_dsdu_iso_u(
                 P, self.weights, self.knots_u, self.knots_v, 1.0, n_points)) if perp else np.array(
-                nurbs_surf_dsdv_iso_u(P, self.weights, self.knots_u, self.knots_v, 1.0, n_points))
+                nurbs_surf_dsdv_iso_u(P, self._weight_list(), self.knots_u, self.knots_v, 1.0, n_points))
         elif edge == SurfaceEdge.u0:
             return np.array(nurbs_surf_dsdu_iso_u(
                 P, self.weights, self.knots_u, self.knots_v, 0.0, n_points)) if perp else np.array(
-                nurbs_surf_dsdv_iso_u(P, self.weights, self.knots_u, self.knots_v, 0.0, n_points))
+                nurbs_surf_dsdv_iso_u(P, self._weight_list(), self.knots_u, self.knots_v, 0.0, n_points))
         else:
             raise ValueError(f"No edge called {edge}")
 
@@ -6854,23 +8530,23 @@ class NURBSSurface(Surface):
         numpy.ndarray
             2-D array of size :math:`n_\text{points} \times 3`
         """
-        P = self.get_control_point_array()
+        P = self._control_point_list()
         if edge == SurfaceEdge.v1:
             return np.array(nurbs_surf_d2sdv2_iso_v(
                 P, self.weights, self.knots_u, self.knots_v, n_points, 1.0)) if perp else np.array(
-                nurbs_surf_d2sdu2_iso_v(P, self.weights, self.knots_u, self.knots_v, n_points, 1.0))
+                nurbs_surf_d2sdu2_iso_v(P, self._weight_list(), self.knots_u, self.knots_v, n_points, 1.0))
         elif edge == SurfaceEdge.v0:
             return np.array(nurbs_surf_d2sdv2_iso_v(
                 P, self.weights, self.knots_u, self.knots_v, n_points, 0.0)) if perp else np.array(
-                nurbs_surf_d2sdu2_iso_v(P, self.weights, self.knots_u, self.knots_v, n_points, 0.0))
+                nurbs_surf_d2sdu2_iso_v(P, self._weight_list(), self.knots_u, self.knots_v, n_points, 0.0))
         elif edge == SurfaceEdge.u1:
             return np.array(nurbs_surf_d2sdu2_iso_u(
                 P, self.weights, self.knots_u, self.knots_v, 1.0, n_points)) if perp else np.array(
-                nurbs_surf_d2sdv2_iso_u(P, self.weights, self.knots_u, self.knots_v, 1.0, n_points))
+                nurbs_surf_d2sdv2_iso_u(P, self._weight_list(), self.knots_u, self.knots_v, 1.0, n_points))
         elif edge == SurfaceEdge.u0:
             return np.array(nurbs_surf_d2sdu2_iso_u(
                 P, self.weights, self.knots_u, self.knots_v, 0.0, n_points)) if perp else np.array(
-                nurbs_surf_d2sdv2_iso_u(P, self.weights, self.knots_u, self.knots_v, 0.0, n_points))
+                nurbs_surf_d2sdv2_iso_u(P, self._weight_list(), self.knots_u, self.knots_v, 0.0, n_points))
         else:
             raise ValueError(f"No edge called {edge}")
 
@@ -7051,6 +8727,60 @@ class NURBSSurface(Surface):
             return fsolve(root_find_func_v, x0=np.array([uv_guess]))[0]
         raise ValueError("Did not detect a u or v input")
 
+    def get_u_or_v_given_uvxyz_array(self, u: float or np.ndarray = None, v: float or np.ndarray = None,
+                                     uv_guess: float = 0.5, x: Length = None, y: Length = None, z: Length = None,
+                                     tol: float = 1e-12, max_iterations: int = 50) -> np.ndarray:
+        """
+        Array version of :obj:`~aerocaps.geom.surfaces.NURBSSurface.get_u_or_v_given_uvxyz`. Computes the
+        :math:`u`-values (if ``v`` is specified) or :math:`v`-values (if ``u`` is specified) corresponding to an array
+        of :math:`x`-, :math:`y`-, or :math:`z`-locations along an array of isoparametric curves. The fixed parameter
+        values and locations are broadcast against each other, and all the values are solved at once using a
+        bracketed Newton-bisection method with the analytic surface derivatives. As an example, the
+        :math:`u`-parameters corresponding to several spanwise stations along the :math:`v=0.8` isoparametric curve
+        can be computed using
+
+        .. code-block:: python
+
+            u = surf.get_u_or_v_given_uvxyz_array(v=0.8, y=LengthArray(m=[0.5, 1.0, 1.4]))
+
+        Unlike :obj:`~aerocaps.geom.surfaces.NURBSSurface.get_u_or_v_given_uvxyz`, the solved values always lie in
+        :math:`[0,1]`. If the isoparametric curve crosses a location more than once, the root closest to ``uv_guess``
+        is returned.
+
+        Parameters
+        ----------
+        u: float or numpy.ndarray or None
+            Values of :math:`u` to specify, or ``None`` to solve for :math:`u`. Default: ``None``
+        v: float or numpy.ndarray or None
+            Values of :math:`v` to specify, or ``None`` to solve for :math:`v`. Default: ``None``
+        uv_guess: float
+            Parameter value used to choose between multiple roots. Default: ``0.5``
+        x: Length or None
+            :math:`x`-locations (e.g., a :obj:`~aerocaps.units.length.LengthArray`). If unspecified, either
+            :math:`y` or :math:`z` must be specified. Default: ``None``
+        y: Length or None
+            :math:`y`-locations. If unspecified, either :math:`x` or :math:`z` must be specified. Default: ``None``
+        z: Length or None
+            :math:`z`-locations. If unspecified, either :math:`x` or :math:`y` must be specified. Default: ``None``
+        tol: float
+            Convergence tolerance on the solved parameter values. Default: ``1e-12``
+        max_iterations: int
+            Maximum number of Newton-bisection iterations. Default: ``50``
+
+        Returns
+        -------
+        numpy.ndarray
+            The values of :math:`u` if :math:`v` is specified or :math:`v` if :math:`u` is specified, with the
+            broadcast shape of the inputs. Locations not reached by the isoparametric curve give ``nan``
+        """
+        if u is None and v is None or (u is not None and v is not None):
+            raise ValueError("Must specify exactly one of either u or v")
+        xyz_spec = [xyz for xyz in (x, y, z) if xyz is not None]
+        if len(xyz_spec) != 1:
+            raise ValueError("Must specify exactly one of x, y, or z")
+        coordinate = [x, y, z].index(xyz_spec[0])
+        return _solve_for_u_or_v_given_xyz(self, u, v, coordinate, xyz_spec[0].m, uv_guess, tol, max_iterations)
+
     def split_at_u(self, u0: float) -> ("NURBSSurface", "NURBSSurface"):
         """
         Splits the NURBS surface at :math:`u=u_0` along the :math:`v`-parametric direction.
@@ -7059,7 +8789,7 @@ class NURBSSurface(Surface):
             raise NotImplementedError(
                 "Curve splitting perpendicular to an edge with internal knots is not yet implemented"
             )
-        Pw = self.get_homogeneous_control_points()
+        Pw = self._homogeneous_control_point_array()
 
         def de_casteljau(i: int, j: int, k: int) -> np.ndarray:
             """
@@ -7112,7 +8842,7 @@ class NURBSSurface(Surface):
             raise NotImplementedError(
                 "Curve splitting perpendicular to an edge with internal knots is not yet implemented"
             )
-        Pw = self.get_homogeneous_control_points()
+        Pw = self._homogeneous_control_point_array()
 
         def de_casteljau(i: int, j: int, k: int) -> np.ndarray:
             """
@@ -7169,7 +8899,7 @@ class NURBSSurface(Surface):
             Transformed surface
         """
         transformation = Transformation3D(**transformation_kwargs)
-        initial_control_points = self.get_control_point_array()
+        initial_control_points = self._control_point_array()
         return NURBSSurface(
             np.array([transformation.transform(p_arr) for p_arr in initial_control_points]),
             weights=deepcopy(self.weights),
@@ -7178,45 +8908,24 @@ class NURBSSurface(Surface):
             name=self.name, construction=self.construction
         )
 
-    def generate_control_point_net(self) -> (typing.List[Point3D], typing.List[Line3D]):
+    def generate_control_point_net(self) -> (PointArray3D, typing.List[Line3D]):
         """
-        Generates a list of :obj:`~aerocaps.geom.point.Point3D` and :obj:`~aerocaps.geom.curves.Line3D` objects
+        Generates a :obj:`~aerocaps.geom.point.PointArray3D` and a list of :obj:`~aerocaps.geom.curves.Line3D` objects
         representing the NURBS surface's control points and connections between them
 
         Returns
         -------
-        typing.List[Point3D], typing.List[Line3D]
-            Control points and lines between adjacent control points in flattened lists
+        PointArray3D, typing.List[Line3D]
+            Control points and lines between adjacent control points in flattened form
         """
-        control_points = self.get_control_point_array()
-        points = []
-        lines = []
-
-        for i in range(self.n_points_u):
-            for j in range(self.n_points_v):
-                points.append(Point3D.from_array(control_points[i, j, :]))
-
-        for i in range(self.n_points_u - 1):
-            for j in range(self.n_points_v - 1):
-                point_obj_1 = Point3D.from_array(control_points[i, j, :])
-                point_obj_2 = Point3D.from_array(control_points[i + 1, j, :])
-                point_obj_3 = Point3D.from_array(control_points[i, j + 1, :])
-
-                line_1 = Line3D(p0=point_obj_1, p1=point_obj_2)
-                line_2 = Line3D(p0=point_obj_1, p1=point_obj_3)
-                lines.extend([line_1, line_2])
-
-                if i < self.n_points_u - 2 and j < self.n_points_v - 2:
-                    continue
-
-                point_obj_4 = Point3D.from_array(control_points[i + 1, j + 1, :])
-                line_3 = Line3D(p0=point_obj_3, p1=point_obj_4)
-                line_4 = Line3D(p0=point_obj_2, p1=point_obj_4)
-                lines.extend([line_3, line_4])
-
+        control_points = self._control_point_array()
+        points = PointArray3D(control_points)
+        lines = [Line3D(p0=Point3D.from_array(segment[0]), p1=Point3D.from_array(segment[1]))
+                 for segment in _get_control_point_net_segments(control_points)]
         return points, lines
 
-    def plot_surface(self, plot: pv.Plotter, Nu: int = 50, Nv: int = 50, **mesh_kwargs):
+    def plot_surface(self, plot: pv.Plotter, Nu: int = 50, Nv: int = 50, XYZ: np.ndarray = None,
+                     **mesh_kwargs):
         """
         Plots the NURBS surface using the `pyvista <https://pyvista.org/>`_ library
 
@@ -7228,6 +8937,10 @@ class NURBSSurface(Surface):
             Number of points to evaluate in the :math:`u`-parametric direction. Default: ``50``
         Nv: int
             Number of points to evaluate in the :math:`v`-parametric direction. Default: ``50``
+        XYZ: numpy.ndarray
+            Points already evaluated on the surface, of size :math:`N_u \\times N_v \\times 3` (e.g., from
+            :obj:`~aerocaps.geom.batch.SurfaceBatch.evaluate_grid`). If specified, ``Nu`` and ``Nv`` are ignored
+            and the surface is not re-evaluated. Default: ``None``
         mesh_kwargs:
             Keyword arguments to pass to :obj:`pyvista.Plotter.add_mesh`
 
@@ -7236,7 +8949,8 @@ class NURBSSurface(Surface):
         pyvista.core.pointset.StructuredGrid
             The evaluated NURBS surface
         """
-        XYZ = self.evaluate_grid(Nu, Nv)
+        if XYZ is None:
+            XYZ = self.evaluate_grid(Nu, Nv)
         grid = pv.StructuredGrid(XYZ[:, :, 0], XYZ[:, :, 1], XYZ[:, :, 2])
         plot.add_mesh(grid, **mesh_kwargs)
         return grid
@@ -7258,9 +8972,7 @@ class NURBSSurface(Surface):
         pv.Actor
             The lines actor
         """
-        _, line_objs = self.generate_control_point_net()
-        line_arr = np.array([[line_obj.p0.as_array(), line_obj.p1.as_array()] for line_obj in line_objs])
-        line_arr = line_arr.reshape((len(line_objs) * 2, 3))
+        line_arr = _get_control_point_net_segments(self._control_point_array()).reshape((-1, 3))
         line_actor = plot.add_lines(line_arr, **line_kwargs)
         return line_actor
 
@@ -7280,8 +8992,7 @@ class NURBSSurface(Surface):
         pv.Actor
             The points actor
         """
-        point_objs, _ = self.generate_control_point_net()
-        point_arr = np.array([point_obj.as_array() for point_obj in point_objs])
+        point_arr = self._control_point_array().reshape((-1, 3))
         point_actor = plot.add_points(point_arr, **point_kwargs)
         return point_actor
 
@@ -1,10 +1,9 @@
 import numpy as np
 import shapely
 import triangle
-from scipy.optimize import minimize_scalar
 
 from aerocaps.geom.curves import BezierCurve3D, PCurve2D, PCurve3D, Line3D
-from aerocaps.geom.point import Point3D, Point2D
+from aerocaps.geom.point import Point3D, Point2D, PointArray3D
 from aerocaps.geom.transformation import Transformation3D
 from aerocaps.geom.vector import Vector3D
 from aerocaps.units.angle import Angle
@@ -16,11 +15,13 @@ __all__ = [
     "measure_distance_point_line",
     "add_vector_to_point",
     "project_point_onto_line",
+    "project_points_onto_line",
     "find_t_corresponding_to_minimum_distance_to_point2d",
     "find_t_corresponding_to_minimum_distance_to_point3d",
     "sweep_along_curve",
     "rotate_about_axis",
     "rotate_point_about_axis",
+    "rotate_points_about_axis",
     "concave_hull"
 ]
 
@@ -70,37 +71,87 @@ def project_point_onto_line(point: Point3D, line: Line3D) -> Point3D:
     return add_vector_to_point(vector=vAD, point=line.p0)
 
 
-def find_t_corresponding_to_minimum_distance_to_point2d(curve: PCurve2D, point: np.ndarray or Point2D) -> (
-        float, float):
+def project_points_onto_line(points: np.ndarray or PointArray3D, line: Line3D) -> np.ndarray:
+    r"""
+    Projects many points onto an infinite line at once. Vectorized equivalent of
+    :obj:`~aerocaps.geom.tools.project_point_onto_line`
 
-    point = point.as_array() if isinstance(point, Point2D) else point
+    Parameters
+    ----------
+    points: numpy.ndarray or PointArray3D
+        Array of size :math:`N \times 3` or point array
+    line: Line3D
+        Line onto which the points are projected
 
-    def minimize_func(t):
-        curve_point = curve.evaluate(t)
-        return (curve_point[0] - point[0]) ** 2 + (curve_point[1] - point[1]) ** 2
+    Returns
+    -------
+    numpy.ndarray
+        Array of size :math:`N \times 3` containing the projected points
+    """
+    points = points.as_array() if isinstance(points, PointArray3D) else np.asarray(points, dtype=float)
+    p0 = line.p0.as_array()
+    direction = line.p1.as_array() - p0
+    return p0 + np.outer((points - p0) @ direction / (direction @ direction), direction)
 
-    res = minimize_scalar(minimize_func, bounds=[0.0, 1.0])
-    return res.x, np.sqrt(res.fun)
 
+def find_t_corresponding_to_minimum_distance_to_point2d(curve: PCurve2D, point: np.ndarray or Point2D) -> (
+        float or np.ndarray, float or np.ndarray):
+    r"""
+    Finds the parameter value of the globally closest point on a 2-D curve to a point or array of points. See
+    :obj:`~aerocaps.geom.curves.PCurve2D.project_points`.
+
+    Parameters
+    ----------
+    curve: PCurve2D
+        Curve on which to find the closest point
+    point: numpy.ndarray or Point2D
+        Point object, array of size :math:`2`, or array of size :math:`N \times 2`
+
+    Returns
+    -------
+    float or numpy.ndarray, float or numpy.ndarray
+        Parameter value of the closest point and distance to the curve (arrays of size :math:`N` if an array of
+        points is given)
+    """
+    point = point.as_array() if isinstance(point, Point2D) else np.asarray(point, dtype=float)
+    t, distance = curve.project_points(point.reshape((-1, 2)))
+    if point.ndim == 1:
+        return float(t[0]), float(distance[0])
+    return t, distance
 
-def find_t_corresponding_to_minimum_distance_to_point3d(curve: PCurve3D, point: np.ndarray or Point3D) -> (
-        float, float):
 
-    point = point.as_array() if isinstance(point, Point3D) else point
+def find_t_corresponding_to_minimum_distance_to_point3d(curve: PCurve3D, point: np.ndarray or Point3D) -> (
+        float or np.ndarray, float or np.ndarray):
+    r"""
+    Finds the parameter value of the globally closest point on a 3-D curve to a point or array of points. See
+    :obj:`~aerocaps.geom.curves.PCurve3D.project_points`.
 
-    def minimize_func(t):
-        curve_point = curve.evaluate(t)
-        return (curve_point[0] - point[0]) ** 2 + (curve_point[1] - point[1]) ** 2 + (curve_point[2] - point[2]) ** 2
+    Parameters
+    ----------
+    curve: PCurve3D
+        Curve on which to find the closest point
+    point: numpy.ndarray or Point3D
+        Point object, array of size :math:`3`, or array of size :math:`N \times 3`
 
-    res = minimize_scalar(minimize_func, bounds=[0.0, 1.0])
-    return res.x, np.sqrt(res.fun)
+    Returns
+    -------
+    float or numpy.ndarray, float or numpy.ndarray
+        Parameter value of the closest point and distance to the curve (arrays of size :math:`N` if an array of
+        points is given)
+    """
+    point = point.as_array() if isinstance(point, Point3D) else np.asarray(point, dtype=float)
+    t, distance = curve.project_points(point.reshape((-1, 3)))
+    if point.ndim == 1:
+        return float(t[0]), float(distance[0])
+    return t, distance
 
 
 def sweep_along_curve(primary_curve: BezierCurve3D, guide_curve: BezierCurve3D):
-    point_list_3d = [primary_curve.control_points]
-    for prev_point, current_point in zip(guide_curve.control_points[:-1], guide_curve.control_points[1:]):
-        point_list_3d.append([primary_point + current_point - prev_point for primary_point in point_list_3d[-1]])
-    return np.array([[[point.x.m, point.y.m, point.z.m] for point in v] for v in point_list_3d])
+    # Each row of the swept net is the primary curve translated by the offset of a guide curve control point
+    # from the first guide curve control point
+    primary_points = primary_curve.get_control_point_array()
+    guide_points = guide_curve.get_control_point_array()
+    return primary_points[np.newaxis, :, :] + (guide_points - guide_points[0])[:, np.newaxis, :]
 
 
 def rotate_about_axis(points: np.ndarray, axis: Vector3D, angle: Angle) -> np.ndarray:
@@ -125,6 +176,30 @@ def rotate_point_about_axis(p: Point3D, ax: Line3D, angle: Angle) -> Point3D:
     return Point3D.from_array(p_mat[0])
 
 
+def rotate_points_about_axis(points: np.ndarray or PointArray3D, ax: Line3D, angle: Angle) -> np.ndarray:
+    r"""
+    Rotates many points about an axis at once. Vectorized equivalent of
+    :obj:`~aerocaps.geom.tools.rotate_point_about_axis`
+
+    Parameters
+    ----------
+    points: numpy.ndarray or PointArray3D
+        Array of size :math:`N \times 3` or point array
+    ax: Line3D
+        Axis of rotation
+    angle: Angle
+        Angle of rotation
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of size :math:`N \times 3` containing the rotated points
+    """
+    points = points.as_array() if isinstance(points, PointArray3D) else np.asarray(points, dtype=float)
+    p0 = ax.p0.as_array()
+    return rotate_about_axis(points - p0, ax.get_vector(), angle) + p0
+
+
 def concave_hull(poly: np.ndarray) -> (np.ndarray, np.ndarray):
     r"""
     Gets the concave hull of points of a polygon. Has a worst-case time complexity of
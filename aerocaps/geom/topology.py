@@ -0,0 +1,225 @@
+"""
+Discovery of the edges shared by the surfaces of a patch network
+"""
+import itertools
+import typing
+
+import numpy as np
+
+from aerocaps.geom import Surface
+from aerocaps.geom.continuity import SharedEdge, _edge_uv
+from aerocaps.geom.surfaces import SurfaceEdge
+
+__all__ = [
+    "PatchAdjacencyGraph",
+    "find_shared_edges"
+]
+
+
+_EDGES = (SurfaceEdge.u0, SurfaceEdge.u1, SurfaceEdge.v0, SurfaceEdge.v1)
+
+
+class PatchAdjacencyGraph:
+    """Adjacency graph of the surfaces of a patch network, with one graph edge per shared surface edge"""
+    def __init__(self,
+                 surfaces: typing.Dict[str, Surface],
+                 shared_edges: typing.List[SharedEdge],
+                 boundary_edges: typing.List[typing.Tuple[str, SurfaceEdge]]):
+        """
+        Adjacency graph of the surfaces of a patch network. The shared edges can be passed directly to
+        :obj:`~aerocaps.geom.continuity.enforce_network_continuity`, and
+        :obj:`~aerocaps.geom.topology.PatchAdjacencyGraph.multiface_kwargs` gives the keyword arguments of the
+        single-surface multi-face methods such as :obj:`~aerocaps.geom.surfaces.BezierSurface.enforce_g0g1_multiface`.
+
+        .. code-block:: python
+
+            graph = find_shared_edges(surfaces)
+            for surf_a, surf_b, shared_edge in graph.surface_pairs():
+                surf_a.verify_g0(surf_b, shared_edge.edge_a, shared_edge.edge_b)
+
+        Parameters
+        ----------
+        surfaces: typing.Dict[str, Surface]
+            Surfaces of the network by name
+        shared_edges: typing.List[SharedEdge]
+            Pairs of coincident surface edges
+        boundary_edges: typing.List[typing.Tuple[str, SurfaceEdge]]
+            Surface edges not shared with any other edge (excluding edges collapsed to a point)
+        """
+        self.surfaces = surfaces
+        self.shared_edges = shared_edges
+        self.boundary_edges = boundary_edges
+
+    def edges_of(self, name: str) -> typing.List[SharedEdge]:
+        """
+        Gets the shared edges of a surface, each seen from that surface (so that ``surface_a`` is ``name``)
+
+        Parameters
+        ----------
+        name: str
+            Name of the surface
+
+        Returns
+        -------
+        typing.List[SharedEdge]
+            Shared edges of the surface, ordered by surface edge
+        """
+        edges = [shared_edge if shared_edge.surface_a == name else shared_edge.swapped()
+                 for shared_edge in self.shared_edges if name in (shared_edge.surface_a, shared_edge.surface_b)]
+        # A seam shared by two edges of the same surface is seen from both of its sides
+        edges.extend(shared_edge.swapped() for shared_edge in self.shared_edges
+                     if shared_edge.surface_a == shared_edge.surface_b == name)
+        return sorted(edges, key=lambda shared_edge: _EDGES.index(shared_edge.edge_a))
+
+    def neighbors(self, name: str) -> typing.List[str]:
+        """
+        Gets the names of the surfaces that share at least one edge with a surface
+
+        Parameters
+        ----------
+        name: str
+            Name of the surface
+
+        Returns
+        -------
+        typing.List[str]
+            Names of the adjacent surfaces, without duplicates
+        """
+        return list(dict.fromkeys(shared_edge.surface_b for shared_edge in self.edges_of(name)))
+
+    def surface_pairs(self) -> typing.Iterator[typing.Tuple[Surface, Surface, SharedEdge]]:
+        """
+        Iterates over the shared edges along with the surfaces on either side of each of them
+
+        Returns
+        -------
+        typing.Iterator[typing.Tuple[Surface, Surface, SharedEdge]]
+            First surface, second surface, and shared edge
+        """
+        for shared_edge in self.shared_edges:
+            yield self.surfaces[shared_edge.surface_a], self.surfaces[shared_edge.surface_b], shared_edge
+
+    def color(self, names: typing.Iterable[str] = None) -> typing.Dict[str, int]:
+        """
+        Colors the surfaces so that no two surfaces sharing an edge have the same color, using the greedy
+        largest-degree-first heuristic. Surfaces of the same color can be modified independently of each other.
+
+        Parameters
+        ----------
+        names: typing.Iterable[str]
+            Names of the surfaces to color. Only the shared edges between these surfaces are considered. If not
+            specified, every surface is colored. Default: ``None``
+
+        Returns
+        -------
+        typing.Dict[str, int]
+            Color of each surface, numbered from ``0``
+        """
+        names = list(self.surfaces.keys()) if names is None else list(names)
+        selected = set(names)
+        adjacency = {name: [other for other in self.neighbors(name) if other in selected and other != name]
+                     for name in names}
+        colors = {}
+        for name in sorted(names, key=lambda name: -len(adjacency[name])):
+            used = {colors[other] for other in adjacency[name] if other in colors}
+            colors[name] = next(color for color in itertools.count() if color not in used)
+        return {name: colors[name] for name in names}
+
+    def multiface_kwargs(self, name: str) -> dict:
+        """
+        Gets the keyword arguments describing the neighbors of a surface in the form used by
+        :obj:`~aerocaps.geom.surfaces.BezierSurface.enforce_g0g1_multiface` and
+        :obj:`~aerocaps.geom.surfaces.BezierSurface.enforce_g0g1g2_multiface`:
+
+        .. code-block:: python
+
+            surfaces[name].enforce_g0g1_multiface(**graph.multiface_kwargs(name))
+
+        Parameters
+        ----------
+        name: str
+            Name of the surface
+
+        Returns
+        -------
+        dict
+            ``adjacent_surf_*``, ``other_edge_*``, and ``f_*_initial`` for every shared edge of the surface
+        """
+        kwargs = {}
+        for shared_edge in self.edges_of(name):
+            edge_name = shared_edge.edge_a.name
+            if shared_edge.reverse:
+                raise ValueError(f"Edge {edge_name} of surface '{name}' has the opposite orientation of the adjacent "
+                                 f"edge, which is not supported by the multi-face continuity methods")
+            if f"adjacent_surf_{edge_name}" in kwargs:
+                raise ValueError(f"Edge {edge_name} of surface '{name}' is shared by more than one other edge")
+            kwargs[f"adjacent_surf_{edge_name}"] = self.surfaces[shared_edge.surface_b]
+            kwargs[f"other_edge_{edge_name}"] = shared_edge.edge_b
+            kwargs[f"f_{edge_name}_initial"] = shared_edge.f_initial
+        return kwargs
+
+
+def find_shared_edges(surfaces: typing.Iterable[Surface],
+                      names: typing.Iterable[str] = None,
+                      tol: float = 1e-6,
+                      n_samples: int = 5,
+                      continuity: int = 1) -> PatchAdjacencyGraph:
+    r"""
+    Finds the pairs of coincident edges of a set of surfaces, in either the same or opposite parametric directions.
+    Each edge is sampled at ``n_samples`` evenly-spaced parameter values, and the centroid of its samples (which does
+    not depend on the direction) is hashed into a uniform grid with cells of size :math:`2 \cdot` ``tol``. Only the
+    edges in the same or neighboring cells are compared, so the cost is close to linear in the number of edges. Two
+    edges are coincident if every pair of corresponding samples is within ``tol``.
+
+    Parameters
+    ----------
+    surfaces: typing.Iterable[Surface]
+        Bézier, rational Bézier, B-spline, or NURBS surfaces
+    names: typing.Iterable[str]
+        Name of each surface. If not specified, the ``name`` attribute of each surface is used. Default: ``None``
+    tol: float
+        Maximum distance between corresponding samples of coincident edges. Default: ``1e-6``
+    n_samples: int
+        Number of samples along each edge. Default: ``5``
+    continuity: int
+        Order of continuity assigned to every shared edge. Default: ``1``
+
+    Returns
+    -------
+    PatchAdjacencyGraph
+        Adjacency graph, with the shared edges ordered by surface and edge
+    """
+    surfaces = list(surfaces)
+    names = [surface.name for surface in surfaces] if names is None else list(names)
+    if len(set(names)) != len(names):
+        raise ValueError("Surface names must be unique")
+    t = np.linspace(0.0, 1.0, n_samples)
+    uv = np.concatenate([_edge_uv(edge, t) for edge in _EDGES])
+    samples = np.concatenate([surface.evaluate_pairs(uv).reshape((len(_EDGES), n_samples, 3))
+                              for surface in surfaces]) if surfaces else np.zeros((0, n_samples, 3))
+
+    # Edges collapsed to a point (at poles, for example) coincide with every edge through that point
+    degenerate = np.max(np.linalg.norm(samples - samples[:, :1], axis=2), axis=1) <= tol
+    cells = np.floor(samples.mean(axis=1) / (2.0 * tol)).astype(np.int64)
+    grid = {}
+    for edge_idx in np.flatnonzero(~degenerate):
+        grid.setdefault(tuple(cells[edge_idx]), []).append(edge_idx)
+
+    shared_edges = []
+    matched = np.zeros(samples.shape[0], dtype=bool)
+    for edge_idx in np.flatnonzero(~degenerate):
+        candidates = [other_idx for offset in itertools.product((-1, 0, 1), repeat=3)
+                      for other_idx in grid.get(tuple(cells[edge_idx] + offset), []) if other_idx > edge_idx]
+        for other_idx in sorted(candidates):
+            forward = np.max(np.linalg.norm(samples[edge_idx] - samples[other_idx], axis=1))
+            backward = np.max(np.linalg.norm(samples[edge_idx] - samples[other_idx, ::-1], axis=1))
+            if min(forward, backward) > tol:
+                continue
+            matched[[edge_idx, other_idx]] = True
+            shared_edges.append(SharedEdge(names[edge_idx // len(_EDGES)], _EDGES[edge_idx % len(_EDGES)],
+                                           names[other_idx // len(_EDGES)], _EDGES[other_idx % len(_EDGES)],
+                                           continuity=continuity, reverse=bool(backward < forward)))
+
+    boundary_edges = [(names[edge_idx // len(_EDGES)], _EDGES[edge_idx % len(_EDGES)])
+                      for edge_idx in np.flatnonzero(~matched & ~degenerate)]
+    return PatchAdjacencyGraph(dict(zip(names, surfaces)), shared_edges, boundary_edges)
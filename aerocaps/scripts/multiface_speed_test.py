@@ -0,0 +1,44 @@
+import time
+import typing
+from copy import deepcopy
+
+from aerocaps.tests.helpers import enforce_g0g1_multiface_loop, four_edge_case
+
+
+def case_1() -> (typing.List[float], str):
+    """:math:`G^0`/:math:`G^1` enforcement on four edges with per-point and with sparse sensitivities"""
+    center, neighbors = four_edge_case()
+
+    start = time.perf_counter()
+    enforce_g0g1_multiface_loop(deepcopy(center), **neighbors)
+    end_loop = time.perf_counter()
+    deepcopy(center).enforce_g0g1_multiface(**neighbors)
+    end_sparse = time.perf_counter()
+
+    return [end_loop - start, end_sparse - end_loop], "enforce_g0g1_multiface"
+
+
+def case_2() -> (typing.List[float], str):
+    """:math:`G^0`/:math:`G^1`/:math:`G^2` enforcement on four edges with BFGS and with linear least squares"""
+    center, neighbors = four_edge_case()
+
+    start = time.perf_counter()
+    deepcopy(center).enforce_g0g1g2_multiface(**neighbors)
+    end_bfgs = time.perf_counter()
+    deepcopy(center).enforce_g0g1g2_multiface(method="linear", **neighbors)
+    end_linear = time.perf_counter()
+
+    return [end_bfgs - start, end_linear - end_bfgs], "enforce_g0g1g2_multiface"
+
+
+def main():
+    times, name = case_1()
+    print(f"Completed {name} (4 edges). Per-point sensitivity loop: {times[0]:.3f} seconds. "
+          f"Sparse sensitivities: {times[1]:.3f} seconds ({times[0] / times[1]:.1f}x speedup).")
+    times, name = case_2()
+    print(f"Completed {name} (4 edges). BFGS: {times[0]:.3f} seconds. "
+          f"Linear least squares: {times[1]:.3f} seconds ({times[0] / times[1]:.1f}x speedup).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import time
+import tracemalloc
+import typing
+
+import numpy as np
+
+import aerocaps as ac
+
+
+def build_point_net(P: np.ndarray) -> typing.List[typing.List[ac.Point3D]]:
+    """Builds a nested list of point objects from an :math:`N_u \\times N_v \\times 3` array"""
+    return [[ac.Point3D(x=ac.Length(m=xyz[0]), y=ac.Length(m=xyz[1]), z=ac.Length(m=xyz[2])) for xyz in row]
+            for row in P.tolist()]
+
+
+def case_1(N: int) -> (typing.List[float], str):
+    """Construction of an :math:`N \\times N` net of point objects"""
+    P = np.random.default_rng(seed=0).random((N, N, 3))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    points = build_point_net(P)
+    end = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(points) == N
+    return [end - start, peak / 1e6], "Point net"
+
+
+def case_2(N: int) -> (typing.List[float], str):
+    """Construction of an :math:`N \\times N` Bézier surface from a net of point objects"""
+    P = np.random.default_rng(seed=0).random((N, N, 3))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    surf = ac.BezierSurface(build_point_net(P))
+    end = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert surf.n_points_u == N
+    return [end - start, peak / 1e6], "Bézier surface"
+
+
+def case_3(N: int) -> (typing.List[float], str):
+    """Reading every coordinate of an :math:`N \\times N` net of point objects in meters and in inches"""
+    points = build_point_net(np.random.default_rng(seed=0).random((N, N, 3)))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for row in points:
+        for point in row:
+            point.as_array()
+            point.as_array(unit="inch")
+    end = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return [end - start, peak / 1e6], "Coordinate access"
+
+
+def main():
+    N = 100
+    for i in range(1, 4):
+        (elapsed, peak_memory), name = globals()[f"case_{i}"](N)
+        print(f"Completed {name} ({N}x{N}). Time: {elapsed:.3f} seconds. Peak traced memory: {peak_memory:.2f} MB.")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ import typing
 import numpy as np
 
 from aerocaps.geom import Surface
+from aerocaps.geom.batch import evaluate_surface_grids
 
 
 class STLGenerator:
@@ -18,8 +19,7 @@ class STLGenerator:
         with open(file_name, "w") as stl_file:
             stl_file.write("solid aerocaps\n")
 
-            for geom in self.geoms:
-                point_array = geom.evaluate_grid(self.Nu, self.Nv)
+            for point_array in evaluate_surface_grids(self.geoms, self.Nu, self.Nv):
                 for i in range(point_array.shape[0] - 1):
                     for j in range(point_array.shape[1] - 1):
                         vertex_1 = point_array[i, j, :]
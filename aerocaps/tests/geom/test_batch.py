@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from aerocaps.geom.batch import SurfaceBatch, evaluate_surface_grids
+from aerocaps.geom.surfaces import BezierSurface
+from aerocaps.tests.helpers import four_surface_classes
+
+
+@pytest.fixture
+def surfaces():
+    # Surfaces of the same type share a group only if they also have the same degrees, sizes, and knots
+    rng = np.random.default_rng(seed=3)
+    other_knots = np.array([0.0, 0.0, 0.0, 0.0, 0.7, 1.0, 1.0, 1.0, 1.0])
+    return four_surface_classes(rng.random((5, 5, 3)), seed=3) + [
+        BezierSurface(rng.random((5, 5, 3))),
+        BezierSurface(rng.random((4, 6, 3))),
+        four_surface_classes(rng.random((5, 5, 3)), seed=4, knots=other_knots)[3]
+    ]
+
+
+def test_surface_batch_matches_single_surface_evaluation(surfaces):
+    batch = SurfaceBatch(surfaces)
+    assert batch.num_groups == 6
+
+    u = np.linspace(0.0, 1.0, 7)
+    v = np.linspace(0.0, 1.0, 9)
+    grids = batch.evaluate_grid(7, 9)
+    dSdu = batch.dSdu_uvvecs(u, v)
+    dSdv = batch.dSdv_uvvecs(u, v)
+    d2Sdu2 = batch.d2Sdu2_uvvecs(u, v)
+    d2Sdv2 = batch.d2Sdv2_uvvecs(u, v)
+    points = batch.evaluate(0.3, 0.8)
+    for surf_idx, surf in enumerate(surfaces):
+        assert np.allclose(grids[surf_idx], surf.evaluate_grid(7, 9))
+        assert np.allclose(dSdu[surf_idx], surf.dSdu_uvvecs(u, v))
+        assert np.allclose(dSdv[surf_idx], surf.dSdv_uvvecs(u, v))
+        assert np.allclose(d2Sdu2[surf_idx], surf.d2Sdu2_uvvecs(u, v))
+        assert np.allclose(d2Sdv2[surf_idx], surf.d2Sdv2_uvvecs(u, v))
+        assert np.allclose(points[surf_idx], surf.evaluate(0.3, 0.8))
+
+
+def test_evaluate_surface_grids(surfaces):
+    grids = evaluate_surface_grids(surfaces, 5, 6)
+    assert len(grids) == len(surfaces)
+    for grid, surf in zip(grids, surfaces):
+        assert np.allclose(grid, surf.evaluate_grid(5, 6))
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from aerocaps.geom.bvh import SurfaceBVH
+from aerocaps.tests.helpers import four_surface_classes, height_field
+
+
+@pytest.fixture
+def surfaces():
+    # The B-spline surface overlaps the Bézier surface, while the NURBS surface is well above it
+    s = np.linspace(0.0, 1.0, 5)
+    X, Y = np.meshgrid(s, s, indexing="ij")
+    offsets = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 0.5], [0.5, 0.0, 0.1], [0.0, 0.0, 1.5]])
+    return four_surface_classes(height_field(0.2 * np.sin(3.0 * X) * np.cos(2.0 * Y)), seed=14, offsets=offsets)
+
+
+def test_leaf_boxes_contain_surfaces(surfaces):
+    bvh = SurfaceBVH(surfaces, max_depth=2)
+    assert set(bvh.surface_index) == {0, 1, 2, 3}
+    for leaf in range(bvh.num_leaves):
+        u0, u1, v0, v1 = bvh.uv_bounds[leaf]
+        u, v = np.meshgrid(np.linspace(u0, u1, 5), np.linspace(v0, v1, 5), indexing="ij")
+        points = surfaces[bvh.surface_index[leaf]].evaluate_pairs(np.column_stack((u.ravel(), v.ravel())))
+        assert np.all(points >= bvh.box_min[leaf] - 1e-12) and np.all(points <= bvh.box_max[leaf] + 1e-12)
+
+    # The leaves of each surface tile its parameter domain
+    for surf_idx in range(len(surfaces)):
+        bounds = bvh.uv_bounds[bvh.surface_index == surf_idx]
+        assert np.isclose(np.sum((bounds[:, 1] - bounds[:, 0]) * (bounds[:, 3] - bounds[:, 2])), 1.0)
+
+
+def test_query_rays_and_boxes_match_brute_force(surfaces):
+    rng = np.random.default_rng(seed=15)
+    bvh = SurfaceBVH(surfaces)
+
+    origins = np.column_stack((rng.uniform(-0.2, 1.7, (300, 2)), np.full(300, -1.0)))
+    directions = np.column_stack((rng.normal(0.0, 0.2, (300, 2)), np.ones(300)))
+    directions[0] = [1.0, 0.0, 0.0]
+    ray, leaf, t_enter = bvh.query_rays(origins, directions, t_max=2.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_1 = (bvh.box_min - origins[:, np.newaxis]) / directions[:, np.newaxis]
+        t_2 = (bvh.box_max - origins[:, np.newaxis]) / directions[:, np.newaxis]
+    inside = (origins[:, np.newaxis] >= bvh.box_min) & (origins[:, np.newaxis] <= bvh.box_max)
+    t_near = np.where(np.isnan(t_1), np.where(inside, -np.inf, np.inf), np.minimum(t_1, t_2)).max(axis=2)
+    t_far = np.where(np.isnan(t_1), np.where(inside, np.inf, -np.inf), np.maximum(t_1, t_2)).min(axis=2)
+    expected = np.nonzero(np.maximum(t_near, 0.0) <= np.minimum(t_far, 2.0))
+    assert set(zip(ray, leaf)) == set(zip(*expected))
+    assert np.all(np.diff(t_enter)[np.diff(ray) == 0] >= 0.0)
+
+    box_center = rng.uniform(-0.5, 2.0, (200, 3))
+    query, leaf = bvh.query_boxes(box_center - 0.1, box_center + 0.1)
+    overlap = np.all((bvh.box_min <= box_center[:, np.newaxis] + 0.1) &
+                     (bvh.box_max >= box_center[:, np.newaxis] - 0.1), axis=2)
+    assert set(zip(query, leaf)) == set(zip(*np.nonzero(overlap)))
+
+
+def test_query_closest_candidates(surfaces):
+    rng = np.random.default_rng(seed=16)
+    bvh = SurfaceBVH(surfaces)
+    points = rng.uniform(-0.5, 2.0, (100, 3))
+    point, leaf, distance = bvh.query_closest_candidates(points)
+
+    # The closest sample of each surface lies in a candidate leaf
+    u, v = np.meshgrid(np.linspace(0.0, 1.0, 101), np.linspace(0.0, 1.0, 101), indexing="ij")
+    uv = np.column_stack((u.ravel(), v.ravel()))
+    samples = [surf.evaluate_pairs(uv) for surf in surfaces]
+    for point_idx in range(points.shape[0]):
+        sample_distance = [np.linalg.norm(s - points[point_idx], axis=1) for s in samples]
+        surf_idx = np.argmin([np.min(d) for d in sample_distance])
+        closest_uv = uv[np.argmin(sample_distance[surf_idx])]
+        candidates = leaf[point == point_idx]
+        bounds = bvh.uv_bounds[candidates[bvh.surface_index[candidates] == surf_idx]]
+        assert np.any((bounds[:, 0] <= closest_uv[0]) & (closest_uv[0] <= bounds[:, 1]) &
+                      (bounds[:, 2] <= closest_uv[1]) & (closest_uv[1] <= bounds[:, 3]))
+    assert np.all(np.diff(distance)[np.diff(point) == 0] >= 0.0)
+
+
+def test_query_overlapping_leaves(surfaces):
+    bvh = SurfaceBVH(surfaces)
+    leaf, other_leaf = bvh.query_overlapping_leaves()
+    assert np.all(leaf < other_leaf)
+    pairs = set(map(frozenset, zip(bvh.surface_index[leaf], bvh.surface_index[other_leaf])))
+    assert frozenset((0, 2)) in pairs and frozenset((0, 3)) not in pairs
+
+    other = SurfaceBVH(surfaces[3:])
+    leaf, other_leaf = bvh.query_overlapping_leaves(other)
+    assert set(bvh.surface_index[leaf]) == {3}
+    assert other_leaf.max() < other.num_leaves
+
+
+def test_unsupported_surface():
+    with pytest.raises(TypeError):
+        SurfaceBVH([object()])
@@ -0,0 +1,219 @@
+from copy import deepcopy
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from aerocaps.geom.continuity import ContinuityTracker, SharedEdge, audit_continuity, enforce_network_continuity
+from aerocaps.geom.geometry_container import GeometryContainer
+from aerocaps.geom.surfaces import BezierSurface, SurfaceEdge
+from aerocaps.tests.helpers import four_edge_case, height_field_control_points
+
+
+def _patch(x0: float, y0: float, rng: np.random.Generator, degree: int = 3) -> np.ndarray:
+    # Patch of a smooth height field with every control point perturbed, so no continuity holds initially
+    P = height_field_control_points(x0, y0, degree)
+    return P + 0.02 * rng.standard_normal(P.shape)
+
+
+def _two_by_two_network(continuity: int):
+    rng = np.random.default_rng(seed=21)
+    surfaces = {f"p{i}{j}": BezierSurface(_patch(i, j, rng)) for i in range(2) for j in range(2)}
+
+    # Reverse the u-direction of one patch so that its shared edges have reversed orientation and matching ends
+    surfaces["p11"] = BezierSurface(surfaces["p11"].get_control_point_array()[::-1])
+    shared_edges = [
+        SharedEdge("p00", SurfaceEdge.u1, "p10", SurfaceEdge.u0, continuity=continuity),
+        SharedEdge("p00", SurfaceEdge.v1, "p01", SurfaceEdge.v0, continuity=continuity),
+        SharedEdge("p10", SurfaceEdge.v1, "p11", SurfaceEdge.v0, continuity=continuity, reverse=True),
+        SharedEdge("p01", SurfaceEdge.u1, "p11", SurfaceEdge.u1, continuity=continuity)
+    ]
+    return surfaces, shared_edges
+
+
+def _cross_derivative_errors(surfaces: dict, shared_edge: SharedEdge, f: float) -> (float, float, float):
+    surf_a, surf_b = surfaces[shared_edge.surface_a], surfaces[shared_edge.surface_b]
+    flip = slice(None, None, -1) if shared_edge.reverse else slice(None)
+    errors = [np.max(np.abs(surf_a.extract_edge_curve(shared_edge.edge_a).get_control_point_array() -
+                            surf_b.extract_edge_curve(shared_edge.edge_b).get_control_point_array()[flip]))]
+    for order, method in enumerate(("get_first_derivs_along_edge", "get_second_derivs_along_edge"), start=1):
+        d_a = getattr(surf_a, method)(shared_edge.edge_a)
+        d_b = getattr(surf_b, method)(shared_edge.edge_b)[flip]
+        errors.append(np.max(np.abs(d_a - (shared_edge.f_sign / f) ** order * d_b)))
+    return tuple(errors)
+
+
+@pytest.mark.parametrize("continuity", [1, 2])
+def test_enforce_network_continuity(continuity):
+    surfaces, shared_edges = _two_by_two_network(continuity)
+    res = enforce_network_continuity(surfaces, shared_edges)
+    assert res.success and res.fun < 1e-20
+    for shared_edge, f in zip(shared_edges, res.factors):
+        errors = _cross_derivative_errors(surfaces, shared_edge, f)
+        assert errors[0] == 0.0
+        assert np.all(np.array(errors[1:continuity + 1]) < 1e-12)
+
+    # Only the rows of control points next to the shared edges are modified
+    original, _ = _two_by_two_network(continuity)
+    P, P_original = surfaces["p00"].get_control_point_array(), original["p00"].get_control_point_array()
+    assert np.array_equal(P[:-(continuity + 1), :-(continuity + 1)], P_original[:-(continuity + 1), :-(continuity + 1)])
+
+    # The solution does not depend on the order of the shared edges
+    reordered, _ = _two_by_two_network(continuity)
+    enforce_network_continuity(reordered, shared_edges[::-1])
+    for name, surf in surfaces.items():
+        assert np.allclose(reordered[name].get_control_point_array(), surf.get_control_point_array(), atol=1e-6)
+
+
+def test_enforce_network_continuity_fixed_surface():
+    surfaces, shared_edges = _two_by_two_network(1)
+    P_fixed = surfaces["p00"].get_control_point_array()
+    res = enforce_network_continuity(surfaces, shared_edges, fixed=["p00"], solve_factors=False)
+    assert res.success
+    assert np.array_equal(surfaces["p00"].get_control_point_array(), P_fixed)
+    assert np.allclose(res.factors, 1.0)
+    for shared_edge in shared_edges:
+        errors = _cross_derivative_errors(surfaces, shared_edge, 1.0)
+        assert errors[0] == 0.0 and errors[1] < 1e-12
+
+
+def test_enforce_network_continuity_invalid_input():
+    surfaces, shared_edges = _two_by_two_network(1)
+    surfaces["p10"] = surfaces["p10"].elevate_degree_v()
+    with pytest.raises(ValueError):
+        enforce_network_continuity(surfaces, shared_edges)
+    with pytest.raises(ValueError):
+        SharedEdge("p00", SurfaceEdge.u1, "p10", SurfaceEdge.u0, continuity=3)
+
+
+def test_geometry_container_enforce_continuity():
+    surfaces, shared_edges = _two_by_two_network(2)
+    container = GeometryContainer()
+    for name, surf in surfaces.items():
+        surf.name = name
+        container.add_geometry(surf)
+    res = container.enforce_continuity(shared_edges)
+    assert res.success
+    for shared_edge, f in zip(shared_edges, res.factors):
+        assert np.all(np.array(_cross_derivative_errors(surfaces, shared_edge, f)) < 1e-12)
+
+
+def _crease(slope: float, curvature: float, reverse: bool) -> dict:
+    # Flat patch for -1 <= x <= 0 and a patch z = slope * x + curvature / 2 * x^2 for 0 <= x <= 1 sharing the edge x = 0
+    x, y = np.meshgrid(np.array([-1.0, -0.5, 0.0]), np.array([0.0, 0.5, 1.0]), indexing="ij")
+    flat = BezierSurface(np.stack((x, y, np.zeros_like(x)), axis=2))
+    x, y = np.meshgrid(np.array([0.0, 0.5, 1.0]), np.array([0.0, 0.5, 1.0]), indexing="ij")
+    z = np.array([0.0, 0.5 * slope, slope + 0.5 * curvature])[:, np.newaxis] * np.ones((1, 3))
+    P = np.stack((x, y, z), axis=2)
+    return {"flat": flat, "curved": BezierSurface(P[:, ::-1] if reverse else P)}
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_audit_continuity_crease(reverse):
+    surfaces = _crease(0.2, 0.6, reverse)
+    shared_edge = SharedEdge("flat", SurfaceEdge.u1, "curved", SurfaceEdge.u0, continuity=2, reverse=reverse)
+    report = audit_continuity(surfaces, [shared_edge], n_samples=11)
+    assert np.allclose(report.gap, 0.0)
+    assert np.allclose(report.angle, np.arctan(0.2))
+    assert np.allclose(report.curvature_mismatch, 0.6 / (1.0 + 0.2 ** 2) ** 1.5, rtol=1e-3)
+    assert np.allclose(report.worst_location("gap")[:, :2], [[0.0, report.worst_parameter("gap")[0]]])
+    assert report.failures() == [0]
+    assert report.failures(angle_tol=0.3, curvature_tol=0.6) == []
+    row = report.summary()[0]
+    assert row["shared_edge"] is shared_edge and np.isclose(row["angle_rms"], np.arctan(0.2))
+
+
+def test_audit_continuity_network():
+    surfaces, shared_edges = _two_by_two_network(2)
+    before = audit_continuity(surfaces, shared_edges)
+    assert np.all(before.max("gap") > 1e-3)
+    assert before.failures() == [0, 1, 2, 3]
+
+    enforce_network_continuity(surfaces, shared_edges)
+    after = audit_continuity(surfaces, shared_edges)
+    assert np.all(after.max("gap") < 1e-12) and np.all(after.max("angle") < 1e-6)
+    assert np.all(after.max("curvature_mismatch") < 1e-6)
+    assert after.failures(gap_tol=1e-12, angle_tol=1e-6, curvature_tol=1e-6) == []
+
+    # The container finds the shared edges itself
+    container = GeometryContainer()
+    for name, surf in surfaces.items():
+        surf.name = name
+        container.add_geometry(surf)
+    report = container.audit_continuity()
+    assert len(report.shared_edges) == 4 and np.all(report.max("angle") < 1e-6)
+    with pytest.raises(ValueError):
+        report.max("twist")
+
+
+@pytest.mark.parametrize("continuity", [1, 2])
+def test_continuity_tracker(continuity):
+    surfaces, shared_edges = _two_by_two_network(continuity)
+    tracker = ContinuityTracker(surfaces, shared_edges)
+    assert tracker.enforce().success and tracker.changed_points() == []
+
+    # Moving a control point away from the shared edges does not require a new solution
+    P = surfaces["p00"].get_control_point_array()
+    P[0, 0] += 0.1
+    surfaces["p00"].points = P
+    res = tracker.update()
+    assert res.nit == 0 and res.shared_edge_indices == []
+
+    # Moving a control point next to the edge shared by p00 and p10 (and, for G2, the edge shared by p00 and p01)
+    # only re-solves the edges depending on it, with the edges sharing control points with them as constraints
+    P[-2, 1] += 0.1
+    surfaces["p00"].points = P
+    assert tracker.changed_points(["p00"]) == [("p00", 2, 1)]
+    affected = tracker.affected_edges(tracker.changed_points())
+    assert affected == ([0] if continuity == 1 else [0, 1])
+    original = {name: surf.get_control_point_array() for name, surf in surfaces.items()}
+    res = tracker.update()
+    assert res.success and res.shared_edge_indices[:len(affected)] == affected
+    assert not np.array_equal(surfaces["p10"].get_control_point_array(), original["p10"])
+    assert np.array_equal(surfaces["p11"].get_control_point_array(), original["p11"])
+    for shared_edge, f in zip(shared_edges, tracker.factors):
+        errors = _cross_derivative_errors(surfaces, shared_edge, f)
+        assert errors[0] == 0.0 and np.all(np.array(errors[1:continuity + 1]) < 1e-12)
+    assert tracker.update().shared_edge_indices == []
+
+
+def test_continuity_tracker_method_calls():
+    center, neighbors = four_edge_case()
+    surfaces = {"center": center, "far": BezierSurface(_patch(2.0, 0.0, np.random.default_rng(seed=25), degree=4))}
+    surfaces.update({name: neighbors[f"adjacent_surf_{name}"] for name in ("u0", "u1", "v0", "v1")})
+    tracker = ContinuityTracker(surfaces)
+    multiface_kwargs = dict(method="linear", n_f_iterations=2, **neighbors)
+    multiface_res = tracker.record("center", "enforce_g0g1_multiface", **multiface_kwargs)
+    tracker.record("far", "enforce_g0g1g2", surfaces["u1"], 1.0, SurfaceEdge.u0, SurfaceEdge.u1)
+    assert tracker.changed_points() == [] and tracker.update().relation_indices == []
+
+    # Moving a control point read by the multi-face call only repeats that call, starting from its previous factors
+    P = surfaces["v1"].get_control_point_array()
+    P[2, 1] += 0.05
+    surfaces["v1"].points = P
+    expected = deepcopy(center)
+    factors = dict(zip(("f_u0_initial", "f_u1_initial", "f_v0_initial", "f_v1_initial"), multiface_res.x[-4:]))
+    expected.enforce_g0g1_multiface(**multiface_kwargs, **factors)
+    far = surfaces["far"].get_control_point_array()
+    res = tracker.update()
+    assert res.shared_edge_indices == [] and res.relation_indices == [0]
+    assert np.allclose(center.get_control_point_array(), expected.get_control_point_array(), atol=1e-12)
+    assert np.array_equal(surfaces["far"].get_control_point_array(), far)
+
+    # Moving a control point read by the pairwise call only repeats that call
+    P = surfaces["u1"].get_control_point_array()
+    P[-2, 2] += 0.05
+    surfaces["u1"].points = P
+    expected = deepcopy(surfaces["far"])
+    expected.enforce_g0g1g2(surfaces["u1"], 1.0, SurfaceEdge.u0, SurfaceEdge.u1)
+    assert tracker.update().relation_indices == [1]
+    assert np.array_equal(surfaces["far"].get_control_point_array(), expected.get_control_point_array())
+
+    # Surfaces that were not modified since the last update are not compared with the snapshot
+    with mock.patch.object(BezierSurface, "_control_point_array", side_effect=AssertionError):
+        assert tracker.changed_points() == []
+
+    with pytest.raises(ValueError):
+        tracker.record("center", "enforce_g0g1", BezierSurface(P), 1.0, SurfaceEdge.u1, SurfaceEdge.u0)
+    with pytest.raises(ValueError):
+        tracker.record("center", "elevate_degree_u")
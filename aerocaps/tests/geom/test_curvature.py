@@ -0,0 +1,65 @@
+import numpy as np
+
+from aerocaps.geom.curvature import SurfaceCurvatureData
+from aerocaps.geom.geometry_container import GeometryContainer
+from aerocaps.geom.surfaces import BezierSurface, RationalBezierSurface
+
+
+def _paraboloid() -> BezierSurface:
+    """Bézier representation of :math:`z = x^2 + y^2` over :math:`[-1,1] \\times [-1,1]`"""
+    x = np.array([-1.0, 0.0, 1.0])
+    z = np.array([1.0, -1.0, 1.0])
+    P = np.zeros((3, 3, 3))
+    P[:, :, 0] = x[:, np.newaxis]
+    P[:, :, 1] = x[np.newaxis, :]
+    P[:, :, 2] = z[:, np.newaxis] + z[np.newaxis, :]
+    return BezierSurface(P)
+
+
+def _quarter_cylinder(radius: float) -> RationalBezierSurface:
+    P = np.array([
+        [[radius, 0.0, 0.0], [radius, 0.0, 1.0]],
+        [[radius, radius, 0.0], [radius, radius, 1.0]],
+        [[0.0, radius, 0.0], [0.0, radius, 1.0]]
+    ])
+    w = np.array([[1.0, 1.0], [np.sqrt(2) / 2, np.sqrt(2) / 2], [1.0, 1.0]])
+    return RationalBezierSurface(P, w)
+
+
+def test_paraboloid_curvature():
+    curvature = SurfaceCurvatureData.from_derivatives(_paraboloid().evaluate_derivatives(0.5, 0.5))
+    assert np.allclose(curvature.normal, [0.0, 0.0, 1.0])
+    assert np.isclose(curvature.gaussian_curvature, 4.0)
+    assert np.isclose(curvature.mean_curvature, 2.0)
+    assert np.isclose(curvature.max_principal_curvature, 2.0)
+    assert np.isclose(curvature.min_principal_curvature, 2.0)
+
+    curvature = SurfaceCurvatureData.from_derivatives(_paraboloid().evaluate_derivatives_grid(7, 5))
+    assert np.all(curvature.max_principal_curvature >= curvature.min_principal_curvature)
+    assert np.allclose(np.einsum("...i,...i->...", curvature.max_principal_direction,
+                                 curvature.min_principal_direction), 0.0)
+
+
+def test_cylinder_curvature():
+    radius = 2.0
+    curvature = SurfaceCurvatureData.from_derivatives(_quarter_cylinder(radius).evaluate_derivatives_grid(6, 4))
+    assert np.allclose(curvature.gaussian_curvature, 0.0)
+    assert np.allclose(curvature.mean_curvature, -0.5 / radius)
+    assert np.allclose(curvature.min_principal_curvature, -1.0 / radius)
+    assert np.allclose(curvature.max_principal_curvature, 0.0)
+    assert np.allclose(np.abs(curvature.max_principal_direction[..., 2]), 1.0)  # Straight lines along the axis
+
+
+def test_container_curvature():
+    container = GeometryContainer()
+    container.add_geometry(_paraboloid())
+    container.add_geometry(_quarter_cylinder(2.0))
+    curvature = container.evaluate_curvature(Nu=8, Nv=9)
+    assert set(curvature.keys()) == {"BezierSurface", "RationalBezierSurface"}
+    assert curvature["BezierSurface"].gaussian_curvature.shape == (8, 9)
+    assert np.allclose(curvature["RationalBezierSurface"].mean_curvature, -0.25)
+
+    grid = curvature["BezierSurface"].to_pyvista()
+    assert np.allclose(grid.points, curvature["BezierSurface"].S.reshape((-1, 3), order="F"))
+    assert np.allclose(grid.point_data["gaussian_curvature"],
+                       curvature["BezierSurface"].gaussian_curvature.ravel(order="F"))
@@ -0,0 +1,143 @@
+import numpy as np
+from scipy.spatial import cKDTree
+
+from aerocaps.geom.curves import BezierCurve2D, BezierCurve3D, BSplineCurve3D, CircularArc2D, Line3D, NURBSCurve3D, \
+    RationalBezierCurve2D, RationalBezierCurve3D
+from aerocaps.geom.point import Point2D, Point3D
+from aerocaps.geom.tools import find_t_corresponding_to_minimum_distance_to_point2d, \
+    find_t_corresponding_to_minimum_distance_to_point3d
+from aerocaps.units.angle import Angle
+from aerocaps.units.length import Length
+
+
+def _airfoil_like_curves():
+    P = np.array([[1.0, 0.0], [0.5, 0.08], [0.0, 0.1], [0.0, 0.0], [0.0, -0.06], [0.5, -0.05], [1.0, 0.0]])
+    w = np.array([1.0, 1.2, 0.8, 1.0, 1.1, 0.9, 1.0])
+    P3 = np.column_stack((P, np.linspace(0.0, 0.2, 7)))
+    return [BezierCurve2D(P), RationalBezierCurve2D(P, w), BezierCurve3D(P3), RationalBezierCurve3D(P3, w)]
+
+
+def test_compute_t_corresponding_to_x():
+    x_seek = np.linspace(0.2, 0.95, 50)
+    for curve in _airfoil_like_curves():
+        # Both crossings of the non-monotonic curve
+        roots = curve.compute_t_corresponding_to_x(x_seek, all_roots=True)
+        assert len(roots) == x_seek.shape[0]
+        for t, x in zip(roots, x_seek):
+            assert t.shape == (2,) and np.all(np.diff(t) > 0.0)
+            assert np.allclose(curve.evaluate(t)[:, 0], x, atol=1e-12)
+
+        # Root closest to the initial guess
+        t_upper = curve.compute_t_corresponding_to_x(x_seek, t0=0.0)
+        t_lower = curve.compute_t_corresponding_to_x(x_seek, t0=1.0)
+        assert np.allclose(t_upper, [t[0] for t in roots])
+        assert np.allclose(t_lower, [t[1] for t in roots])
+
+        # Scalar inputs, roots at the ends of the curve, and values the curve does not reach
+        assert isinstance(curve.compute_t_corresponding_to_x(0.5), float)
+        assert np.allclose(curve.compute_t_corresponding_to_x(1.0, all_roots=True), [0.0, 1.0])
+        assert np.isnan(curve.compute_t_corresponding_to_x(2.0))
+        assert curve.compute_t_corresponding_to_x(-1.0, all_roots=True).shape == (0,)
+
+
+def test_compute_t_corresponding_to_y_and_z():
+    for curve in _airfoil_like_curves():
+        t = curve.compute_t_corresponding_to_y(np.array([[0.02, 0.04], [-0.02, 0.0]]), t0=0.3)
+        assert t.shape == (2, 2)
+        assert np.allclose(curve.evaluate(t.ravel())[:, 1], [0.02, 0.04, -0.02, 0.0])
+        if isinstance(curve, (BezierCurve3D, RationalBezierCurve3D)):
+            z_seek = np.linspace(0.0, 0.2, 11)
+            assert np.allclose(curve.evaluate(curve.compute_t_corresponding_to_z(z_seek))[:, 2], z_seek)
+
+
+def test_project_points():
+    rng = np.random.default_rng(seed=13)
+    P = np.array([[0.0, 0.0, 0.0], [0.3, 0.4, 0.1], [0.7, -0.3, 0.2], [1.0, 0.2, 0.0], [1.3, 0.0, -0.1]])
+    w = np.array([1.0, 0.7, 1.4, 0.9, 1.0])
+    knots = np.array([0.0, 0.0, 0.0, 0.0, 0.4, 1.0, 1.0, 1.0, 1.0])
+    curves = _airfoil_like_curves() + [
+        BSplineCurve3D(P, knots, 3),
+        NURBSCurve3D(P, w, knots, 3),
+        Line3D(Point3D.from_array(np.zeros(3)), Point3D.from_array(np.ones(3))),
+        CircularArc2D(Point2D.from_array(np.zeros(2)), Length(m=1.0), start_angle=Angle(deg=0.0),
+                      end_angle=Angle(deg=270.0))
+    ]
+    for curve in curves:
+        dim = curve.evaluate(0.5).shape[0]
+        points = np.concatenate((
+            curve.evaluate(rng.uniform(0.0, 1.0, 200)) + 0.01 * rng.standard_normal((200, dim)),
+            rng.uniform(-1.5, 1.5, (200, dim))
+        ))
+        t, distance = curve.project_points(points)
+        assert np.all((t >= 0.0) & (t <= 1.0))
+        assert np.allclose(np.linalg.norm(curve.evaluate(t) - points, axis=1), distance)
+
+        # Never farther than the closest of many samples of the curve
+        sample_distance, _ = cKDTree(curve.evaluate(np.linspace(0.0, 1.0, 20001))).query(points)
+        assert np.all(distance <= sample_distance + 1e-12)
+
+
+def test_find_t_corresponding_to_minimum_distance_to_point():
+    curve = BezierCurve2D(np.array([[0.0, 0.0], [0.5, 1.0], [1.0, 0.0]]))
+    t, distance = find_t_corresponding_to_minimum_distance_to_point2d(curve, Point2D.from_array(np.array([0.5, 1.0])))
+    assert isinstance(t, float) and np.isclose(t, 0.5) and np.isclose(distance, 0.5)
+
+    # Points with two local minima of the distance
+    curve_3d = curve.convert_to_3d()
+    points = np.array([[0.45, -1.0, 0.0], [0.55, -1.0, 0.0]])
+    t, distance = find_t_corresponding_to_minimum_distance_to_point3d(curve_3d, points)
+    assert np.allclose(t, [0.0, 1.0])
+    assert np.allclose(distance, np.sqrt(1.2025))
+
+
+def test_arc_length_table():
+    P = np.array([[0.0, 0.0, 0.0], [0.3, 0.4, 0.1], [0.7, -0.3, 0.2], [1.0, 0.2, 0.0], [1.3, 0.0, -0.1]])
+    w = np.array([1.0, 0.7, 1.4, 0.9, 1.0])
+    knots = np.array([0.0, 0.0, 0.0, 0.0, 0.4, 1.0, 1.0, 1.0, 1.0])
+    curves = _airfoil_like_curves() + [BSplineCurve3D(P, knots, 3), NURBSCurve3D(P, w, knots, 3)]
+    for curve in curves:
+        # Matches the chord-length sum of a dense polyline
+        t_dense = np.linspace(0.0, 1.0, 20001)
+        polyline_length = curve.evaluate_pcurvedata(t_dense).approximate_arc_length()
+        assert np.isclose(curve.length(), polyline_length, rtol=1e-7)
+
+        # The parameter values at given arc-lengths invert the arc-length function
+        s = np.linspace(0.0, curve.length(), 57)
+        t = curve.t_at_length(s)
+        assert np.all(np.diff(t) > 0.0) and t[0] == 0.0 and np.isclose(t[-1], 1.0)
+        assert np.allclose(curve.arc_length_table().length_at_t(t), s, atol=1e-12)
+        assert isinstance(curve.t_at_length(0.5 * curve.length()), float)
+
+        # Equal arc-length samples are equally spaced along the curve, with chords no longer than the arcs
+        t = curve.equal_arc_length_parameters(401)
+        assert np.allclose(np.diff(curve.arc_length_table().length_at_t(t)), curve.length() / 400, atol=1e-12)
+        chords = np.linalg.norm(np.diff(curve.evaluate(t), axis=0), axis=1)
+        assert np.all(chords <= curve.length() / 400 + 1e-12) and np.median(chords) > 0.999 * curve.length() / 400
+
+    # Circular arcs have an exact length
+    arc = CircularArc2D(Point2D.from_array(np.zeros(2)), Length(m=2.0), start_angle=Angle(deg=0.0),
+                        end_angle=Angle(deg=270.0))
+    assert np.isclose(arc.length(), 3.0 * np.pi, rtol=1e-12)
+
+
+def test_arc_length_table_invalidated():
+    curve = BezierCurve3D(np.array([[0.0, 0.0, 0.0], [0.5, 0.5, 0.0], [1.0, 0.0, 0.0]]))
+    table = curve.arc_length_table()
+    assert curve.arc_length_table() is table
+    curve.control_points[1].y = Length(m=1.0)
+    assert curve.arc_length_table() is not table
+    assert np.isclose(curve.length(), curve.evaluate_pcurvedata(np.linspace(0.0, 1.0, 100001)).approximate_arc_length())
+
+    # Reassigning the knots of a B-spline curve is tracked by its version
+    P = np.array([[0.0, 0.0, 0.0], [0.3, 0.4, 0.1], [0.7, -0.3, 0.2], [1.0, 0.2, 0.0], [1.3, 0.0, -0.1]])
+    bspline = BSplineCurve3D(P, np.array([0.0, 0.0, 0.0, 0.0, 0.4, 1.0, 1.0, 1.0, 1.0]), 3)
+    table, version = bspline.arc_length_table(), bspline.version
+    bspline.knot_vector = np.array([0.0, 0.0, 0.0, 0.0, 0.7, 1.0, 1.0, 1.0, 1.0])
+    assert bspline.version > version and bspline.arc_length_table() is not table
+    assert not bspline.knot_vector.flags.writeable
+
+    # Modifications of curves that do not track them are detected from the control points
+    curve_2d = BezierCurve2D(np.array([[0.0, 0.0], [1.0, 0.0]]))
+    assert np.isclose(curve_2d.length(), 1.0)
+    curve_2d.control_points = [Point2D.from_array(np.zeros(2)), Point2D.from_array(np.array([3.0, 4.0]))]
+    assert np.isclose(curve_2d.length(), 5.0)
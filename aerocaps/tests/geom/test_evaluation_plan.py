@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+import scipy.sparse
+
+from aerocaps.geom.evaluation_plan import SurfaceEvaluationPlan
+from aerocaps.geom.surfaces import BezierSurface, RationalBezierSurface, NURBSSurface
+
+
+def test_bezier_evaluation_plan():
+    rng = np.random.default_rng(seed=11)
+    surf = BezierSurface(rng.random((4, 3, 3)))
+    u = np.linspace(0.0, 1.0, 8)
+    v = np.linspace(0.0, 1.0, 6)
+    plan = SurfaceEvaluationPlan.from_surface(surf, u, v)
+    assert not plan.sparse
+
+    # Re-evaluating with new control points does not require a new plan
+    for _ in range(3):
+        P = rng.random((4, 3, 3))
+        surf = BezierSurface(P)
+        assert np.allclose(plan.evaluate(P), surf.evaluate_grid(8, 6))
+        assert np.allclose(plan.dSdu(P), surf.dSdu_grid(8, 6))
+        assert np.allclose(plan.dSdv(P), surf.dSdv_grid(8, 6))
+        assert np.allclose(plan.d2Sdu2(P), surf.d2Sdu2_grid(8, 6))
+        assert np.allclose(plan.d2Sdv2(P), surf.d2Sdv2_grid(8, 6))
+
+    with pytest.raises(ValueError):
+        plan.evaluate(rng.random((3, 3, 3)))
+
+
+def test_rational_evaluation_plans():
+    rng = np.random.default_rng(seed=12)
+    u = np.linspace(0.0, 1.0, 7)
+    v = np.linspace(0.0, 1.0, 9)
+
+    P = rng.random((3, 4, 3))
+    w = rng.uniform(0.5, 1.5, (3, 4))
+    surf = RationalBezierSurface(P, w)
+    plan = SurfaceEvaluationPlan.from_surface(surf, u, v)
+    assert np.allclose(plan.evaluate(P, w), surf.evaluate_grid(7, 9))
+    assert np.allclose(plan.d2Sdv2(P, w), surf.d2Sdv2_grid(7, 9))
+
+    knots_u = np.array([0.0, 0.0, 0.0, 0.3, 0.6, 1.0, 1.0, 1.0])
+    knots_v = np.array([0.0, 0.0, 0.0, 0.0, 0.5, 1.0, 1.0, 1.0, 1.0])
+    P = rng.random((5, 5, 3))
+    w = rng.uniform(0.5, 1.5, (5, 5))
+    surf = NURBSSurface(P, knots_u, knots_v, w)
+    plan = SurfaceEvaluationPlan.from_surface(surf, u, v)
+    assert plan.sparse and scipy.sparse.issparse(plan.Bu[0])
+    assert np.allclose(plan.evaluate(P, w), surf.evaluate_grid(7, 9))
+    assert np.allclose(plan.dSdu(P, w), surf.dSdu_grid(7, 9))
+    assert np.allclose(plan.dSdv(P, w), surf.dSdv_grid(7, 9))
+    assert np.allclose(plan.d2Sdu2(P, w), surf.d2Sdu2_grid(7, 9))
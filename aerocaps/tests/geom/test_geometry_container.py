@@ -115,3 +115,18 @@ def test_export_iges(geometry_container):
     geometry_container.export_iges(file_name)
     if os.path.exists(file_name):
         os.remove(file_name)
+
+
+def test_evaluate_all(geometry_container):
+    grids = geometry_container.evaluate_all(Nu=10, Nv=12)
+    assert list(grids.keys()) == ["BezierSurface"]
+    surf = geometry_container.geometry_by_name("BezierSurface")
+    assert np.allclose(grids["BezierSurface"], surf.evaluate_grid(10, 12))
+
+
+def test_build_bvh(geometry_container):
+    bvh = geometry_container.build_bvh(max_depth=2)
+    assert bvh.names == ["BezierSurface"]
+    assert np.all(bvh.surface_index == 0)
+    ray, _, _ = bvh.query_rays(np.array([[0.5, -1.0, 0.5], [5.0, -1.0, 5.0]]), np.array([[0.0, 1.0, 0.0]] * 2))
+    assert set(ray) == {0}
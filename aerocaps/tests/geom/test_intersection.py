@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+
+from aerocaps.geom.bvh import SurfaceBVH
+from aerocaps.geom.curves import BSplineCurve3D, CurveOnParametricSurface
+from aerocaps.geom.geometry_container import GeometryContainer
+from aerocaps.geom.intersection import points_inside_closed_surfaces, ray_surface_intersections, \
+    surface_surface_intersections
+from aerocaps.geom.surfaces import BezierSurface, BSplineSurface, NURBSSurface
+from aerocaps.tests.helpers import four_surface_classes, height_field
+
+
+@pytest.fixture
+def surfaces():
+    rng = np.random.default_rng(seed=15)
+    return four_surface_classes(height_field(0.1 * rng.standard_normal((5, 5))), seed=15)
+
+
+def test_ray_surface_intersectionsheight_field():
+    # The x- and y-coordinates of a height field with uniformly spaced control points are equal to u and v
+    rng = np.random.default_rng(seed=16)
+    surf = BezierSurface(height_field(0.2 * rng.standard_normal((6, 6))))
+    xy = rng.uniform(0.0, 1.0, (500, 2))
+    origins = np.column_stack((xy, np.full(500, -2.0)))
+    directions = np.tile([0.0, 0.0, 0.5], (500, 1))
+    hits = surf.ray_intersect(origins, directions)
+    assert np.all(hits.hit)
+    assert np.allclose(hits.u, xy[:, 0]) and np.allclose(hits.v, xy[:, 1])
+    z = surf.evaluate_pairs(xy)[:, 2]
+    assert np.allclose(hits.t, (z + 2.0) / 0.5)
+    assert np.allclose(np.linalg.norm(hits.normal, axis=1), 1.0) and np.all(hits.normal[:, 2] > 0.0)
+
+    # Normals are perpendicular to the surface tangents
+    h = 1e-6
+    S_u = surf.evaluate_pairs(xy + [h, 0.0]) - surf.evaluate_pairs(xy - [h, 0.0])
+    S_v = surf.evaluate_pairs(xy + [0.0, h]) - surf.evaluate_pairs(xy - [0.0, h])
+    assert np.allclose(np.einsum("ij,ij->i", hits.normal, S_u) / (2 * h), 0.0, atol=1e-6)
+    assert np.allclose(np.einsum("ij,ij->i", hits.normal, S_v) / (2 * h), 0.0, atol=1e-6)
+
+
+def test_ray_surface_intersections_first_and_all_hits(surfaces):
+    rng = np.random.default_rng(seed=17)
+    bvh = SurfaceBVH(surfaces)
+    origins = np.column_stack((rng.uniform(-0.2, 1.2, (2000, 2)), np.full(2000, -1.0)))
+    directions = np.column_stack((rng.normal(0.0, 0.01, (2000, 2)), np.ones(2000)))
+    all_hits = ray_surface_intersections(bvh, origins, directions, all_hits=True, chunk_size=300)
+    first_hits = ray_surface_intersections(bvh, origins, directions, chunk_size=300, num_workers=2)
+    inline_hits = ray_surface_intersections(bvh, origins, directions, chunk_size=300, num_workers=1)
+    assert np.array_equal(first_hits.point, inline_hits.point, equal_nan=True)
+
+    # Every intersection lies on its surface and its ray
+    for hits in (all_hits, first_hits):
+        for surf_idx, surf in enumerate(surfaces):
+            mask = hits.surface_index == surf_idx
+            S = surf.evaluate_pairs(np.column_stack((hits.u[mask], hits.v[mask])))
+            assert np.allclose(S, hits.point[mask], atol=1e-10)
+            ray = hits.ray_index[mask]
+            assert np.allclose(origins[ray] + hits.t[mask, np.newaxis] * directions[ray], S, atol=1e-10)
+
+    # Rays through the interior of the footprint hit each surface once, and the first hit is the lowest surface
+    num_hits = all_hits.num_hits_per_ray(2000)
+    interior = np.all((origins[:, :2] > 0.3) & (origins[:, :2] < 0.7), axis=1)
+    assert np.all(num_hits[interior] == 4)
+    assert np.all(first_hits.surface_index[interior] == 0)
+    assert np.array_equal(first_hits.hit, num_hits > 0)
+    first_index = np.searchsorted(all_hits.ray_index, np.flatnonzero(num_hits > 0))
+    assert np.allclose(first_hits.t[first_hits.hit], all_hits.t[first_index])
+    assert np.all(np.isnan(first_hits.t[~first_hits.hit]))
+
+    # Limiting the ray parameter range
+    limited = ray_surface_intersections(bvh, origins[interior], directions[interior], t_min=1.5, t_max=2.5)
+    assert np.all(limited.surface_index == 1)
+
+
+def test_points_inside_closed_surfaces():
+    # Unit cube made of six bilinear faces
+    corners = np.array([[[[x, y, z] for z in (0.0, 1.0)] for y in (0.0, 1.0)] for x in (0.0, 1.0)])
+    faces = [BezierSurface(corners[0]), BezierSurface(corners[1]), BezierSurface(corners[:, 0]),
+             BezierSurface(corners[:, 1]), BezierSurface(corners[:, :, 0]), BezierSurface(corners[:, :, 1])]
+    rng = np.random.default_rng(seed=18)
+    points = rng.uniform(-0.5, 1.5, (1000, 3))
+    inside = points_inside_closed_surfaces(faces, points)
+    assert np.array_equal(inside, np.all((points > 0.0) & (points < 1.0), axis=1))
+
+
+def test_geometry_container_ray_intersect(surfaces):
+    container = GeometryContainer()
+    for surf in surfaces:
+        container.add_geometry(surf)
+    hits = container.ray_intersect(np.array([[0.5, 0.5, 5.0], [5.0, 5.0, 5.0]]), np.array([[0.0, 0.0, -1.0]] * 2))
+    assert hits.hit_surface_names() == [container.geometry_name_list()[-1], None]
+
+
+def test_surface_surface_intersections_closed_loop():
+    s = np.linspace(-1.0, 1.0, 5)
+    X, Y = np.meshgrid(s, s, indexing="ij")
+    bump = BezierSurface(np.stack((X, Y, 1.0 - X ** 2 - Y ** 2), axis=2))
+    corners = np.array([[[-1.5, -1.5, 0.3], [-1.5, 1.5, 0.3]], [[1.5, -1.5, 0.3], [1.5, 1.5, 0.3]]])
+    curves = surface_surface_intersections(bump, BezierSurface(corners))
+    assert len(curves) == 1 and curves[0].closed
+    curve = curves[0]
+    assert np.allclose(curve.points[0], curve.points[-1])
+    assert np.allclose(curve.points[:, 2], 0.3, atol=1e-10)
+    assert np.allclose(bump.evaluate_pairs(curve.uv_a), curve.points, atol=1e-10)
+
+    # The model-space curve and the pcurves share the same parameterization
+    t = np.linspace(0.0, 1.0, 201)
+    model_space_points = curve.model_space_curve().evaluate(t)
+    pcurve = curve.parametric_curve_a()
+    assert isinstance(pcurve, BSplineCurve3D) and np.allclose(pcurve.evaluate(t)[:, 2], 0.0)
+    assert np.allclose(bump.evaluate_pairs(pcurve.evaluate(t)[:, :2]), model_space_points, atol=1e-4)
+    assert np.allclose(model_space_points[:, 2], 0.3, atol=1e-4)
+
+
+def test_surface_surface_intersections_open_curves():
+    # NURBS cylinder of unit radius along the y-axis pierced by a slightly curved B-spline plate
+    r = np.sqrt(0.5)
+    ring = np.array([[1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [-1.0, 1.0], [-1.0, 0.0], [-1.0, -1.0], [0.0, -1.0],
+                     [1.0, -1.0], [1.0, 0.0]])
+    P = np.stack([np.column_stack((ring[:, 0], np.full(9, y), ring[:, 1])) for y in (-2.0, 2.0)], axis=1)
+    weights = np.tile(np.array([1.0, r, 1.0, r, 1.0, r, 1.0, r, 1.0])[:, np.newaxis], (1, 2))
+    cylinder = NURBSSurface(P, np.array([0.0, 0.0, 0.0, 0.25, 0.25, 0.5, 0.5, 0.75, 0.75, 1.0, 1.0, 1.0]),
+                            np.array([0.0, 0.0, 1.0, 1.0]), weights)
+    X, Y = np.meshgrid(np.linspace(-3.0, 3.0, 4), np.linspace(-0.5, 0.5, 4), indexing="ij")
+    knots = np.array([0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0])
+    plate = BSplineSurface(np.stack((X, Y, 0.1 * Y ** 2 + 0.05 * X), axis=2), knots, knots)
+
+    curves = surface_surface_intersections(cylinder, plate)
+    assert len(curves) == 2
+    for curve in curves:
+        assert not curve.closed
+        assert np.allclose(np.linalg.norm(curve.points[:, [0, 2]], axis=1), 1.0, atol=1e-10)
+        assert np.allclose(plate.evaluate_pairs(curve.uv_b), curve.points, atol=1e-10)
+
+        # Both ends lie on the edges of the plate at v = 0 and v = 1
+        assert np.allclose(np.sort(curve.uv_b[[0, -1], 1]), [0.0, 1.0])
+        trim_curve = curve.curve_on_surface_b()
+        assert isinstance(trim_curve, CurveOnParametricSurface) and trim_curve.surface is plate
+    assert np.allclose(np.sort([curve.points[0, 0] for curve in curves]), [-1.0, 1.0], atol=1e-2)
+
+
+def test_surface_surface_intersections_disjoint(surfaces):
+    assert surface_surface_intersections(surfaces[0], surfaces[3]) == []
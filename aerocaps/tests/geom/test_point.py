@@ -0,0 +1,64 @@
+import numpy as np
+
+from aerocaps.geom.curves import BezierCurve3D
+from aerocaps.geom.point import Point3D, PointArray3D
+from aerocaps.geom.tools import sweep_along_curve
+from aerocaps.units.length import Length, LengthArray
+
+
+def test_length_scalar_arithmetic():
+    # Numbers are interpreted in feet even though lengths are stored in meters
+    assert np.isclose((Length(ft=1.0) + 1).ft, 2.0)
+    assert np.isclose((Length(m=1.0) - 0.5).m, 1.0 - 0.5 * 0.3048)
+    assert np.isclose((Length(m=1.0) + Length(m=2.0)).m, 3.0)
+    assert np.isclose((Length(inch=6.0) * 2).inch, 12.0)
+
+
+def test_length_array_arithmetic():
+    lengths = LengthArray(m=[1.0, 2.0, 3.0])
+    assert np.allclose((lengths + Length(m=1.0)).m, [2.0, 3.0, 4.0])
+    assert np.allclose((Length(m=1.0) - lengths).m, [0.0, -1.0, -2.0])
+    assert np.allclose((2.0 * lengths).m, [2.0, 4.0, 6.0])
+    assert np.allclose((lengths + 1.0).m, (lengths[0] + 1.0).m + np.array([0.0, 1.0, 2.0]))
+    assert np.allclose((np.array([1.0, 2.0, 3.0]) - lengths).ft, [1.0, 2.0, 3.0] - lengths.ft)
+    assert np.allclose(lengths.mm, [1000.0, 2000.0, 3000.0])
+    assert isinstance(lengths[1], Length) and lengths[1].m == 2.0
+    assert isinstance(lengths[1:], LengthArray) and len(lengths[1:]) == 2
+
+
+def test_point_array_matches_point3d():
+    xyz = np.array([[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+    points = [Point3D.from_array(row) for row in xyz]
+    point_array = PointArray3D.from_points(points)
+
+    assert len(point_array) == 2
+    assert np.allclose(point_array.as_array(), xyz)
+    assert np.allclose(point_array.as_array(unit="ft"), np.array([p.as_array(unit="ft") for p in points]))
+    assert np.allclose(point_array.x.m, xyz[:, 0])
+    assert np.allclose((point_array + point_array).as_array(), 2.0 * xyz)
+    assert np.allclose((point_array - points[0]).as_array(), xyz - xyz[0])
+    assert np.allclose((point_array * np.array([1.0, 2.0])).as_array(), xyz * np.array([[1.0], [2.0]]))
+    assert np.all(point_array.almost_equals(PointArray3D(xyz)))
+    assert np.allclose(point_array.projection_array_on_principal_plane("YZ"),
+                       np.array([p.projection_on_principal_plane("YZ").as_array() for p in points]))
+    assert point_array[1].almost_equals(points[1])
+
+    # Storage in a different unit
+    point_array_inch = PointArray3D(xyz / 0.0254, unit="inch")
+    assert np.allclose(point_array_inch.as_array(), xyz)
+    assert np.all(point_array_inch.almost_equals(point_array))
+
+
+def test_bezier_curve_from_point_array():
+    xyz = np.array([[0.0, 0.0, 0.0], [0.5, 1.0, 0.0], [1.0, 0.0, 0.5]])
+    curve = BezierCurve3D(PointArray3D(xyz))
+    assert np.allclose(curve.evaluate(1.0), xyz[-1])
+
+
+def test_sweep_along_curve():
+    primary = BezierCurve3D(np.array([[0.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 2.0, 1.0]]))
+    guide = BezierCurve3D(np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.5], [2.0, 0.5, 0.5]]))
+    net = sweep_along_curve(primary, guide)
+    assert net.shape == (3, 3, 3)
+    for i, guide_point in enumerate(guide.get_control_point_array()):
+        assert np.allclose(net[i], primary.get_control_point_array() + guide_point)
@@ -0,0 +1,97 @@
+import numpy as np
+
+from aerocaps.geom.curves import BSplineCurve3D
+from aerocaps.geom.geometry_container import GeometryContainer
+from aerocaps.geom.plane import Plane
+from aerocaps.geom.point import Point3D
+from aerocaps.geom.section import section_surfaces
+from aerocaps.geom.surfaces import BezierSurface, NURBSSurface
+from aerocaps.units.length import Length
+
+
+def _bump() -> BezierSurface:
+    s = np.linspace(-1.0, 1.0, 5)
+    X, Y = np.meshgrid(s, s, indexing="ij")
+    return BezierSurface(np.stack((X, Y, 1.0 - X ** 2 - Y ** 2), axis=2))
+
+
+def _cylinder() -> NURBSSurface:
+    # NURBS cylinder of unit radius along the y-axis
+    r = np.sqrt(0.5)
+    ring = np.array([[1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [-1.0, 1.0], [-1.0, 0.0], [-1.0, -1.0], [0.0, -1.0],
+                     [1.0, -1.0], [1.0, 0.0]])
+    P = np.stack([np.column_stack((ring[:, 0], np.full(9, y), ring[:, 1])) for y in (-2.0, 2.0)], axis=1)
+    weights = np.tile(np.array([1.0, r, 1.0, r, 1.0, r, 1.0, r, 1.0])[:, np.newaxis], (1, 2))
+    return NURBSSurface(P, np.array([0.0, 0.0, 0.0, 0.25, 0.25, 0.5, 0.5, 0.75, 0.75, 1.0, 1.0, 1.0]),
+                        np.array([0.0, 0.0, 1.0, 1.0]), weights)
+
+
+def test_section_surfaces_bump():
+    bump = _bump()
+    heights = np.linspace(-1.5, 1.5, 13)
+    planes = [Plane.plane_parallel_X(Length(m=x)) for x in np.linspace(-0.9, 0.9, 7)] + \
+             [Plane.plane_parallel_Z(Length(m=z)) for z in heights]
+    sections = section_surfaces([bump], planes, chunk_size=5, num_workers=2)
+    assert len(sections) == len(planes)
+    inline_sections = section_surfaces([bump], planes, chunk_size=5, num_workers=1)
+    assert all(np.array_equal(curve.points, inline_curve.points)
+               for curves, inline_curves in zip(sections, inline_sections)
+               for curve, inline_curve in zip(curves, inline_curves, strict=True))
+
+    # Cuts across the bump are single open curves spanning the surface
+    for curves in sections[:7]:
+        assert len(curves) == 1 and not curves[0].closed
+        assert np.allclose(np.sort(np.abs(curves[0].points[[0, -1], 1])), 1.0)
+
+    # Horizontal cuts are closed loops above the edges and empty above the top
+    top = bump.evaluate_pairs(np.array([[0.5, 0.5]]))[0, 2]
+    for z, curves in zip(heights, sections[7:]):
+        if 0.0 < z < top:
+            assert len(curves) == 1 and curves[0].closed
+            assert np.allclose(curves[0].points[0], curves[0].points[-1])
+        elif z > top or z < -1.0:
+            assert curves == []
+
+    # Every point lies on its plane and on the surface
+    for plane, curves in zip(planes, sections):
+        origin, normal = plane.p0.as_array(), plane.compute_normal().as_array()
+        for curve in curves:
+            assert np.allclose((curve.points - origin) @ normal, 0.0, atol=1e-10)
+            assert np.allclose(bump.evaluate_pairs(curve.uv), curve.points, atol=1e-10)
+            assert np.all(curve.surface_index == 0)
+            assert np.all(np.linalg.norm(np.diff(curve.points, axis=0), axis=1) > 0.0)
+
+    # The fitted curve interpolates the polyline
+    curve = sections[7 + 7][0]
+    fit = curve.fit()
+    assert isinstance(fit, BSplineCurve3D)
+    assert np.allclose(fit.evaluate(np.array([0.0, 1.0])), curve.points[[0, -1]])
+
+
+def test_section_surfaces_joined_across_surfaces():
+    # Cylinder split into lower and upper halves, sectioned by oblique planes
+    cylinder = _cylinder()
+    P, w = cylinder.get_control_point_array(), cylinder.weights
+    knots = np.array([0.0, 0.0, 0.0, 0.5, 0.5, 1.0, 1.0, 1.0])
+    halves = [NURBSSurface(P[:5], knots, np.array([0.0, 0.0, 1.0, 1.0]), w[:5]),
+              NURBSSurface(P[4:], knots, np.array([0.0, 0.0, 1.0, 1.0]), w[4:])]
+    planes = [Plane(Point3D.from_array(np.array([0.0, y, 0.0])), Point3D.from_array(np.array([1.0, y + 0.2, 0.0])),
+                    Point3D.from_array(np.array([0.0, y, 1.0]))) for y in (-1.0, 0.0, 1.0)]
+    for curves in section_surfaces(halves, planes):
+        assert len(curves) == 1
+        curve = curves[0]
+        assert curve.closed and set(curve.surface_index.tolist()) == {0, 1}
+        assert np.allclose(np.linalg.norm(curve.points[:, [0, 2]], axis=1), 1.0, atol=1e-10)
+        for surf_idx, surf in enumerate(halves):
+            mask = curve.surface_index == surf_idx
+            assert np.allclose(surf.evaluate_pairs(curve.uv[mask]), curve.points[mask], atol=1e-10)
+
+
+def test_geometry_container_section():
+    container = GeometryContainer()
+    container.add_geometry(_bump())
+    container.add_geometry(_cylinder())
+    sections = container.section([Plane.plane_parallel_Y(Length(m=0.5)), Plane.plane_parallel_Y(Length(m=5.0))])
+    assert len(sections[0]) == 2 and sections[1] == []
+    assert sorted(curve.surface_names[curve.surface_index[0]] for curve in sections[0]) == \
+        sorted(container.geometry_name_list())
@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from aerocaps.geom.continuity import enforce_multiface_parallel, enforce_network_continuity
+from aerocaps.geom.geometry_container import GeometryContainer
+from aerocaps.geom.surfaces import BezierSurface, NURBSSurface, SurfaceEdge
+from aerocaps.geom.topology import find_shared_edges
+from aerocaps.tests.helpers import height_field_control_points
+
+
+def _grid(n: int, rng: np.random.Generator) -> dict:
+    # n x n grid of cubic patches of a height field, with the interior control points perturbed
+    surfaces = {}
+    for i in range(n):
+        for j in range(n):
+            P = height_field_control_points(i, j)
+            P[1:-1, 1:-1, 2] += 0.05 * rng.standard_normal((2, 2))
+            surfaces[f"p{i}{j}"] = BezierSurface(P)
+    return surfaces
+
+
+def _key(shared_edge) -> tuple:
+    return shared_edge.surface_a, shared_edge.edge_a, shared_edge.surface_b, shared_edge.edge_b, shared_edge.reverse
+
+
+def test_find_shared_edges_grid():
+    surfaces = _grid(3, np.random.default_rng(seed=22))
+
+    # Reverse the u-direction of the corner patch
+    surfaces["p22"] = BezierSurface(surfaces["p22"].get_control_point_array()[::-1])
+    graph = find_shared_edges(surfaces.values(), names=surfaces.keys())
+    expected = {(f"p{i}{j}", SurfaceEdge.u1, f"p{i + 1}{j}", SurfaceEdge.u0, False)
+                for i in range(2) for j in range(3) if (i + 1, j) != (2, 2)}
+    expected |= {(f"p{i}{j}", SurfaceEdge.v1, f"p{i}{j + 1}", SurfaceEdge.v0, False)
+                 for i in range(3) for j in range(2) if (i, j + 1) != (2, 2)}
+    expected |= {("p12", SurfaceEdge.u1, "p22", SurfaceEdge.u1, False),
+                 ("p21", SurfaceEdge.v1, "p22", SurfaceEdge.v0, True)}
+    assert {_key(shared_edge) for shared_edge in graph.shared_edges} == expected
+    assert len(graph.boundary_edges) == 12
+
+    # Views from each surface
+    assert graph.neighbors("p11") == ["p01", "p21", "p10", "p12"]
+    assert [shared_edge.edge_a for shared_edge in graph.edges_of("p11")] == \
+        [SurfaceEdge.u0, SurfaceEdge.u1, SurfaceEdge.v0, SurfaceEdge.v1]
+    for surf_a, surf_b, shared_edge in graph.surface_pairs():
+        if not shared_edge.reverse:
+            surf_a.verify_g0(surf_b, shared_edge.edge_a, shared_edge.edge_b)
+
+    # The multi-face methods and the network solver consume the graph directly
+    res = surfaces["p11"].enforce_g0g1_multiface(**graph.multiface_kwargs("p11"), method="linear")
+    assert res.success
+    with pytest.raises(ValueError):
+        graph.multiface_kwargs("p22")
+    assert enforce_network_continuity(graph.surfaces, graph.shared_edges).success
+
+
+def test_find_shared_edges_seam_and_degenerate_edges():
+    # NURBS cylinder whose u0 and u1 edges coincide, capped by a patch with a collapsed edge
+    r = np.sqrt(0.5)
+    ring = np.array([[1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [-1.0, 1.0], [-1.0, 0.0], [-1.0, -1.0], [0.0, -1.0],
+                     [1.0, -1.0], [1.0, 0.0]])
+    P = np.stack([np.column_stack((ring[:, 0], np.full(9, y), ring[:, 1])) for y in (-2.0, 2.0)], axis=1)
+    weights = np.tile(np.array([1.0, r, 1.0, r, 1.0, r, 1.0, r, 1.0])[:, np.newaxis], (1, 2))
+    cylinder = NURBSSurface(P, np.array([0.0, 0.0, 0.0, 0.25, 0.25, 0.5, 0.5, 0.75, 0.75, 1.0, 1.0, 1.0]),
+                            np.array([0.0, 0.0, 1.0, 1.0]), weights)
+    cap = BezierSurface(np.array([[[0.0, 3.0, 0.0], [1.0, 3.0, 0.0]], [[0.0, 3.0, 0.0], [1.0, 3.0, 1.0]]]))
+    graph = find_shared_edges([cylinder, cap], names=["cylinder", "cap"])
+    assert [_key(shared_edge) for shared_edge in graph.shared_edges] == \
+        [("cylinder", SurfaceEdge.u0, "cylinder", SurfaceEdge.u1, False)]
+    assert [shared_edge.edge_a for shared_edge in graph.edges_of("cylinder")] == [SurfaceEdge.u0, SurfaceEdge.u1]
+    assert ("cap", SurfaceEdge.v0) not in graph.boundary_edges and len(graph.boundary_edges) == 5
+
+
+def test_geometry_container_find_shared_edges():
+    container = GeometryContainer()
+    for surf in _grid(2, np.random.default_rng(seed=23)).values():
+        container.add_geometry(surf)
+    graph = container.find_shared_edges(continuity=2)
+    assert len(graph.shared_edges) == 4
+    assert all(shared_edge.continuity == 2 for shared_edge in graph.shared_edges)
+    assert container.enforce_continuity(graph.shared_edges).success
+
+
+def test_enforce_multiface_parallel():
+    surfaces = _grid(3, np.random.default_rng(seed=24))
+    graph = find_shared_edges(surfaces.values(), names=surfaces.keys())
+    colors = graph.color()
+    assert all(colors[shared_edge.surface_a] != colors[shared_edge.surface_b] for shared_edge in graph.shared_edges)
+
+    # Processing the colors in parallel gives the same result as calling the multi-face method surface by surface
+    surfaces = _grid(3, np.random.default_rng(seed=24))
+    sequential = find_shared_edges(surfaces.values(), names=surfaces.keys())
+    for name in sorted(colors, key=lambda name: colors[name]):
+        sequential.surfaces[name].enforce_g0g1_multiface(**sequential.multiface_kwargs(name), method="linear")
+    results = enforce_multiface_parallel(graph, method="linear", num_workers=2)
+    assert list(results) == list(graph.surfaces) and all(res.success for res in results.values())
+    for name, surf in graph.surfaces.items():
+        assert np.array_equal(surf.get_control_point_array(), sequential.surfaces[name].get_control_point_array())
+    for surf_a, surf_b, shared_edge in graph.surface_pairs():
+        surf_a.verify_g0(surf_b, shared_edge.edge_a, shared_edge.edge_b)
+
+    # Non-Bézier neighbors cannot be rebuilt from their control points in the worker processes
+    P = surfaces["p11"].get_control_point_array()
+    graph.surfaces["p11"] = NURBSSurface(P, np.array([0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0]),
+                                         np.array([0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0]), np.ones(P.shape[:2]))
+    original = {name: surf.get_control_point_array() for name, surf in graph.surfaces.items()}
+    with pytest.raises(ValueError):
+        enforce_multiface_parallel(graph, names=["p01", "p10"], num_workers=1)
+    assert all(np.array_equal(surf.get_control_point_array(), original[name]) for name, surf in graph.surfaces.items())
@@ -0,0 +1,110 @@
+import typing
+
+import numpy as np
+from scipy.optimize import OptimizeResult, minimize
+
+from aerocaps.geom import Surface
+from aerocaps.geom.surfaces import BezierSurface, RationalBezierSurface, BSplineSurface, NURBSSurface, SurfaceEdge
+
+
+def height_field_control_points(x0: float, y0: float, degree: int = 3) -> np.ndarray:
+    r"""
+    Control points of a Bézier patch over the unit square with lower-left corner :math:`(x_0, y_0)`, placed on the
+    smooth height field :math:`z = 0.2 \sin(1.3 x + 0.4) \cos(0.9 y - 0.2)`. Patches over adjacent unit squares
+    share their edge control points, which is why the continuity tests perturb them.
+    """
+    s = np.linspace(0.0, 1.0, degree + 1)
+    X, Y = np.meshgrid(x0 + s, y0 + s, indexing="ij")
+    return np.stack((X, Y, 0.2 * np.sin(1.3 * X + 0.4) * np.cos(0.9 * Y - 0.2)), axis=2)
+
+
+def height_field(z: np.ndarray) -> np.ndarray:
+    r"""
+    Control points over the unit square with uniformly spaced :math:`x`- and :math:`y`-coordinates and the heights
+    ``z`` (size :math:`n \times m`). For Bézier surfaces, :math:`x` and :math:`y` are then equal to :math:`u`
+    and :math:`v`.
+    """
+    X, Y = np.meshgrid(np.linspace(0.0, 1.0, z.shape[0]), np.linspace(0.0, 1.0, z.shape[1]), indexing="ij")
+    return np.stack((X, Y, z), axis=2)
+
+
+def four_surface_classes(P: np.ndarray, seed: int, offsets: np.ndarray = None,
+                         knots: np.ndarray = None) -> typing.List[Surface]:
+    r"""
+    A Bézier, a rational Bézier, a B-spline, and a NURBS surface built from the same :math:`5 \times 5` control
+    net ``P``, each translated by the corresponding row of ``offsets`` (size :math:`4 \times 3`, by default
+    one unit apart along :math:`z`). The B-spline and NURBS surfaces are cubic with the knot vector ``knots`` in
+    both directions (by default with one interior knot at ``0.4``), and the weights are drawn from a generator
+    seeded with ``seed``.
+    """
+    rng = np.random.default_rng(seed=seed)
+    offsets = np.column_stack((np.zeros((4, 2)), np.arange(4.0))) if offsets is None else np.asarray(offsets)
+    knots = np.array([0.0, 0.0, 0.0, 0.0, 0.4, 1.0, 1.0, 1.0, 1.0]) if knots is None else knots
+    return [
+        BezierSurface(P + offsets[0]),
+        RationalBezierSurface(P + offsets[1], rng.uniform(0.5, 1.5, P.shape[:2])),
+        BSplineSurface(P + offsets[2], knots, knots),
+        NURBSSurface(P + offsets[3], knots, knots, rng.uniform(0.5, 1.5, P.shape[:2]))
+    ]
+
+
+def four_edge_case() -> typing.Tuple[BezierSurface, typing.Dict[str, typing.Any]]:
+    """
+    Center Bézier patch surrounded by four neighbors, with perturbed interior control points. Returns the center
+    patch and the keyword arguments of the multi-face continuity methods.
+    """
+    def patch(x0, y0):
+        return BezierSurface(height_field_control_points(x0, y0, degree=4))
+
+    P = height_field_control_points(0.0, 0.0, degree=4)
+    P[1:-1, 1:-1, 2] += np.random.default_rng(seed=19).normal(0.0, 0.05, (3, 3))
+    neighbors = dict(
+        adjacent_surf_u0=patch(-1.0, 0.0), other_edge_u0=SurfaceEdge.u1,
+        adjacent_surf_u1=patch(1.0, 0.0), other_edge_u1=SurfaceEdge.u0,
+        adjacent_surf_v0=patch(0.0, -1.0), other_edge_v0=SurfaceEdge.v1,
+        adjacent_surf_v1=patch(0.0, 1.0), other_edge_v1=SurfaceEdge.v0
+    )
+    return BezierSurface(P), neighbors
+
+
+def enforce_g0g1_multiface_loop(surf: BezierSurface, n_deriv_points: int = 10, **neighbors) -> OptimizeResult:
+    """
+    Reference implementation of :obj:`~aerocaps.geom.surfaces.BezierSurface.enforce_g0g1_multiface` evaluating
+    the Jacobian with one sensitivity call per control point and edge. Only the public surface interface is used.
+    """
+    edges = [SurfaceEdge.u0, SurfaceEdge.u1, SurfaceEdge.v0, SurfaceEdge.v1]
+    mapping = {edge: (neighbors[f"adjacent_surf_{edge.name}"], neighbors[f"other_edge_{edge.name}"])
+               for edge in edges}
+    for edge, (other, other_edge) in mapping.items():
+        surf.enforce_g0(other, surface_edge=edge, other_surface_edge=other_edge)
+    d1_other = {edge: other.get_first_derivs_along_edge(other_edge, n_points=n_deriv_points)
+                for edge, (other, other_edge) in mapping.items()}
+    mod_ijs = []
+    for edge in edges:
+        for row_index in range(1, surf.get_parallel_n_points(edge) - 1):
+            point_ij = surf.get_point_ij(row_index, continuity_index=1, surface_edge=edge)
+            if point_ij not in mod_ijs:
+                mod_ijs.append(point_ij)
+    mod_i, mod_j = np.array(mod_ijs).T
+    x0 = np.append(surf.get_control_point_array()[mod_i, mod_j].flatten(), np.ones(4))
+
+    def obj_fun_and_jac(x):
+        P = surf.get_control_point_array()
+        P[mod_i, mod_j] = x[:3 * len(mod_ijs)].reshape((len(mod_ijs), 3))
+        surf.points = P
+        obj_fun_val, jac_arr = 0.0, np.zeros(x.shape)
+        for edge_idx, (edge, (_, other_edge)) in enumerate(mapping.items()):
+            f = x[3 * len(mod_ijs) + edge_idx]
+            f_sign = -1.0 if edge.name[-1] == other_edge.name[-1] else 1.0  # Negative if both edges end in 0 or 1
+            A, dA = -f_sign / abs(f), f_sign / f ** 2
+            d1_self = surf.get_first_derivs_along_edge(edge, n_points=n_deriv_points)
+            obj_fun_val += np.sum((d1_other[edge] + A * d1_self) ** 2)
+            for point_idx, (i, j) in enumerate(mod_ijs):
+                d1_sens_self = surf.get_first_deriv_cp_sens_along_edge(edge, i, j, n_points=n_deriv_points)
+                for k in range(3):
+                    jac_arr[3 * point_idx + k] += np.sum(
+                        2 * (d1_other[edge][:, k] + A * d1_self[:, k]) * A * d1_sens_self[:, k])
+            jac_arr[3 * len(mod_ijs) + edge_idx] = np.sum(2 * (d1_other[edge] + A * d1_self) * dA * d1_self)
+        return obj_fun_val, jac_arr
+
+    return minimize(obj_fun_and_jac, x0, jac=True)
@@ -1,9 +1,13 @@
+from copy import deepcopy
+
 import numpy as np
+import pytest
 from scipy.optimize import minimize
 
 import aerocaps as ac
 from aerocaps.examples.bezier_surface import bezier_surface_2x3
 from aerocaps.iges.iges_generator import IGESGenerator
+from aerocaps.tests.helpers import enforce_g0g1_multiface_loop, four_edge_case
 
 
 def test_one_edge():
@@ -121,5 +125,45 @@ def test_one_edge():
     # plot.show()
 
 
+def test_enforce_g0g1_multiface_four_edges():
+    center, neighbors = four_edge_case()
+    loop_surf, sparse_surf = deepcopy(center), deepcopy(center)
+    loop_res = enforce_g0g1_multiface_loop(loop_surf, **neighbors)
+    sparse_res = sparse_surf.enforce_g0g1_multiface(**neighbors)
+
+    # Same optimization problem, same solution (see aerocaps/scripts/multiface_speed_test.py for the timings)
+    assert sparse_res.success
+    assert np.allclose(sparse_res.x, loop_res.x, atol=1e-8)
+    assert np.allclose(sparse_surf.get_control_point_array(), loop_surf.get_control_point_array(), atol=1e-8)
+
+
+def test_enforce_multiface_linear():
+    center, neighbors = four_edge_case()
+    for method_name in ("enforce_g0g1_multiface", "enforce_g0g1g2_multiface"):
+        bfgs_surf, linear_surf, updated_surf = deepcopy(center), deepcopy(center), deepcopy(center)
+        bfgs_res = getattr(bfgs_surf, method_name)(**neighbors)
+        linear_res = getattr(linear_surf, method_name)(method="linear", **neighbors)
+        updated_res = getattr(updated_surf, method_name)(method="linear", n_f_iterations=5, **neighbors)
+
+        # Fixing the factors at one costs little, and updating them recovers the BFGS optimum
+        assert linear_res.success and updated_res.success
+        assert np.allclose(linear_res.x[-4:], 1.0)
+        assert bfgs_res.fun <= linear_res.fun < 1.05 * bfgs_res.fun
+        assert updated_res.fun <= linear_res.fun
+        assert np.isclose(updated_res.fun, bfgs_res.fun, rtol=1e-3)
+        assert np.allclose(linear_surf.get_control_point_array()[[0, -1]], bfgs_surf.get_control_point_array()[[0, -1]])
+
+    # The linear solution does not depend on the initial interior control points
+    P = center.get_control_point_array()
+    P[1:-1, 1:-1] += np.random.default_rng(seed=20).normal(0.0, 0.3, (3, 3, 3))
+    perturbed = ac.BezierSurface(P)
+    center.enforce_g0g1g2_multiface(method="linear", **neighbors)
+    perturbed.enforce_g0g1g2_multiface(method="linear", **neighbors)
+    assert np.allclose(perturbed.get_control_point_array(), center.get_control_point_array(), atol=1e-10)
+
+    with pytest.raises(ValueError):
+        center.enforce_g0g1_multiface(method="newton", **neighbors)
+
+
 if __name__ == "__main__":
     test_one_edge()
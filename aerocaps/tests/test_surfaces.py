@@ -2,12 +2,14 @@ import os
 
 import numpy as np
 import copy
+import pytest
 
 from aerocaps.geom.point import Point3D
 from aerocaps.geom.surfaces import NURBSSurface, BezierSurface, RationalBezierSurface, SurfaceEdge, BSplineSurface
 from aerocaps.geom.curves import BezierCurve3D,Line3D
 from aerocaps.geom import NegativeWeightError
 from aerocaps.units.angle import Angle
+from aerocaps.units.length import Length, LengthArray
 from rust_nurbs import *
 
 
@@ -818,3 +820,240 @@ def test_bspline_surf():
 
     # TODO: understand why this next verification does not pass
     # bspline_surf_1.verify_g2(bspline_surf_2, SurfaceEdge.v0, SurfaceEdge.v1)
+
+
+def test_control_point_array_storage():
+    """
+    Tests that the surface control points are stored as a single array and that the point objects returned by
+    ``points`` read from and write to that array for all four tensor-product surface types.
+    """
+    rng = np.random.default_rng(seed=7)
+    cps = rng.random((4, 3, 3))
+    knots_u = np.array([0.0, 0.0, 0.0, 0.5, 1.0, 1.0, 1.0])
+    knots_v = np.array([0.0, 0.0, 0.0, 1.0, 1.0, 1.0])
+    surfs = [
+        BezierSurface(cps),
+        RationalBezierSurface(cps, np.ones((4, 3))),
+        BSplineSurface(cps, knots_u, knots_v),
+        NURBSSurface(cps, knots_u, knots_v, np.ones((4, 3)))
+    ]
+    for surf in surfs:
+        assert surf.n_points_u == 4
+        assert surf.n_points_v == 3
+        assert np.array_equal(surf.get_control_point_array(), cps)
+
+        # The array returned by the getter is a writable copy
+        P = surf.get_control_point_array()
+        P[0, 0, 0] = 100.0
+        assert surf.get_control_point_array()[0, 0, 0] == cps[0, 0, 0]
+
+        # Writing through a point view modifies the surface
+        point = surf.points[1][2]
+        point.x.m = 5.0
+        assert surf.get_control_point_array()[1, 2, 0] == 5.0
+        point.y = Point3D.from_array(np.array([0.0, 6.0, 0.0])).y
+        assert np.isclose(surf.get_control_point_array()[1, 2, 1], 6.0)
+
+        # Assigning a point object to an index modifies the surface
+        surf.points[2][0] = Point3D.from_array(np.array([7.0, 8.0, 9.0]))
+        assert np.allclose(surf.get_control_point_array()[2, 0], np.array([7.0, 8.0, 9.0]))
+        assert np.isclose(surf.evaluate(1.0, 0.0)[0], surf.get_control_point_array()[-1, 0, 0])
+
+        # Arithmetic on views produces detached points
+        detached = surf.points[0][0] + surf.points[0][1]
+        detached.x.m = -1.0
+        assert surf.get_control_point_array()[0, 0, 0] != -1.0
+
+
+def test_control_points_copied_from_point_objects():
+    """
+    Tests that the point objects used to create or assign the control points of a surface are copied, so modifying
+    them afterward (or sharing them with another surface) does not modify the surface
+    """
+    pts = [[Point3D.from_array(np.array([float(i), float(j), 0.0])) for j in range(3)] for i in range(3)]
+    surf = BezierSurface(pts)
+    other = BezierSurface(pts)
+    pts[1][1].z = Length(m=100.0)
+    assert surf.get_control_point_array()[1, 1, 2] == 0.0
+    assert other.get_control_point_array()[1, 1, 2] == 0.0
+
+    # Re-assigning the points applies the modification
+    surf.points = pts
+    assert surf.get_control_point_array()[1, 1, 2] == 100.0
+    assert other.get_control_point_array()[1, 1, 2] == 0.0
+
+
+def test_cached_arrays_invalidated_on_modification():
+    """
+    Tests that the cached control point data of surfaces and curves is rebuilt after every kind of modification,
+    including modifications made directly through the point objects
+    """
+    cps = np.array([
+        [[0.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 2.0, 0.0]],
+        [[1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [1.0, 2.0, 0.0]],
+        [[2.0, 0.0, 0.0], [2.0, 1.0, 0.0], [2.0, 2.0, 0.0]]
+    ])
+    surf = RationalBezierSurface(cps, np.ones((3, 3)))
+
+    # Repeated calls reuse the cached data internally, while the public getters return copies
+    assert surf._control_point_array() is surf._control_point_array()
+    assert surf._homogeneous_control_point_array() is surf._homogeneous_control_point_array()
+    assert surf.get_homogeneous_control_points() is not surf.get_homogeneous_control_points()
+    assert np.isclose(surf.evaluate(1.0, 1.0)[2], 0.0)
+
+    # Direct modification of a coordinate
+    version = surf.version
+    surf.points[2][2].z.m = 1.0
+    assert surf.version > version
+    assert surf.get_control_point_array()[2, 2, 2] == 1.0
+    assert np.isclose(surf.evaluate(1.0, 1.0)[2], 1.0)
+
+    # Modification using set_point
+    surf.set_point(Point3D.from_array(np.array([2.0, 2.0, 3.0])), 2, 0, SurfaceEdge.u1)
+    assert np.isclose(surf.evaluate(1.0, 1.0)[2], 3.0)
+
+    # Modification using set_weight and the weights property
+    surf.set_weight(2.0, 1, 0, SurfaceEdge.u1)
+    assert surf.get_homogeneous_control_points()[2, 1, 3] == 2.0
+    surf.weights = np.full((3, 3), 3.0)
+    assert surf.get_homogeneous_control_points()[2, 1, 3] == 3.0
+    with pytest.raises(ValueError):
+        surf.weights[0, 0] = 1.0
+
+    # Curves
+    curve = BezierCurve3D(cps[:, 0, :])
+    assert np.isclose(curve.evaluate(1.0)[1], 0.0)
+    curve.control_points[-1].y.m = 4.0
+    assert np.isclose(curve.evaluate(1.0)[1], 4.0)
+    curve.control_points[-1] = Point3D.from_array(np.array([2.0, 5.0, 0.0]))
+    assert np.isclose(curve.evaluate(1.0)[1], 5.0)
+
+
+def test_evaluate_derivatives():
+    rng = np.random.default_rng(seed=7)
+    P = rng.random((4, 4, 3))
+    w = rng.uniform(0.5, 1.5, (4, 4))
+    knots_u = np.array([0.0, 0.0, 0.0, 0.4, 1.0, 1.0, 1.0])
+    knots_v = np.array([0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0])
+    surfs = [
+        BezierSurface(P),
+        RationalBezierSurface(P, w),
+        BSplineSurface(P, knots_u, knots_v),
+        NURBSSurface(P, knots_u, knots_v, w)
+    ]
+    step = 1e-6
+    for surf in surfs:
+        # Grid input
+        data = surf.evaluate_derivatives_grid(6, 7)
+        assert np.allclose(data.S, surf.evaluate_grid(6, 7))
+        assert np.allclose(data.Su, surf.dSdu_grid(6, 7))
+        assert np.allclose(data.Sv, surf.dSdv_grid(6, 7))
+        assert np.allclose(data.Suu, surf.d2Sdu2_grid(6, 7))
+        assert np.allclose(data.Svv, surf.d2Sdv2_grid(6, 7))
+
+        # Vector input
+        u = np.array([0.0, 0.25, 0.9])
+        v = np.array([0.1, 1.0])
+        data = surf.evaluate_derivatives(u, v, order=1)
+        assert np.allclose(data.Sv, surf.dSdv_uvvecs(u, v))
+        assert data.Suu is None and data.Suv is None and data.Svv is None
+
+        # Scalar input (compare the mixed partial to a central difference)
+        data = surf.evaluate_derivatives(0.3, 0.6)
+        assert data.S.shape == (3,)
+        assert np.allclose(data.S, surf.evaluate(0.3, 0.6))
+        Suv = (surf.dSdv(0.3 + step, 0.6) - surf.dSdv(0.3 - step, 0.6)) / (2 * step)
+        assert np.allclose(data.Suv, Suv, atol=1e-6)
+
+
+def test_evaluate_pairs():
+    rng = np.random.default_rng(seed=8)
+    P = rng.random((4, 4, 3))
+    w = rng.uniform(0.5, 1.5, (4, 4))
+    knots_u = np.array([0.0, 0.0, 0.0, 0.4, 1.0, 1.0, 1.0])
+    knots_v = np.array([0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0])
+    surfs = [
+        BezierSurface(P),
+        RationalBezierSurface(P, w),
+        BSplineSurface(P, knots_u, knots_v),
+        NURBSSurface(P, knots_u, knots_v, w)
+    ]
+    uv = np.vstack((rng.random((10, 2)), [[0.0, 0.0], [1.0, 1.0], [0.4, 1.0]]))
+    for surf in surfs:
+        assert np.allclose(surf.evaluate_pairs(uv), [surf.evaluate(u, v) for u, v in uv])
+        assert np.allclose(surf.dSdu_pairs(uv), [surf.dSdu(u, v) for u, v in uv])
+        assert np.allclose(surf.dSdv_pairs(uv), [surf.dSdv(u, v) for u, v in uv])
+        assert np.allclose(surf.d2Sdu2_pairs(uv), [surf.d2Sdu2(u, v) for u, v in uv])
+        assert np.allclose(surf.d2Sdv2_pairs(uv), [surf.d2Sdv2(u, v) for u, v in uv])
+        data = surf.evaluate_derivatives_pairs(uv)
+        assert np.allclose(data.Suv, [surf.evaluate_derivatives(u, v).Suv for u, v in uv])
+
+        with pytest.raises(ValueError):
+            surf.evaluate_pairs(uv[:, 0])
+
+
+def test_project_points():
+    rng = np.random.default_rng(seed=9)
+    x = np.linspace(0.0, 1.0, 4)
+    P = np.zeros((4, 4, 3))
+    P[:, :, 0] = x[:, np.newaxis]
+    P[:, :, 1] = x[np.newaxis, :]
+    P[:, :, 2] = 0.3 * rng.random((4, 4))
+    w = rng.uniform(0.5, 1.5, (4, 4))
+    knots_u = np.array([0.0, 0.0, 0.0, 0.4, 1.0, 1.0, 1.0])
+    knots_v = np.array([0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0])
+    surfs = [
+        BezierSurface(P),
+        RationalBezierSurface(P, w),
+        BSplineSurface(P, knots_u, knots_v),
+        NURBSSurface(P, knots_u, knots_v, w)
+    ]
+    for surf in surfs:
+        # Offset points along the surface normal so that the closest points are known
+        uv_exact = rng.uniform(0.05, 0.95, (200, 2))
+        data = surf.evaluate_derivatives_pairs(uv_exact, order=1)
+        normals = np.cross(data.Su, data.Sv)
+        normals /= np.linalg.norm(normals, axis=1)[:, np.newaxis]
+        uv, distance, converged = surf.project_points(data.S + 0.01 * normals)
+        assert np.all(converged)
+        assert np.allclose(uv, uv_exact, atol=1e-8)
+        assert np.allclose(distance, 0.01)
+
+        # A point beyond the u=1 edge projects onto the edge
+        uv, distance, converged = surf.project_points(np.array([[2.0, 0.5, 0.1]]))
+        assert converged[0] and uv[0, 0] == 1.0
+        assert np.isclose(distance[0], np.linalg.norm(surf.evaluate(*uv[0]) - np.array([2.0, 0.5, 0.1])))
+
+
+def test_get_u_or_v_given_uvxyz_array():
+    rng = np.random.default_rng(seed=11)
+    x = np.linspace(0.0, 1.0, 4)
+    P = np.zeros((4, 4, 3))
+    P[:, :, 0] = x[:, np.newaxis] + 0.1 * rng.random((4, 4))
+    P[:, :, 1] = 3.0 * x[np.newaxis, :] + 0.1 * rng.random((4, 4))
+    P[:, :, 2] = 0.3 * rng.random((4, 4))
+    w = rng.uniform(0.5, 1.5, (4, 4))
+    knots_u = np.array([0.0, 0.0, 0.0, 0.4, 1.0, 1.0, 1.0])
+    knots_v = np.array([0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0])
+    surfs = [
+        BezierSurface(P),
+        RationalBezierSurface(P, w),
+        NURBSSurface(P, knots_u, knots_v, w)
+    ]
+    for surf in surfs:
+        uv = rng.uniform(0.0, 1.0, (100, 2))
+        xyz = surf.evaluate_pairs(uv)
+
+        # Solve for v given u and y, and for u given v and x
+        v = surf.get_u_or_v_given_uvxyz_array(u=uv[:, 0], y=LengthArray(m=xyz[:, 1]))
+        assert np.allclose(v, uv[:, 1], atol=1e-10)
+        u = surf.get_u_or_v_given_uvxyz_array(v=uv[:, 1], x=LengthArray(m=xyz[:, 0]))
+        assert np.allclose(u, uv[:, 0], atol=1e-10)
+
+        # Scalar fixed parameter broadcast against the targets, and a target outside the surface
+        u = surf.get_u_or_v_given_uvxyz_array(v=uv[0, 1], x=LengthArray(m=[xyz[0, 0], 10.0]))
+        assert np.isclose(u[0], uv[0, 0]) and np.isnan(u[1])
+        assert np.isclose(surf.get_u_or_v_given_uvxyz_array(v=uv[0, 1], x=Length(m=xyz[0, 0])), uv[0, 0])
+
+        with pytest.raises(ValueError):
+            surf.get_u_or_v_given_uvxyz_array(u=0.5, x=Length(m=0.5), y=Length(m=0.5))
@@ -1,26 +1,50 @@
+import typing
+
+import numpy as np
+
 from aerocaps.units.unit import Unit
 from aerocaps.units.area import Area
 
 
 __all__ = [
-    "Length"
+    "Length",
+    "LengthArray"
 ]
 
 
+length_conversions_from_ft = {
+    'm': 0.3048,
+    'inch': 12,
+    'mm': 304.8,
+    'mi': 1 / 5280,
+    'nmi': 1 / 5280 / 1.150779448,
+    'km': 0.0003048,
+    'cm': 30.48
+}
+
+length_conversions_to_m = {
+    'm': 1.0,
+    'ft': 0.3048,
+    'inch': 0.0254,
+    'mm': 0.001,
+    'mi': 0.3048 * 5280,
+    'nmi': 0.3048 * 5280 * 1.150779448,
+    'km': 1000.0,
+    'cm': 0.01
+}
+
+
 class Length(Unit):
-    """Base-level class for a length dimension with various available units."""
+    """
+    Base-level class for a length dimension with various available units. Only the value in meters is stored;
+    the value in any other unit is computed when it is requested. Numbers added to or subtracted from a length are
+    interpreted in feet.
+    """
+    __slots__ = ("_m",)
+    convert_from_feet_map = length_conversions_from_ft
+
     def __init__(self, ft=None, m=None, inch=None, mm=None, mi=None, nmi=None, km=None, cm=None):
-        self._ft, self._m, self._inch, self._mm, self._mi, self._nmi, self._km, self._cm = \
-            None, None, None, None, None, None, None, None
-        self.convert_from_feet_map = {
-            'm': 0.3048,
-            'inch': 12,
-            'mm': 304.8,
-            'mi': 1 / 5280,
-            'nmi': 1 / 5280 / 1.150779448,
-            'km': 0.0003048,
-            'cm': 30.48
-        }
+        self._m = None
         if ft is not None:
             self.ft = ft
         elif m is not None:
@@ -37,21 +61,7 @@ class Length(Unit):
             self.km = km
         elif cm is not None:
             self.cm = cm
-        super().__init__(primary_unit="ft")
-
-    def set_all(self):
-        """After setting the length in feet, set the length for all other units"""
-        for k, v in self.convert_from_feet_map.items():
-            setattr(self, f'_{k}', self._ft * v)
-
-    @property
-    def ft(self):
-        return self._ft
-
-    @ft.setter
-    def ft(self, ft):
-        self._ft = ft
-        self.set_all()
+        super().__init__(primary_unit="m")
 
     @property
     def m(self):
@@ -59,68 +69,210 @@ class Length(Unit):
 
     @m.setter
     def m(self, m):
-        self._ft = m / self.convert_from_feet_map['m']
-        self.set_all()
+        self._m = m
+
+    @property
+    def ft(self):
+        return None if self._m is None else self._m / length_conversions_to_m['ft']
+
+    @ft.setter
+    def ft(self, ft):
+        self._m = ft * length_conversions_to_m['ft']
 
     @property
     def inch(self):
-        return self._inch
+        return None if self._m is None else self._m / length_conversions_to_m['inch']
 
     @inch.setter
     def inch(self, inch):
-        self._ft = inch / self.convert_from_feet_map['inch']
-        self.set_all()
+        self._m = inch * length_conversions_to_m['inch']
 
     @property
     def mm(self):
-        return self._mm
+        return None if self._m is None else self._m / length_conversions_to_m['mm']
 
     @mm.setter
     def mm(self, mm):
-        self._ft = mm / self.convert_from_feet_map['mm']
-        self.set_all()
+        self._m = mm * length_conversions_to_m['mm']
 
     @property
     def mi(self):
-        return self._mi
+        return None if self._m is None else self._m / length_conversions_to_m['mi']
 
     @mi.setter
     def mi(self, mi):
-        self._ft = mi / self.convert_from_feet_map['mi']
-        self.set_all()
+        self._m = mi * length_conversions_to_m['mi']
 
     @property
     def nmi(self):
-        return self._nmi
+        return None if self._m is None else self._m / length_conversions_to_m['nmi']
 
     @nmi.setter
     def nmi(self, nmi):
-        self._ft = nmi / self.convert_from_feet_map['nmi']
-        self.set_all()
+        self._m = nmi * length_conversions_to_m['nmi']
 
     @property
     def km(self):
-        return self._km
+        return None if self._m is None else self._m / length_conversions_to_m['km']
 
     @km.setter
     def km(self, km):
-        self._ft = km / self.convert_from_feet_map['km']
-        self.set_all()
+        self._m = km * length_conversions_to_m['km']
+
+    @property
+    def cm(self):
+        return None if self._m is None else self._m / length_conversions_to_m['cm']
 
-    @property 
-    def cm(self): 
-        return self._cm
-    
     @cm.setter
     def cm(self, cm):
-        self._ft = cm / self.convert_from_feet_map['cm']
-        self.set_all()
+        self._m = cm * length_conversions_to_m['cm']
+
+    def __add__(self, other):
+        # Bare numbers are interpreted in feet, as they were when feet were the primary unit of lengths
+        if isinstance(other, (int, float)):
+            return self._dimension(m=self.m + other * length_conversions_to_m['ft'])
+        return super().__add__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, (int, float)):
+            return self._dimension(m=self.m - other * length_conversions_to_m['ft'])
+        return super().__sub__(other)
 
     def __mul__(self, other):
         if isinstance(other, (int, float)):
             new_primary_value = getattr(self, self.primary_unit) * other
-            return self.__class__(**{self.primary_unit: new_primary_value})
+            return self._new(new_primary_value)
         elif isinstance(other, Length):
             return Area(m2=self.m * other.m)
         else:
             return NotImplemented
+
+
+class LengthArray(Length):
+    """
+    Array of lengths stored as a single float array in meters. Supports the same units as
+    :obj:`~aerocaps.units.length.Length`, with every unit property returning an array, and element-wise arithmetic
+    with other lengths, length arrays, scalars, and arrays of matching shape. As for
+    :obj:`~aerocaps.units.length.Length`, numbers and arrays added to or subtracted from a length array are
+    interpreted in feet.
+    """
+    __slots__ = ()
+    __array_ufunc__ = None  # Makes NumPy defer binary operations (e.g., ``numpy.float64 * LengthArray``) to this class
+
+    def __init__(self, ft=None, m=None, inch=None, mm=None, mi=None, nmi=None, km=None, cm=None):
+        values = dict(ft=ft, m=m, inch=inch, mm=mm, mi=mi, nmi=nmi, km=km, cm=cm)
+        super().__init__(**{unit: None if value is None else np.array(value, dtype=float)
+                            for unit, value in values.items()})
+
+    @property
+    def shape(self) -> tuple:
+        return self._m.shape
+
+    def __len__(self) -> int:
+        return len(self._m)
+
+    def __getitem__(self, index) -> Length or "LengthArray":
+        value = self._m[index]
+        if np.ndim(value) == 0:
+            return Length(m=float(value))
+        return LengthArray(m=value)
+
+    def __iter__(self) -> typing.Iterator[Length]:
+        return (Length(m=value) for value in self._m.tolist())
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array(self._m, dtype=dtype)
+
+    @staticmethod
+    def _value_in_m(other) -> float or np.ndarray or None:
+        if isinstance(other, Length):
+            return other.m
+        if isinstance(other, (int, float, np.number, np.ndarray)):
+            return np.asarray(other, dtype=float) * length_conversions_to_m['ft']  # Bare numbers are in feet
+        return None
+
+    def __add__(self, other):
+        other_m = self._value_in_m(other)
+        return NotImplemented if other_m is None else LengthArray(m=self._m + other_m)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        other_m = self._value_in_m(other)
+        return NotImplemented if other_m is None else LengthArray(m=self._m - other_m)
+
+    def __rsub__(self, other):
+        other_m = self._value_in_m(other)
+        return NotImplemented if other_m is None else LengthArray(m=other_m - self._m)
+
+    def __mul__(self, other):
+        if isinstance(other, Length):
+            return Area(m2=self._m * other.m)
+        if isinstance(other, (int, float, np.number, np.ndarray)):
+            return LengthArray(m=self._m * other)
+        return NotImplemented
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        if isinstance(other, Length):
+            return self._m / other.m
+        if isinstance(other, (int, float, np.number, np.ndarray)):
+            return LengthArray(m=self._m / other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(m={self._m.tolist()})"
+
+
+class ArrayBackedLength(Length):
+    """
+    Length whose value is not owned by the object but stored (in meters) in one element of a float array.
+    Reading any unit reads from the array, and setting any unit writes to the array. Arithmetic on these objects
+    produces ordinary (detached) :obj:`~aerocaps.units.length.Length` objects.
+    """
+    __slots__ = ("_buffer", "_index", "_on_modify")
+
+    def __init__(self, buffer: np.ndarray, index: int, on_modify: typing.Callable[[], None] = None):
+        """
+        Length view into one element of a float array
+
+        Parameters
+        ----------
+        buffer: numpy.ndarray
+            1-D array holding the value in meters
+        index: int
+            Index of the element of ``buffer`` that holds the value
+        on_modify: typing.Callable[[], None]
+            Optional function called with no arguments each time the value is written to the array. Used by the
+            owner of the array to invalidate any data derived from it. Default: ``None``
+        """
+        self._buffer = buffer
+        self._index = index
+        self._on_modify = on_modify
+        Unit.__init__(self, primary_unit="m")
+
+    @property
+    def _dimension(self) -> type:
+        return Length
+
+    @property
+    def _m(self):
+        return float(self._buffer[self._index])
+
+    @_m.setter
+    def _m(self, m):
+        self._buffer[self._index] = m
+        if self._on_modify is not None:
+            self._on_modify()
+
+    def __copy__(self) -> Length:
+        return Length(m=self.m)
+
+    def __deepcopy__(self, memo) -> Length:
+        return Length(m=self.m)
+
+    def __reduce__(self):
+        return Length, (None, self.m)
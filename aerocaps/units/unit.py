@@ -2,33 +2,44 @@ from abc import ABC
 
 
 class Unit(ABC):
+    __slots__ = ("primary_unit",)
+
     def __init__(self, primary_unit: str):
         self.primary_unit = primary_unit
 
+    @property
+    def _dimension(self) -> type:
+        """Class used to build the results of arithmetic operations and to check for compatible operands"""
+        return self.__class__
+
+    def _new(self, primary_value: float) -> "Unit":
+        """Creates a new unit object of the same dimension from a value expressed in the primary unit"""
+        return self._dimension(**{self.primary_unit: primary_value})
+
     def __add__(self, other):
-        if self.__class__ == other.__class__:
-            new_primary_value = getattr(self, self.primary_unit) + getattr(other, other.primary_unit)
-            return self.__class__(**{self.primary_unit: new_primary_value})
+        if isinstance(other, self._dimension):
+            new_primary_value = getattr(self, self.primary_unit) + getattr(other, self.primary_unit)
+            return self._new(new_primary_value)
         elif isinstance(other, (int, float)):
             new_primary_value = getattr(self, self.primary_unit) + other
-            return self.__class__(**{self.primary_unit: new_primary_value})
+            return self._new(new_primary_value)
         else:
             return NotImplemented
 
     def __sub__(self, other):
-        if self.__class__ == other.__class__:
-            new_primary_value = getattr(self, self.primary_unit) - getattr(other, other.primary_unit)
-            return self.__class__(**{self.primary_unit: new_primary_value})
+        if isinstance(other, self._dimension):
+            new_primary_value = getattr(self, self.primary_unit) - getattr(other, self.primary_unit)
+            return self._new(new_primary_value)
         elif isinstance(other, (int, float)):
             new_primary_value = getattr(self, self.primary_unit) - other
-            return self.__class__(**{self.primary_unit: new_primary_value})
+            return self._new(new_primary_value)
         else:
             return NotImplemented
 
     def __mul__(self, other):
         if isinstance(other, (int, float)):
             new_primary_value = getattr(self, self.primary_unit) * other
-            return self.__class__(**{self.primary_unit: new_primary_value})
+            return self._new(new_primary_value)
         else:
             return NotImplemented
 
@@ -38,17 +49,17 @@ class Unit(ABC):
     def __truediv__(self, other):
         if isinstance(other, (int, float)):
             new_primary_value = getattr(self, self.primary_unit) / other
-            return self.__class__(**{self.primary_unit: new_primary_value})
-        elif self.__class__ == other.__class__:
-            new_primary_value = getattr(self, self.primary_unit) / getattr(other, other.primary_unit)
+            return self._new(new_primary_value)
+        elif isinstance(other, self._dimension):
+            new_primary_value = getattr(self, self.primary_unit) / getattr(other, self.primary_unit)
             return new_primary_value
         else:
             return NotImplemented
 
     def __abs__(self):
         new_primary_value = abs(getattr(self, self.primary_unit))
-        return self.__class__(**{self.primary_unit: new_primary_value})
+        return self._new(new_primary_value)
 
     def __neg__(self):
         new_primary_value = -(getattr(self, self.primary_unit))
-        return self.__class__(**{self.primary_unit: new_primary_value})
+        return self._new(new_primary_value)
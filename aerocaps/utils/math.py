@@ -3,8 +3,11 @@ Math utilities
 """
 from math import factorial
 from decimal import Decimal
+import typing
 
 import numpy as np
+from scipy.sparse import csr_matrix, sparray, spmatrix
+from scipy.sparse.linalg import lsmr
 
 
 def nchoosek(n: int, k: int):
@@ -56,3 +59,109 @@ def bernstein_poly(n: int, i: int, t: int or float or np.ndarray):
     if not 0 <= i <= n:
         return 0.0 if isinstance(t, float) else np.zeros(t.shape)
     return nchoosek(n, i) * t ** i * (1.0 - t) ** (n - i)
+
+
+def newton_bisection(func: typing.Callable[[np.ndarray, np.ndarray], typing.Tuple[np.ndarray, np.ndarray]],
+                     lo: np.ndarray, hi: np.ndarray, sign_lo: np.ndarray = None, t0: np.ndarray = None,
+                     tol: float = 1e-12, max_iterations: int = 50) -> np.ndarray:
+    r"""
+    Finds a root of each of a set of scalar functions inside brackets :math:`[t_\text{lo}, t_\text{hi}]` on
+    which the functions change sign. All the roots are found at once using Newton's method safeguarded by
+    bisection: a Newton step is rejected in favor of bisection if it leaves the current bracket or does not
+    halve the previous step, so the method always converges and is quadratically convergent near simple roots.
+
+    Parameters
+    ----------
+    func: typing.Callable[[numpy.ndarray, numpy.ndarray], typing.Tuple[numpy.ndarray, numpy.ndarray]]
+        Function that accepts a 1-D array of parameter values and a 1-D array of the same size containing the
+        indices of the brackets they belong to, and returns the function values and their derivatives with
+        respect to the parameter
+    lo: numpy.ndarray
+        1-D array of lower bracket bounds
+    hi: numpy.ndarray
+        1-D array of upper bracket bounds
+    sign_lo: numpy.ndarray
+        Sign of each function just above its lower bracket bound. If not specified, the functions are evaluated
+        at the lower bounds. Must be specified if any function is exactly zero at its lower bound. Default: ``None``
+    t0: numpy.ndarray
+        Initial parameter values inside the brackets. If not specified, the bracket midpoints are used.
+        Default: ``None``
+    tol: float
+        Convergence tolerance on the parameter values. Default: ``1e-12``
+    max_iterations: int
+        Maximum number of iterations. Default: ``50``
+
+    Returns
+    -------
+    numpy.ndarray
+        Roots of each function
+    """
+    lo = np.array(lo, dtype=float)
+    hi = np.array(hi, dtype=float)
+    indices = np.arange(lo.shape[0])
+    if sign_lo is None:
+        sign_lo = np.sign(func(lo, indices)[0])
+    sign_lo = np.asarray(sign_lo)
+    t = 0.5 * (lo + hi) if t0 is None else np.array(t0, dtype=float)
+    previous_step = hi - lo
+
+    result = t.copy()
+    active = indices
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        f, dfdt = func(t[active], active)
+
+        # Shrink the brackets
+        same_sign_as_lo = np.sign(f) == sign_lo[active]
+        lo[active[same_sign_as_lo]] = t[active[same_sign_as_lo]]
+        hi[active[~same_sign_as_lo]] = t[active[~same_sign_as_lo]]
+
+        # Newton step, or bisection if the step leaves the bracket or converges too slowly
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = t[active] - f / dfdt
+        bisect = (~np.isfinite(newton) | (newton < lo[active]) | (newton > hi[active]) |
+                  (np.abs(newton - t[active]) > 0.5 * np.abs(previous_step[active])))
+        new_t = np.where(f == 0.0, t[active], np.where(bisect, 0.5 * (lo[active] + hi[active]), newton))
+        previous_step[active] = new_t - t[active]
+        t[active] = new_t
+
+        done = (np.abs(previous_step[active]) <= tol) | (hi[active] - lo[active] <= tol)
+        result[active] = t[active]
+        active = active[~done]
+
+    return result
+
+
+def sparse_least_squares(matrix: sparray or spmatrix, rhs: np.ndarray, tol: float = 1e-14,
+                         max_iterations: int = None) -> np.ndarray:
+    r"""
+    Solves the linear least-squares problem :math:`\min_x \lVert \mathbf{A} x - b \rVert^2` for a sparse matrix
+    :math:`\mathbf{A}` and one or more right-hand sides using the LSMR method. If :math:`\mathbf{A}` is
+    rank-deficient, the minimum-norm solution is returned, so solving for a correction to a current value leaves the
+    components of the value that do not affect the residual unchanged.
+
+    Parameters
+    ----------
+    matrix: scipy.sparse.sparray or scipy.sparse.spmatrix
+        Sparse matrix of size :math:`M \times N`
+    rhs: numpy.ndarray
+        Right-hand side of size :math:`M` or :math:`M \times K`
+    tol: float
+        Relative tolerance on the residual and on the normal-equation residual. Default: ``1e-14``
+    max_iterations: int
+        Maximum number of LSMR iterations for each right-hand side. If not specified, ``10 * N`` is used.
+        Default: ``None``
+
+    Returns
+    -------
+    numpy.ndarray
+        Solution of size :math:`N` or :math:`N \times K`
+    """
+    matrix = csr_matrix(matrix)
+    max_iterations = 10 * matrix.shape[1] if max_iterations is None else max_iterations
+    columns = rhs if rhs.ndim == 2 else rhs[:, np.newaxis]
+    solution = np.column_stack([
+        lsmr(matrix, column, atol=tol, btol=tol, maxiter=max_iterations)[0] for column in columns.T
+    ])
+    return solution if rhs.ndim == 2 else solution[:, 0]